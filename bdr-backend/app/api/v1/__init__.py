@@ -12,7 +12,7 @@ api_router = APIRouter(prefix="/api/v1")
 # INCLUDE ALL ROUTERS — THIS WAS MISSING THE AUTH ONE!
 api_router.include_router(auth_router)
 api_router.include_router(projects_router)
-api_router.include_router(transactions_router)
+api_router.include_router(transactions_router, prefix="/transactions")
 api_router.include_router(pages_router)
 api_router.include_router(users_router)
 api_router.include_router(messages_router)
@@ -1,18 +1,34 @@
 # app/api/v1/admin.py
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse, PlainTextResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from datetime import datetime
+from typing import Any, Dict, Optional
+import json
+import logging
 
 from ...dependencies import get_db, get_current_user
+from ...database import SessionLocal
 from ...models.user import User, UserRole
-from ...models.transaction import Transaction
+from ...models.transaction import Transaction, TransactionStatus
+from ...models.project import Project, ProjectStatus
 from ...models.contact_message import ContactMessage
+from ...schemas.transaction import BankTransferSettle, BankTransferSettleOut
 from ...crud import project as crud_project
 from ...crud import transaction as crud_transaction
 from ...crud import user as crud_user
+from ...crud import page as crud_page
+from .contact import crud as crud_contact
+from .contact.schemas import BulkMessageAction, BulkMessageResult
+from ...utils.export import stream_csv, stream_parquet, parquet_available
+from ...utils.profiling import profile_store
+from ...utils.content_store import content_store
 
 # THIS IS THE KEY: prefix includes /api/v1/admin
 router = APIRouter(prefix="/api/v1/admin", tags=["Admin"])
+logger = logging.getLogger(__name__)
 
 
 async def require_admin(current_user: User = Depends(get_current_user)):
@@ -31,23 +47,21 @@ async def require_admin(current_user: User = Depends(get_current_user)):
 
 @router.get("/stats")
 def get_stats(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    # sum of all transaction amounts (coalesce -> 0)
-    total_donated = db.query(func.coalesce(func.sum(Transaction.amount), 0)).scalar() or 0
-    # jobs created calculation: keep consistent with your app logic (1 job per 10,000)
-    total_jobs = int(total_donated // 10000)
+    # money + jobs from the per-project totals every credit maintains (and
+    # rebuild_project_jobs repairs) — no ledger scan, cold months included
+    total_donated, total_jobs = db.query(
+        func.coalesce(func.sum(Project.current_funding), 0), func.coalesce(func.sum(Project.jobs_created), 0)
+    ).one()
 
     # messages: handle optional is_read column gracefully
     total_messages = 0
     unread_messages = 0
     try:
         total_messages = db.query(ContactMessage).count()
-        if hasattr(ContactMessage, 'is_read'):
-            unread_messages = db.query(ContactMessage).filter(ContactMessage.is_read == False).count()
-        else:
-            unread_messages = total_messages
+        unread_messages = crud_contact.get_unread_count(db)  # maintained counter, no scan
     except Exception as e:
         # don't crash the stats endpoint if contact table has issues; return best-effort numbers
-        print("ContactMessage stats error:", e)
+        logger.warning(f"ContactMessage stats error: {e}")
 
     # Use .value for enum comparisons to avoid DB/Enum mismatch
     total_backers = db.query(User).filter(User.role == UserRole.BACKER.value).count()
@@ -55,7 +69,7 @@ def get_stats(db: Session = Depends(get_db), admin: User = Depends(require_admin
 
     return {
         "total_donated_rwf": int(total_donated),
-        "total_jobs_created": total_jobs,
+        "total_jobs_created": int(total_jobs),
         "total_backers": total_backers,
         "total_entrepreneurs": total_entrepreneurs,
         "total_messages": total_messages,
@@ -63,45 +77,292 @@ def get_stats(db: Session = Depends(get_db), admin: User = Depends(require_admin
     }
 
 
+# ===================== PAGINATED LISTS (KEYSET + PROJECTION) =====================
+# All four lists share: ?cursor=<last id>&limit=&sort=&order=asc|desc&with_total=
+# and return {items, next_cursor, total_estimate, total_is_exact}.
+def list_params(
+    cursor: Optional[int] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    with_total: bool = Query(True, description="Set false on later pages to skip the count"),
+) -> dict:
+    return {"cursor": cursor, "limit": limit, "descending": order == "desc", "with_total": with_total}
+
+
+def _parse_status(enum_cls, value: Optional[str]):
+    if value is None:
+        return None
+    try:
+        return enum_cls(value)
+    except ValueError:
+        allowed = ", ".join(s.value for s in enum_cls)
+        raise HTTPException(status_code=400, detail=f"Invalid status. Use one of: {allowed}")
+
+
+def _page(fetch, **kwargs):
+    try:
+        return fetch(**kwargs)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/projects")
-def get_projects(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    return crud_project.get_projects(db)
+def get_projects(
+    sort: str = "created_at",
+    status: Optional[str] = None,
+    sector: Optional[str] = None,
+    entrepreneur_id: Optional[int] = None,
+    q: Optional[str] = Query(None, description="Title prefix"),
+    params: dict = Depends(list_params),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    return _page(
+        crud_project.get_all_projects, db=db, sort=sort,
+        status=_parse_status(ProjectStatus, status), sector=sector,
+        entrepreneur_id=entrepreneur_id, q=q, **params
+    )
 
 
 @router.get("/transactions")
-def get_transactions(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    return crud_transaction.get_all_transactions(db)
+def get_transactions(
+    sort: str = "id",
+    status: Optional[str] = None,
+    project_id: Optional[int] = None,
+    backer_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    params: dict = Depends(list_params),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    return _page(
+        crud_transaction.get_all_transactions, db=db, sort=sort,
+        status=_parse_status(TransactionStatus, status), project_id=project_id,
+        backer_id=backer_id, start=start, end=end, **params
+    )
+
+
+# ===================== BANK TRANSFERS =====================
+# Banks have no status API or callback: once the money lands (or clearly
+# won't), an admin settles the transfer by the reference the backer quoted
+# — one backing or a whole basket payment. Same idempotent path as webhooks.
+@router.post("/transfers/{reference}/settle", response_model=BankTransferSettleOut)
+def settle_bank_transfer(
+    reference: str,
+    data: BankTransferSettle,
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    row = crud_transaction.get_by_external_id(db, reference)
+    if row is None:
+        raise HTTPException(status_code=404, detail="No payment with that reference")
+    if row.provider != "bank":
+        raise HTTPException(status_code=409, detail=f"This is a {row.provider} payment; its provider settles it")
+    if isinstance(row, Transaction) and row.payment_id is not None:
+        raise HTTPException(status_code=409, detail=f"Part of basket payment {row.payment.external_id}; settle that")
+    if row.status != TransactionStatus.pending:
+        raise HTTPException(status_code=409, detail=f"Already {row.status.value}")
+
+    row = crud_transaction.update_transaction_status(
+        db, reference, data.bank_ref, "SUCCESSFUL" if data.received else "FAILED"
+    )
+    logger.info(f"Bank transfer {reference} settled as {row.status.value} by {admin.email}")
+    return {"reference": reference, "status": row.status.value}
 
 
 @router.get("/users")
-def get_users(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    return crud_user.get_all_users(db)
+def get_users(
+    sort: str = "created_at",
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    q: Optional[str] = Query(None, description="Email prefix"),
+    params: dict = Depends(list_params),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    return _page(crud_user.get_all_users, db=db, sort=sort, role=role, is_active=is_active, q=q, **params)
 
 
 @router.get("/messages")
-def get_messages(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    messages = db.query(ContactMessage).order_by(ContactMessage.created_at.desc()).all()
-    result = []
-    for m in messages:
-        msg_data = {
-            "id": m.id,
-            "name": m.name,
-            "email": m.email,
-            "message": m.message,
-            "created_at": m.created_at.isoformat() if m.created_at else None,
-        }
-        msg_data["is_read"] = getattr(m, "is_read", False)
-        result.append(msg_data)
-    return result
-
-
-# NEW: Mark as read
+def get_messages(
+    sort: str = "created_at",
+    is_read: Optional[bool] = None,
+    archived: bool = False,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    params: dict = Depends(list_params),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    return _page(
+        crud_contact.get_all_messages, db=db, sort=sort, is_read=is_read,
+        archived=archived, start=start, end=end, **params
+    )
+
+
+# ===================== INBOX TRIAGE =====================
+@router.get("/messages/unread-count")
+def get_unread_count(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+    return {"unread": crud_contact.get_unread_count(db)}
+
+
+@router.post("/messages/bulk", response_model=BulkMessageResult)
+def bulk_triage_messages(
+    body: BulkMessageAction,
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    try:
+        affected = crud_contact.bulk_update_messages(db, body.action, ids=body.ids, filter=body.filter)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"action": body.action, "affected": affected, "unread_count": crud_contact.get_unread_count(db)}
+
+
+# Mark as read (single) — same set-based path as bulk
 @router.patch("/messages/{message_id}/read")
 def mark_as_read(message_id: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)):
-    msg = db.query(ContactMessage).filter(ContactMessage.id == message_id).first()
-    if not msg:
+    if not db.query(ContactMessage.id).filter(ContactMessage.id == message_id).first():
         raise HTTPException(status_code=404, detail="Message not found")
-    if hasattr(msg, 'is_read'):
-        msg.is_read = True
-        db.commit()
+    crud_contact.bulk_update_messages(db, "read", ids=[message_id])
     return {"success": True}
+
+
+# ===================== STREAMING EXPORTS (CSV / PARQUET) =====================
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+def _export_response(name: str, fmt: str, columns, iter_rows) -> StreamingResponse:
+    """
+    The generator owns its session: the request-scoped one from get_db is
+    closed before the body finishes streaming.
+    """
+    if fmt == "parquet" and not parquet_available:
+        raise HTTPException(status_code=400, detail="Parquet export requires pyarrow on the server")
+    encode = stream_parquet if fmt == "parquet" else stream_csv
+
+    def body():
+        db = SessionLocal()
+        try:
+            yield from encode(columns, iter_rows(db))
+        finally:
+            db.close()
+
+    filename = f"{name}_{datetime.utcnow():%Y%m%d_%H%M%S}.{fmt}"
+    return StreamingResponse(
+        body(),
+        media_type=EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export/transactions")
+def export_transactions(
+    format: str = Query("csv", pattern="^(csv|parquet)$"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
+    status: Optional[str] = None,
+    include_archived: bool = False,
+    admin: User = Depends(require_admin)
+):
+    status_filter = _parse_status(TransactionStatus, status)
+    return _export_response(
+        "transactions",
+        format,
+        crud_transaction.TRANSACTION_EXPORT_COLUMNS,
+        lambda db: crud_transaction.iter_transactions_for_export(
+            db, start=start, end=end, status=status_filter, include_archived=include_archived
+        ),
+    )
+
+
+@router.get("/export/projects")
+def export_projects(
+    format: str = Query("csv", pattern="^(csv|parquet)$"),
+    start: Optional[datetime] = Query(None, description="created_at >= start"),
+    end: Optional[datetime] = Query(None, description="created_at < end"),
+    status: Optional[str] = None,
+    admin: User = Depends(require_admin)
+):
+    status_filter = _parse_status(ProjectStatus, status)
+    return _export_response(
+        "projects",
+        format,
+        crud_project.PROJECT_EXPORT_COLUMNS,
+        lambda db: crud_project.iter_projects_for_export(db, start=start, end=end, status=status_filter),
+    )
+
+
+# ===================== PROFILES =====================
+# On-demand: repeat any request with `X-Profile: 1` as admin, read X-Profile-Id.
+@router.get("/profiles")
+def list_profiles(route: Optional[str] = None, admin: User = Depends(require_admin)):
+    return [p.summary() for p in profile_store.list(route)]
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: str, admin: User = Depends(require_admin)):
+    """Folded stacks — paste into speedscope.app or pipe to flamegraph.pl."""
+    profile = profile_store.get(profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found (it may have been evicted)")
+    return PlainTextResponse(profile.folded)
+
+
+# ===================== PAGE CONTENT =====================
+# Every save is a new version; the public pages switch over without a redeploy.
+def _page_or_404(db: Session, key: str, version: Optional[int] = None):
+    document = crud_page.get_page_version(db, key, version)
+    if not document:
+        raise HTTPException(status_code=404, detail="Page not found")
+    return document
+
+
+def _publish(db: Session, key: str, content: Dict[str, Any], admin: User):
+    try:
+        document = crud_page.create_page_version(db, key, content, user_id=admin.id)
+    except IntegrityError:
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Page was edited concurrently — reload and try again")
+    entry = content_store.reload(db).pages[key]
+    logger.info(f"Page {key} v{document.version} published by {admin.email}")
+    return {"key": key, "version": document.version, "etag": entry.etag}
+
+
+@router.get("/pages")
+def list_pages(db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+    return [
+        {"key": entry.key, "version": entry.version, "etag": entry.etag, "bytes": len(entry.body)}
+        for entry in content_store.current(db).pages.values()
+    ]
+
+
+@router.get("/pages/{key}/versions")
+def list_page_versions(key: str, db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+    _page_or_404(db, key)
+    return crud_page.list_page_versions(db, key)
+
+
+@router.get("/pages/{key}/versions/{version}")
+def get_page_version(key: str, version: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+    document = _page_or_404(db, key, version)
+    return Response(document.content, media_type="application/json")
+
+
+@router.put("/pages/{key}")
+def update_page(
+    key: str,
+    content: Dict[str, Any] = Body(...),
+    db: Session = Depends(get_db),
+    admin: User = Depends(require_admin)
+):
+    _page_or_404(db, key)
+    return _publish(db, key, content, admin)
+
+
+@router.post("/pages/{key}/rollback/{version}")
+def rollback_page(key: str, version: int, db: Session = Depends(get_db), admin: User = Depends(require_admin)):
+    """Re-publishes an old version as the newest one (history is never rewritten)."""
+    document = _page_or_404(db, key, version)
+    return _publish(db, key, json.loads(document.content), admin)
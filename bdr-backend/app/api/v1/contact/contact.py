@@ -1,30 +1,42 @@
 # bdr-backend/app/api/v1/contact.py
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.dependencies import get_db  # ← THIS IS YOUR REAL FILE
-from app.utils.email import send_contact_email
+from app.utils.email import queue_contact_email
 from app.api.v1.contact.schemas import ContactMessageCreate, ContactMessageInDB
 from app.api.v1.contact.crud import create_contact_message
+from app.api.v1.contact.ingest import check_rate_limits, check_duplicate, release_duplicate, spam_score
 
 router = APIRouter(prefix="/contact", tags=["Contact"])
 
 @router.post("/", response_model=ContactMessageInDB, status_code=status.HTTP_201_CREATED)
 async def submit_contact_form(
     data: ContactMessageCreate,
+    request: Request,
     db: Session = Depends(get_db)  # ← uses your real get_db
 ):
-    # Save to database
-    saved = create_contact_message(db=db, message=data)
+    # Cheap checks first — a flood never reaches the DB or SMTP
+    await check_rate_limits(request, data)
+    await check_duplicate(data)
 
-    # Send emails (auto-reply + notify Francis)
+    score = spam_score(data)
+
+    # Save to database (sync session → threadpool, keeps the loop free)
     try:
-        await send_contact_email(
+        saved = await run_in_threadpool(create_contact_message, db, data, score)
+    except Exception:
+        await release_duplicate(data)       # nothing was saved — let the retry through
+        raise
+
+    # Emails go through the background worker (auto-reply + notify Francis)
+    if score < settings.CONTACT_SPAM_THRESHOLD:
+        queue_contact_email(
             to_user=data.email,
             user_name=data.name,
             subject=data.subject,
             user_message=data.message
         )
-    except Exception as e:
-        print(f"Email failed (but message was saved): {e}")
 
-    return saved
\ No newline at end of file
+    return saved
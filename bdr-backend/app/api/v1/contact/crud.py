@@ -1,11 +1,142 @@
 # bdr-backend/app/api/v1/contact/crud.py
 from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func, and_
+from typing import Optional, Dict, List
+from datetime import datetime
+from app.core.config import settings
 from app.models.contact_message import ContactMessage
-from app.api.v1.contact.schemas import ContactMessageCreate
+from app.models.counter import UNREAD_CONTACT_MESSAGES
+from app.api.v1.contact.schemas import ContactMessageCreate, ContactMessageFilter
+from app.crud.counter import increment, get_counter
+from app.utils.pagination import paginate
 
-def create_contact_message(db: Session, message: ContactMessageCreate):
-    db_message = ContactMessage(**message.dict())
+def create_contact_message(db: Session, message: ContactMessageCreate, spam_score: int = 0):
+    db_message = ContactMessage(**message.dict(), spam_score=spam_score)
+    if spam_score >= settings.CONTACT_SPAM_THRESHOLD:
+        # Kept for review but out of the inbox (archived ⇒ read, no badge bump)
+        db_message.is_archived = True
+        db_message.is_read = True
     db.add(db_message)
+    if not db_message.is_archived:
+        increment(db, UNREAD_CONTACT_MESSAGES, 1)
     db.commit()
     db.refresh(db_message)
-    return db_message
\ No newline at end of file
+    return db_message
+
+
+# ADMIN INBOX — keyset pagination, projected columns only
+MESSAGE_SORT_COLUMNS = {
+    "id": ContactMessage.id,
+    "created_at": ContactMessage.created_at,
+}
+
+def get_all_messages(
+    db: Session,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "created_at",
+    descending: bool = True,
+    is_read: Optional[bool] = None,
+    archived: bool = False,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    with_total: bool = True
+) -> Dict:
+    if sort not in MESSAGE_SORT_COLUMNS:
+        raise ValueError(f"Sort must be one of: {', '.join(MESSAGE_SORT_COLUMNS)}")
+
+    query = select(
+        ContactMessage.id,
+        ContactMessage.name,
+        ContactMessage.email,
+        ContactMessage.subject,
+        ContactMessage.message,
+        ContactMessage.created_at,
+        ContactMessage.is_read,
+        ContactMessage.is_archived,
+    ).where(ContactMessage.is_archived == archived)
+    if is_read is not None:
+        query = query.where(ContactMessage.is_read == is_read)
+    if start:
+        query = query.where(ContactMessage.created_at >= start)
+    if end:
+        query = query.where(ContactMessage.created_at < end)
+
+    return paginate(db, query, MESSAGE_SORT_COLUMNS[sort], ContactMessage.id, cursor, limit, descending, with_total)
+
+
+# UNREAD BADGE — maintained counter, seeded once from the (is_read, created_at) index
+def count_unread_messages(db: Session) -> int:
+    return db.query(func.count(ContactMessage.id)).filter(ContactMessage.is_read == False).scalar() or 0
+
+def get_unread_count(db: Session) -> int:
+    return get_counter(db, UNREAD_CONTACT_MESSAGES, seed=count_unread_messages)
+
+
+# BULK TRIAGE — every action is set-based; the counter moves by rowcount
+def _selection(ids: Optional[List[int]], filter: Optional[ContactMessageFilter]):
+    clauses = []
+    if ids:
+        clauses.append(ContactMessage.id.in_(ids))
+    if filter:
+        if filter.is_read is not None:
+            clauses.append(ContactMessage.is_read == filter.is_read)
+        if filter.is_archived is not None:
+            clauses.append(ContactMessage.is_archived == filter.is_archived)
+        if filter.email:
+            clauses.append(ContactMessage.email == filter.email)
+        if filter.before:
+            clauses.append(ContactMessage.created_at < filter.before)
+        if filter.after:
+            clauses.append(ContactMessage.created_at >= filter.after)
+    if not clauses:
+        raise ValueError("Select messages with ids or a non-empty filter")
+    return and_(*clauses)
+
+def bulk_update_messages(
+    db: Session,
+    action: str,
+    ids: Optional[List[int]] = None,
+    filter: Optional[ContactMessageFilter] = None
+) -> int:
+    """
+    read    → is_read = true
+    unread  → is_read = false, back to the inbox
+    archive → is_archived = true, is_read = true
+    delete  → DELETE
+    Returns the number of messages affected. One DB transaction.
+    """
+    get_unread_count(db)  # make sure the counter exists before applying deltas
+    where = _selection(ids, filter)
+    unread = ContactMessage.is_read == False
+
+    if action == "read":
+        affected = db.execute(update(ContactMessage).where(where, unread).values(is_read=True)).rowcount
+        increment(db, UNREAD_CONTACT_MESSAGES, -affected)
+
+    elif action == "unread":
+        affected = db.execute(
+            update(ContactMessage).where(where, ContactMessage.is_read == True)
+            .values(is_read=False, is_archived=False)
+        ).rowcount
+        increment(db, UNREAD_CONTACT_MESSAGES, affected)
+
+    elif action == "archive":
+        was_unread = db.execute(
+            update(ContactMessage).where(where, unread).values(is_read=True, is_archived=True)
+        ).rowcount
+        increment(db, UNREAD_CONTACT_MESSAGES, -was_unread)
+        affected = was_unread + db.execute(
+            update(ContactMessage).where(where, ContactMessage.is_archived == False).values(is_archived=True)
+        ).rowcount
+
+    elif action == "delete":
+        was_unread = db.execute(delete(ContactMessage).where(where, unread)).rowcount
+        increment(db, UNREAD_CONTACT_MESSAGES, -was_unread)
+        affected = was_unread + db.execute(delete(ContactMessage).where(where)).rowcount
+
+    else:
+        raise ValueError(f"Unknown action: {action}")
+
+    db.commit()
+    return affected
@@ -0,0 +1,101 @@
+# bdr-backend/app/api/v1/contact/ingest.py
+"""
+BDR – Contact form ingestion (runs before anything touches the DB or SMTP)
+- check_rate_limits()  → per-IP and per-email token buckets → 429
+- check_duplicate()    → same normalised body from same email within the window → 409
+- release_duplicate()  → forget the body again when saving it failed, so a retry isn't a 409
+- spam_score()         → cheap 0–100 heuristic; high scores are stored archived, no emails
+"""
+
+import hashlib
+import math
+import re
+
+from fastapi import HTTPException, Request, status
+
+from app.core.config import settings
+from app.utils.rate_limit import get_rate_limit_store, client_ip, per_hour
+from app.api.v1.contact.schemas import ContactMessageCreate
+
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_LINK = re.compile(r"https?://|www\.", re.IGNORECASE)
+_SPAM_WORDS = (
+    "casino", "crypto", "bitcoin", "viagra", "loan offer", "seo service",
+    "backlinks", "guest post", "click here", "buy now", "free money",
+)
+
+
+def normalise(text: str) -> str:
+    text = _PUNCTUATION.sub(" ", text.lower())
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def message_fingerprint(data: ContactMessageCreate) -> str:
+    body = f"{data.email.lower()}|{normalise(data.message)}"
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def spam_score(data: ContactMessageCreate) -> int:
+    text = f"{data.subject} {data.message}"
+    lowered = text.lower()
+    score = 0
+    score += min(40, 15 * len(_LINK.findall(text)))
+    score += min(40, 20 * sum(word in lowered for word in _SPAM_WORDS))
+
+    letters = [c for c in text if c.isalpha()]
+    if len(letters) >= 20 and sum(c.isupper() for c in letters) / len(letters) > 0.6:
+        score += 20
+    if len(normalise(data.message)) < 5:
+        score += 20
+    return min(100, score)
+
+
+def _too_many(retry_after: float, detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+async def check_rate_limits(request: Request, data: ContactMessageCreate) -> None:
+    store = get_rate_limit_store()
+
+    allowed, retry_after = await store.take(
+        f"contact:ip:{client_ip(request)}",
+        settings.CONTACT_IP_BURST,
+        per_hour(settings.CONTACT_IP_PER_HOUR),
+    )
+    if not allowed:
+        raise _too_many(retry_after, "Too many messages from your network. Please try again later.")
+
+    allowed, retry_after = await store.take(
+        f"contact:email:{data.email.lower()}",
+        settings.CONTACT_EMAIL_BURST,
+        per_hour(settings.CONTACT_EMAIL_PER_HOUR),
+    )
+    if not allowed:
+        raise _too_many(retry_after, "You've sent several messages already. We'll reply soon — please try again later.")
+
+
+def _duplicate_key(data: ContactMessageCreate) -> str:
+    return f"contact:body:{message_fingerprint(data)}"
+
+
+async def check_duplicate(data: ContactMessageCreate) -> None:
+    # Reserved atomically up front, so two identical submissions racing
+    # can't both be saved; release_duplicate() undoes it on failure
+    fresh = await get_rate_limit_store().add_if_absent(
+        _duplicate_key(data),
+        settings.CONTACT_DUPLICATE_WINDOW_SECONDS,
+    )
+    if not fresh:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="We already received this message. We'll get back to you within 24 hours.",
+        )
+
+
+async def release_duplicate(data: ContactMessageCreate) -> None:
+    await get_rate_limit_store().forget(_duplicate_key(data))
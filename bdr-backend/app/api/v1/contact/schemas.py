@@ -1,6 +1,6 @@
 # bdr-backend/app/api/v1/contact/schemas.py
-from pydantic import BaseModel, EmailStr
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from typing import Optional, List, Literal
 from datetime import datetime
 
 class ContactMessageCreate(BaseModel):
@@ -20,4 +20,25 @@ class ContactMessageInDB(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# ADMIN BULK TRIAGE — select by ids OR by filter (never both empty)
+class ContactMessageFilter(BaseModel):
+    is_read: Optional[bool] = None
+    is_archived: Optional[bool] = None
+    email: Optional[str] = None
+    before: Optional[datetime] = None   # created_at < before
+    after: Optional[datetime] = None    # created_at >= after
+
+
+class BulkMessageAction(BaseModel):
+    action: Literal["read", "unread", "archive", "delete"]
+    ids: Optional[List[int]] = Field(None, max_length=5000)
+    filter: Optional[ContactMessageFilter] = None
+
+
+class BulkMessageResult(BaseModel):
+    action: str
+    affected: int
+    unread_count: int
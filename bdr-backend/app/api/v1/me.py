@@ -0,0 +1,31 @@
+# app/api/v1/me.py
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+
+from app.dependencies import get_db, get_current_backer
+from app.models.user import User
+from app.schemas.backer import BackerImpactOut, ContributionPage
+from app.crud.backer_stats import get_backer_stats, get_contribution_history
+
+router = APIRouter(prefix="/me", tags=["Backer Dashboard"])
+
+
+# ===================== IMPACT (ROLLUP ROW — CONSTANT TIME) =====================
+@router.get("/impact", response_model=BackerImpactOut)
+def get_my_impact(db: Session = Depends(get_db), current_user: User = Depends(get_current_backer)):
+    stats = get_backer_stats(db, current_user.id)
+    return stats or BackerImpactOut()
+
+
+# ===================== CONTRIBUTION HISTORY (KEYSET) =====================
+@router.get("/contributions", response_model=ContributionPage)
+def get_my_contributions(
+    before_id: Optional[int] = Query(None, description="Last id of the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_backer)
+):
+    items = get_contribution_history(db, current_user.id, before_id=before_id, limit=limit)
+    next_cursor = items[-1]["id"] if len(items) == limit else None
+    return {"items": items, "next_cursor": next_cursor}
@@ -1,9 +1,165 @@
 # app/api/v1/mentors.py
-from fastapi import APIRouter
+"""
+Mentor directory + bookings
+- GET  /mentors/                     → directory (plain array, as the frontend expects)
+- GET  /mentors/{slug}               → one mentor + weekly availability
+- GET  /mentors/{slug}/slots?week=   → free slots for one week (UTC)
+- POST /mentors/{slug}/bookings      → book a slot (409 if it was just taken)
+- GET  /mentors/bookings/me          → my bookings (and, for mentors, bookings with me)
+- POST /mentors/bookings/{id}/cancel
+- PUT  /mentors/me/availability      → mentors edit their weekly windows
+                                       (409 while upcoming bookings are off the new grid)
+"""
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ...core.config import settings
+from ...dependencies import get_db, get_current_user
+from ...models.user import User, UserRole
+from ...models.mentor import BookingStatus
+from ...crud import mentor as crud_mentor
+from ...schemas.mentor import (
+    MentorOut, AvailabilityWindow, WeekSlotsOut, SlotOut, BookingCreate, BookingOut,
+)
+from ...utils.mentor_schedule import (
+    schedule_cache, week_slots, week_start, slot_on_grid, to_utc_naive,
+)
+from ...utils.responses import model_list_response, model_response
 
 router = APIRouter(prefix="/mentors", tags=["Mentors"])
+logger = logging.getLogger(__name__)
+
+
+def _mentor_or_404(db: Session, slug: str):
+    mentor = crud_mentor.get_mentor_by_slug(db, slug)
+    if not mentor:
+        raise HTTPException(status_code=404, detail="Mentor not found")
+    return mentor
+
+
+def _live_bookings_loader(db: Session, mentor_id: int):
+    # Anything that could still overlap an upcoming slot
+    return lambda: crud_mentor.load_live_bookings(db, mentor_id, since=datetime.utcnow() - timedelta(days=1))
 
+
+# ===================== DIRECTORY =====================
 # Frontend expects the array directly, not wrapped in {mentors: [...]}
-@router.get("/")
-def get_mentors():
-    return []   # ← JUST RETURN THE ARRAY
\ No newline at end of file
+@router.get("/", response_model=List[MentorOut])
+def get_mentors(expertise: Optional[str] = None, db: Session = Depends(get_db)):
+    return model_list_response(MentorOut, crud_mentor.get_mentors(db, expertise=expertise))
+
+
+# ===================== BOOKINGS (static paths before /{slug}) =====================
+@router.get("/bookings/me", response_model=List[BookingOut])
+def my_bookings(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    profile = crud_mentor.get_mentor_by_user(db, current_user.id)
+    bookings = crud_mentor.get_user_bookings(db, current_user.id, mentor_id=profile.id if profile else None)
+    return model_list_response(BookingOut, bookings)
+
+
+@router.post("/bookings/{booking_id}/cancel", response_model=BookingOut)
+def cancel_booking(booking_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    booking = crud_mentor.get_booking(db, booking_id)
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    is_mentor = booking.mentor.user_id == current_user.id
+    if booking.user_id != current_user.id and not is_mentor and current_user.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Not your booking")
+    if booking.status == BookingStatus.cancelled:
+        return model_response(BookingOut, booking)
+
+    booking = crud_mentor.cancel_booking(db, booking)
+    schedule_cache.cancelled(booking.mentor_id, (booking.starts_at, booking.ends_at))
+    return model_response(BookingOut, booking)
+
+
+# ===================== MENTOR SELF-SERVICE =====================
+@router.put("/me/availability", response_model=List[AvailabilityWindow])
+def set_my_availability(
+    windows: List[AvailabilityWindow],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    profile = crud_mentor.get_mentor_by_user(db, current_user.id)
+    if not profile:
+        raise HTTPException(status_code=403, detail="Only mentors with a profile can set availability")
+    try:
+        profile = crud_mentor.set_availability(db, profile, [w.model_dump() for w in windows])
+    except crud_mentor.AvailabilityConflict as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return crud_mentor.availability_windows(profile)
+
+
+# ===================== ONE MENTOR =====================
+@router.get("/{slug}")
+def get_mentor(slug: str, db: Session = Depends(get_db)):
+    mentor = _mentor_or_404(db, slug)
+    data = MentorOut.model_validate(mentor).model_dump()
+    data["availability"] = crud_mentor.availability_windows(mentor)
+    return data
+
+
+@router.get("/{slug}/slots", response_model=WeekSlotsOut)
+def get_free_slots(
+    slug: str,
+    week: Optional[date] = Query(None, description="Any day in the wanted week (default: this week)"),
+    db: Session = Depends(get_db)
+):
+    mentor = _mentor_or_404(db, slug)
+    today = datetime.utcnow().date()
+    monday = week_start(week or today)
+    if monday > week_start(today) + timedelta(weeks=settings.MENTOR_BOOKING_WEEKS_AHEAD):
+        raise HTTPException(status_code=422, detail="That week is not open for booking yet")
+
+    now = datetime.utcnow()
+    candidates = [slot for slot in week_slots(mentor, monday) if slot[0] > now]
+    free = schedule_cache.free_slots(mentor.id, _live_bookings_loader(db, mentor.id), candidates)
+    return {
+        "mentor": mentor.slug,
+        "week_start": datetime.combine(monday, datetime.min.time()),
+        "timezone": mentor.timezone,
+        "slots": [SlotOut(starts_at=start, ends_at=end) for start, end in free],
+    }
+
+
+@router.post("/{slug}/bookings", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
+def book_slot(
+    slug: str,
+    data: BookingCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    mentor = _mentor_or_404(db, slug)
+    if not mentor.available:
+        raise HTTPException(status_code=409, detail="This mentor is not taking bookings right now")
+    if mentor.user_id == current_user.id:
+        raise HTTPException(status_code=422, detail="You can't book yourself")
+
+    starts_at = to_utc_naive(data.starts_at)
+    now = datetime.utcnow()
+    if starts_at <= now or starts_at > now + timedelta(weeks=settings.MENTOR_BOOKING_WEEKS_AHEAD + 1):
+        raise HTTPException(status_code=422, detail="Pick an upcoming slot")
+    if not slot_on_grid(mentor, starts_at):
+        raise HTTPException(status_code=422, detail="Not one of this mentor's slots")
+
+    slot = (starts_at, starts_at + timedelta(minutes=mentor.slot_minutes))
+    # Cheap early answer from the index; the unique index below is what actually decides
+    if not schedule_cache.free_slots(mentor.id, _live_bookings_loader(db, mentor.id), [slot]):
+        raise HTTPException(status_code=409, detail="That slot is already booked")
+    try:
+        booking = crud_mentor.create_booking(db, mentor, current_user.id, starts_at, topic=data.topic)
+    except IntegrityError:
+        db.rollback()
+        schedule_cache.invalidate(mentor.id)   # another worker got there first; our view is stale
+        raise HTTPException(status_code=409, detail="That slot was just booked — pick another")
+
+    schedule_cache.booked(mentor.id, slot)
+    logger.info(f"Booking {booking.id}: {current_user.email} → {mentor.slug} at {starts_at:%Y-%m-%d %H:%M} UTC")
+    return model_response(BookingOut, booking, status_code=status.HTTP_201_CREATED)
@@ -1,18 +1,130 @@
 # app/api/v1/messages.py
-from fastapi import APIRouter, Depends
-from app.dependencies import get_current_user
+"""
+Direct messages between users
+- GET  /messages/                                → inbox (conversations + last message), dashboard shape
+- GET  /messages/unread-count
+- POST /messages/conversations                   → start (or reuse) a conversation with a first message
+- GET  /messages/conversations/{id}/messages     → newest first, ?before_id= keyset
+- POST /messages/conversations/{id}/messages     → send
+- POST /messages/conversations/{id}/read         → move my read cursor
+- GET  /messages/conversations/{id}/poll         → long-poll for messages after ?after_id=
+"""
+from typing import List, Optional
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.dependencies import get_db, get_current_user
+from app.models.user import User
+from app.crud import message as crud_message
+from app.schemas.message import (
+    ConversationCreate, ConversationOut, MessageCreate, MessageOut, MessagePage, ReadCursor,
+)
+from app.utils.pubsub import broker
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+def _participant_or_404(db: Session, conversation_id: int, user: User):
+    participant = crud_message.get_participant(db, conversation_id, user.id)
+    if not participant:
+        raise HTTPException(status_code=404, detail="Conversation not found")
+    return participant
+
+
+# ===================== INBOX =====================
+@router.get("/", response_model=List[ConversationOut])
+def get_conversations(
+    before_id: Optional[int] = Query(None, description="last_message_id of the last row on the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    return crud_message.list_conversations(db, user.id, before_id=before_id, limit=limit)
+
+
+@router.get("/unread-count")
+def get_unread_count(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    return {"unread": crud_message.unread_total(db, user.id)}
+
+
+# ===================== CONVERSATIONS =====================
+@router.post("/conversations", response_model=MessageOut, status_code=status.HTTP_201_CREATED)
+def start_conversation(data: ConversationCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+    if data.recipient_id == user.id:
+        raise HTTPException(status_code=422, detail="You can't message yourself")
+    recipient = db.get(User, data.recipient_id)
+    if not recipient or not recipient.is_active:
+        raise HTTPException(status_code=404, detail="Recipient not found")
+    conversation = crud_message.get_or_create_conversation(db, user.id, recipient.id)
+    return crud_message.send_message(db, conversation.id, user.id, data.body)
+
+
+@router.get("/conversations/{conversation_id}/messages", response_model=MessagePage)
+def get_messages(
+    conversation_id: int,
+    before_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    _participant_or_404(db, conversation_id, user)
+    return crud_message.get_messages_page(db, conversation_id, before_id=before_id, limit=limit)
+
+
+@router.post("/conversations/{conversation_id}/messages", response_model=MessageOut, status_code=status.HTTP_201_CREATED)
+def send_message(
+    conversation_id: int,
+    data: MessageCreate,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    _participant_or_404(db, conversation_id, user)
+    return crud_message.send_message(db, conversation_id, user.id, data.body)
+
+
+@router.post("/conversations/{conversation_id}/read")
+def mark_read(
+    conversation_id: int,
+    data: Optional[ReadCursor] = None,
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    participant = _participant_or_404(db, conversation_id, user)
+    return {"last_read_seq": crud_message.mark_read(db, participant, data.seq if data else None)}
+
+
+# ===================== LONG-POLL =====================
+# Returns as soon as there is anything after `after_id`, or [] after `timeout`.
+@router.get("/conversations/{conversation_id}/poll", response_model=List[MessageOut])
+async def poll_messages(
+    conversation_id: int,
+    after_id: int = Query(0, ge=0),
+    timeout: float = Query(None, ge=0),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    await run_in_threadpool(_participant_or_404, db, conversation_id, user)
+    wait = min(timeout if timeout is not None else settings.MESSAGE_POLL_SECONDS, settings.MESSAGE_POLL_SECONDS)
 
-@router.get("/")
-def get_messages(user = Depends(get_current_user)):
-    return [
-        {
-            "id": 1,
-            "from": "BDR Team",
-            "subject": "Welcome to BDR!",
-            "message": "Your account has been created successfully.",
-            "sent_at": "2025-04-05T10:00:00Z",
-            "read": False
-        }
-    ]
\ No newline at end of file
+    # Subscribe before the first read, so a message sent in between still wakes us
+    try:
+        subscription = broker.subscribe(crud_message.conversation_channel(conversation_id))
+    except OverflowError:
+        raise HTTPException(status_code=503, detail="Too many open connections", headers={"Retry-After": "5"})
+    try:
+        messages = await run_in_threadpool(crud_message.get_messages_after, db, conversation_id, after_id)
+        if not messages and wait > 0:
+            # Hand the connection back to the pool while we wait: a pool's
+            # worth of idle pollers must not starve every other request.
+            # The re-read below checks one out again.
+            await run_in_threadpool(db.rollback)
+            if await subscription.get(timeout=wait) is not None:
+                messages = await run_in_threadpool(crud_message.get_messages_after, db, conversation_id, after_id)
+        return messages
+    finally:
+        subscription.close()
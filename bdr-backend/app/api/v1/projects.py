@@ -1,6 +1,9 @@
 # app/api/v1/projects.py
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, Query, Request, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import select, func
 from typing import List, Optional
 import os
 import shutil
@@ -9,7 +12,19 @@ from datetime import datetime, timedelta
 from app.dependencies import get_db, get_current_entrepreneur
 from app.models.user import User
 from app.models.project import Project, ProjectStatus
-from app.schemas.project import ProjectOut, ProjectListOut
+from app.models.transaction import Transaction
+from app.models.counter import PROJECTS_VERSION
+from app.schemas.project import ProjectOut, ProjectListOut, ProjectAnalyticsOut
+from app.crud.project_analytics import get_project_analytics
+from app.crud.counter import get_counter
+from app.utils.responses import model_response, model_list_response
+from app.utils.etag import version_etag, check_not_modified
+from app.utils.pubsub import broker, project_channel, format_sse
+from app.crud.project import funding_progress
+from app.crud.project_engagement import record_view, record_share
+from app.crud.ranking import get_trending, get_similar
+from app.utils.impact import jobs_for
+from app.core.config import settings
 
 router = APIRouter(tags=["projects"])
 
@@ -31,8 +46,6 @@ async def create_project_with_pdf(
     if not business_plan.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
 
-    jobs_to_create = funding_goal // 200000
-
     # Auto sector
     lower_title = title.lower()
     sector = "Technology & Innovation"
@@ -44,6 +57,7 @@ async def create_project_with_pdf(
         sector = "Education"
     elif any(x in lower_title for x in ["energy", "solar", "power"]):
         sector = "Renewable Energy"
+    jobs_to_create = jobs_for(funding_goal, sector)
 
     # Unique slug
     base_slug = slugify(title)
@@ -101,34 +115,137 @@ async def create_project_with_pdf(
     return project
 
 
+# Hot read paths below return model_response(): rows are validated once and
+# dumped straight to JSON bytes (response_model stays for the OpenAPI docs).
+# Detail views load the nested entrepreneur / transactions / backers up front
+# instead of one lazy load per transaction.
+def _detail_options():
+    return (
+        joinedload(Project.entrepreneur),
+        selectinload(Project.transactions).joinedload(Transaction.backer),
+    )
+
+
 # ===================== LIST ALL PROJECTS =====================
 @router.get("/", response_model=List[ProjectListOut])
-def list_projects(db: Session = Depends(get_db)):
-    return db.query(Project).all()
+def list_projects(request: Request, db: Session = Depends(get_db)):
+    # Version stamp first: a revalidating client gets 304 without loading a row.
+    # Credits show up through the backer total; days_remaining moves with the UTC date.
+    backers = db.execute(select(func.coalesce(func.sum(Project.backers_count), 0))).scalar()
+    version = get_counter(db, PROJECTS_VERSION, seed=lambda _: 1)
+    etag = version_etag("projects", f"{version}.{backers}.{datetime.utcnow():%Y%m%d}")
+    check_not_modified(request, etag)
+
+    columns = [getattr(Project, name) for name in ProjectListOut.model_fields]
+    rows = db.execute(select(*columns).order_by(Project.id)).all()
+    response = model_list_response(ProjectListOut, rows)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+# ===================== TRENDING (PUBLIC) =====================
+# Precomputed by app/jobs/rebuild_rankings.py — one join on the rank index
+@router.get("/trending", response_model=List[ProjectListOut])
+def trending_projects(limit: int = Query(10, ge=1, le=50), db: Session = Depends(get_db)):
+    columns = [getattr(Project, name) for name in ProjectListOut.model_fields]
+    return model_list_response(ProjectListOut, get_trending(db, columns, limit=limit))
+
+
+# ===================== SIMILAR PROJECTS (PUBLIC) =====================
+@router.get("/{slug}/similar", response_model=List[ProjectListOut])
+def similar_projects(slug: str, limit: int = Query(6, ge=1, le=20), db: Session = Depends(get_db)):
+    project_id = db.execute(select(Project.id).where(Project.slug == slug)).scalar()
+    if project_id is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    columns = [getattr(Project, name) for name in ProjectListOut.model_fields]
+    return model_list_response(ProjectListOut, get_similar(db, project_id, columns, limit=limit))
 
 
 # ===================== MY PROJECTS =====================
 @router.get("/my", response_model=List[ProjectOut])
 def get_my_projects(db: Session = Depends(get_db), current_user: User = Depends(get_current_entrepreneur)):
-    return db.query(Project).filter(Project.entrepreneur_id == current_user.id).all()
+    projects = db.query(Project).options(*_detail_options()).filter(Project.entrepreneur_id == current_user.id).all()
+    return model_list_response(ProjectOut, projects)
 
 
 # ===================== GET BY SLUG (PUBLIC) =====================
 @router.get("/slug/{slug}", response_model=ProjectOut)
 def get_project_by_slug(slug: str, db: Session = Depends(get_db)):
-    project = db.query(Project).filter(Project.slug == slug).first()
+    project = db.query(Project).options(*_detail_options()).filter(Project.slug == slug).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    record_view(project.id)   # buffered; no write on the read path
+    return model_response(ProjectOut, project)
 
 
 # ===================== GET BY ID (EDIT) =====================
 @router.get("/{project_id}", response_model=ProjectOut)
 def get_project_by_id(project_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_entrepreneur)):
+    project = db.query(Project).options(*_detail_options()).filter(
+        Project.id == project_id, Project.entrepreneur_id == current_user.id
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found or access denied")
+    return model_response(ProjectOut, project)
+
+
+# ===================== SHARE TRACKING (PUBLIC) =====================
+# Called by the frontend share buttons; counted like views (write-behind).
+# The PK read keeps made-up ids from filling the buffer; RateLimitMiddleware
+# ("projects.share") caps each client at a few shares per project.
+@router.post("/{project_id}/share", status_code=status.HTTP_204_NO_CONTENT)
+def track_share(project_id: int, db: Session = Depends(get_db)):
+    if db.execute(select(Project.id).where(Project.id == project_id)).scalar() is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    record_share(project_id)
+    return None
+
+
+# ===================== FUNDING ANALYTICS (OWNER ONLY) =====================
+@router.get("/{project_id}/analytics", response_model=ProjectAnalyticsOut)
+def get_project_funding_analytics(
+    project_id: int,
+    days: int = Query(365, ge=1, le=366),
+    hours: int = Query(48, ge=1, le=168),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_entrepreneur)
+):
     project = db.query(Project).filter(Project.id == project_id, Project.entrepreneur_id == current_user.id).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found or access denied")
-    return project
+    return get_project_analytics(db, project, days=days, hours=hours)
+
+
+# ===================== LIVE FUNDING STREAM (SSE, PUBLIC) =====================
+# event: progress, data: {project_id, funding, goal, progress, backers, jobs, status}
+# The current numbers are sent first, then one event per completed payment.
+@router.get("/{project_id}/stream")
+def stream_funding_progress(project_id: int, db: Session = Depends(get_db)):
+    # Subscribe before reading the snapshot, so no payment can slip in between
+    try:
+        subscription = broker.subscribe(project_channel(project_id))
+    except OverflowError:
+        raise HTTPException(status_code=503, detail="Too many live viewers right now", headers={"Retry-After": "30"})
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if not project:
+        subscription.close()
+        raise HTTPException(status_code=404, detail="Project not found")
+    snapshot = funding_progress(project)
+    heartbeat = settings.STREAM_HEARTBEAT_SECONDS
+
+    async def events():
+        yield b"retry: 5000\n\n" + format_sse("progress", snapshot)
+        while True:
+            message = await subscription.get(timeout=heartbeat)
+            yield format_sse("progress", message) if message else b": keep-alive\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        background=BackgroundTask(subscription.close),   # runs on disconnect too
+    )
 
 
 # ===================== UPDATE PROJECT (WITH PDF REPLACEMENT) =====================
@@ -163,9 +280,10 @@ async def update_project(
         project.description = description
     if funding_goal is not None:
         project.funding_goal = funding_goal
-        project.jobs_to_create = funding_goal // 200000
     if sector is not None:
         project.sector = sector
+    if funding_goal is not None or sector is not None:
+        project.jobs_to_create = jobs_for(project.funding_goal, project.sector)
 
     # Replace business plan PDF
     if business_plan:
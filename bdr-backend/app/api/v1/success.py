@@ -1,30 +1,14 @@
 # app/api/v1/success.py
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.orm import Session
+
+from ...dependencies import get_db
+from ...utils.content_store import content_store
 
 router = APIRouter(prefix="/success", tags=["Success Stories"])
 
 
+# Content lives in the page store (key "success-stories", editable by admins)
 @router.get("/")
-def get_success_stories():
-    return {
-        "stories": [
-            {
-                "id": 1,
-                "title": "Coffee Roastery in Musanze",
-                "jobs_created": 12,
-                "raised_rwf": 8_400_000,
-                "entrepreneur": "Jean Paul",
-                "image": "/success1.jpg",
-                "quote": "BDR turned my idea into 12 real jobs for youth in my village."
-            },
-            {
-                "id": 2,
-                "title": "Tech Training Hub – Kigali",
-                "jobs_created": 8,
-                "raised_rwf": 6_200_000,
-                "entrepreneur": "Aline U.",
-                "image": "/success2.jpg",
-                "quote": "We now employ 8 young developers full-time thanks to BDR backers."
-            }
-        ]
-    }
\ No newline at end of file
+def get_success_stories(request: Request, db: Session = Depends(get_db)):
+    return content_store.response(request, db, "success-stories")
@@ -1,82 +1,219 @@
 # app/api/v1/transactions.py
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+"""
+Payments
+- POST /transactions/                  → pending transaction + provider request (momo | card | bank);
+                                         send an Idempotency-Key so retries replay instead of paying twice
+- POST /transactions/basket            → several projects, one provider charge (Idempotency-Key too)
+- POST /transactions/pledges           → monthly MoMo pledge (run by app/jobs/run_pledges.py)
+- GET  /transactions/pledges/me
+- POST /transactions/pledges/{id}/cancel
+- POST /transactions/webhook/momo      → MoMo callback (MoMo sends PUT; POST accepted too),
+                                         confirmed with MoMo before anything is credited
+- POST /transactions/webhook/stripe    → Stripe checkout events
+
+Provider calls are awaited on the shared pooled client (app/utils/payments);
+DB work runs in the threadpool so the loop never blocks on the session.
+"""
+import logging
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from uuid import uuid4
+
 from ...dependencies import get_db, get_current_backer
-from ...core.config import settings
+from ...models.transaction import TransactionStatus
 from ...models.user import User
-from ...schemas.transaction import (
-    TransactionCreate, TransactionOut, PaymentInitiateResponse, TransactionListOut
+from ...schemas.transaction import TransactionCreate, PaymentInitiateResponse
+from ...crud.transaction import (
+    create_transaction, record_initiation, fail_initiation, get_by_external_id, update_transaction_status,
 )
-from ...crud.transaction import create_transaction, update_transaction_status
-from ...crud.project import get_project_by_id
-from ...utils.momo import initiate_momo_payment
-from ...utils.stripe import create_stripe_session
+from ...crud import payment as crud_payment
+from ...models.payment import PledgeStatus
+from ...schemas.payment import BasketCheckout, BasketCheckoutResponse, PledgeCreate, PledgeOut
+from ...utils.idempotency import run_idempotent
+from ...utils.payments import PaymentError, PaymentRequest, get_provider
+
+router = APIRouter(tags=["Transactions"])
+logger = logging.getLogger(__name__)
+
+# Webhook path → payment method
+WEBHOOK_PROVIDERS = {"momo": "momo", "stripe": "card"}
+
+
+def _create_pending(db: Session, transaction_in: TransactionCreate, user: User):
+    db_transaction = create_transaction(db=db, transaction_in=transaction_in, backer_id=user.id)
+    payment = PaymentRequest(
+        external_id=db_transaction.external_id,
+        amount=int(db_transaction.amount),
+        project_id=db_transaction.project_id,
+        project_title=db_transaction.project.title,
+        phone=transaction_in.momo_phone,
+        email=user.email,
+    )
+    return db_transaction, payment
 
-router = APIRouter(prefix="/transactions", tags=["Transactions"])
 
+# ===================== INITIATE =====================
 @router.post("/", response_model=PaymentInitiateResponse)
 async def initiate_payment(
     transaction_in: TransactionCreate,
-    background_tasks: BackgroundTasks,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_backer)
 ):
-    project = get_project_by_id(db, transaction_in.project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    external_id = str(uuid4())
-
-    # Create DB record first
-    db_transaction = create_transaction(
-        db=db,
-        transaction_in=transaction_in,
-        backer_id=current_user.id,
-        external_id=external_id
+    # A double-tap on a slow connection must not create two payments / two MoMo prompts
+    return await run_idempotent(
+        db, current_user.id, "payments.initiate", idempotency_key, transaction_in,
+        lambda: _initiate(transaction_in, db, current_user),
     )
 
-    jobs = (transaction_in.amount // settings.JOB_CREATION_RATE)
+
+async def _initiate(transaction_in: TransactionCreate, db: Session, current_user: User) -> PaymentInitiateResponse:
+    provider = get_provider(transaction_in.payment_method)
+    try:
+        db_transaction, payment = await run_in_threadpool(_create_pending, db, transaction_in, current_user)
+    except ValueError as e:
+        raise HTTPException(status_code=404 if "not found" in str(e) else 400, detail=str(e))
 
     try:
-        if transaction_in.payment_method == "momo":
-            result = await initiate_momo_payment(
-                amount=transaction_in.amount,
-                phone=transaction_in.phone,
-                project_id=project.id,
-                external_id=external_id
-            )
-            return PaymentInitiateResponse(
-                transaction_id=db_transaction.id,
-                momo_request_id=external_id,
-                message=result["message"],
-                jobs_to_create=jobs
-            )
-
-        elif transaction_in.payment_method == "card":
-            result = await create_stripe_session(
-                project_id=project.id,
-                amount_rwf=transaction_in.amount,
-                project_title=project.title,
-                backer_email=current_user.email
-            )
-            # Update transaction with Stripe session
-            db_transaction.stripe_session_id = result["session_id"]
-            db.commit()
-
-            return PaymentInitiateResponse(
-                transaction_id=db_transaction.id,
-                stripe_checkout_url=result["url"],
-                message="Redirecting to secure payment...",
-                jobs_to_create=jobs
-            )
-
-        elif transaction_in.payment_method == "bank":
-            return PaymentInitiateResponse(
-                transaction_id=db_transaction.id,
-                message="Bank transfer instructions sent to your email",
-                jobs_to_create=jobs
-            )
+        result = await provider.initiate(payment)
+    except PaymentError as e:
+        logger.error(f"{provider.name} initiation failed for tx {db_transaction.id}: {e}")
+        await run_in_threadpool(fail_initiation, db, db_transaction)
+        raise HTTPException(status_code=502, detail="Payment initiation failed. Try again.")
+
+    await run_in_threadpool(record_initiation, db, db_transaction, result.reference)
+    return PaymentInitiateResponse(
+        transaction_id=db_transaction.id,
+        external_id=payment.external_id,
+        payment_method=provider.name,
+        momo_request_id=result.reference if provider.name == "momo" else None,
+        checkout_url=result.checkout_url,
+        instructions=result.instructions,
+        message=result.message,
+        jobs_to_create=db_transaction.jobs_created,
+    )
+
+
+# ===================== BASKET =====================
+def _create_basket(db: Session, checkout: BasketCheckout, user: User):
+    payment = crud_payment.create_basket(
+        db, user.id, [(item.project_id, item.amount) for item in checkout.items], checkout.payment_method,
+    )
+    lines = payment.transactions
+    request = PaymentRequest(
+        external_id=payment.external_id,
+        amount=int(payment.amount),
+        project_id=None,
+        project_title=f"BDR: {len(lines)} projects",
+        phone=checkout.momo_phone,
+        email=user.email,
+    )
+    return payment, [t.id for t in lines], sum(t.jobs_created for t in lines), request
+
+
+@router.post("/basket", response_model=BasketCheckoutResponse)
+async def checkout_basket(
+    checkout: BasketCheckout,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_backer)
+):
+    return await run_idempotent(
+        db, current_user.id, "payments.basket", idempotency_key, checkout,
+        lambda: _checkout(checkout, db, current_user),
+    )
 
+
+async def _checkout(checkout: BasketCheckout, db: Session, current_user: User) -> BasketCheckoutResponse:
+    provider = get_provider(checkout.payment_method)
+    try:
+        payment, transaction_ids, jobs, request = await run_in_threadpool(_create_basket, db, checkout, current_user)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # One provider round trip (one MoMo prompt) for the whole basket
+    try:
+        result = await provider.initiate(request)
+    except PaymentError as e:
+        logger.error(f"{provider.name} initiation failed for basket payment {payment.id}: {e}")
+        await run_in_threadpool(crud_payment.fail_payment_initiation, db, payment)
+        raise HTTPException(status_code=502, detail="Payment initiation failed. Try again.")
+
+    await run_in_threadpool(crud_payment.record_payment_initiation, db, payment, result.reference)
+    return BasketCheckoutResponse(
+        payment_id=payment.id,
+        external_id=request.external_id,
+        payment_method=provider.name,
+        amount=request.amount,
+        jobs_to_create=jobs,
+        transaction_ids=transaction_ids,
+        momo_request_id=result.reference if provider.name == "momo" else None,
+        checkout_url=result.checkout_url,
+        instructions=result.instructions,
+        message=result.message,
+    )
+
+
+# ===================== PLEDGES =====================
+@router.post("/pledges", response_model=PledgeOut, status_code=status.HTTP_201_CREATED)
+def create_pledge(data: PledgeCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_backer)):
+    try:
+        return crud_payment.create_pledge(
+            db, current_user.id, [(item.project_id, item.amount) for item in data.items],
+            data.momo_phone, day_of_month=data.day_of_month,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/pledges/me", response_model=List[PledgeOut])
+def my_pledges(db: Session = Depends(get_db), current_user: User = Depends(get_current_backer)):
+    return crud_payment.get_user_pledges(db, current_user.id)
+
+
+@router.post("/pledges/{pledge_id}/cancel", response_model=PledgeOut)
+def cancel_pledge(pledge_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_backer)):
+    pledge = crud_payment.get_pledge(db, pledge_id)
+    if not pledge or pledge.backer_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Pledge not found")
+    if pledge.status == PledgeStatus.cancelled:
+        return pledge
+    return crud_payment.cancel_pledge(db, pledge)
+
+
+# ===================== WEBHOOKS =====================
+@router.api_route("/webhook/{source}", methods=["POST", "PUT"])
+async def payment_webhook(source: str, request: Request, db: Session = Depends(get_db)):
+    if source not in WEBHOOK_PROVIDERS:
+        raise HTTPException(status_code=404, detail="Unknown payment provider")
+    provider = get_provider(WEBHOOK_PROVIDERS[source])
+
+    body = await request.body()
+    try:
+        event = provider.parse_webhook(body, request.headers)
+    except PaymentError as e:
+        logger.warning(f"Rejected {source} webhook: {e}")
+        raise HTTPException(status_code=400, detail="Invalid webhook")
+    if event is None:
+        return {"status": "ignored"}
+
+    # Unknown references still get a 2xx, so the provider stops retrying them
+    # Single backings and basket payments share the path (keyed by external_id)
+    settled = await run_in_threadpool(get_by_external_id, db, event.external_id)
+    if settled is None:
+        return {"status": "unknown"}
+    if settled.status != TransactionStatus.pending:
+        return {"status": settled.status.value}
+
+    try:
+        event = await provider.confirm(event, settled.provider_ref)
+    except PaymentError as e:
+        logger.warning(f"Could not confirm {source} webhook for {settled.external_id}: {e}")
+        raise HTTPException(status_code=502, detail="Could not confirm payment with the provider")
+    if event is None:
+        return {"status": "pending"}       # reconciliation settles it once the provider does
+
+    settled = await run_in_threadpool(update_transaction_status, db, event.external_id, event.provider_ref, event.status)
+    return {"status": settled.status.value}
@@ -13,7 +13,8 @@ class Settings(BaseSettings):
 
     FRONTEND_URL: str = os.environ.get("FRONTEND_URL", "http://localhost:3000")
     DEBUG: bool = os.environ.get("DEBUG", "True").lower() == "true"
-    JOB_CREATION_RATE: int = 10000
+    JOB_CREATION_RATE: int = 10000         # base RWF per job; dated / per-sector rates: app/utils/impact.py
+    IMPACT_RATES_FILE: Optional[str] = None    # default app/content/impact_rates.json
 
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
@@ -27,10 +28,114 @@ class Settings(BaseSettings):
     MOMO_API_USER: Optional[str] = None
     MOMO_API_KEY: Optional[str] = None
     MOMO_SUBSCRIPTION_KEY: Optional[str] = None
+    MOMO_BASE_URL: Optional[str] = None    # default: MTN sandbox / live proxy by MOMO_ENV
+    MOMO_CALLBACK_URL: Optional[str] = None
+    MOMO_CURRENCY: str = "RWF"             # the MTN sandbox only accepts "EUR"
+    MOMO_WEBHOOK_SECRET: Optional[str] = None   # HMAC of callback bodies (X-Signature); required once MoMo is configured
 
     # --- Stripe (optional too) ---
     STRIPE_SECRET_KEY: Optional[str] = ""
     STRIPE_WEBHOOK_SECRET: Optional[str] = ""
+    STRIPE_API_BASE: str = "https://api.stripe.com"
+
+    # --- Bank transfer ---
+    BANK_TRANSFER_DETAILS: str = "Bank of Kigali, account 000-0000000-00 (Beyond Degrees Rwanda)."
+
+    # --- Shared payment HTTP client (one pool per worker) ---
+    PAYMENT_HTTP_TIMEOUT_SECONDS: float = 15.0
+    PAYMENT_HTTP_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    PAYMENT_HTTP_MAX_CONNECTIONS: int = 50
+    PAYMENT_HTTP_MAX_KEEPALIVE: int = 20
+    PAYMENT_HTTP_KEEPALIVE_SECONDS: float = 60.0
+    PAYMENT_HTTP2: bool = True             # used when the h2 package is installed
+
+    # --- Idempotency-Key (payment initiation) ---
+    IDEMPOTENCY_TTL_HOURS: int = 24        # how long a key's response is replayed
+    IDEMPOTENCY_WAIT_SECONDS: float = 10.0 # a duplicate waits this long for the first request
+    IDEMPOTENCY_LEASE_SECONDS: float = 120.0  # an unfinished request's key can be taken over after this
+
+    # --- Monthly pledges (app/jobs/run_pledges.py) ---
+    PLEDGE_BATCH_SIZE: int = 100
+    PLEDGE_CONCURRENCY: int = 10           # MoMo prompts in flight at once
+    PLEDGE_INTERVAL_SECONDS: float = 600.0 # --loop mode
+
+    # --- Payment reconciliation (app/jobs/reconcile_payments.py) ---
+    RECONCILE_AFTER_MINUTES: int = 15      # pending this long without a callback → ask the provider
+    RECONCILE_GIVE_UP_HOURS: int = 24      # still pending after this → failed
+    RECONCILE_BATCH_SIZE: int = 100
+    RECONCILE_CONCURRENCY: int = 10        # provider status calls in flight at once
+    RECONCILE_MAX_PER_RUN: int = 5000
+    RECONCILE_INTERVAL_SECONDS: float = 300.0   # --loop mode
+
+    # --- Transaction ledger archival ---
+    ARCHIVE_AFTER_DAYS: int = 180          # settled rows older than this leave the hot table
+    COLD_STORAGE_AFTER_DAYS: int = 730     # archived months older than this go to files
+    ARCHIVE_BATCH_SIZE: int = 1000
+    ARCHIVE_DIR: str = "archive/transactions"
+    ARCHIVE_FORMAT: str = "jsonl"          # "jsonl" (gzip) or "parquet" (needs pyarrow)
+
+    # --- Rate limiting (memory per process, or redis shared) ---
+    RATE_LIMIT_BACKEND: str = "memory"     # "memory" or "redis" (needs redis package)
+    REDIS_URL: Optional[str] = None
+    TRUSTED_PROXY_HOPS: int = 0            # proxies in front of us appending X-Forwarded-For (Render: 1); 0 = socket peer
+    RATE_LIMIT_ENABLED: bool = True        # per-route limits in app/middleware/rate_limit.py
+
+    # --- Load shedding (fast 503 instead of a pile-up) ---
+    MAX_IN_FLIGHT: int = 200
+    MAX_LOOP_LAG_MS: int = 500
+    SHED_RETRY_AFTER_SECONDS: int = 2
+
+    # --- Contact form ingestion ---
+    CONTACT_IP_BURST: int = 5
+    CONTACT_IP_PER_HOUR: int = 20
+    CONTACT_EMAIL_BURST: int = 3
+    CONTACT_EMAIL_PER_HOUR: int = 5
+    CONTACT_DUPLICATE_WINDOW_SECONDS: int = 3600
+    CONTACT_SPAM_THRESHOLD: int = 60       # score ≥ this → stored archived, no emails
+    EMAIL_QUEUE_MAXSIZE: int = 1000
+
+    # --- Metrics / instrumentation ---
+    METRICS_TOKEN: Optional[str] = None    # GET /metrics needs "Authorization: Bearer <token>"; unset → DEBUG only
+    SLOW_QUERY_MS: int = 0                 # > 0 logs statements slower than this (logger "bdr.slow_query")
+
+    # --- Profiling (admin on-demand via X-Profile: 1 or ?profile=1) ---
+    PROFILE_SAMPLE_RATE: float = 0.0       # fraction of requests silently profiled (0 = off)
+    PROFILE_SLOWEST_PER_ROUTE: int = 5     # sampled profiles kept per route (slowest win)
+    PROFILE_ON_DEMAND_KEEP: int = 50
+    PROFILE_INTERVAL_MS: int = 5
+
+    # --- Response compression (brotli if installed, else gzip) ---
+    COMPRESSION_MIN_BYTES: int = 1024
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5
+
+    # --- Page content (seeded from app/content/pages, edited via admin) ---
+    PAGES_REFRESH_SECONDS: float = 5.0     # max staleness of other workers after an edit
+
+    # --- Mentor bookings ---
+    MENTOR_SCHEDULE_TTL_SECONDS: float = 30.0  # per-mentor booking index reload interval
+    MENTOR_BOOKING_WEEKS_AHEAD: int = 8        # how far ahead slots can be booked
+
+    # --- Live funding streams (SSE) ---
+    PUBSUB_BACKEND: str = "memory"         # "memory" (one worker) or "redis" (uses REDIS_URL)
+    STREAM_MAX_SUBSCRIBERS: int = 1000     # open streams per worker before 503
+    STREAM_QUEUE_SIZE: int = 16            # per-subscriber backlog; oldest dropped first
+    STREAM_HEARTBEAT_SECONDS: float = 15.0
+    MESSAGE_POLL_SECONDS: float = 25.0     # max long-poll wait (stay under proxy idle timeouts)
+
+    # --- Project views / shares (write-behind) + trending decay ---
+    ENGAGEMENT_FLUSH_SECONDS: float = 5.0  # also the most a crashed worker can lose
+    ENGAGEMENT_BUFFER_SHARDS: int = 16
+    ENGAGEMENT_BUFFER_MAX_KEYS: int = 50000    # projects pending per worker before increments drop
+    TRENDING_HALF_LIFE_HOURS: float = 24.0
+    TRENDING_SHARE_WEIGHT: float = 5.0     # one share counts as this many views
+    TRENDING_DECAY_INTERVAL_SECONDS: float = 600.0  # app/jobs/decay_trending.py --loop
+
+    # --- Trending / similar projects (app/jobs/rebuild_rankings.py) ---
+    RANKING_WINDOW_DAYS: int = 7           # funding velocity + recent backings look back this far
+    RANKING_SIMILAR_PER_PROJECT: int = 6
+    RANKING_MAX_TERMS: int = 2000          # TF-IDF vocabulary cap (memory is projects × terms)
+    RANKING_INTERVAL_SECONDS: float = 900.0    # --loop mode
 
     ALLOWED_HOSTS: List[str] = ["localhost", "127.0.0.1"]
     LOG_LEVEL: str = "INFO"
@@ -0,0 +1,194 @@
+# app/crud/backer_stats.py
+"""
+BDR – Backer dashboard CRUD
+- record_contribution()      → incremental rollup update (webhook path)
+- get_backer_stats()         → O(1) dashboard read
+- get_contribution_history() → keyset page, project titles joined in one query
+- rebuild_backer_stats()     → full recompute (backfill / repair)
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete, insert, func, cast, String, union_all, literal
+from typing import Optional, List, Dict
+from datetime import datetime
+
+from ..models.backer_stats import BackerStats, BackerProject
+from ..models.transaction import Transaction, TransactionArchive, TransactionColdSummary, TransactionStatus
+from ..models.project import Project
+from ..models.user import User
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Incremental update — called inside the webhook's DB transaction (no commit)
+# ─────────────────────────────────────────────────────────────────────────────
+def record_contribution(db: Session, transaction: Transaction) -> None:
+    backer_id = transaction.backer_id
+    amount = transaction.amount
+    jobs = transaction.jobs_created or 0
+    now = datetime.utcnow()
+
+    # First backing of this project by this backer?
+    new_project = False
+    pair = db.get(BackerProject, (backer_id, transaction.project_id))
+    if pair:
+        pair.total_rwf = BackerProject.total_rwf + amount
+    else:
+        try:
+            with db.begin_nested():
+                db.add(BackerProject(
+                    backer_id=backer_id,
+                    project_id=transaction.project_id,
+                    total_rwf=amount,
+                ))
+            new_project = True
+        except IntegrityError:
+            # Concurrent first backing already inserted the pair
+            db.execute(
+                update(BackerProject)
+                .where(BackerProject.backer_id == backer_id, BackerProject.project_id == transaction.project_id)
+                .values(total_rwf=BackerProject.total_rwf + amount)
+            )
+
+    # Atomic increments — no read-modify-write on the rollup row
+    values = dict(
+        total_rwf=BackerStats.total_rwf + amount,
+        jobs_created=BackerStats.jobs_created + jobs,
+        projects_backed=BackerStats.projects_backed + (1 if new_project else 0),
+        contributions_count=BackerStats.contributions_count + 1,
+        last_backed_at=now,
+    )
+    result = db.execute(update(BackerStats).where(BackerStats.backer_id == backer_id).values(**values))
+    if result.rowcount:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(BackerStats(
+                backer_id=backer_id,
+                total_rwf=amount,
+                jobs_created=jobs,
+                projects_backed=1 if new_project else 0,
+                contributions_count=1,
+                last_backed_at=now,
+            ))
+    except IntegrityError:
+        db.execute(update(BackerStats).where(BackerStats.backer_id == backer_id).values(**values))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reads
+# ─────────────────────────────────────────────────────────────────────────────
+def get_backer_stats(db: Session, backer_id: int) -> Optional[BackerStats]:
+    return db.get(BackerStats, backer_id)
+
+
+def get_contribution_history(
+    db: Session,
+    backer_id: int,
+    before_id: Optional[int] = None,
+    limit: int = 20
+) -> List[Dict]:
+    """
+    Newest first, hot + archived rows, one round trip.
+    Pass the last `id` of the previous page as `before_id`.
+    """
+    hot = (
+        select(
+            Transaction.id,
+            Transaction.amount,
+            Transaction.jobs_created,
+            cast(Transaction.status, String).label("status"),
+            Transaction.project_id,
+            Transaction.created_at.label("initiated_at"),
+        )
+        .where(Transaction.backer_id == backer_id)
+    )
+    archived = (
+        select(
+            TransactionArchive.id,
+            TransactionArchive.amount,
+            TransactionArchive.jobs_created,
+            TransactionArchive.status,
+            TransactionArchive.project_id,
+            TransactionArchive.created_at.label("initiated_at"),
+        )
+        .where(TransactionArchive.backer_id == backer_id)
+    )
+    if before_id:
+        hot = hot.where(Transaction.id < before_id)
+        archived = archived.where(TransactionArchive.id < before_id)
+
+    # Each branch is bounded by the (backer_id, id) index before the union
+    hot = hot.order_by(Transaction.id.desc()).limit(limit).subquery()
+    archived = archived.order_by(TransactionArchive.id.desc()).limit(limit).subquery()
+    page = union_all(select(hot), select(archived)).subquery()
+
+    rows = db.execute(
+        select(
+            page.c.id,
+            page.c.amount,
+            page.c.jobs_created,
+            page.c.status,
+            page.c.initiated_at,
+            func.coalesce(Project.title, literal("Deleted project")).label("project_title"),
+        )
+        .outerjoin(Project, Project.id == page.c.project_id)
+        .order_by(page.c.id.desc())
+        .limit(limit)
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Full rebuild
+# ─────────────────────────────────────────────────────────────────────────────
+def rebuild_backer_stats(db: Session, backer_id: Optional[int] = None) -> int:
+    """
+    Recompute rollups from completed transactions (hot + archive + cold
+    summaries). Used for the initial backfill and to repair drift.
+    Archived rows of deleted users / projects are skipped (the rollups
+    have FKs).
+    """
+    completed = TransactionStatus.completed.value
+    ledger = union_all(
+        select(Transaction.backer_id, Transaction.project_id, Transaction.amount, Transaction.jobs_created,
+               literal(1).label("contributions"), Transaction.created_at.label("first_at"),
+               Transaction.created_at.label("last_at"))
+        .where(Transaction.status == TransactionStatus.completed),
+        select(TransactionArchive.backer_id, TransactionArchive.project_id, TransactionArchive.amount,
+               TransactionArchive.jobs_created, literal(1), TransactionArchive.created_at,
+               TransactionArchive.created_at)
+        .where(TransactionArchive.status == completed),
+        select(TransactionColdSummary.backer_id, TransactionColdSummary.project_id, TransactionColdSummary.amount,
+               TransactionColdSummary.jobs_created, TransactionColdSummary.contributions,
+               TransactionColdSummary.first_backed_at, TransactionColdSummary.last_backed_at),
+    ).subquery()
+    if backer_id is not None:
+        ledger = select(ledger).where(ledger.c.backer_id == backer_id).subquery()
+
+    pair_filter = [] if backer_id is None else [BackerProject.backer_id == backer_id]
+    stats_filter = [] if backer_id is None else [BackerStats.backer_id == backer_id]
+    db.execute(delete(BackerProject).where(*pair_filter))
+    db.execute(delete(BackerStats).where(*stats_filter))
+
+    db.execute(insert(BackerProject).from_select(
+        ["backer_id", "project_id", "total_rwf", "first_backed_at"],
+        select(ledger.c.backer_id, ledger.c.project_id,
+               func.sum(ledger.c.amount), func.min(ledger.c.first_at))
+        .where(ledger.c.backer_id.in_(select(User.id)), ledger.c.project_id.in_(select(Project.id)))
+        .group_by(ledger.c.backer_id, ledger.c.project_id)
+    ))
+    db.execute(insert(BackerStats).from_select(
+        ["backer_id", "total_rwf", "jobs_created", "projects_backed", "contributions_count", "last_backed_at"],
+        select(ledger.c.backer_id,
+               func.sum(ledger.c.amount),
+               func.coalesce(func.sum(ledger.c.jobs_created), 0),
+               func.count(func.distinct(ledger.c.project_id)),
+               func.sum(ledger.c.contributions),
+               func.max(ledger.c.last_at))
+        .where(ledger.c.backer_id.in_(select(User.id)))
+        .group_by(ledger.c.backer_id)
+    ))
+    db.commit()
+    return db.query(BackerStats).filter(*stats_filter).count()
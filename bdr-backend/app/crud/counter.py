@@ -0,0 +1,49 @@
+# app/crud/counter.py
+"""
+BDR – Counter CRUD
+increment() never commits — it joins the caller's DB transaction, so the
+counter moves together with the rows it counts.
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import update
+from typing import Callable, Optional
+
+from ..models.counter import Counter
+
+
+def increment(db: Session, name: str, delta: int = 1) -> None:
+    if not delta:
+        return
+    # If the row doesn't exist yet this is a no-op on purpose: get_counter()
+    # seeds it from a real count, otherwise the first delta would become the value.
+    db.execute(update(Counter).where(Counter.name == name).values(value=Counter.value + delta))
+
+
+def get_counter(db: Session, name: str, seed: Optional[Callable[[Session], int]] = None) -> int:
+    """
+    Read a counter. If the row doesn't exist yet and `seed` is given,
+    compute the true value once and store it.
+    """
+    counter = db.get(Counter, name)
+    if counter:
+        return int(counter.value)
+    if seed is None:
+        return 0
+    return set_counter(db, name, seed(db))
+
+
+def set_counter(db: Session, name: str, value: int) -> int:
+    """Overwrite a counter (seeding / drift repair). Commits."""
+    try:
+        with db.begin_nested():
+            counter = db.get(Counter, name)
+            if counter:
+                counter.value = value
+            else:
+                db.add(Counter(name=name, value=value))
+    except IntegrityError:
+        db.execute(update(Counter).where(Counter.name == name).values(value=value))
+    db.commit()
+    return value
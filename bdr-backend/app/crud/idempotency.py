@@ -0,0 +1,116 @@
+# app/crud/idempotency.py
+"""
+BDR – Idempotency key CRUD
+- claim()          → insert the key (we run the request), take over an expired
+                     lease, or return the existing row
+- get()            → fresh read of a key (waiting duplicates poll this)
+- complete()       → store the response for replays
+- fail()           → store an error response (the session may need a rollback first)
+- release()        → drop the key after a failure, so a retry can run again
+                     (only for failures before any provider call)
+- purge_expired()  → TTL cleanup in batches
+"""
+
+import json
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import select, delete, update, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.idempotency import IdempotencyKey, IN_PROGRESS, COMPLETED
+
+
+def get(db: Session, user_id: int, scope: str, key: str) -> Optional[IdempotencyKey]:
+    db.commit()   # end any open read transaction, so we see other workers' commits
+    return db.execute(
+        select(IdempotencyKey).where(
+            IdempotencyKey.user_id == user_id, IdempotencyKey.scope == scope, IdempotencyKey.key == key
+        ).execution_options(populate_existing=True)
+    ).scalar_one_or_none()
+
+
+def _take_over(db: Session, record: IdempotencyKey, now: datetime, lease: timedelta) -> bool:
+    """Renew a lapsed lease; the conditional UPDATE lets only one duplicate win it."""
+    result = db.execute(
+        update(IdempotencyKey)
+        .where(
+            IdempotencyKey.id == record.id,
+            IdempotencyKey.state == IN_PROGRESS,
+            or_(IdempotencyKey.locked_until.is_(None), IdempotencyKey.locked_until <= now),
+        )
+        .values(locked_until=now + lease)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def claim(
+    db: Session, user_id: int, scope: str, key: str, request_hash: str, ttl: timedelta, lease: timedelta,
+) -> Tuple[IdempotencyKey, bool]:
+    """(row, True) if this request now owns the key; (existing row, False) otherwise."""
+    now = datetime.utcnow()
+    existing = get(db, user_id, scope, key)
+    if existing and existing.expires_at <= now:
+        # Expired but not purged yet
+        db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == existing.id))
+        db.commit()
+        existing = None
+    if existing:
+        # The owner died mid-request (crash, deploy): same request → run it here instead
+        if (existing.state == IN_PROGRESS and existing.request_hash == request_hash
+                and (existing.locked_until is None or existing.locked_until <= now)
+                and _take_over(db, existing, now, lease)):
+            db.refresh(existing)
+            return existing, True
+        return existing, False
+
+    record = IdempotencyKey(
+        user_id=user_id, scope=scope, key=key, request_hash=request_hash,
+        locked_until=now + lease, expires_at=now + ttl,
+    )
+    try:
+        with db.begin_nested():
+            db.add(record)
+        db.commit()
+    except IntegrityError:
+        # A duplicate inserted first; on Postgres our INSERT waited for its commit
+        existing = get(db, user_id, scope, key)
+        if existing is None:     # ...and it already failed and released the key
+            return claim(db, user_id, scope, key, request_hash, ttl, lease)
+        return existing, False
+    return record, True
+
+
+def complete(db: Session, record: IdempotencyKey, status_code: int, body: Any) -> None:
+    record.state = COMPLETED
+    record.locked_until = None
+    record.response_status = status_code
+    record.response_body = json.dumps(body, separators=(",", ":"), default=str)
+    db.commit()
+
+
+def fail(db: Session, record: IdempotencyKey, status_code: int, body: Any) -> None:
+    db.rollback()
+    complete(db, record, status_code, body)
+
+
+def release(db: Session, record: IdempotencyKey) -> None:
+    db.execute(delete(IdempotencyKey).where(IdempotencyKey.id == record.id))
+    db.commit()
+
+
+def purge_expired(db: Session, now: Optional[datetime] = None, batch_size: int = 1000) -> int:
+    now = now or datetime.utcnow()
+    removed = 0
+    while True:
+        ids = db.execute(
+            select(IdempotencyKey.id).where(IdempotencyKey.expires_at <= now).limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return removed
+        db.execute(delete(IdempotencyKey).where(IdempotencyKey.id.in_(ids)))
+        db.commit()
+        removed += len(ids)
@@ -0,0 +1,100 @@
+# app/crud/impact.py
+"""
+BDR – Job-impact backfill
+- backfill_jobs_created() → recompute transactions.jobs_created (hot or
+                            archive) at the rates in app/utils/impact.py
+- rebuild_project_jobs()  → projects.jobs_created = sum over their completed
+                            backings (hot + archive + cold summaries),
+                            bumping the list version
+
+Walks the table by id in batches: one read (sector joined in), one
+jobs_bulk() call and one executemany UPDATE of the rows whose value
+actually changed, then a commit — so a long backfill never holds a big
+transaction open and can simply be re-run after an interruption.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import select, update, bindparam, func
+from sqlalchemy.orm import Session
+
+from ..models.counter import Counter, PROJECTS_VERSION
+from ..models.project import Project
+from ..models.transaction import Transaction, TransactionArchive, TransactionColdSummary, TransactionStatus
+from ..utils.impact import RateTable, jobs_bulk, rate_table
+
+logger = logging.getLogger(__name__)
+
+
+def backfill_jobs_created(
+    db: Session,
+    model=Transaction,
+    batch_size: int = 1000,
+    table: Optional[RateTable] = None,
+) -> int:
+    """`model` is Transaction or TransactionArchive. Returns rows changed."""
+    table = table or rate_table()
+    ledger = model.__table__
+    stmt = update(ledger).where(ledger.c.id == bindparam("tx_id"))
+    if model is TransactionArchive:
+        # Partitioned by created_at on Postgres: the full key prunes to one partition
+        stmt = stmt.where(ledger.c.created_at == bindparam("tx_created_at"))
+    stmt = stmt.values(jobs_created=bindparam("jobs"))
+
+    changed = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(model.id, model.amount, model.created_at, model.jobs_created, Project.sector)
+            .outerjoin(Project, Project.id == model.project_id)       # deleted project → default rate
+            .where(model.id > last_id)
+            .order_by(model.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        jobs = jobs_bulk([r.amount for r in rows], [r.sector for r in rows], [r.created_at for r in rows], table=table)
+        updates = [
+            {"tx_id": r.id, "tx_created_at": r.created_at, "jobs": int(n)}
+            for r, n in zip(rows, jobs)
+            if (r.jobs_created or 0) != n
+        ]
+        if updates:
+            db.execute(stmt, updates)
+            changed += len(updates)
+        db.commit()
+    logger.info(f"{ledger.name}: jobs_created changed on {changed} row(s)")
+    return changed
+
+
+def rebuild_project_jobs(db: Session) -> int:
+    """Recompute every project's jobs_created from the ledger. Commits. Returns projects changed."""
+    # Credits add to jobs_created under the project's row lock: take every
+    # lock first, so the totals below already include any credit that got
+    # in ahead of us and none can commit in between (no-op on SQLite)
+    db.execute(select(Project.id).with_for_update()).all()
+
+    def ledger_jobs(model, *where):
+        return func.coalesce(
+            select(func.sum(model.jobs_created)).where(model.project_id == Project.id, *where).scalar_subquery(), 0
+        )
+
+    total = (
+        ledger_jobs(Transaction, Transaction.status == TransactionStatus.completed)
+        + ledger_jobs(TransactionArchive, TransactionArchive.status == TransactionStatus.completed.value)
+        + ledger_jobs(TransactionColdSummary)
+    )
+    # One correlated UPDATE: each row gets its own sum, written only where it differs
+    changed = db.execute(
+        update(Project).where(Project.jobs_created != total).values(jobs_created=total)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if changed:
+        # Core-style UPDATE: the flush hook doesn't see it, so invalidate list ETags here
+        db.execute(update(Counter).where(Counter.name == PROJECTS_VERSION).values(value=Counter.value + 1))
+    db.commit()
+    logger.info(f"projects: jobs_created changed on {changed} project(s)")
+    return changed
@@ -0,0 +1,184 @@
+# app/crud/mentor.py
+"""
+BDR – Mentor CRUD
+- get_mentors() / get_mentor_by_slug() / get_mentor_by_user()
+- load_live_bookings()  → (start, end) of a mentor's upcoming bookings,
+                          one range scan on the live-slot index
+- create_booking()      → INSERT; a taken slot raises IntegrityError (commits)
+- cancel_booking()      → frees the slot for re-booking (commits)
+- set_availability()    → replace a mentor's weekly windows (commits);
+                          refused while upcoming bookings are off the new grid
+- seed_mentors()        → directory seed from app/content/mentors.json
+"""
+
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from ..models.mentor import MentorProfile, MentorAvailability, MentorBooking, BookingStatus
+from ..models.notification import Notification, NotificationType
+from ..utils.mentor_schedule import parse_hhmm, format_hhmm, slot_on_grid
+
+SEED_FILE = Path(__file__).resolve().parent.parent / "content" / "mentors.json"
+
+
+def get_mentors(db: Session, expertise: Optional[str] = None) -> List[MentorProfile]:
+    query = (
+        select(MentorProfile)
+        .options(selectinload(MentorProfile.availability))
+        .order_by(MentorProfile.id)
+    )
+    if expertise:
+        # Expertise is a small JSON list; a LIKE on the quoted value is enough here
+        query = query.where(MentorProfile.expertise.like(f"%{json.dumps(expertise, ensure_ascii=False)}%"))
+    return list(db.execute(query).scalars())
+
+
+def get_mentor_by_slug(db: Session, slug: str) -> Optional[MentorProfile]:
+    return db.execute(
+        select(MentorProfile)
+        .options(selectinload(MentorProfile.availability))
+        .where(MentorProfile.slug == slug)
+    ).scalar_one_or_none()
+
+
+def get_mentor_by_user(db: Session, user_id: int) -> Optional[MentorProfile]:
+    return db.execute(select(MentorProfile).where(MentorProfile.user_id == user_id)).scalar_one_or_none()
+
+
+def load_live_bookings(db: Session, mentor_id: int, since: datetime) -> List[Tuple[datetime, datetime]]:
+    rows = db.execute(
+        select(MentorBooking.starts_at, MentorBooking.ends_at)
+        .where(
+            MentorBooking.mentor_id == mentor_id,
+            MentorBooking.starts_at >= since,
+            MentorBooking.status != BookingStatus.cancelled,
+        )
+        .order_by(MentorBooking.starts_at)
+    ).all()
+    return [(row.starts_at, row.ends_at) for row in rows]
+
+
+def create_booking(
+    db: Session,
+    mentor: MentorProfile,
+    user_id: int,
+    starts_at: datetime,
+    topic: Optional[str] = None
+) -> MentorBooking:
+    """
+    No availability read first — the partial unique index on
+    (mentor_id, starts_at) rejects a second live booking of the slot.
+    The mentor's notification commits with the booking.
+    """
+    booking = MentorBooking(
+        mentor_id=mentor.id,
+        user_id=user_id,
+        starts_at=starts_at,
+        ends_at=starts_at + timedelta(minutes=mentor.slot_minutes),
+        topic=topic,
+        status=BookingStatus.pending,
+    )
+    db.add(booking)
+    if mentor.user_id:
+        db.add(Notification(
+            user_id=mentor.user_id,
+            title="New Mentorship Booking",
+            message=f"Session booked for {starts_at:%a %d %b, %H:%M} UTC" + (f" — {topic}" if topic else ""),
+            type=NotificationType.booking_request,
+            data=json.dumps({"mentor_id": mentor.id, "starts_at": starts_at.isoformat()}),
+        ))
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def get_booking(db: Session, booking_id: int) -> Optional[MentorBooking]:
+    return db.get(MentorBooking, booking_id)
+
+
+def cancel_booking(db: Session, booking: MentorBooking) -> MentorBooking:
+    booking.status = BookingStatus.cancelled
+    booking.cancelled_at = datetime.utcnow()
+    db.commit()
+    db.refresh(booking)
+    return booking
+
+
+def get_user_bookings(db: Session, user_id: int, mentor_id: Optional[int] = None, limit: int = 100) -> List[MentorBooking]:
+    """Bookings the user made — plus, for a mentor, bookings made with them."""
+    condition = MentorBooking.user_id == user_id
+    if mentor_id is not None:
+        condition = condition | (MentorBooking.mentor_id == mentor_id)
+    return list(db.execute(
+        select(MentorBooking).where(condition).order_by(MentorBooking.starts_at.desc()).limit(limit)
+    ).scalars())
+
+
+def availability_windows(mentor: MentorProfile) -> List[Dict[str, Any]]:
+    return [
+        {"weekday": w.weekday, "start": format_hhmm(w.start_minute), "end": format_hhmm(w.end_minute)}
+        for w in mentor.availability
+    ]
+
+
+class AvailabilityConflict(ValueError):
+    """Upcoming live bookings would fall off the new slot grid."""
+
+
+def set_availability(db: Session, mentor: MentorProfile, windows: List[Dict[str, Any]]) -> MentorProfile:
+    """
+    `windows`: [{"weekday", "start": "HH:MM", "end": "HH:MM"}]. Windows on
+    the same day must not overlap, otherwise their slot grids could.
+    Every upcoming live booking must still start on the new grid — a moved
+    grid would let new slots overlap it with a different start time.
+    """
+    parsed = sorted((w["weekday"], parse_hhmm(w["start"]), parse_hhmm(w["end"])) for w in windows)
+    for (day_a, _, end_a), (day_b, start_b, _) in zip(parsed, parsed[1:]):
+        if day_a == day_b and start_b < end_a:
+            raise ValueError("Availability windows overlap")
+    new_windows = [
+        MentorAvailability(weekday=day, start_minute=start, end_minute=end)
+        for day, start, end in parsed
+    ]
+    grid = SimpleNamespace(timezone=mentor.timezone, slot_minutes=mentor.slot_minutes, availability=new_windows)
+    stranded = [
+        start for start, _ in load_live_bookings(db, mentor.id, since=datetime.utcnow())
+        if not slot_on_grid(grid, start)
+    ]
+    if stranded:
+        raise AvailabilityConflict(
+            f"{len(stranded)} upcoming booking(s) fall outside the new availability, "
+            f"first at {stranded[0]:%a %d %b, %H:%M} UTC — cancel them first"
+        )
+    mentor.availability = new_windows
+    db.commit()
+    db.refresh(mentor)
+    return mentor
+
+
+def seed_mentors(db: Session, seed_file: Path = SEED_FILE) -> int:
+    """Insert seed mentors missing by slug. Returns how many were added."""
+    seed = json.loads(seed_file.read_text(encoding="utf-8"))
+    existing = set(db.execute(select(MentorProfile.slug)).scalars())
+    added = 0
+    for entry in seed["mentors"]:
+        if entry["slug"] in existing:
+            continue
+        fields = dict(entry)
+        windows = fields.pop("availability", seed.get("default_availability", []))
+        fields["expertise"] = json.dumps(fields.get("expertise", []), ensure_ascii=False)
+        mentor = MentorProfile(**fields)
+        mentor.availability = [
+            MentorAvailability(weekday=w["weekday"], start_minute=parse_hhmm(w["start"]), end_minute=parse_hhmm(w["end"]))
+            for w in windows
+        ]
+        db.add(mentor)
+        added += 1
+    db.commit()
+    return added
@@ -0,0 +1,164 @@
+# app/crud/message.py
+"""
+BDR – Direct message CRUD
+- get_or_create_conversation() → one conversation per pair, race-safe via pair_key
+- send_message()               → next seq + insert + conversation pointer (commits)
+- list_conversations()         → inbox with last message + unread, one query
+- unread_total()               → Σ(last_seq - last_read_seq) over my conversations
+- get_messages_page()          → newest first, keyset on (conversation_id, id)
+- get_messages_after()         → oldest first after an id (long-poll catch-up)
+- mark_read()                  → move my read cursor forward (never back)
+"""
+
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, update, func, and_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from ..models.message import Conversation, ConversationParticipant, Message, pair_key
+from ..models.user import User
+from ..utils.pagination import paginate
+from ..utils.pubsub import broker
+
+MESSAGE_COLUMNS = (Message.id, Message.conversation_id, Message.sender_id, Message.seq, Message.body, Message.created_at)
+
+
+def conversation_channel(conversation_id: int) -> str:
+    return f"conversation:{conversation_id}"
+
+
+def get_participant(db: Session, conversation_id: int, user_id: int) -> Optional[ConversationParticipant]:
+    return db.get(ConversationParticipant, (conversation_id, user_id))
+
+
+def get_or_create_conversation(db: Session, user_id: int, other_id: int) -> Conversation:
+    key = pair_key(user_id, other_id)
+    conversation = db.execute(select(Conversation).where(Conversation.pair_key == key)).scalar_one_or_none()
+    if conversation:
+        return conversation
+    try:
+        with db.begin_nested():
+            conversation = Conversation(pair_key=key)
+            conversation.participants = [
+                ConversationParticipant(user_id=user_id),
+                ConversationParticipant(user_id=other_id),
+            ]
+            db.add(conversation)
+    except IntegrityError:
+        # Both users opened the conversation at the same moment
+        conversation = db.execute(select(Conversation).where(Conversation.pair_key == key)).scalar_one()
+    return conversation
+
+
+def send_message(db: Session, conversation_id: int, sender_id: int, body: str) -> Message:
+    # The UPDATE takes the conversation row lock, so seqs are handed out one at a time
+    db.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(last_seq=Conversation.last_seq + 1)
+    )
+    seq = db.execute(select(Conversation.last_seq).where(Conversation.id == conversation_id)).scalar_one()
+
+    message = Message(conversation_id=conversation_id, sender_id=sender_id, seq=seq, body=body)
+    db.add(message)
+    db.flush()
+    db.execute(
+        update(Conversation)
+        .where(Conversation.id == conversation_id)
+        .values(last_message_id=message.id, last_message_at=func.now())
+    )
+    # Sending implies having read everything before it
+    db.execute(
+        update(ConversationParticipant)
+        .where(ConversationParticipant.conversation_id == conversation_id, ConversationParticipant.user_id == sender_id)
+        .values(last_read_seq=seq)
+    )
+    db.commit()
+    db.refresh(message)
+
+    # Wake long-polls on this conversation (they re-read from the DB)
+    broker.publish(conversation_channel(conversation_id), {"id": message.id, "seq": seq})
+    return message
+
+
+def list_conversations(db: Session, user_id: int, before_id: Optional[int] = None, limit: int = 20) -> List[Dict]:
+    """
+    Inbox, most recent first. Conversation, other participant, their name
+    and the last message come back in one joined query — no N+1.
+    Cursor is the last_message_id of the previous page's last row.
+    """
+    me = aliased(ConversationParticipant)
+    other = aliased(ConversationParticipant)
+    query = (
+        select(
+            Conversation.id,
+            Conversation.last_seq,
+            Conversation.last_message_id,
+            me.last_read_seq,
+            other.user_id.label("with_user_id"),
+            User.full_name.label("with_name"),
+            Message.body,
+            Message.sender_id,
+            Message.created_at,
+        )
+        .select_from(me)
+        .join(Conversation, Conversation.id == me.conversation_id)
+        .join(other, and_(other.conversation_id == Conversation.id, other.user_id != me.user_id))
+        .join(User, User.id == other.user_id)
+        .join(Message, Message.id == Conversation.last_message_id)
+        .where(me.user_id == user_id)
+    )
+    if before_id:
+        query = query.where(Conversation.last_message_id < before_id)
+    rows = db.execute(query.order_by(Conversation.last_message_id.desc()).limit(limit)).all()
+    return [
+        {
+            "id": row.id,
+            "with_user_id": row.with_user_id,
+            "from": row.with_name,
+            "content": row.body,
+            "time": row.created_at,
+            "last_message_id": row.last_message_id,
+            "last_sender_id": row.sender_id,
+            "unread_count": max(row.last_seq - row.last_read_seq, 0),
+            "unread": row.last_seq > row.last_read_seq,
+        }
+        for row in rows
+    ]
+
+
+def unread_total(db: Session, user_id: int) -> int:
+    return int(db.execute(
+        select(func.coalesce(func.sum(Conversation.last_seq - ConversationParticipant.last_read_seq), 0))
+        .select_from(ConversationParticipant)
+        .join(Conversation, Conversation.id == ConversationParticipant.conversation_id)
+        .where(ConversationParticipant.user_id == user_id)
+    ).scalar())
+
+
+def get_messages_page(db: Session, conversation_id: int, before_id: Optional[int] = None, limit: int = 50) -> Dict:
+    query = select(*MESSAGE_COLUMNS).where(Message.conversation_id == conversation_id)
+    return paginate(db, query, Message.id, Message.id, cursor=before_id, limit=limit, with_total=False)
+
+
+def get_messages_after(db: Session, conversation_id: int, after_id: int, limit: int = 100) -> List[Dict]:
+    rows = db.execute(
+        select(*MESSAGE_COLUMNS)
+        .where(Message.conversation_id == conversation_id, Message.id > after_id)
+        .order_by(Message.id)
+        .limit(limit)
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def mark_read(db: Session, participant: ConversationParticipant, seq: Optional[int] = None) -> int:
+    """Move the cursor to `seq` (default: latest). Returns the cursor."""
+    last_seq = db.execute(
+        select(Conversation.last_seq).where(Conversation.id == participant.conversation_id)
+    ).scalar_one()
+    target = last_seq if seq is None else min(seq, last_seq)
+    if target > participant.last_read_seq:
+        participant.last_read_seq = target
+        db.commit()
+    return participant.last_read_seq
@@ -0,0 +1,96 @@
+# app/crud/page.py
+"""
+BDR – Page content CRUD
+- seed_missing_pages()  → first boot: insert v1 of every seed file not yet in the DB
+- get_latest_pages()    → newest version of every page (one query)
+- list_page_versions()  → history for the admin, newest first
+- create_page_version() → append version + 1 and bump PAGES_VERSION (commits)
+
+Documents are stored as compact JSON text, so the store can serve the
+column as-is without re-serialising.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from ..models.page_document import PageDocument
+from ..models.counter import PAGES_VERSION
+from .counter import increment, get_counter
+
+SEED_DIR = Path(__file__).resolve().parent.parent / "content" / "pages"
+
+
+def encode_content(content: Dict[str, Any]) -> str:
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+
+
+def load_seed_files(seed_dir: Path = SEED_DIR) -> Dict[str, Dict[str, Any]]:
+    """key → document, one <key>.json per page."""
+    return {
+        path.stem: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(seed_dir.glob("*.json"))
+    }
+
+
+def seed_missing_pages(db: Session, seed_dir: Path = SEED_DIR) -> List[str]:
+    """Returns the keys that were seeded. Existing pages are never overwritten."""
+    seeds = load_seed_files(seed_dir)
+    existing = set(db.execute(select(PageDocument.key).distinct()).scalars())
+    missing = [key for key in seeds if key not in existing]
+    for key in missing:
+        db.add(PageDocument(key=key, version=1, content=encode_content(seeds[key])))
+    if missing:
+        db.commit()
+    # Make sure the version counter row exists, so edits can increment it
+    get_counter(db, PAGES_VERSION, seed=lambda _: 1)
+    return missing
+
+
+def get_latest_pages(db: Session) -> List[PageDocument]:
+    latest = (
+        select(PageDocument.key, func.max(PageDocument.version).label("version"))
+        .group_by(PageDocument.key)
+        .subquery()
+    )
+    return list(db.execute(
+        select(PageDocument).join(
+            latest,
+            (PageDocument.key == latest.c.key) & (PageDocument.version == latest.c.version),
+        )
+    ).scalars())
+
+
+def get_page_version(db: Session, key: str, version: Optional[int] = None) -> Optional[PageDocument]:
+    """A specific version, or the newest one when `version` is None."""
+    query = select(PageDocument).where(PageDocument.key == key)
+    if version is not None:
+        query = query.where(PageDocument.version == version)
+    return db.execute(query.order_by(PageDocument.version.desc()).limit(1)).scalar_one_or_none()
+
+
+def list_page_versions(db: Session, key: str) -> List[Dict[str, Any]]:
+    rows = db.execute(
+        select(PageDocument.key, PageDocument.version, PageDocument.created_by, PageDocument.created_at)
+        .where(PageDocument.key == key)
+        .order_by(PageDocument.version.desc())
+    ).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def create_page_version(db: Session, key: str, content: Dict[str, Any], user_id: Optional[int] = None) -> PageDocument:
+    """
+    Versions are append-only. Two concurrent edits of the same page race
+    for the same (key, version) primary key — the loser gets an
+    IntegrityError instead of silently overwriting the winner.
+    """
+    current = db.execute(select(func.max(PageDocument.version)).where(PageDocument.key == key)).scalar() or 0
+    document = PageDocument(key=key, version=current + 1, content=encode_content(content), created_by=user_id)
+    db.add(document)
+    increment(db, PAGES_VERSION)
+    db.commit()
+    db.refresh(document)
+    return document
@@ -0,0 +1,259 @@
+# app/crud/payment.py
+"""
+BDR – Basket payments + monthly pledges CRUD
+- create_basket()           → parent Payment + one bulk INSERT of its child Transactions
+- record_payment_initiation() / fail_payment_initiation()
+- update_payment_status()   → settle every child in one DB transaction (webhook / reconcile)
+- create_pledge() / cancel_pledge() / get_user_pledges()
+- get_due_pledges()         → scheduler batch (SKIP LOCKED on Postgres)
+- next_occurrence()         → the pledge's next monthly run
+"""
+
+import json
+import logging
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import select, insert, update
+from sqlalchemy.orm import Session
+
+from ..models.payment import Payment, Pledge, PledgeItem, PledgeStatus
+from ..models.project import Project, ProjectStatus
+from ..models.transaction import Transaction, TransactionStatus
+from ..models.notification import Notification, NotificationType
+from ..utils.email import queue_payment_confirmed_email
+from ..utils.impact import jobs_bulk
+from .project import publish_funding_progress
+from .transaction import claim_pending, credit_transaction, notify_entrepreneur
+
+logger = logging.getLogger(__name__)
+
+PLEDGE_RUN_HOUR_UTC = 7      # 09:00 in Kigali — nobody wants a MoMo prompt at midnight
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Basket checkout
+# ─────────────────────────────────────────────────────────────────────────────
+def create_basket(
+    db: Session,
+    backer_id: int,
+    items: Iterable[Tuple[int, Decimal]],
+    provider: str,
+    pledge_id: Optional[int] = None,
+    skip_inactive: bool = False,
+    commit: bool = True,
+) -> Optional[Payment]:
+    """
+    items: (project_id, amount). Raises ValueError for a missing / closed
+    project, unless skip_inactive (pledges), which drops those lines and
+    returns None when nothing is left.
+    """
+    items = list(items)
+    active = dict(db.execute(
+        select(Project.id, Project.sector)
+        .where(Project.id.in_([pid for pid, _ in items]), Project.status == ProjectStatus.active)
+    ).all())
+    closed = [pid for pid, _ in items if pid not in active]
+    if closed and not skip_inactive:
+        raise ValueError(f"Project(s) not accepting funds: {', '.join(map(str, closed))}")
+    items = [(pid, amount) for pid, amount in items if pid in active]
+    if not items:
+        return None
+
+    payment = Payment(
+        external_id=str(uuid4()),
+        provider=provider,
+        amount=sum(Decimal(amount) for _, amount in items),
+        status=TransactionStatus.pending,
+        backer_id=backer_id,
+        pledge_id=pledge_id,
+    )
+    db.add(payment)
+    db.flush()
+
+    jobs = jobs_bulk([amount for _, amount in items], [active[pid] for pid, _ in items])
+    # One multi-row INSERT for all the lines
+    db.execute(insert(Transaction), [
+        {
+            "amount": Decimal(amount),
+            "jobs_created": int(jobs[n - 1]),
+            "status": TransactionStatus.pending,
+            "backer_id": backer_id,
+            "project_id": project_id,
+            "provider": provider,
+            "external_id": f"{payment.external_id}.{n}",
+            "payment_id": payment.id,
+        }
+        for n, (project_id, amount) in enumerate(items, start=1)
+    ])
+    if commit:
+        db.commit()
+        db.refresh(payment)
+    return payment
+
+
+def record_payment_initiation(db: Session, payment: Payment, provider_ref: str) -> Payment:
+    payment.provider_ref = provider_ref
+    db.add(Notification(
+        user_id=payment.backer_id,
+        title="Payment Request Sent",
+        message=f"Your RWF {int(payment.amount):,} payment for {len(payment.transactions)} projects is processing.",
+        type=NotificationType.payment_confirmed,
+        data=json.dumps({"payment_id": payment.id}),
+    ))
+    db.commit()
+    logger.info(f"Basket payment {payment.id} ({payment.provider}) sent: {len(payment.transactions)} projects")
+    return payment
+
+
+def _set_failed(db: Session, payment: Payment) -> None:
+    payment.status = TransactionStatus.failed
+    db.execute(
+        update(Transaction)
+        .where(Transaction.payment_id == payment.id, Transaction.status == TransactionStatus.pending)
+        .values(status=TransactionStatus.failed)
+    )
+
+
+def fail_payment_initiation(db: Session, payment: Payment) -> None:
+    _set_failed(db, payment)
+    db.commit()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Settlement (webhook / reconciliation)
+# ─────────────────────────────────────────────────────────────────────────────
+def update_payment_status(db: Session, payment: Payment, momo_ref: Optional[str], status: str) -> Payment:
+    succeeded = status.upper() == "SUCCESSFUL"
+    if not claim_pending(db, payment, TransactionStatus.completed if succeeded else TransactionStatus.failed):
+        db.rollback()
+        db.refresh(payment)
+        logger.info(f"Payment {payment.id} already processed")
+        return payment
+
+    if not succeeded:
+        _set_failed(db, payment)
+        db.add(Notification(
+            user_id=payment.backer_id,
+            title="Payment Failed",
+            message=f"Your RWF {int(payment.amount):,} payment for {len(payment.transactions)} projects failed. Try again.",
+            type=NotificationType.payment_failed,
+        ))
+        db.commit()
+        logger.info(f"Payment {payment.id} failed")
+        return payment
+
+    # Every project is credited in the same DB transaction as the payment
+    payment.status = TransactionStatus.completed
+    payment.momo_ref = momo_ref
+    credited = []
+    for db_transaction in payment.transactions:
+        if db_transaction.status == TransactionStatus.pending:
+            credited.append((db_transaction, *credit_transaction(db, db_transaction)))
+    db.commit()
+
+    total_jobs = sum(jobs for _, jobs, _ in credited)
+    for db_transaction, jobs, milestone in credited:
+        publish_funding_progress(db_transaction.project)
+        notify_entrepreneur(db, db_transaction, jobs, milestone)
+    db.add(Notification(
+        user_id=payment.backer_id,
+        title="Payment Confirmed!",
+        message=f"Your RWF {int(payment.amount):,} backed {len(credited)} projects and created {total_jobs} job(s)!",
+        type=NotificationType.payment_confirmed,
+        data=json.dumps({"payment_id": payment.id, "jobs": total_jobs}),
+    ))
+    db.commit()
+
+    queue_payment_confirmed_email(
+        payment.backer.email, payment.backer.full_name, payment.amount,
+        [t.project.title for t, _, _ in credited], total_jobs,
+    )
+
+    logger.info(f"Payment {payment.id} completed: {len(credited)} projects, {total_jobs} jobs")
+    return payment
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Monthly pledges
+# ─────────────────────────────────────────────────────────────────────────────
+def next_occurrence(after: datetime, day_of_month: int) -> datetime:
+    """First `day_of_month` at PLEDGE_RUN_HOUR_UTC strictly after `after`."""
+    candidate = datetime(after.year, after.month, day_of_month, PLEDGE_RUN_HOUR_UTC)
+    if candidate > after:
+        return candidate
+    year, month = (after.year + 1, 1) if after.month == 12 else (after.year, after.month + 1)
+    return datetime(year, month, day_of_month, PLEDGE_RUN_HOUR_UTC)
+
+
+def create_pledge(db: Session, backer_id: int, items: List[Tuple[int, Decimal]], momo_phone: str,
+                  day_of_month: Optional[int] = None) -> Pledge:
+    project_ids = [pid for pid, _ in items]
+    active = set(db.execute(
+        select(Project.id).where(Project.id.in_(project_ids), Project.status == ProjectStatus.active)
+    ).scalars())
+    closed = [pid for pid in project_ids if pid not in active]
+    if closed:
+        raise ValueError(f"Project(s) not accepting funds: {', '.join(map(str, closed))}")
+
+    now = datetime.utcnow()
+    pledge = Pledge(
+        backer_id=backer_id,
+        payment_method="momo",
+        momo_phone=momo_phone,
+        day_of_month=day_of_month or min(now.day, 28),
+        # No day picked → first charge on the scheduler's next pass
+        next_run_at=next_occurrence(now, day_of_month) if day_of_month else now,
+        items=[PledgeItem(project_id=pid, amount=amount) for pid, amount in items],
+    )
+    db.add(pledge)
+    db.commit()
+    db.refresh(pledge)
+    return pledge
+
+
+def get_pledge(db: Session, pledge_id: int) -> Optional[Pledge]:
+    return db.get(Pledge, pledge_id)
+
+
+def get_user_pledges(db: Session, backer_id: int) -> List[Pledge]:
+    return db.execute(
+        select(Pledge).where(Pledge.backer_id == backer_id).order_by(Pledge.id.desc())
+    ).scalars().all()
+
+
+def cancel_pledge(db: Session, pledge: Pledge) -> Pledge:
+    pledge.status = PledgeStatus.cancelled
+    db.commit()
+    db.refresh(pledge)
+    return pledge
+
+
+def get_due_pledges(db: Session, now: datetime, after_id: int = 0, limit: int = 100) -> List[Pledge]:
+    """Due active pledges by id. Other scheduler processes skip rows we hold (Postgres)."""
+    return db.execute(
+        select(Pledge)
+        .where(Pledge.status == PledgeStatus.active, Pledge.next_run_at <= now, Pledge.id > after_id)
+        .order_by(Pledge.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=Pledge)
+    ).scalars().all()
+
+
+def start_pledge_run(db: Session, pledge: Pledge, now: datetime) -> Optional[Payment]:
+    """
+    Add this month's basket and move the pledge on. No commit: the scheduler
+    commits a whole batch at once, so the row locks from get_due_pledges()
+    hold until every pledge in it has moved on — no month is charged twice.
+    None if none of the pledged projects is still open.
+    """
+    payment = create_basket(
+        db, pledge.backer_id, [(item.project_id, item.amount) for item in pledge.items],
+        pledge.payment_method, pledge_id=pledge.id, skip_inactive=True, commit=False,
+    )
+    pledge.last_run_at = now
+    pledge.last_payment_id = payment.id if payment else None
+    pledge.next_run_at = next_occurrence(max(now, pledge.next_run_at), pledge.day_of_month)
+    return payment
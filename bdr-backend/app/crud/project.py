@@ -1,22 +1,25 @@
 # app/crud/project.py
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy import select, cast, BigInteger, String
+from typing import List, Optional, Iterator, Dict
 from datetime import datetime, timedelta
 import json
 import logging
 
-from ..models.project import Project
+from ..models.project import Project, ProjectStatus
 from ..schemas.project import ProjectCreate, ProjectUpdate
 from ..models.user import User
 from ..models.notification import Notification
-from ..utils.security import calculate_jobs_created
+from ..utils.impact import jobs_for
 from ..utils.email import send_email
+from ..utils.pagination import paginate
+from ..utils.pubsub import broker, project_channel
 
 logger = logging.getLogger(__name__)
 
 # CREATE PROJECT
 def create_project(db: Session, project_in: ProjectCreate, entrepreneur_id: int) -> Project:
-    job_goal = calculate_jobs_created(int(project_in.funding_goal))
+    job_goal = jobs_for(project_in.funding_goal, project_in.sector)
     
     db_project = Project(
         title=project_in.title,
@@ -46,6 +49,26 @@ def create_project(db: Session, project_in: ProjectCreate, entrepreneur_id: int)
     db.commit()
     return db_project
 
+# LIVE FUNDING PROGRESS — absolute numbers, so a missed message is harmless
+def funding_progress(project: Project) -> Dict:
+    funding = int(project.current_funding or 0)
+    return {
+        "project_id": project.id,
+        "funding": funding,
+        "goal": int(project.funding_goal),
+        "progress": project.progress_percentage,
+        "backers": project.backers_count or 0,
+        "jobs": project.jobs_created or 0,
+        "status": project.status.value if hasattr(project.status, "value") else project.status,
+    }
+
+def publish_funding_progress(project: Project) -> None:
+    """Push to /projects/{id}/stream subscribers. Call after the commit."""
+    try:
+        broker.publish(project_channel(project.id), funding_progress(project))
+    except Exception as e:
+        logger.warning(f"Funding progress publish failed for project {project.id}: {e}")
+
 # GET PROJECT BY ID
 def get_project_by_id(db: Session, project_id: int) -> Optional[Project]:
     return db.query(Project).filter(Project.id == project_id).first()
@@ -72,6 +95,102 @@ def get_projects(
         query = query.filter(Project.entrepreneur_id == entrepreneur_id)
     return query.offset(skip).limit(limit).all()
 
+# ADMIN LIST — keyset pagination, projected columns only
+PROJECT_SORT_COLUMNS = {
+    "id": Project.id,
+    "created_at": Project.created_at,
+    "current_funding": Project.current_funding,
+    "funding_goal": Project.funding_goal,
+}
+
+def get_all_projects(
+    db: Session,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "created_at",
+    descending: bool = True,
+    status: Optional[ProjectStatus] = None,
+    sector: Optional[str] = None,
+    entrepreneur_id: Optional[int] = None,
+    q: Optional[str] = None,
+    with_total: bool = True
+) -> Dict:
+    if sort not in PROJECT_SORT_COLUMNS:
+        raise ValueError(f"Sort must be one of: {', '.join(PROJECT_SORT_COLUMNS)}")
+
+    query = select(
+        Project.id,
+        Project.title,
+        Project.slug,
+        Project.sector,
+        cast(Project.status, String).label("status"),
+        cast(Project.funding_goal, BigInteger).label("funding_goal"),
+        cast(Project.current_funding, BigInteger).label("current_funding"),
+        Project.backers_count,
+        Project.entrepreneur_id,
+        Project.created_at,
+        Project.ends_at,
+    )
+    if status:
+        query = query.where(Project.status == status)
+    if sector:
+        query = query.where(Project.sector == sector)
+    if entrepreneur_id:
+        query = query.where(Project.entrepreneur_id == entrepreneur_id)
+    if q:
+        query = query.where(Project.title.like(f"{q}%"))
+
+    return paginate(db, query, PROJECT_SORT_COLUMNS[sort], Project.id, cursor, limit, descending, with_total)
+
+# STREAMING EXPORT (ADMIN)
+PROJECT_EXPORT_COLUMNS = [
+    ("id", "int"),
+    ("slug", "str"),
+    ("title", "str"),
+    ("sector", "str"),
+    ("status", "str"),
+    ("funding_goal", "int"),
+    ("current_funding", "int"),
+    ("backers_count", "int"),
+    ("jobs_to_create", "int"),
+    ("entrepreneur_id", "int"),
+    ("created_at", "datetime"),
+    ("launched_at", "datetime"),
+    ("ends_at", "datetime"),
+]
+
+def iter_projects_for_export(
+    db: Session,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    status: Optional[ProjectStatus] = None,
+    batch_size: int = 1000
+) -> Iterator[tuple]:
+    query = select(
+        Project.id,
+        Project.slug,
+        Project.title,
+        Project.sector,
+        cast(Project.status, String),
+        cast(Project.funding_goal, BigInteger),
+        cast(Project.current_funding, BigInteger),
+        Project.backers_count,
+        Project.jobs_to_create,
+        Project.entrepreneur_id,
+        Project.created_at,
+        Project.launched_at,
+        Project.ends_at,
+    ).order_by(Project.id)
+    if start:
+        query = query.where(Project.created_at >= start)
+    if end:
+        query = query.where(Project.created_at < end)
+    if status:
+        query = query.where(Project.status == status)
+
+    for row in db.execute(query.execution_options(yield_per=batch_size)):
+        yield tuple(row)
+
 # GET PROJECTS BY ENTREPRENEUR
 def get_projects_by_entrepreneur(db: Session, entrepreneur_id: int) -> List[Project]:
     return db.query(Project).filter(Project.entrepreneur_id == entrepreneur_id).all()
@@ -84,7 +203,7 @@ def update_project(db: Session, project_id: int, project_in: ProjectUpdate, entr
 
     update_data = project_in.dict(exclude_unset=True)
     if "funding_goal" in update_data:
-        update_data["job_goal"] = calculate_jobs_created(int(update_data["funding_goal"]))
+        update_data["job_goal"] = jobs_for(update_data["funding_goal"], update_data.get("sector") or db_project.sector)
 
     for field, value in update_data.items():
         if value is not None:
@@ -0,0 +1,178 @@
+# app/crud/project_analytics.py
+"""
+BDR – Entrepreneur analytics
+- record_funding_bucket()   → hourly + daily increments (webhook path, no commit)
+- get_project_analytics()   → histograms, velocity, projected completion
+- rebuild_funding_buckets() → backfill from the ledger
+"""
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, update, delete, insert, union_all
+from typing import Optional, Dict, List, Tuple
+from datetime import datetime, timedelta
+from collections import defaultdict
+from decimal import Decimal
+
+from ..models.project import Project
+from ..models.project_funding_bucket import ProjectFundingBucket, HOUR, DAY
+from ..models.transaction import Transaction, TransactionArchive, TransactionColdSummary, TransactionStatus
+
+
+def floor_hour(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def floor_day(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Incremental update
+# ─────────────────────────────────────────────────────────────────────────────
+def record_funding_bucket(db: Session, transaction: Transaction, at: Optional[datetime] = None) -> None:
+    at = at or datetime.utcnow()
+    amount = transaction.amount
+    jobs = transaction.jobs_created or 0
+
+    for granularity, bucket_start in ((HOUR, floor_hour(at)), (DAY, floor_day(at))):
+        key = (
+            ProjectFundingBucket.project_id == transaction.project_id,
+            ProjectFundingBucket.granularity == granularity,
+            ProjectFundingBucket.bucket_start == bucket_start,
+        )
+        values = dict(
+            amount_rwf=ProjectFundingBucket.amount_rwf + amount,
+            contributions=ProjectFundingBucket.contributions + 1,
+            jobs_created=ProjectFundingBucket.jobs_created + jobs,
+        )
+        if db.execute(update(ProjectFundingBucket).where(*key).values(**values)).rowcount:
+            continue
+        try:
+            with db.begin_nested():
+                db.add(ProjectFundingBucket(
+                    project_id=transaction.project_id,
+                    granularity=granularity,
+                    bucket_start=bucket_start,
+                    amount_rwf=amount,
+                    contributions=1,
+                    jobs_created=jobs,
+                ))
+        except IntegrityError:
+            db.execute(update(ProjectFundingBucket).where(*key).values(**values))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Read
+# ─────────────────────────────────────────────────────────────────────────────
+def get_buckets(
+    db: Session,
+    project_id: int,
+    granularity: str,
+    since: datetime
+) -> List[ProjectFundingBucket]:
+    """Single PK range read."""
+    return db.query(ProjectFundingBucket).filter(
+        ProjectFundingBucket.project_id == project_id,
+        ProjectFundingBucket.granularity == granularity,
+        ProjectFundingBucket.bucket_start >= since,
+    ).order_by(ProjectFundingBucket.bucket_start).all()
+
+
+def _velocity(daily: List[ProjectFundingBucket], today: datetime, days: int) -> float:
+    since = today - timedelta(days=days - 1)
+    total = sum(int(b.amount_rwf) for b in daily if b.bucket_start.replace(tzinfo=None) >= since)
+    return round(total / days, 2)
+
+
+def get_project_analytics(db: Session, project: Project, days: int = 365, hours: int = 48) -> Dict:
+    now = datetime.utcnow()
+    today = floor_day(now)
+
+    daily = get_buckets(db, project.id, DAY, today - timedelta(days=days - 1))
+    hourly = get_buckets(db, project.id, HOUR, floor_hour(now) - timedelta(hours=hours - 1))
+
+    velocity_7d = _velocity(daily, today, 7)
+    velocity_30d = _velocity(daily, today, 30)
+
+    remaining = max(Decimal(0), Decimal(project.funding_goal) - Decimal(project.current_funding or 0))
+    projected = None
+    if remaining > 0 and velocity_7d > 0:
+        projected = now + timedelta(days=float(remaining) / velocity_7d)
+
+    ends_at = project.ends_at.replace(tzinfo=None) if project.ends_at else None
+    return {
+        "project_id": project.id,
+        "funding_goal": int(project.funding_goal),
+        "current_funding": int(project.current_funding or 0),
+        "remaining_rwf": int(remaining),
+        "velocity_7d_rwf_per_day": velocity_7d,
+        "velocity_30d_rwf_per_day": velocity_30d,
+        "projected_completion_at": projected,
+        "on_track": None if ends_at is None else (remaining == 0 or (projected is not None and projected <= ends_at)),
+        "daily": daily,
+        "hourly": hourly,
+    }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Backfill
+# ─────────────────────────────────────────────────────────────────────────────
+def rebuild_funding_buckets(db: Session, project_id: Optional[int] = None, batch_size: int = 1000) -> int:
+    """
+    Recompute buckets from completed transactions (hot + archive),
+    bucketed by completion time (updated_at). Streams the ledger and
+    aggregates in memory — bucket count, not row count, bounds memory.
+    Cold months only kept per-day sums, so they come back as day buckets.
+    """
+    hot = select(
+        Transaction.project_id, Transaction.amount, Transaction.jobs_created,
+        Transaction.updated_at, Transaction.created_at,
+    ).where(Transaction.status == TransactionStatus.completed)
+    archived = select(
+        TransactionArchive.project_id, TransactionArchive.amount, TransactionArchive.jobs_created,
+        TransactionArchive.updated_at, TransactionArchive.created_at,
+    ).where(TransactionArchive.status == TransactionStatus.completed.value)
+    if project_id is not None:
+        hot = hot.where(Transaction.project_id == project_id)
+        archived = archived.where(TransactionArchive.project_id == project_id)
+    live_projects = select(Project.id)
+    hot = hot.where(Transaction.project_id.in_(live_projects))
+    archived = archived.where(TransactionArchive.project_id.in_(live_projects))
+
+    totals: Dict[Tuple[int, str, datetime], List] = defaultdict(lambda: [Decimal(0), 0, 0])
+    rows = db.execute(union_all(hot, archived).execution_options(yield_per=batch_size))
+    for row in rows:
+        at = (row.updated_at or row.created_at).replace(tzinfo=None)
+        for key in ((row.project_id, HOUR, floor_hour(at)), (row.project_id, DAY, floor_day(at))):
+            bucket = totals[key]
+            bucket[0] += Decimal(row.amount)
+            bucket[1] += 1
+            bucket[2] += row.jobs_created or 0
+
+    cold = select(
+        TransactionColdSummary.project_id, TransactionColdSummary.day,
+        TransactionColdSummary.amount, TransactionColdSummary.contributions, TransactionColdSummary.jobs_created,
+    ).where(TransactionColdSummary.project_id.in_(live_projects))
+    if project_id is not None:
+        cold = cold.where(TransactionColdSummary.project_id == project_id)
+    for row in db.execute(cold.execution_options(yield_per=batch_size)):
+        bucket = totals[(row.project_id, DAY, row.day)]
+        bucket[0] += Decimal(row.amount)
+        bucket[1] += row.contributions
+        bucket[2] += row.jobs_created
+
+    stale = delete(ProjectFundingBucket)
+    if project_id is not None:
+        stale = stale.where(ProjectFundingBucket.project_id == project_id)
+    db.execute(stale)
+
+    payload = [
+        {"project_id": pid, "granularity": gran, "bucket_start": start,
+         "amount_rwf": amount, "contributions": count, "jobs_created": jobs}
+        for (pid, gran, start), (amount, count, jobs) in totals.items()
+    ]
+    for i in range(0, len(payload), batch_size):
+        db.execute(insert(ProjectFundingBucket), payload[i:i + batch_size])
+    db.commit()
+    return len(payload)
@@ -0,0 +1,101 @@
+# app/crud/project_engagement.py
+"""
+BDR – Project views / shares + trending score
+- record_view() / record_share() → in-memory increment, no DB write
+- apply_engagement()             → the buffer's flush: one executemany UPDATE
+- decay_trending()               → scale every score down by the time elapsed
+
+trending_score is an exponentially decayed count: each flush adds
+views + TRENDING_SHARE_WEIGHT × shares, and decay_trending() multiplies
+all scores by 0.5 ^ (elapsed / TRENDING_HALF_LIFE_HOURS). The elapsed
+time comes from a counter row, so missed or doubled decay runs still
+decay by exactly the wall-clock time that passed.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import bindparam, case, update
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..database import SessionLocal
+from ..models.counter import Counter, TRENDING_DECAYED_AT
+from ..models.project import Project
+from ..utils.counter_buffer import CounterBuffer, Deltas
+from .counter import set_counter
+
+MIN_TRENDING_SCORE = 0.01      # below this a score is zeroed, so decay stops touching the row
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Write-behind counts
+# ─────────────────────────────────────────────────────────────────────────────
+def apply_engagement(db: Session, rows: Deltas) -> None:
+    # Core UPDATE on the table: skips the ORM flush hook, so views don't
+    # bump PROJECTS_VERSION and invalidate every list ETag
+    projects = Project.__table__
+    db.execute(
+        update(projects)
+        .where(projects.c.id == bindparam("project_id"))
+        .values(
+            views_count=projects.c.views_count + bindparam("views"),
+            shares_count=projects.c.shares_count + bindparam("shares"),
+            trending_score=projects.c.trending_score + bindparam("points"),
+        ),
+        [
+            {"project_id": project_id, "views": views, "shares": shares,
+             "points": views + settings.TRENDING_SHARE_WEIGHT * shares}
+            for project_id, (views, shares) in rows
+        ],
+    )
+
+
+engagement_buffer = CounterBuffer(
+    "project_engagement",
+    fields=("views", "shares"),
+    apply=apply_engagement,
+    shards=settings.ENGAGEMENT_BUFFER_SHARDS,
+    max_keys=settings.ENGAGEMENT_BUFFER_MAX_KEYS,
+    interval=settings.ENGAGEMENT_FLUSH_SECONDS,
+    session_factory=SessionLocal,
+)
+
+
+def record_view(project_id: int) -> None:
+    engagement_buffer.add(project_id, views=1)
+
+
+def record_share(project_id: int) -> None:
+    engagement_buffer.add(project_id, shares=1)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Trending
+# ─────────────────────────────────────────────────────────────────────────────
+def decay_trending(db: Session, now: Optional[float] = None, half_life_hours: Optional[float] = None) -> int:
+    """Decay all scores to `now` (unix seconds). Commits. Returns rows touched."""
+    now = int(now if now is not None else time.time())
+    half_life = (half_life_hours or settings.TRENDING_HALF_LIFE_HOURS) * 3600
+
+    # Row lock: two decay runs at once would otherwise both apply the same interval
+    marker = db.get(Counter, TRENDING_DECAYED_AT, with_for_update=True)
+    if marker is None:
+        set_counter(db, TRENDING_DECAYED_AT, now)
+        return 0
+    elapsed = now - int(marker.value)
+    if elapsed <= 0:
+        db.rollback()
+        return 0
+
+    projects = Project.__table__
+    decayed = projects.c.trending_score * (0.5 ** (elapsed / half_life))
+    result = db.execute(
+        update(projects)
+        .where(projects.c.trending_score > 0)
+        .values(trending_score=case((decayed < MIN_TRENDING_SCORE, 0.0), else_=decayed))
+    )
+    marker.value = now
+    db.commit()
+    return result.rowcount
+
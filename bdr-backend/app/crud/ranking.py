@@ -0,0 +1,137 @@
+# app/crud/ranking.py
+"""
+BDR – Trending + similar projects
+- rebuild_rankings() → recompute both tables in one DB transaction (scheduled job)
+- get_trending()     → rank order, active projects only
+- get_similar()      → a project's precomputed neighbours, best first
+
+Recent funding comes from the daily project_funding_buckets, never the
+ledger; the math lives in app/utils/ranking.py.
+"""
+
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.project import Project, ProjectStatus
+from ..models.project_funding_bucket import ProjectFundingBucket, DAY
+from ..models.project_ranking import ProjectRanking, ProjectSimilarity
+from ..utils.ranking import trending_scores, tfidf_matrix, top_similar
+from .project_analytics import floor_day
+
+logger = logging.getLogger(__name__)
+
+
+def _naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
+    if dt is None or dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Rebuild
+# ─────────────────────────────────────────────────────────────────────────────
+def rebuild_rankings(
+    db: Session,
+    now: Optional[datetime] = None,
+    window_days: Optional[int] = None,
+    k: Optional[int] = None,
+    max_terms: Optional[int] = None,
+) -> Dict:
+    started = time.perf_counter()
+    now = now or datetime.utcnow()
+    window_days = window_days or settings.RANKING_WINDOW_DAYS
+
+    rows = db.execute(
+        select(Project.id, Project.title, Project.description, Project.sector, Project.status,
+               Project.funding_goal, Project.current_funding, Project.ends_at, Project.trending_score)
+        .order_by(Project.id)
+    ).all()
+    recent = {
+        row.project_id: row
+        for row in db.execute(
+            select(ProjectFundingBucket.project_id,
+                   func.sum(ProjectFundingBucket.amount_rwf).label("amount"),
+                   func.sum(ProjectFundingBucket.contributions).label("backings"))
+            .where(ProjectFundingBucket.granularity == DAY,
+                   ProjectFundingBucket.bucket_start >= floor_day(now - timedelta(days=window_days)))
+            .group_by(ProjectFundingBucket.project_id)
+        )
+    }
+
+    ids = np.array([row.id for row in rows], dtype=np.int64)
+    active = np.array([row.status == ProjectStatus.active for row in rows], dtype=bool)
+
+    # Trending: active projects only
+    live = [row for row in rows if row.status == ProjectStatus.active]
+    scores = trending_scores(
+        recent_amount=np.array([float(recent[r.id].amount) if r.id in recent else 0.0 for r in live]),
+        recent_backings=np.array([float(recent[r.id].backings) if r.id in recent else 0.0 for r in live]),
+        funding_goal=np.array([float(r.funding_goal) for r in live]),
+        current_funding=np.array([float(r.current_funding or 0) for r in live]),
+        days_left=np.array([
+            (_naive_utc(r.ends_at) - now).total_seconds() / 86400 if r.ends_at else np.nan for r in live
+        ]),
+        engagement=np.array([float(r.trending_score or 0) for r in live]),
+    )
+    order = np.lexsort((ids[active], -scores))        # score desc, then id
+    live_ids = ids[active]
+
+    # Similar: every project gets neighbours (a funded project's page can
+    # still point to open ones), but only active projects are suggested
+    neighbours = top_similar(
+        tfidf_matrix([f"{r.title} {r.description}" for r in rows], max_terms=max_terms or settings.RANKING_MAX_TERMS),
+        [r.sector for r in rows],
+        candidates=active,
+        k=k or settings.RANKING_SIMILAR_PER_PROJECT,
+    )
+
+    db.execute(delete(ProjectRanking))
+    db.execute(delete(ProjectSimilarity))
+    if len(order):
+        db.execute(insert(ProjectRanking), [
+            {"project_id": int(live_ids[i]), "rank": rank, "trending_score": float(scores[i]), "computed_at": now}
+            for rank, i in enumerate(order, start=1)
+        ])
+    similar_rows = [
+        {"project_id": int(ids[row]), "rank": rank, "similar_id": int(ids[col]), "score": score}
+        for row, best in enumerate(neighbours)
+        for rank, (col, score) in enumerate(best, start=1)
+    ]
+    if similar_rows:
+        db.execute(insert(ProjectSimilarity), similar_rows)
+    db.commit()
+
+    stats = {"projects": len(rows), "ranked": len(order), "similar_pairs": len(similar_rows),
+             "seconds": round(time.perf_counter() - started, 3)}
+    logger.info(f"Rankings rebuilt: {stats}")
+    return stats
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Read — `columns` are the Project columns the caller wants back
+# ─────────────────────────────────────────────────────────────────────────────
+def get_trending(db: Session, columns: Sequence, limit: int = 10) -> List:
+    return db.execute(
+        select(*columns)
+        .join(ProjectRanking, ProjectRanking.project_id == Project.id)
+        .where(Project.status == ProjectStatus.active)     # may have closed since the rebuild
+        .order_by(ProjectRanking.rank)
+        .limit(limit)
+    ).all()
+
+
+def get_similar(db: Session, project_id: int, columns: Sequence, limit: int = 6) -> List:
+    return db.execute(
+        select(*columns)
+        .join(ProjectSimilarity, ProjectSimilarity.similar_id == Project.id)
+        .where(ProjectSimilarity.project_id == project_id, Project.status == ProjectStatus.active)
+        .order_by(ProjectSimilarity.rank)
+        .limit(limit)
+    ).all()
@@ -3,11 +3,12 @@ BDR – Beyond Degrees Rwanda
 CRUD Operations for Transaction
 
 Handles:
-- Payment initiation (pending)
-- Webhook update (MoMo callback)
+- Payment initiation (pending row → provider reference)
+- Webhook update (MoMo / Stripe callback; basket payments → crud/payment.py)
 - Retrieval (by project, backer)
+- Admin list (keyset) + streaming export
 - Job impact calculation
-- Project funding update
+- Project funding update (+ live progress push)
 
 Aligned with:
 - UML Class Diagram: CRUD → Transaction → Project
@@ -17,17 +18,23 @@ Aligned with:
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
-from typing import Optional, List
+from sqlalchemy import select, update, cast, union_all, BigInteger, String
+from typing import Optional, List, Iterator, Dict, Union
 from datetime import datetime
+from uuid import uuid4
 from decimal import Decimal
-from ..models.transaction import Transaction, TransactionStatus
+from ..models.transaction import Transaction, TransactionArchive, TransactionStatus
+from ..models.payment import Payment
 from ..models.project import Project, ProjectStatus
 from ..models.user import User
 from ..models.notification import Notification, NotificationType
 from ..schemas.transaction import TransactionCreate
-from ..utils.security import calculate_jobs_created
+from ..utils.impact import jobs_for
 from ..utils.email import send_email
-from ..utils.momo import initiate_momo_payment
+from ..utils.pagination import paginate
+from .backer_stats import record_contribution
+from .project_analytics import record_funding_bucket
+from .project import publish_funding_progress
 import logging
 import json
 
@@ -43,61 +50,56 @@ def create_transaction(
     backer_id: int
 ) -> Transaction:
     """
-    Create a pending transaction and initiate MoMo payment.
-    Returns transaction with momo_request_id.
+    Create the pending transaction. The payment provider is called by the
+    route afterwards (async, shared HTTP client), then record_initiation().
     """
     project = db.query(Project).filter(Project.id == transaction_in.project_id).first()
     if not project:
         raise ValueError("Project not found")
-    if project.status != ProjectStatus.live:
+    if project.status != ProjectStatus.active:
         raise ValueError("Project is not accepting funds")
 
-    # Calculate jobs
-    jobs_to_create = calculate_jobs_created(int(transaction_in.amount))
+    # Jobs at today's rate for the project's sector, fixed on the backing
+    jobs_to_create = jobs_for(transaction_in.amount, project.sector)
 
-    # Create transaction
     db_transaction = Transaction(
         amount=transaction_in.amount,
-        momo_phone=transaction_in.momo_phone,
         status=TransactionStatus.pending,
         jobs_created=jobs_to_create,
         backer_id=backer_id,
-        project_id=project.id
+        project_id=project.id,
+        provider=transaction_in.payment_method,
+        external_id=str(uuid4()),
     )
     db.add(db_transaction)
     db.commit()
     db.refresh(db_transaction)
+    return db_transaction
 
-    # Initiate MoMo payment
-    try:
-        momo_response = initiate_momo_payment(
-            amount=int(transaction_in.amount),
-            phone=transaction_in.momo_phone,
-            external_id=str(db_transaction.id)
-        )
-        db_transaction.momo_ref = momo_response.get("financialTransactionId")
-        db.commit()
-    except Exception as e:
-        db_transaction.status = TransactionStatus.failed
-        db.commit()
-        logger.error(f"MoMo initiation failed for tx {db_transaction.id}: {e}")
-        raise ValueError("Payment initiation failed. Try again.")
 
-    # Notify backer
+def record_initiation(db: Session, db_transaction: Transaction, provider_ref: str) -> Transaction:
+    """The provider accepted the request: keep its reference and tell the backer."""
+    db_transaction.provider_ref = provider_ref
+    project = db_transaction.project
     notif = Notification(
-        user_id=backer_id,
+        user_id=db_transaction.backer_id,
         title="Payment Request Sent",
-        message=f"Your RWF {transaction_in.amount:,} payment for **{project.title}** is processing. Check your phone.",
+        message=f"Your RWF {int(db_transaction.amount):,} payment for **{project.title}** is processing.",
         type=NotificationType.payment_confirmed,
         data=json.dumps({"transaction_id": db_transaction.id, "project_id": project.id})
     )
     db.add(notif)
     db.commit()
 
-    logger.info(f"Transaction created: {db_transaction.id} for project {project.id}")
+    logger.info(f"Transaction created: {db_transaction.id} ({db_transaction.provider}) for project {project.id}")
     return db_transaction
 
 
+def fail_initiation(db: Session, db_transaction: Transaction) -> None:
+    db_transaction.status = TransactionStatus.failed
+    db.commit()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Get Transaction by ID
 # ─────────────────────────────────────────────────────────────────────────────
@@ -111,14 +113,17 @@ def get_transaction_by_id(db: Session, transaction_id: int) -> Optional[Transact
 def get_transactions_by_project(
     db: Session,
     project_id: int,
-    skip: int = 0,
+    before_id: Optional[int] = None,
     limit: int = 20
 ) -> List[Transaction]:
-    return db.query(Transaction)\
-        .filter(Transaction.project_id == project_id)\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    """
+    Keyset pagination: pass the last id of the previous page as `before_id`.
+    Reads only the hot table (see app/jobs/archive_transactions.py).
+    """
+    query = db.query(Transaction).filter(Transaction.project_id == project_id)
+    if before_id:
+        query = query.filter(Transaction.id < before_id)
+    return query.order_by(Transaction.id.desc()).limit(limit).all()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -127,68 +132,243 @@ def get_transactions_by_project(
 def get_transactions_by_backer(
     db: Session,
     backer_id: int,
-    skip: int = 0,
+    before_id: Optional[int] = None,
     limit: int = 20
 ) -> List[Transaction]:
-    return db.query(Transaction)\
-        .filter(Transaction.backer_id == backer_id)\
-        .order_by(Transaction.initiated_at.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    """Keyset pagination on (backer_id, id) — newest first."""
+    query = db.query(Transaction).filter(Transaction.backer_id == backer_id)
+    if before_id:
+        query = query.filter(Transaction.id < before_id)
+    return query.order_by(Transaction.id.desc()).limit(limit).all()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Admin List (keyset pagination, projected columns)
+# ─────────────────────────────────────────────────────────────────────────────
+TRANSACTION_SORT_COLUMNS = {
+    "id": Transaction.id,
+    "created_at": Transaction.created_at,
+    "amount": Transaction.amount,
+}
+
+
+def get_all_transactions(
+    db: Session,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "id",
+    descending: bool = True,
+    status: Optional[TransactionStatus] = None,
+    project_id: Optional[int] = None,
+    backer_id: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    with_total: bool = True
+) -> Dict:
+    if sort not in TRANSACTION_SORT_COLUMNS:
+        raise ValueError(f"Sort must be one of: {', '.join(TRANSACTION_SORT_COLUMNS)}")
+
+    query = select(
+        Transaction.id,
+        cast(Transaction.amount, BigInteger).label("amount"),
+        Transaction.jobs_created,
+        cast(Transaction.status, String).label("status"),
+        Transaction.project_id,
+        Transaction.backer_id,
+        Transaction.momo_ref,
+        Transaction.created_at,
+    )
+    if status:
+        query = query.where(Transaction.status == status)
+    if project_id:
+        query = query.where(Transaction.project_id == project_id)
+    if backer_id:
+        query = query.where(Transaction.backer_id == backer_id)
+    if start:
+        query = query.where(Transaction.created_at >= start)
+    if end:
+        query = query.where(Transaction.created_at < end)
+
+    return paginate(db, query, TRANSACTION_SORT_COLUMNS[sort], Transaction.id, cursor, limit, descending, with_total)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Streaming Export (Admin)
+# ─────────────────────────────────────────────────────────────────────────────
+TRANSACTION_EXPORT_COLUMNS = [
+    ("id", "int"),
+    ("created_at", "datetime"),
+    ("updated_at", "datetime"),
+    ("status", "str"),
+    ("amount", "int"),
+    ("jobs_created", "int"),
+    ("backer_id", "int"),
+    ("project_id", "int"),
+    ("momo_ref", "str"),
+    ("external_id", "str"),
+]
+
+
+def iter_transactions_for_export(
+    db: Session,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    status: Optional[TransactionStatus] = None,
+    include_archived: bool = False,
+    batch_size: int = 1000
+) -> Iterator[tuple]:
+    """
+    Rows as plain tuples in TRANSACTION_EXPORT_COLUMNS order.
+    yield_per → server-side cursor on Postgres, fixed-size fetches on SQLite.
+    """
+    def ledger_select(table, status_value):
+        query = select(
+            table.id,
+            table.created_at,
+            table.updated_at,
+            cast(table.status, String),
+            cast(table.amount, BigInteger),
+            table.jobs_created,
+            table.backer_id,
+            table.project_id,
+            table.momo_ref,
+            table.external_id,
+        )
+        if start:
+            query = query.where(table.created_at >= start)
+        if end:
+            query = query.where(table.created_at < end)
+        if status:
+            query = query.where(table.status == status_value)
+        return query
+
+    query = ledger_select(Transaction, status)
+    if include_archived:
+        query = union_all(query, ledger_select(TransactionArchive, status.value if status else None))
+
+    result = db.execute(query.execution_options(yield_per=batch_size))
+    for row in result:
+        yield tuple(row)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Update Transaction from MoMo Webhook
 # ─────────────────────────────────────────────────────────────────────────────
+def claim_pending(db: Session, row: Union[Transaction, Payment], status: TransactionStatus) -> bool:
+    """
+    Move a pending transaction / payment to `status` with one conditional
+    UPDATE. Only the caller that gets True may credit it: a duplicate
+    webhook, or reconciliation racing one, finds the row already moved
+    (on Postgres it waits on the row lock, then matches nothing).
+    """
+    model = type(row)
+    result = db.execute(
+        update(model)
+        .where(model.id == row.id, model.status == TransactionStatus.pending)
+        .values(status=status)
+    )
+    return result.rowcount == 1
+
+
+def credit_transaction(db: Session, db_transaction: Transaction, momo_ref: Optional[str] = None):
+    """
+    Mark completed and credit its project (funding, backer rollup, analytics,
+    milestone). No commit — callers credit one or many, then commit once.
+    The caller must have claimed the row (or its basket payment) first.
+    Returns (jobs, milestone or None).
+    """
+    project = db_transaction.project
+    db_transaction.status = TransactionStatus.completed
+    db_transaction.momo_ref = momo_ref
+    db_transaction.completed_at = datetime.utcnow()
+
+    # Update project funding
+    jobs_from_this = db_transaction.jobs_created or 0
+    project.update_funding(db_transaction.amount, jobs_from_this)
+    db.flush()
+
+    # Backer dashboard rollup + entrepreneur analytics (same DB transaction)
+    record_contribution(db, db_transaction)
+    record_funding_bucket(db, db_transaction)
+
+    # Milestone check
+    milestone = None
+    if project.progress_percentage >= 25 and project.progress_percentage < 50:
+        milestone = 25
+    elif project.progress_percentage >= 50 and project.progress_percentage < 75:
+        milestone = 50
+    elif project.progress_percentage >= 75 and project.progress_percentage < 100:
+        milestone = 75
+    elif project.progress_percentage >= 100:
+        project.status = ProjectStatus.funded
+        milestone = 100
+    return jobs_from_this, milestone
+
+
+def notify_entrepreneur(db: Session, db_transaction: Transaction, jobs: int, milestone: Optional[int]) -> None:
+    """Funding (+ milestone) notifications for the project owner. No commit."""
+    project = db_transaction.project
+    notif_ent = Notification.create_funding_notification(
+        project=project,
+        amount=db_transaction.amount,
+        jobs=jobs,
+        backer_name=db_transaction.backer.full_name
+    )
+    notif_ent.user_id = project.entrepreneur_id
+    db.add(notif_ent)
+
+    if milestone:
+        notif_milestone = Notification.create_milestone_notification(project, milestone)
+        notif_milestone.user_id = project.entrepreneur_id
+        db.add(notif_milestone)
+
+
+def get_by_external_id(db: Session, external_id: str) -> Optional[Union[Transaction, Payment]]:
+    """The single backing or basket payment a provider callback refers to."""
+    return (
+        db.query(Transaction).filter(Transaction.external_id == external_id).first()
+        or db.query(Payment).filter(Payment.external_id == external_id).first()
+    )
+
+
 def update_transaction_status(
     db: Session,
     external_id: str,
     momo_ref: str,
     status: str,
     amount: Optional[Decimal] = None
-) -> Optional[Transaction]:
+) -> Optional[Union[Transaction, Payment]]:
     """
-    Called by MoMo webhook.
-    Updates transaction and project funding.
+    Called by the payment webhooks (and reconciliation), keyed by our external_id.
+    Updates transaction and project funding. Basket payments are settled as a whole.
     """
-    db_transaction = db.query(Transaction).filter(Transaction.id == int(external_id)).first()
+    db_transaction = get_by_external_id(db, external_id)
+    if isinstance(db_transaction, Payment):
+        from .payment import update_payment_status   # crud.payment builds on this module
+        return update_payment_status(db, db_transaction, momo_ref, status)
     if not db_transaction:
         logger.warning(f"Transaction not found for external_id: {external_id}")
         return None
 
-    if db_transaction.status != TransactionStatus.pending:
+    succeeded = status.upper() == "SUCCESSFUL"
+    if not claim_pending(db, db_transaction, TransactionStatus.completed if succeeded else TransactionStatus.failed):
+        db.rollback()
+        db.refresh(db_transaction)
         logger.info(f"Transaction {db_transaction.id} already processed")
         return db_transaction
 
     project = db_transaction.project
     backer = db_transaction.backer
 
-    if status.upper() == "SUCCESSFUL":
-        db_transaction.status = TransactionStatus.completed
-        db_transaction.momo_ref = momo_ref
-        db_transaction.completed_at = datetime.utcnow()
-
-        # Update project funding
-        project.current_funding += db_transaction.amount
-        jobs_from_this = project.update_funding(db_transaction.amount)
-
-        # Milestone check
-        milestone = None
-        if project.progress_percentage >= 25 and project.progress_percentage < 50:
-            milestone = 25
-        elif project.progress_percentage >= 50 and project.progress_percentage < 75:
-            milestone = 50
-        elif project.progress_percentage >= 75 and project.progress_percentage < 100:
-            milestone = 75
-        elif project.progress_percentage >= 100:
-            project.status = ProjectStatus.funded
-            milestone = 100
-
+    if succeeded:
+        jobs_from_this, milestone = credit_transaction(db, db_transaction, momo_ref)
         db.commit()
         db.refresh(db_transaction)
         db.refresh(project)
 
+        # Live progress for anyone watching the project page
+        publish_funding_progress(project)
+
         # Notifications
         # 1. Backer
         notif_backer = Notification(
@@ -200,22 +380,8 @@ def update_transaction_status(
         )
         db.add(notif_backer)
 
-        # 2. Entrepreneur
-        notif_ent = Notification.create_funding_notification(
-            project=project,
-            amount=db_transaction.amount,
-            jobs=jobs_from_this,
-            backer_name=backer.full_name
-        )
-        notif_ent.user_id = project.entrepreneur_id
-        db.add(notif_ent)
-
-        # 3. Milestone
-        if milestone:
-            notif_milestone = Notification.create_milestone_notification(project, milestone)
-            notif_milestone.user_id = project.entrepreneur_id
-            db.add(notif_milestone)
-
+        # 2. Entrepreneur (+ 3. milestone)
+        notify_entrepreneur(db, db_transaction, jobs_from_this, milestone)
         db.commit()
 
         # Emails
@@ -252,4 +418,4 @@ def update_transaction_status(
         db.add(notif)
         db.commit()
 
-    return db_transaction
\ No newline at end of file
+    return db_transaction
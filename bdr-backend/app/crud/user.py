@@ -1,6 +1,9 @@
 # app/crud/user.py
 from sqlalchemy.orm import Session
+from sqlalchemy import select
+from typing import Optional, Dict
 from app.models.user import User
+from app.utils.pagination import paginate
 from app.schemas.user import UserCreate
 from app.utils.security import get_password_hash, verify_password
 from sqlalchemy.exc import IntegrityError
@@ -38,4 +41,37 @@ def authenticate_user(db: Session, email: str, password: str):
     user = get_user_by_email(db, email)
     if not user or not verify_password(password, user.hashed_password):
         return None
-    return user
\ No newline at end of file
+    return user
+
+
+# ADMIN LIST — keyset pagination, projected columns only (never hashed_password)
+USER_SORT_COLUMNS = {
+    "id": User.id,
+    "created_at": User.created_at,
+    "email": User.email,
+}
+
+def get_all_users(
+    db: Session,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    sort: str = "created_at",
+    descending: bool = True,
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    q: Optional[str] = None,
+    with_total: bool = True
+) -> Dict:
+    if sort not in USER_SORT_COLUMNS:
+        raise ValueError(f"Sort must be one of: {', '.join(USER_SORT_COLUMNS)}")
+
+    query = select(User.id, User.email, User.full_name, User.role, User.is_active, User.created_at)
+    if role:
+        query = query.where(User.role == role)
+    if is_active is not None:
+        query = query.where(User.is_active == is_active)
+    if q:
+        # prefix match keeps the email index usable
+        query = query.where(User.email.like(f"{q.lower()}%"))
+
+    return paginate(db, query, USER_SORT_COLUMNS[sort], User.id, cursor, limit, descending, with_total)
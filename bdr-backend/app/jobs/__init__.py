@@ -0,0 +1,6 @@
+# app/jobs/__init__.py
+"""
+BDR – Background / scheduled jobs
+Each module is runnable on its own:
+    python -m app.jobs.<job_name>
+"""
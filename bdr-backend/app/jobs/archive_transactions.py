@@ -0,0 +1,306 @@
+# app/jobs/archive_transactions.py
+"""
+BDR – Transaction ledger archival job
+
+Two passes, both safe to re-run:
+1. HOT → ARCHIVE: settled (non-pending) transactions older than
+   ARCHIVE_AFTER_DAYS are copied into `transactions_archive` with one
+   INSERT ... SELECT per batch and deleted from `transactions` in the
+   same DB transaction. The hot table stays small, so backer / project
+   pages only ever touch recent rows.
+2. ARCHIVE → COLD: whole months older than COLD_STORAGE_AFTER_DAYS are
+   streamed to ARCHIVE_DIR as gzip JSONL (default) or Parquet, then
+   removed from the archive (DETACH + DROP partition on Postgres,
+   range DELETE on SQLite). Their completed backings are first summed
+   into `transactions_cold_summary`, which the rollup rebuilders read in
+   place of the dropped rows. A month that is already cold gets a new
+   part file (YYYY-MM.part2...), never an overwrite.
+
+Run:
+    python -m app.jobs.archive_transactions
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import String, cast, delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..database import SessionLocal
+from ..models.transaction import Transaction, TransactionArchive, TransactionColdSummary, TransactionStatus
+from ..crud.project_analytics import floor_day
+
+logger = logging.getLogger(__name__)
+
+# Parquet is optional — gzip JSONL always works
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    parquet_available = True
+except Exception:
+    parquet_available = False
+
+ARCHIVE_COLUMNS = [
+    "id", "created_at", "amount", "jobs_created", "status", "momo_ref",
+    "external_id", "provider", "provider_ref", "updated_at", "backer_id", "project_id", "payment_id",
+]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Month helpers
+# ─────────────────────────────────────────────────────────────────────────────
+def month_start(dt: datetime) -> datetime:
+    return datetime(dt.year, dt.month, 1)
+
+
+def next_month(dt: datetime) -> datetime:
+    return datetime(dt.year + 1, 1, 1) if dt.month == 12 else datetime(dt.year, dt.month + 1, 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"transactions_archive_{month:%Y_%m}"
+
+
+def _is_postgres(db: Session) -> bool:
+    return db.get_bind().dialect.name == "postgresql"
+
+
+def ensure_archive_partition(db: Session, month: datetime) -> None:
+    """Create the monthly partition on Postgres (no-op on SQLite)."""
+    if not _is_postgres(db):
+        return
+    db.execute(text(
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} "
+        f"PARTITION OF transactions_archive "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{next_month(month):%Y-%m-%d}')"
+    ))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pass 1 — hot table → archive table
+# ─────────────────────────────────────────────────────────────────────────────
+def archive_settled_transactions(
+    db: Session,
+    older_than: datetime,
+    batch_size: int = None
+) -> int:
+    batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+    moved = 0
+
+    while True:
+        batch = db.execute(
+            select(Transaction.id, Transaction.created_at)
+            .where(
+                Transaction.status != TransactionStatus.pending,
+                Transaction.created_at < older_than,
+            )
+            .order_by(Transaction.id)
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+
+        ids = [row.id for row in batch]
+        for month in {month_start(row.created_at) for row in batch}:
+            ensure_archive_partition(db, month)
+
+        db.execute(
+            insert(TransactionArchive).from_select(
+                ARCHIVE_COLUMNS,
+                select(
+                    Transaction.id,
+                    Transaction.created_at,
+                    Transaction.amount,
+                    Transaction.jobs_created,
+                    cast(Transaction.status, String),
+                    Transaction.momo_ref,
+                    Transaction.external_id,
+                    Transaction.provider,
+                    Transaction.provider_ref,
+                    Transaction.updated_at,
+                    Transaction.backer_id,
+                    Transaction.project_id,
+                    Transaction.payment_id,
+                ).where(Transaction.id.in_(ids))
+            )
+        )
+        db.execute(delete(Transaction).where(Transaction.id.in_(ids)))
+        db.commit()
+
+        moved += len(ids)
+        logger.info(f"Archived {len(ids)} transactions (up to id {ids[-1]})")
+
+    return moved
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Pass 2 — archive table → cold files
+# ─────────────────────────────────────────────────────────────────────────────
+def _serialise(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _iter_month_rows(db: Session, start: datetime, end: datetime, summary: Dict[Tuple, List]) -> Iterator[Dict]:
+    """Yields export rows; sums completed ones into `summary` on the way."""
+    completed = TransactionStatus.completed.value
+    rows = db.execute(
+        select(*[getattr(TransactionArchive, c) for c in ARCHIVE_COLUMNS])
+        .where(TransactionArchive.created_at >= start, TransactionArchive.created_at < end)
+        .order_by(TransactionArchive.id)
+        .execution_options(yield_per=settings.ARCHIVE_BATCH_SIZE)
+    )
+    for row in rows:
+        if row.status == completed:
+            day = floor_day((row.updated_at or row.created_at).replace(tzinfo=None))
+            entry = summary.setdefault((day, row.project_id, row.backer_id),
+                                       [Decimal(0), 0, 0, row.created_at, row.created_at])
+            entry[0] += Decimal(row.amount)
+            entry[1] += 1
+            entry[2] += row.jobs_created or 0
+            entry[3] = min(entry[3], row.created_at)
+            entry[4] = max(entry[4], row.created_at)
+        yield {c: _serialise(getattr(row, c)) for c in ARCHIVE_COLUMNS}
+
+
+def _write_jsonl(path: str, rows: Iterator[Dict]) -> int:
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row) + "\n")
+            count += 1
+    return count
+
+
+def _write_parquet(path: str, rows: Iterator[Dict]) -> int:
+    count = 0
+    writer = None
+    chunk: List[Dict] = []
+    try:
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= settings.ARCHIVE_BATCH_SIZE:
+                table = pa.Table.from_pylist(chunk)
+                writer = writer or pq.ParquetWriter(path, table.schema, compression="zstd")
+                writer.write_table(table)
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            table = pa.Table.from_pylist(chunk)
+            writer = writer or pq.ParquetWriter(path, table.schema, compression="zstd")
+            writer.write_table(table)
+            count += len(chunk)
+    finally:
+        if writer:
+            writer.close()
+    return count
+
+
+def _cold_path(month: datetime, ext: str) -> str:
+    """First free name for the month: YYYY-MM.ext, then YYYY-MM.part2.ext, ..."""
+    base = os.path.join(settings.ARCHIVE_DIR, f"{month:%Y-%m}")
+    path, part = f"{base}.{ext}", 1
+    while os.path.exists(path):
+        part += 1
+        path = f"{base}.part{part}.{ext}"
+    return path
+
+
+def export_month_to_cold_storage(db: Session, month: datetime, fmt: str = None) -> Optional[str]:
+    """
+    Write one archived month to a compressed file, then drop it from the DB.
+    The file is written under a temp name and renamed, so a crash never
+    leaves a half-written month next to deleted rows. The month's summary
+    rows commit together with the drop.
+    """
+    fmt = fmt or settings.ARCHIVE_FORMAT
+    if fmt == "parquet" and not parquet_available:
+        logger.warning("pyarrow not installed — falling back to gzip JSONL")
+        fmt = "jsonl"
+
+    end = next_month(month)
+    os.makedirs(settings.ARCHIVE_DIR, exist_ok=True)
+    ext = "parquet" if fmt == "parquet" else "jsonl.gz"
+    tmp_path = os.path.join(settings.ARCHIVE_DIR, f"{month:%Y-%m}.{ext}.tmp")
+
+    summary: Dict[Tuple, List] = {}
+    rows = _iter_month_rows(db, month, end, summary)
+    count = _write_parquet(tmp_path, rows) if fmt == "parquet" else _write_jsonl(tmp_path, rows)
+    if count == 0:
+        os.remove(tmp_path)
+        return None
+    # An earlier part of this month is already cold — its rows are gone, keep its file
+    path = _cold_path(month, ext)
+    os.rename(tmp_path, path)
+
+    if summary:
+        db.execute(insert(TransactionColdSummary), [
+            {"month": month, "day": day, "project_id": project_id, "backer_id": backer_id,
+             "amount": amount, "contributions": contributions, "jobs_created": jobs,
+             "first_backed_at": first, "last_backed_at": last}
+            for (day, project_id, backer_id), (amount, contributions, jobs, first, last) in summary.items()
+        ])
+
+    if _is_postgres(db):
+        name = partition_name(month)
+        db.execute(text(f"ALTER TABLE transactions_archive DETACH PARTITION {name}"))
+        db.execute(text(f"DROP TABLE {name}"))
+    else:
+        db.execute(
+            delete(TransactionArchive)
+            .where(TransactionArchive.created_at >= month, TransactionArchive.created_at < end)
+        )
+    db.commit()
+
+    logger.info(f"Moved {count} archived transactions for {month:%Y-%m} to {path}")
+    return path
+
+
+def export_cold_months(db: Session, older_than: datetime) -> List[str]:
+    oldest = db.execute(
+        select(func.min(TransactionArchive.created_at))
+        .where(TransactionArchive.created_at < older_than)
+    ).scalar()
+    if not oldest:
+        return []
+
+    paths = []
+    month = month_start(oldest)
+    # Only whole months that ended before the cutoff
+    while next_month(month) <= older_than:
+        path = export_month_to_cold_storage(db, month)
+        if path:
+            paths.append(path)
+        month = next_month(month)
+    return paths
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+def run(db: Session = None) -> Dict[str, int]:
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        now = datetime.utcnow()
+        moved = archive_settled_transactions(db, now - timedelta(days=settings.ARCHIVE_AFTER_DAYS))
+        files = export_cold_months(db, now - timedelta(days=settings.COLD_STORAGE_AFTER_DAYS))
+        logger.info(f"Archive run complete: {moved} rows archived, {len(files)} month(s) to cold storage")
+        return {"archived": moved, "cold_files": len(files)}
+    finally:
+        if own_session:
+            db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run()
@@ -0,0 +1,51 @@
+# app/jobs/backfill_jobs_created.py
+"""
+BDR – Recompute jobs_created on every transaction (hot + archive) after
+the impact rates change (app/content/impact_rates.json), then rebuild the
+rollups that sum it: projects.jobs_created, backer_stats and
+project_funding_buckets.
+Idempotent — rows already at the right value are not touched.
+
+Run:
+    python -m app.jobs.backfill_jobs_created [--batch-size 1000] [--skip-rollups]
+"""
+
+import argparse
+import logging
+from typing import Dict
+
+from ..database import SessionLocal
+from ..crud.impact import backfill_jobs_created, rebuild_project_jobs
+from ..crud.backer_stats import rebuild_backer_stats
+from ..crud.project_analytics import rebuild_funding_buckets
+from ..models.transaction import Transaction, TransactionArchive
+from ..utils.impact import reload_rate_table
+
+logger = logging.getLogger(__name__)
+
+
+def run(batch_size: int = 1000, rollups: bool = True) -> Dict:
+    table = reload_rate_table()
+    db = SessionLocal()
+    try:
+        stats = {
+            "hot": backfill_jobs_created(db, Transaction, batch_size=batch_size, table=table),
+            "archive": backfill_jobs_created(db, TransactionArchive, batch_size=batch_size, table=table),
+        }
+        if rollups and (stats["hot"] or stats["archive"]):
+            stats["projects"] = rebuild_project_jobs(db)
+            stats["backers"] = rebuild_backer_stats(db)
+            stats["funding_buckets"] = rebuild_funding_buckets(db, batch_size=batch_size)
+        logger.info(f"Job backfill complete: {stats}")
+        return stats
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Recompute transactions.jobs_created at the current impact rates")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--skip-rollups", action="store_true", help="don't rebuild project totals / backer_stats / funding buckets")
+    args = parser.parse_args()
+    run(batch_size=args.batch_size, rollups=not args.skip_rollups)
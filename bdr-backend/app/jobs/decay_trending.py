@@ -0,0 +1,50 @@
+# app/jobs/decay_trending.py
+"""
+BDR – Decay project trending scores (see app/crud/project_engagement.py).
+Decays by the wall-clock time since the last run, so the schedule only
+sets how smooth the curve is; skipped or overlapping runs are harmless.
+
+Run:
+    python -m app.jobs.decay_trending            # once
+    python -m app.jobs.decay_trending --loop     # every TRENDING_DECAY_INTERVAL_SECONDS
+"""
+
+import argparse
+import logging
+import time
+
+from ..core.config import settings
+from ..database import SessionLocal
+from ..crud.project_engagement import decay_trending
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    db = SessionLocal()
+    try:
+        touched = decay_trending(db)
+        logger.info(f"Decayed {touched} trending score(s)")
+        return touched
+    finally:
+        db.close()
+
+
+def run_forever(interval: float) -> None:
+    while True:
+        try:
+            run()
+        except Exception:
+            logger.exception("Trending decay failed")
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Decay project trending scores")
+    parser.add_argument("--loop", action="store_true", help="keep running every TRENDING_DECAY_INTERVAL_SECONDS")
+    args = parser.parse_args()
+    if args.loop:
+        run_forever(settings.TRENDING_DECAY_INTERVAL_SECONDS)
+    else:
+        run()
@@ -0,0 +1,30 @@
+# app/jobs/purge_idempotency_keys.py
+"""
+BDR – Delete expired Idempotency-Key rows (past IDEMPOTENCY_TTL_HOURS).
+Batched deletes on the expires_at index; safe to run as often as you like.
+
+Run:
+    python -m app.jobs.purge_idempotency_keys
+"""
+
+import logging
+
+from ..database import SessionLocal
+from ..crud.idempotency import purge_expired
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    db = SessionLocal()
+    try:
+        removed = purge_expired(db)
+        logger.info(f"Purged {removed} expired idempotency key(s)")
+        return removed
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run()
@@ -0,0 +1,32 @@
+# app/jobs/rebuild_backer_stats.py
+"""
+BDR – Backfill / repair backer_stats + backer_projects from the ledger.
+Normal operation keeps the rollups current from the webhook path;
+run this once after deploying, or if the rollups ever drift.
+
+Run:
+    python -m app.jobs.rebuild_backer_stats [backer_id]
+"""
+
+import logging
+import sys
+
+from ..database import SessionLocal
+from ..crud.backer_stats import rebuild_backer_stats
+
+logger = logging.getLogger(__name__)
+
+
+def run(backer_id: int = None) -> int:
+    db = SessionLocal()
+    try:
+        count = rebuild_backer_stats(db, backer_id=backer_id)
+        logger.info(f"Rebuilt rollups for {count} backer(s)")
+        return count
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else None)
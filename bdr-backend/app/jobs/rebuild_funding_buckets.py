@@ -0,0 +1,31 @@
+# app/jobs/rebuild_funding_buckets.py
+"""
+BDR – Backfill / repair project_funding_buckets from the ledger.
+The webhook path keeps buckets current; run this once after deploying.
+
+Run:
+    python -m app.jobs.rebuild_funding_buckets [project_id]
+"""
+
+import logging
+import sys
+
+from ..database import SessionLocal
+from ..crud.project_analytics import rebuild_funding_buckets
+
+logger = logging.getLogger(__name__)
+
+
+def run(project_id: int = None) -> int:
+    db = SessionLocal()
+    try:
+        count = rebuild_funding_buckets(db, project_id=project_id)
+        logger.info(f"Rebuilt {count} funding bucket(s)")
+        return count
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else None)
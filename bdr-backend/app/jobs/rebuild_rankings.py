@@ -0,0 +1,49 @@
+# app/jobs/rebuild_rankings.py
+"""
+BDR – Recompute trending + similar project rankings (app/crud/ranking.py).
+The endpoints only read what the last run stored; until the first run
+they return empty lists.
+
+Run:
+    python -m app.jobs.rebuild_rankings            # once
+    python -m app.jobs.rebuild_rankings --loop     # every RANKING_INTERVAL_SECONDS
+"""
+
+import argparse
+import logging
+import time
+from typing import Dict
+
+from ..core.config import settings
+from ..database import SessionLocal
+from ..crud.ranking import rebuild_rankings
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> Dict:
+    db = SessionLocal()
+    try:
+        return rebuild_rankings(db)
+    finally:
+        db.close()
+
+
+def run_forever(interval: float) -> None:
+    while True:
+        try:
+            run()
+        except Exception:
+            logger.exception("Ranking rebuild failed")
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Recompute trending + similar projects")
+    parser.add_argument("--loop", action="store_true", help="keep running every RANKING_INTERVAL_SECONDS")
+    args = parser.parse_args()
+    if args.loop:
+        run_forever(settings.RANKING_INTERVAL_SECONDS)
+    else:
+        run()
@@ -0,0 +1,215 @@
+# app/jobs/reconcile_payments.py
+"""
+BDR – Payment status reconciliation
+
+A lost MoMo callback leaves a transaction `pending` forever. This job
+walks pending transactions — and basket payments, whose lines settle with
+them — older than RECONCILE_AFTER_MINUTES (index scan on (status,
+created_at), keyset by (created_at, id)), asks each provider's status
+API — RECONCILE_CONCURRENCY calls in flight at once,
+on the shared payment client — and applies the answers through
+update_transaction_status(), the same idempotent path as the webhooks.
+
+Still pending past RECONCILE_GIVE_UP_HOURS → failed (the provider has
+expired the request by then). Bank transfers have no status API and are
+left for an admin (POST /api/v1/admin/transfers/{reference}/settle).
+
+Run:
+    python -m app.jobs.reconcile_payments            # once
+    python -m app.jobs.reconcile_payments --loop     # every RECONCILE_INTERVAL_SECONDS
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, or_, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..crud.transaction import update_transaction_status
+from ..database import SessionLocal
+from ..models.payment import Payment
+from ..models.transaction import Transaction, TransactionStatus
+from ..utils.email_queue import email_queue
+from ..utils.payments import FAILED, PENDING, PaymentError, get_provider, payment_http
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconcileStats:
+    scanned: int = 0
+    completed: int = 0
+    failed: int = 0
+    expired: int = 0           # gave up waiting → failed
+    still_pending: int = 0
+    unsupported: int = 0       # provider can't be asked (dev mode, unknown provider)
+    errors: int = 0            # provider unreachable / refused; retried next run
+    seconds: float = 0.0
+
+    @property
+    def resolved(self) -> int:
+        return self.completed + self.failed + self.expired
+
+    def as_dict(self) -> Dict:
+        return {**asdict(self), "resolved": self.resolved, "seconds": round(self.seconds, 3)}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Scan
+# ─────────────────────────────────────────────────────────────────────────────
+def find_stuck(db: Session, older_than: datetime, after: Optional[tuple] = None, limit: int = 100,
+               model=Transaction) -> List:
+    """
+    Pending rows of `model` (Transaction or Payment) created before
+    `older_than`, oldest first, after the (created_at, id) cursor.
+    """
+    query = (
+        select(model.id, model.created_at, model.external_id, model.provider, model.provider_ref)
+        .where(
+            model.status == TransactionStatus.pending,
+            model.created_at < older_than,
+            model.provider != "bank",              # no status API; settled by an admin
+        )
+    )
+    if model is Transaction:
+        query = query.where(Transaction.payment_id.is_(None))   # basket lines settle with their payment
+    if after:
+        created_at, last_id = after
+        query = query.where(or_(
+            model.created_at > created_at,
+            and_(model.created_at == created_at, model.id > last_id),
+        ))
+    return db.execute(query.order_by(model.created_at, model.id).limit(limit)).all()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Reconcile
+# ─────────────────────────────────────────────────────────────────────────────
+async def _check(row, semaphore: asyncio.Semaphore):
+    """(row, ProviderStatus | None | PaymentError)"""
+    try:
+        provider = get_provider(row.provider)
+    except KeyError:
+        return row, None
+    if not row.provider_ref:
+        return row, None
+    async with semaphore:
+        try:
+            return row, await provider.fetch_status(row.provider_ref)
+        except PaymentError as e:
+            return row, e
+
+
+async def reconcile(
+    db: Session,
+    now: Optional[datetime] = None,
+    after_minutes: Optional[int] = None,
+    give_up_hours: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    max_rows: Optional[int] = None,
+) -> ReconcileStats:
+    started = time.perf_counter()
+    now = now or datetime.utcnow()
+    cutoff = now - timedelta(minutes=after_minutes if after_minutes is not None else settings.RECONCILE_AFTER_MINUTES)
+    give_up = now - timedelta(hours=give_up_hours if give_up_hours is not None else settings.RECONCILE_GIVE_UP_HOURS)
+    batch_size = batch_size or settings.RECONCILE_BATCH_SIZE
+    max_rows = max_rows or settings.RECONCILE_MAX_PER_RUN
+    semaphore = asyncio.Semaphore(concurrency or settings.RECONCILE_CONCURRENCY)
+
+    stats = ReconcileStats()
+    for model in (Transaction, Payment):
+        await _reconcile_rows(db, model, cutoff, give_up, batch_size, max_rows, semaphore, stats)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+async def _reconcile_rows(db, model, cutoff, give_up, batch_size, max_rows, semaphore, stats: ReconcileStats) -> None:
+    cursor = None
+    while stats.scanned < max_rows:
+        rows = find_stuck(db, cutoff, after=cursor, limit=min(batch_size, max_rows - stats.scanned), model=model)
+        if not rows:
+            break
+        stats.scanned += len(rows)
+        cursor = (rows[-1].created_at, rows[-1].id)
+
+        # Provider calls overlap; DB writes happen after, one at a time on this session
+        for row, result in await asyncio.gather(*(_check(row, semaphore) for row in rows)):
+            if isinstance(result, Exception):
+                logger.warning(f"Status check failed for tx {row.id} ({row.provider}): {result}")
+                stats.errors += 1
+                continue
+            status = result.status if result else None
+            expired = False
+            if status is None:
+                # Dev mode / unknown provider, or initiation never got a provider reference
+                if row.provider_ref or row.created_at >= give_up:
+                    stats.unsupported += 1
+                    stats.still_pending += 1
+                    continue
+                status, expired = FAILED, True
+            elif status == PENDING:
+                if row.created_at >= give_up:
+                    stats.still_pending += 1
+                    continue
+                status, expired = FAILED, True
+
+            transaction = update_transaction_status(db, row.external_id, result.provider_ref if result else None, status)
+            if transaction is None or transaction.status == TransactionStatus.pending:
+                stats.still_pending += 1
+            elif expired:
+                stats.expired += 1
+            elif transaction.status == TransactionStatus.completed:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+async def run_async(db: Session = None) -> Dict:
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        await email_queue.start()          # receipts for the payments this run settles
+        try:
+            async with payment_http:
+                stats = await reconcile(db)
+        finally:
+            await email_queue.stop()
+        logger.info(f"Reconcile run complete: {stats.as_dict()}")
+        return stats.as_dict()
+    finally:
+        if own_session:
+            db.close()
+
+
+def run(db: Session = None) -> Dict:
+    return asyncio.run(run_async(db))
+
+
+async def run_forever(interval: float) -> None:
+    while True:
+        try:
+            await run_async()
+        except Exception:
+            logger.exception("Reconcile run failed")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Resolve stuck pending payments from provider status APIs")
+    parser.add_argument("--loop", action="store_true", help="keep running every RECONCILE_INTERVAL_SECONDS")
+    args = parser.parse_args()
+    if args.loop:
+        asyncio.run(run_forever(settings.RECONCILE_INTERVAL_SECONDS))
+    else:
+        run()
@@ -0,0 +1,134 @@
+# app/jobs/run_pledges.py
+"""
+BDR – Monthly pledge scheduler
+
+Picks active pledges whose next_run_at has passed, PLEDGE_BATCH_SIZE at a
+time (index on (status, next_run_at); SKIP LOCKED on Postgres, so two
+schedulers never take the same pledge). One commit per batch creates
+each pledge's basket payment for the month and moves next_run_at on — a
+crash after that point skips a month rather than charging it twice.
+The MoMo prompts then go out PLEDGE_CONCURRENCY at a time on the shared
+payment client; the webhook / reconciliation settle them like any basket.
+
+Run:
+    python -m app.jobs.run_pledges            # once
+    python -m app.jobs.run_pledges --loop     # every PLEDGE_INTERVAL_SECONDS
+"""
+
+import argparse
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..crud import payment as crud_payment
+from ..database import SessionLocal
+from ..utils.payments import PaymentError, PaymentRequest, get_provider, payment_http
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PledgeRunStats:
+    due: int = 0
+    charged: int = 0           # prompt sent; settles via webhook / reconciliation
+    failed: int = 0            # provider refused or unreachable
+    skipped: int = 0           # none of the pledged projects is still open
+
+
+async def _initiate(pledge, payment, semaphore: asyncio.Semaphore):
+    request = PaymentRequest(
+        external_id=payment.external_id,
+        amount=int(payment.amount),
+        project_id=None,
+        project_title=f"BDR monthly pledge #{pledge.id}",
+        phone=pledge.momo_phone,
+    )
+    async with semaphore:
+        try:
+            return payment, await get_provider(payment.provider).initiate(request)
+        except PaymentError as e:
+            return payment, e
+
+
+async def run_due_pledges(
+    db: Session,
+    now: Optional[datetime] = None,
+    batch_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+) -> PledgeRunStats:
+    now = now or datetime.utcnow()
+    batch_size = batch_size or settings.PLEDGE_BATCH_SIZE
+    semaphore = asyncio.Semaphore(concurrency or settings.PLEDGE_CONCURRENCY)
+
+    stats = PledgeRunStats()
+    last_id = 0
+    while True:
+        pledges = crud_payment.get_due_pledges(db, now, after_id=last_id, limit=batch_size)
+        if not pledges:
+            break
+        last_id = pledges[-1].id
+        stats.due += len(pledges)
+
+        started = []
+        for pledge in pledges:
+            payment = crud_payment.start_pledge_run(db, pledge, now)
+            if payment is None:
+                stats.skipped += 1
+            else:
+                started.append((pledge, payment))
+        db.commit()
+
+        for payment, result in await asyncio.gather(*(_initiate(p, pay, semaphore) for p, pay in started)):
+            if isinstance(result, Exception):
+                logger.warning(f"Pledge payment {payment.id} not sent: {result}")
+                crud_payment.fail_payment_initiation(db, payment)
+                stats.failed += 1
+            else:
+                crud_payment.record_payment_initiation(db, payment, result.reference)
+                stats.charged += 1
+    return stats
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entry point
+# ─────────────────────────────────────────────────────────────────────────────
+async def run_async(db: Session = None) -> Dict:
+    own_session = db is None
+    db = db or SessionLocal()
+    try:
+        async with payment_http:
+            stats = await run_due_pledges(db)
+        logger.info(f"Pledge run complete: {asdict(stats)}")
+        return asdict(stats)
+    finally:
+        if own_session:
+            db.close()
+
+
+def run(db: Session = None) -> Dict:
+    return asyncio.run(run_async(db))
+
+
+async def run_forever(interval: float) -> None:
+    while True:
+        try:
+            await run_async()
+        except Exception:
+            logger.exception("Pledge run failed")
+        await asyncio.sleep(interval)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Charge due monthly pledges")
+    parser.add_argument("--loop", action="store_true", help="keep running every PLEDGE_INTERVAL_SECONDS")
+    args = parser.parse_args()
+    if args.loop:
+        asyncio.run(run_forever(settings.PLEDGE_INTERVAL_SECONDS))
+    else:
+        run()
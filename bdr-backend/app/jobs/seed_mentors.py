@@ -0,0 +1,30 @@
+# app/jobs/seed_mentors.py
+"""
+BDR – Load the mentor directory (app/content/mentors.json) into the DB.
+Mentors already present (by slug) are left untouched, so it is safe to re-run.
+
+Run:
+    python -m app.jobs.seed_mentors
+"""
+
+import logging
+
+from ..database import SessionLocal
+from ..crud.mentor import seed_mentors
+
+logger = logging.getLogger(__name__)
+
+
+def run() -> int:
+    db = SessionLocal()
+    try:
+        added = seed_mentors(db)
+        logger.info(f"Seeded {added} mentor(s)")
+        return added
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run()
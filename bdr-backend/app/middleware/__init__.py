@@ -0,0 +1,13 @@
+# app/middleware/__init__.py
+from .rate_limit import RateLimitMiddleware, RouteLimit, DEFAULT_ROUTE_LIMITS
+from .load_shedding import LoadSheddingMiddleware
+from .metrics import MetricsMiddleware
+from .profiling import ProfilingMiddleware
+from .compression import CompressionMiddleware
+from .responses import send_retry_after
+
+__all__ = [
+    "RateLimitMiddleware", "RouteLimit", "DEFAULT_ROUTE_LIMITS",
+    "LoadSheddingMiddleware", "MetricsMiddleware", "ProfilingMiddleware",
+    "CompressionMiddleware", "send_retry_after",
+]
@@ -0,0 +1,158 @@
+# app/middleware/compression.py
+"""
+BDR – Compression + conditional GET (pure ASGI)
+
+Single-body responses (normal JSON):
+- GET 200 without an ETag gets a weak ETag hashed from the body;
+  a matching If-None-Match turns it into a bodiless 304
+- bodies ≥ min_size are brotli'd (if installed and accepted) or gzipped;
+  a strong ETag becomes weak, since the encoded bytes differ
+Streaming responses (exports) are compressed chunk by chunk.
+Server-sent events, images and already-encoded bodies pass straight through.
+
+Routes that know a version stamp (see app/utils/etag.py) answer 304
+themselves before doing any work; the body hash here is the fallback.
+"""
+
+import gzip
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.etag import body_etag, etag_matches
+
+# Safe import — brotli is optional, gzip always works
+try:
+    import brotli
+    brotli_available = True
+except Exception:
+    brotli = None
+    brotli_available = False
+
+COMPRESSIBLE = ("application/json", "text/html", "text/plain", "text/csv", "text/css",
+                "application/javascript", "image/svg+xml", "application/xml")
+
+
+class _Encoder:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._c = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._c = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._c.process(data) + self._c.flush()
+        return self._c.compress(data) + self._c.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._c.finish() if self.encoding == "br" else self._c.flush()
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, min_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5):
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def _pick_encoding(self, accept: str) -> Optional[str]:
+        accepted = {part.split(";")[0].strip().lower() for part in accept.split(",")}
+        if brotli_available and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def _compress_whole(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        encoding = self._pick_encoding(request_headers.get("accept-encoding", ""))
+        if_none_match = request_headers.get("if-none-match")
+        conditional = scope["method"] in ("GET", "HEAD")
+
+        start: Optional[Message] = None
+        passthrough = False
+        encoder: Optional[_Encoder] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough, encoder
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                passthrough = (
+                    "content-encoding" in headers
+                    or content_type.startswith("text/event-stream")
+                    or message["status"] in (204, 304)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    start = message     # hold until we see the body
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more = message.get("more_body", False)
+            headers = MutableHeaders(raw=start["headers"]) if start else None
+            compressible = headers is not None and headers.get("content-type", "").startswith(COMPRESSIBLE)
+
+            if start is not None and not more:
+                # ── whole body in one message ───────────────────────────────
+                if conditional and start["status"] == 200 and "etag" not in headers:
+                    headers["ETag"] = body_etag(body)
+                if conditional and start["status"] == 200 and etag_matches(if_none_match, headers["etag"]):
+                    start["status"] = 304
+                    for name in ("content-length", "content-type"):
+                        if name in headers:
+                            del headers[name]
+                    await send(start)
+                    await send({"type": "http.response.body", "body": b""})
+                    return
+                if encoding and compressible and len(body) >= self.min_size:
+                    body = self._compress_whole(encoding, body)
+                    headers["Content-Encoding"] = encoding
+                    if headers.get("etag", "").startswith('"'):
+                        headers["ETag"] = "W/" + headers["etag"]
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                elif compressible:
+                    headers.add_vary_header("Accept-Encoding")
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                start = None
+                return
+
+            if start is not None:
+                # ── first chunk of a streaming body ─────────────────────────
+                if encoding and compressible:
+                    encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+                    headers["Content-Encoding"] = encoding
+                    headers.add_vary_header("Accept-Encoding")
+                    if "content-length" in headers:
+                        del headers["content-length"]
+                await send(start)
+                start = None
+
+            if encoder is not None:
+                body = encoder.chunk(body) if body else b""
+                if not more:
+                    body += encoder.finish()
+            await send({"type": "http.response.body", "body": body, "more_body": more})
+
+        await self.app(scope, receive, send_wrapper)
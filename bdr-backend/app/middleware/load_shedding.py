@@ -0,0 +1,91 @@
+# app/middleware/load_shedding.py
+"""
+BDR – Concurrency-based load shedding
+
+Two overload signals, both checked before the request is handed on:
+- in-flight requests above MAX_IN_FLIGHT
+- event-loop lag (how late a 100 ms ticker wakes up) above MAX_LOOP_LAG_MS,
+  the closest thing to "queue latency" a single uvicorn worker exposes
+
+Either one → immediate 503 + Retry-After instead of piling more work on.
+Health checks are never shed, so Render doesn't restart a busy instance.
+Long-lived streams (SSE) and long-polls are admitted by the same checks
+but don't count as in-flight — they sit idle, and would otherwise fill
+the budget.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Iterable, Optional, Tuple
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .responses import send_retry_after
+
+logger = logging.getLogger(__name__)
+
+_TICK = 0.1
+
+
+class LoadSheddingMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_in_flight: int = 200,
+        max_loop_lag_ms: float = 500.0,
+        retry_after: int = 2,
+        exempt_paths: Iterable[str] = ("/", "/health", "/metrics"),
+        stream_suffixes: Tuple[str, ...] = ("/stream", "/poll"),
+    ):
+        self.app = app
+        self.max_in_flight = max_in_flight
+        self.max_loop_lag = max_loop_lag_ms / 1000.0
+        self.retry_after = retry_after
+        self.exempt_paths = frozenset(exempt_paths)
+        self.stream_suffixes = stream_suffixes
+        self.in_flight = 0
+        self.loop_lag = 0.0
+        self.shed_count = 0
+        self._monitor: Optional[asyncio.Task] = None
+
+    async def _watch_loop(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(_TICK)
+            lag = time.perf_counter() - started - _TICK
+            # Decay slowly so one hiccup doesn't flap, but a busy loop shows
+            self.loop_lag = max(lag, self.loop_lag * 0.7)
+
+    def overloaded(self) -> Optional[str]:
+        if self.in_flight >= self.max_in_flight:
+            return f"in_flight={self.in_flight}"
+        if self.loop_lag > self.max_loop_lag:
+            return f"loop_lag={self.loop_lag * 1000:.0f}ms"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self._monitor is None or self._monitor.done():
+            self._monitor = asyncio.create_task(self._watch_loop())
+
+        reason = self.overloaded()
+        if reason:
+            self.shed_count += 1
+            if self.shed_count % 100 == 1:
+                logger.warning(f"Shedding load ({reason}), {self.shed_count} requests shed so far")
+            await send_retry_after(send, 503, "Server is busy. Please retry in a moment.", self.retry_after)
+            return
+
+        if scope["path"].endswith(self.stream_suffixes):
+            await self.app(scope, receive, send)
+            return
+
+        self.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.in_flight -= 1
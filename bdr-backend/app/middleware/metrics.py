@@ -0,0 +1,69 @@
+# app/middleware/metrics.py
+"""
+BDR – Per-route latency + DB usage (pure ASGI)
+
+Routes are labelled by their path template ("/api/v1/projects/{project_id}"),
+never the raw path, so label cardinality stays bounded.
+"""
+
+import time
+from typing import Dict
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import (
+    REQUESTS, REQUEST_LATENCY, DB_QUERIES_PER_REQUEST, DB_TIME_PER_REQUEST,
+    start_request, end_request,
+)
+
+
+_templates: Dict[object, str] = {}
+
+
+def route_template(scope: Scope) -> str:
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    template = _templates.get(endpoint)
+    if template is None:
+        routes = getattr(scope.get("app"), "routes", [])
+        template = next(
+            (getattr(r, "path", "unmatched") for r in routes
+             if isinstance(r, BaseRoute) and getattr(r, "endpoint", None) is endpoint),
+            "unmatched",
+        )
+        _templates[endpoint] = template
+    return template
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request(lambda: route_template(scope))
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = stats.route
+            method = scope["method"]
+            REQUESTS.inc(method=method, route=route, status=status_code)
+            REQUEST_LATENCY.observe(elapsed, method=method, route=route)
+            DB_QUERIES_PER_REQUEST.observe(stats.queries, route=route)
+            DB_TIME_PER_REQUEST.observe(stats.db_seconds, route=route)
+            end_request(token)
@@ -0,0 +1,92 @@
+# app/middleware/profiling.py
+"""
+BDR – Request profiling (pure ASGI)
+
+- Admin on demand: send `X-Profile: 1` (or `?profile=1`) with an admin
+  bearer token → response carries `X-Profile-Id`; fetch the folded stacks
+  from GET /api/v1/admin/profiles/{id}.
+- Silent sampling: PROFILE_SAMPLE_RATE of all requests are profiled and
+  only the slowest per route are kept.
+Everyone else pays one random() call.
+"""
+
+import random
+import time
+from datetime import datetime
+from typing import Optional
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.models.user import UserRole
+from app.utils.profiling import sampler, profile_store, current_session, StoredProfile
+from app.utils.security import verify_token
+from .metrics import route_template
+
+
+def _admin_requested(scope: Scope) -> bool:
+    conn = HTTPConnection(scope)
+    flag = conn.headers.get("x-profile") or conn.query_params.get("profile")
+    if flag not in ("1", "true", "yes"):
+        return False
+    auth = conn.headers.get("authorization", "")
+    if not auth.lower().startswith("bearer "):
+        return False
+    payload = verify_token(auth[7:])
+    return bool(payload) and payload.get("role") == UserRole.ADMIN.value
+
+
+class ProfilingMiddleware:
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0):
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trigger: Optional[str] = None
+        if _admin_requested(scope):
+            trigger = "admin"
+        elif self.sample_rate and random.random() < self.sample_rate:
+            trigger = "sampled"
+        if trigger is None:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profile_store.new_id()
+        key, session = sampler.start_session(scope)
+        token = current_session.set(session)
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if trigger == "admin":
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_session.reset(token)
+            sampler.stop_session(key)
+            duration_ms = (time.perf_counter() - started) * 1000
+            route = route_template(scope)
+            if trigger == "admin" or profile_store.wants(route, duration_ms):
+                profile_store.add(StoredProfile(
+                    id=profile_id,
+                    route=route,
+                    method=scope["method"],
+                    path=scope["path"],
+                    status=status_code,
+                    duration_ms=round(duration_ms, 2),
+                    samples=session.sample_count,
+                    trigger=trigger,
+                    captured_at=datetime.utcnow(),
+                    folded=session.folded(),
+                ))
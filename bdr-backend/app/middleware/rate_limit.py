@@ -0,0 +1,99 @@
+# app/middleware/rate_limit.py
+"""
+BDR – Per-route token-bucket limits (pure ASGI, runs before routing)
+
+Each RouteLimit matches a method + path regex and is keyed by client IP
+or by the JWT subject (falls back to IP when there is no valid token),
+optionally per path too (one bucket per client per project).
+Buckets live in the shared RateLimitStore (memory or redis, see
+app/utils/rate_limit.py). Requests matching no rule pass straight through.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Pattern
+
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .responses import send_retry_after
+from app.utils.rate_limit import get_rate_limit_store, client_ip, per_minute
+from app.utils.security import verify_token
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RouteLimit:
+    name: str
+    path: str                      # regex, matched against the full path
+    capacity: int                  # burst
+    per_min: float                 # sustained refill
+    methods: tuple = ("POST",)
+    key_by: str = "ip"             # "ip" or "user"
+    per_path: bool = False         # separate bucket for every matching path
+    pattern: Pattern = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.pattern = re.compile(self.path)
+
+    def matches(self, method: str, path: str) -> bool:
+        return method in self.methods and self.pattern.fullmatch(path) is not None
+
+
+# Expensive endpoints: pbkdf2 on login/register, file writes on upload,
+# whole-table aggregates on admin stats / exports. Message sends are
+# limited per user to keep spam bursts out of inboxes. Share tracking is
+# public and feeds trending_score, so each client gets a few per project.
+DEFAULT_ROUTE_LIMITS: List[RouteLimit] = [
+    RouteLimit("auth.login", r"/api/v1/auth/login/?", capacity=10, per_min=5),
+    RouteLimit("auth.register", r"/api/v1/auth/register/?", capacity=5, per_min=2),
+    RouteLimit("projects.upload", r"/api/v1/projects/upload/?", capacity=5, per_min=2, key_by="user"),
+    RouteLimit("admin.stats", r"/api/v1/admin/stats/?", capacity=10, per_min=10, methods=("GET",), key_by="user"),
+    RouteLimit("admin.export", r"/api/v1/admin/export/.*", capacity=3, per_min=1, methods=("GET",), key_by="user"),
+    RouteLimit("messages.send", r"/api/v1/messages/conversations(/\d+/messages)?/?", capacity=20, per_min=10, key_by="user"),
+    RouteLimit("projects.share", r"/api/v1/projects/\d+/share/?", capacity=3, per_min=0.2, per_path=True),
+]
+
+
+def _subject(conn: HTTPConnection) -> Optional[str]:
+    auth = conn.headers.get("authorization", "")
+    if not auth.lower().startswith("bearer "):
+        return None
+    payload = verify_token(auth[7:])
+    return str(payload["sub"]) if payload and payload.get("sub") is not None else None
+
+
+class RateLimitMiddleware:
+    def __init__(self, app: ASGIApp, limits: Optional[List[RouteLimit]] = None, enabled: bool = True):
+        self.app = app
+        self.limits = DEFAULT_ROUTE_LIMITS if limits is None else limits
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method, path = scope["method"], scope["path"]
+        rule = next((r for r in self.limits if r.matches(method, path)), None)
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        conn = HTTPConnection(scope)
+        subject = _subject(conn) if rule.key_by == "user" else None
+        key = f"user:{subject}" if subject else f"ip:{client_ip(conn)}"
+        if rule.per_path:
+            key += f":{path.rstrip('/')}"
+
+        allowed, retry_after = await get_rate_limit_store().take(
+            f"route:{rule.name}:{key}", rule.capacity, per_minute(rule.per_min)
+        )
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        logger.info(f"Rate limited {rule.name} for {key}")
+        await send_retry_after(send, 429, "Too many requests. Please slow down and try again shortly.", retry_after)
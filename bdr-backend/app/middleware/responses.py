@@ -0,0 +1,27 @@
+# app/middleware/responses.py
+"""
+BDR – Raw ASGI responses shared by the middlewares that turn requests away
+before routing (rate limiting, load shedding)
+
+send_retry_after(send, status_code, detail, retry_after)
+    → JSON {"detail": ...} with a Retry-After header (whole seconds, ≥ 1)
+"""
+
+import json
+import math
+
+from starlette.types import Send
+
+
+async def send_retry_after(send: Send, status_code: int, detail: str, retry_after: float) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
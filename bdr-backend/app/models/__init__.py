@@ -2,14 +2,42 @@
 
 from .user import User
 from .project import Project
-from .transaction import Transaction
+from .transaction import Transaction, TransactionArchive, TransactionColdSummary
 from .notification import Notification
 from .contact_message import ContactMessage
+from .backer_stats import BackerStats, BackerProject
+from .project_funding_bucket import ProjectFundingBucket
+from .counter import Counter
+from .page_document import PageDocument
+from .mentor import MentorProfile, MentorAvailability, MentorBooking
+from .message import Conversation, ConversationParticipant, Message
+from .idempotency import IdempotencyKey
+from .payment import Payment, Pledge, PledgeItem
+from .project_ranking import ProjectRanking, ProjectSimilarity
 
 __all__ = [
     "User",
     "Project",
     "Transaction",
+    "TransactionArchive",
+    "TransactionColdSummary",
     "Notification",
     "ContactMessage",
+    "BackerStats",
+    "BackerProject",
+    "ProjectFundingBucket",
+    "Counter",
+    "PageDocument",
+    "MentorProfile",
+    "MentorAvailability",
+    "MentorBooking",
+    "Conversation",
+    "ConversationParticipant",
+    "Message",
+    "IdempotencyKey",
+    "Payment",
+    "Pledge",
+    "PledgeItem",
+    "ProjectRanking",
+    "ProjectSimilarity",
 ]
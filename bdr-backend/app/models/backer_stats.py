@@ -0,0 +1,40 @@
+# app/models/backer_stats.py
+"""
+BDR – Backer impact rollups
+One row per backer, maintained when a transaction completes, so the
+backer dashboard is a primary-key read no matter how many
+contributions the backer has made.
+"""
+
+from sqlalchemy import Column, Integer, DateTime, DECIMAL, ForeignKey
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class BackerStats(Base):
+    __tablename__ = "backer_stats"
+
+    backer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+
+    total_rwf = Column(DECIMAL(14, 0), default=0, nullable=False)
+    jobs_created = Column(Integer, default=0, nullable=False)
+    projects_backed = Column(Integer, default=0, nullable=False)
+    contributions_count = Column(Integer, default=0, nullable=False)
+
+    last_backed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<BackerStats backer={self.backer_id} rwf={self.total_rwf}>"
+
+
+class BackerProject(Base):
+    """Distinct (backer, project) pairs — drives `projects_backed`."""
+    __tablename__ = "backer_projects"
+
+    backer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+
+    total_rwf = Column(DECIMAL(14, 0), default=0, nullable=False)
+    first_backed_at = Column(DateTime(timezone=True), server_default=func.now())
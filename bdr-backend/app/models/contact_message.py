@@ -1,6 +1,6 @@
 # bdr-backend/app/models/contact_message.py
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, SmallInteger, String, Text, DateTime, Boolean, Index, false, text
 from sqlalchemy.sql import func
 from app.database import Base  # ← Correct import
 
@@ -19,3 +19,15 @@ class ContactMessage(Base):
 
     # NEW FIELD — works correctly now
     is_read = Column(Boolean, default=False, nullable=False)
+
+    # Archived messages leave the inbox; archiving also marks them read,
+    # so "unread" always means "unread in the inbox" (see counters).
+    is_archived = Column(Boolean, default=False, server_default=false(), nullable=False)
+
+    # 0–100 heuristic from contact ingestion; high scores arrive archived
+    spam_score = Column(SmallInteger, default=0, server_default=text("0"), nullable=False)
+
+    __table_args__ = (
+        # Inbox badge / "unread first" triage path
+        Index("ix_contact_messages_is_read_created_at", "is_read", "created_at"),
+    )
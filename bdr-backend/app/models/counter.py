@@ -0,0 +1,31 @@
+# app/models/counter.py
+"""
+BDR – Maintained counters
+Small named counters kept up to date with atomic increments, so badges
+and totals are a primary-key read instead of a COUNT(*) scan.
+"""
+
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+UNREAD_CONTACT_MESSAGES = "contact_messages.unread"
+# Bumped on every flush that changes a Project beyond its funding totals —
+# the project list ETag (funding is covered by the total backer count)
+PROJECTS_VERSION = "projects.version"
+# Bumped on every page content edit — workers reload their snapshot
+PAGES_VERSION = "pages.version"
+# Unix time trending scores were last decayed to (app/jobs/decay_trending.py)
+TRENDING_DECAYED_AT = "projects.trending_decayed_at"
+
+
+class Counter(Base):
+    __tablename__ = "counters"
+
+    name = Column(String(100), primary_key=True)
+    value = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<Counter {self.name}={self.value}>"
@@ -0,0 +1,46 @@
+# app/models/idempotency.py
+"""
+BDR – Idempotency keys for retried POSTs (payment initiation)
+
+One row per (user, scope, Idempotency-Key). The row is inserted before
+the work starts, so the unique index is what serialises duplicates: the
+first request wins the insert, the others find its row and wait for
+the stored response. While in progress the owner holds a lease
+(locked_until); if it dies without finishing, a duplicate may take the
+key over once the lease has run out. Rows expire after
+IDEMPOTENCY_TTL_HOURS and are removed by app/jobs/purge_idempotency_keys.py.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+IN_PROGRESS = "in_progress"
+COMPLETED = "completed"
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    scope = Column(String(50), nullable=False)            # e.g. "payments.initiate"
+    key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)     # sha256 of the request body
+
+    state = Column(String(20), default=IN_PROGRESS, nullable=False)
+    response_status = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)           # JSON, replayed as-is
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    locked_until = Column(DateTime, nullable=True)        # naive UTC; owner's lease while in progress
+    expires_at = Column(DateTime, nullable=False)         # naive UTC
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "scope", "key", name="uq_idempotency_keys_user_scope_key"),
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    def __repr__(self):
+        return f"<IdempotencyKey {self.scope}:{self.key} {self.state}>"
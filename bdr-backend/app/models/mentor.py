@@ -0,0 +1,140 @@
+# app/models/mentor.py
+"""
+BDR – Mentors, weekly availability, bookings
+
+- MentorProfile       → public directory entry (optionally linked to a user)
+- MentorAvailability  → recurring weekly windows in the mentor's timezone
+- MentorBooking       → one fixed-length slot; times stored as naive UTC
+
+Double-booking is stopped by the database, not by a read-then-write
+check: a partial unique index allows one live (non-cancelled) booking
+per (mentor, start). On one slot grid two overlapping bookings share a
+start time, but the grid moves when a mentor edits their availability,
+so on Postgres an exclusion constraint also rejects any two live
+bookings of a mentor whose [starts_at, ends_at) ranges overlap.
+set_availability() refuses a grid that upcoming bookings are not on.
+"""
+
+import enum
+
+from sqlalchemy import (
+    Column, Integer, SmallInteger, String, Text, DateTime, Boolean, Numeric,
+    Enum, ForeignKey, Index, CheckConstraint, DDL, event, text,
+)
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class BookingStatus(enum.Enum):
+    pending = "pending"
+    confirmed = "confirmed"
+    cancelled = "cancelled"
+
+
+class MentorProfile(Base):
+    __tablename__ = "mentor_profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), unique=True, nullable=True)
+    slug = Column(String(100), unique=True, index=True, nullable=False)
+
+    name = Column(String(150), nullable=False)
+    title = Column(String(150), nullable=True)
+    company = Column(String(150), nullable=True)
+    bio = Column(Text, nullable=True)
+    quote = Column(Text, nullable=True)
+    image = Column(String(255), nullable=True)
+    expertise = Column(Text, nullable=True)          # JSON list of strings
+
+    rating = Column(Numeric(2, 1), default=5.0)
+    sessions_completed = Column(Integer, default=0)
+    hourly_rate = Column(Integer, default=0)         # RWF
+
+    timezone = Column(String(50), default="Africa/Kigali", server_default="Africa/Kigali", nullable=False)
+    slot_minutes = Column(SmallInteger, default=60, server_default=text("60"), nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    availability = relationship(
+        "MentorAvailability",
+        back_populates="mentor",
+        cascade="all, delete-orphan",
+        order_by="(MentorAvailability.weekday, MentorAvailability.start_minute)",
+    )
+
+    @property
+    def available(self) -> bool:
+        return bool(self.is_active and self.availability)
+
+    def __repr__(self):
+        return f"<MentorProfile {self.slug}>"
+
+
+class MentorAvailability(Base):
+    __tablename__ = "mentor_availability"
+
+    id = Column(Integer, primary_key=True)
+    mentor_id = Column(Integer, ForeignKey("mentor_profiles.id", ondelete="CASCADE"), nullable=False, index=True)
+    weekday = Column(SmallInteger, nullable=False)       # 0 = Monday
+    start_minute = Column(SmallInteger, nullable=False)  # minutes after local midnight
+    end_minute = Column(SmallInteger, nullable=False)
+
+    mentor = relationship("MentorProfile", back_populates="availability")
+
+    __table_args__ = (
+        CheckConstraint("weekday BETWEEN 0 AND 6", name="ck_mentor_availability_weekday"),
+        CheckConstraint("start_minute >= 0 AND end_minute <= 1440 AND start_minute < end_minute",
+                        name="ck_mentor_availability_window"),
+    )
+
+
+class MentorBooking(Base):
+    __tablename__ = "mentor_bookings"
+
+    id = Column(Integer, primary_key=True, index=True)
+    mentor_id = Column(Integer, ForeignKey("mentor_profiles.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    starts_at = Column(DateTime, nullable=False)   # UTC
+    ends_at = Column(DateTime, nullable=False)     # UTC
+    topic = Column(String(255), nullable=True)
+    status = Column(Enum(BookingStatus), default=BookingStatus.pending, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    cancelled_at = Column(DateTime(timezone=True), nullable=True)
+
+    mentor = relationship("MentorProfile")
+
+    __table_args__ = (
+        # One live booking per slot — the insert itself is the conflict check.
+        # Also the (mentor, time) range index the schedule loader scans.
+        Index(
+            "uq_mentor_bookings_live_slot", "mentor_id", "starts_at",
+            unique=True,
+            postgresql_where=text("status <> 'cancelled'"),
+            sqlite_where=text("status <> 'cancelled'"),
+        ),
+        # Catches overlaps off the current grid (needs btree_gist for mentor_id =)
+        ExcludeConstraint(
+            ("mentor_id", "="),
+            (func.tsrange(text("starts_at"), text("ends_at")), "&&"),
+            name="ex_mentor_bookings_live_overlap",
+            using="gist",
+            where=text("status <> 'cancelled'"),
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    def __repr__(self):
+        return f"<MentorBooking {self.mentor_id}@{self.starts_at} {self.status.value}>"
+
+
+# create_all() on Postgres: the exclusion constraint's `mentor_id WITH =` needs btree_gist
+event.listen(
+    MentorBooking.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist").execute_if(dialect="postgresql"),
+)
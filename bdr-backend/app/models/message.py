@@ -0,0 +1,79 @@
+# app/models/message.py
+"""
+BDR – Direct messages (backer ↔ entrepreneur, mentor ↔ mentee)
+
+- Conversation             → one per pair of users (pair_key is unique)
+- ConversationParticipant  → per-user read cursor (last_read_seq)
+- Message                  → numbered 1, 2, 3... inside its conversation
+
+Unread = conversation.last_seq - participant.last_read_seq: two columns
+already on the rows being listed, so no per-message read flags and no
+COUNT(*). Message pages are keyset on (conversation_id, id).
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index, UniqueConstraint, text
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+def pair_key(user_a: int, user_b: int) -> str:
+    low, high = sorted((user_a, user_b))
+    return f"{low}:{high}"
+
+
+class Conversation(Base):
+    __tablename__ = "conversations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    pair_key = Column(String(50), unique=True, nullable=False)   # "<low id>:<high id>"
+
+    last_seq = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    # No FK: messages already point here, and the cycle isn't worth it
+    last_message_id = Column(Integer, nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    participants = relationship("ConversationParticipant", back_populates="conversation", cascade="all, delete-orphan")
+
+    def __repr__(self):
+        return f"<Conversation {self.pair_key} seq={self.last_seq}>"
+
+
+class ConversationParticipant(Base):
+    __tablename__ = "conversation_participants"
+
+    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    last_read_seq = Column(Integer, default=0, server_default=text("0"), nullable=False)
+    joined_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    conversation = relationship("Conversation", back_populates="participants")
+    user = relationship("User")
+
+    __table_args__ = (
+        # "My conversations" starts from the user
+        Index("ix_conversation_participants_user_id", "user_id", "conversation_id"),
+    )
+
+
+class Message(Base):
+    __tablename__ = "messages"
+
+    id = Column(Integer, primary_key=True)
+    conversation_id = Column(Integer, ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    sender_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    seq = Column(Integer, nullable=False)
+    body = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Keyset pages + long-poll "after id" reads
+        Index("ix_messages_conversation_id_id", "conversation_id", "id"),
+        UniqueConstraint("conversation_id", "seq", name="uq_messages_conversation_seq"),
+    )
+
+    def __repr__(self):
+        return f"<Message {self.conversation_id}#{self.seq}>"
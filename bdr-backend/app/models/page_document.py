@@ -0,0 +1,24 @@
+# app/models/page_document.py
+"""
+BDR – Versioned page content (home / about / success ...)
+Append-only: an edit inserts (key, version + 1), old versions stay for
+rollback. Seeds live in app/content/pages/<key>.json.
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class PageDocument(Base):
+    __tablename__ = "page_documents"
+
+    key = Column(String(50), primary_key=True)
+    version = Column(Integer, primary_key=True)
+    content = Column(Text, nullable=False)          # JSON document, stored as written
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<PageDocument {self.key} v{self.version}>"
@@ -0,0 +1,98 @@
+# app/models/payment.py
+"""
+BDR – Basket payments + monthly pledges
+
+- Payment     → one provider charge covering several projects; its child
+                Transactions (one per project) are bulk-inserted with it
+                and settled together when the provider confirms
+- Pledge      → monthly recurring basket; app/jobs/run_pledges.py turns
+                each due pledge into a Payment and moves next_run_at on
+- PledgeItem  → project + amount inside a pledge
+"""
+
+import enum
+
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, DECIMAL, Index
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+from app.models.transaction import TransactionStatus
+
+
+class Payment(Base):
+    __tablename__ = "payments"
+
+    id = Column(Integer, primary_key=True, index=True)
+    external_id = Column(String, unique=True, nullable=False)   # what the provider echoes back
+    provider = Column(String(20), nullable=False)
+    provider_ref = Column(String, nullable=True)
+    momo_ref = Column(String, unique=True, nullable=True)
+
+    amount = Column(DECIMAL(12, 0), nullable=False)              # Σ children, RWF
+    status = Column(Enum(TransactionStatus), default=TransactionStatus.pending, nullable=False)
+
+    backer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    pledge_id = Column(Integer, ForeignKey("pledges.id", ondelete="SET NULL"), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    transactions = relationship("Transaction", back_populates="payment", order_by="Transaction.id")
+    backer = relationship("User")
+
+    __table_args__ = (
+        # Reconciliation scan of old pending payments
+        Index("ix_payments_status_created_at", "status", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<Payment {self.id} {self.status.value} x{len(self.transactions)}>"
+
+
+class PledgeStatus(enum.Enum):
+    active = "active"
+    cancelled = "cancelled"
+
+
+class Pledge(Base):
+    __tablename__ = "pledges"
+
+    id = Column(Integer, primary_key=True, index=True)
+    backer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    payment_method = Column(String(20), default="momo", nullable=False)
+    momo_phone = Column(String(20), nullable=True)
+
+    status = Column(Enum(PledgeStatus), default=PledgeStatus.active, nullable=False)
+    day_of_month = Column(Integer, nullable=False)              # 1-28, so every month has it
+    next_run_at = Column(DateTime, nullable=False)              # naive UTC
+    last_run_at = Column(DateTime, nullable=True)
+    last_payment_id = Column(Integer, nullable=True)            # no FK: payments already point here
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    items = relationship("PledgeItem", back_populates="pledge", cascade="all, delete-orphan", lazy="selectin")
+    backer = relationship("User")
+
+    __table_args__ = (
+        # Scheduler: WHERE status = 'active' AND next_run_at <= now
+        Index("ix_pledges_status_next_run_at", "status", "next_run_at"),
+        Index("ix_pledges_backer_id", "backer_id"),
+    )
+
+    @property
+    def amount(self) -> int:
+        return sum(int(item.amount) for item in self.items)
+
+    def __repr__(self):
+        return f"<Pledge {self.id} {self.status.value} day={self.day_of_month}>"
+
+
+class PledgeItem(Base):
+    __tablename__ = "pledge_items"
+
+    pledge_id = Column(Integer, ForeignKey("pledges.id", ondelete="CASCADE"), primary_key=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    amount = Column(DECIMAL(10, 0), nullable=False)
+
+    pledge = relationship("Pledge", back_populates="items")
@@ -1,10 +1,10 @@
 # app/models/project.py
 
 from sqlalchemy import (
-    Column, Integer, String, Text, DECIMAL, DateTime, Enum,
-    ForeignKey, func
+    Column, Integer, BigInteger, Float, String, Text, DECIMAL, DateTime, Enum,
+    ForeignKey, Index, func, event, update, inspect
 )
-from sqlalchemy.orm import relationship, validates
+from sqlalchemy.orm import relationship, validates, Session
 from sqlalchemy.exc import IntegrityError
 from typing import Optional
 from datetime import datetime, timedelta
@@ -12,6 +12,7 @@ import enum
 
 # ✅ Use the new unified Base
 from app.db.base import Base
+from app.models.counter import Counter, PROJECTS_VERSION
 
 
 class ProjectStatus(enum.Enum):
@@ -35,6 +36,13 @@ class Project(Base):
     job_goal = Column(Integer, nullable=False)
     jobs_to_create = Column(Integer, nullable=False)
     backers_count = Column(Integer, default=0, nullable=False)
+    # Jobs from completed backings, each at its own rate — maintained on credit,
+    # recomputed by app/jobs/backfill_jobs_created.py when the rates change
+    jobs_created = Column(Integer, default=0, server_default="0", nullable=False)
+    # Written behind by app/crud/project_engagement.py (batched, approximate)
+    views_count = Column(BigInteger, default=0, server_default="0", nullable=False)
+    shares_count = Column(BigInteger, default=0, server_default="0", nullable=False)
+    trending_score = Column(Float, default=0.0, server_default="0", nullable=False)   # decayed views + shares
     image_url = Column(String, nullable=True)
     video_url = Column(String, nullable=True)
     business_plan_pdf = Column(String(500), nullable=True)
@@ -43,7 +51,7 @@ class Project(Base):
     launched_at = Column(DateTime(timezone=True), nullable=True)
     ends_at = Column(DateTime(timezone=True), nullable=True)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     entrepreneur_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -60,6 +68,10 @@ class Project(Base):
         passive_deletes=True
     )
 
+    __table_args__ = (
+        Index("ix_projects_trending_score", "trending_score"),
+    )
+
     @validates("funding_goal")
     def validate_funding_goal(self, key, value):
         if float(value) <= 0:
@@ -79,6 +91,17 @@ class Project(Base):
         delta = self.ends_at - datetime.utcnow()
         return max(0, delta.days)
 
+    def update_funding(self, amount, jobs: int = 0) -> None:
+        """
+        Credit a completed backing and the jobs fixed when it was made.
+        Incremented in SQL, so concurrent credits can't overwrite each other;
+        flush before reading the new totals.
+        """
+        cls = type(self)
+        self.current_funding = func.coalesce(cls.current_funding, 0) + amount
+        self.backers_count = func.coalesce(cls.backers_count, 0) + 1
+        self.jobs_created = func.coalesce(cls.jobs_created, 0) + jobs
+
     def launch(self):
         """Launch the project and automatically start a 90-day campaign."""
         if self.status != ProjectStatus.draft:
@@ -86,3 +109,35 @@ class Project(Base):
         self.status = ProjectStatus.active
         self.launched_at = datetime.utcnow()
         self.ends_at = self.launched_at + timedelta(days=90)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Version stamp for conditional GETs on the project list: any ORM flush that
+# adds or deletes a Project, or changes more than its funding totals, bumps
+# the counter in the same DB transaction. (Core bulk updates must bump it
+# themselves.) Funding credits don't touch it — every credit adds a backer,
+# so the list ETag folds in the total backer count instead, and concurrent
+# credits to different projects never queue on the one counter row.
+# ─────────────────────────────────────────────────────────────────────────────
+FUNDING_COLUMNS = frozenset({"current_funding", "backers_count", "jobs_created", "updated_at"})
+
+
+def _listing_changed(project: Project) -> bool:
+    state = inspect(project)
+    return any(
+        key not in FUNDING_COLUMNS and state.attrs[key].history.has_changes()
+        for key in state.mapper.column_attrs.keys()
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_projects_version(session, flush_context, instances):
+    touched = any(
+        isinstance(obj, Project) for obj in (*session.new, *session.deleted)
+    ) or any(
+        isinstance(obj, Project) and _listing_changed(obj) for obj in session.dirty
+    )
+    if touched:
+        session.connection().execute(
+            update(Counter).where(Counter.name == PROJECTS_VERSION).values(value=Counter.value + 1)
+        )
@@ -0,0 +1,30 @@
+# app/models/project_funding_bucket.py
+"""
+BDR – Pre-aggregated funding time series
+One row per (project, granularity, bucket_start). Incremented when a
+transaction completes, so analytics never scan `transactions`.
+The primary key doubles as the range-read index:
+    WHERE project_id = ? AND granularity = 'day' AND bucket_start >= ?
+"""
+
+from sqlalchemy import Column, Integer, String, DateTime, DECIMAL, ForeignKey
+
+from app.db.base import Base
+
+HOUR = "hour"
+DAY = "day"
+
+
+class ProjectFundingBucket(Base):
+    __tablename__ = "project_funding_buckets"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    granularity = Column(String(8), primary_key=True)       # "hour" | "day"
+    bucket_start = Column(DateTime(timezone=True), primary_key=True)
+
+    amount_rwf = Column(DECIMAL(14, 0), default=0, nullable=False)
+    contributions = Column(Integer, default=0, nullable=False)
+    jobs_created = Column(Integer, default=0, nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectFundingBucket {self.project_id} {self.granularity} {self.bucket_start}>"
@@ -0,0 +1,41 @@
+# app/models/project_ranking.py
+"""
+BDR – Precomputed project rankings
+Rebuilt on a schedule by app/jobs/rebuild_rankings.py, so the trending
+and "similar projects" endpoints are plain index reads.
+- project_rankings      → one row per active project; `rank` 1 = hottest
+- project_similarities  → top-k neighbours per project; the primary key
+                          (project_id, rank) is the read index
+"""
+
+from sqlalchemy import Column, Integer, Float, DateTime, ForeignKey, Index
+
+from app.db.base import Base
+
+
+class ProjectRanking(Base):
+    __tablename__ = "project_rankings"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, nullable=False)
+    trending_score = Column(Float, nullable=False)
+    computed_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_project_rankings_rank", "rank"),
+    )
+
+    def __repr__(self):
+        return f"<ProjectRanking {self.project_id} #{self.rank}>"
+
+
+class ProjectSimilarity(Base):
+    __tablename__ = "project_similarities"
+
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    similar_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectSimilarity {self.project_id} #{self.rank} → {self.similar_id}>"
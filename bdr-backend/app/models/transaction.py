@@ -1,6 +1,16 @@
 """
 BDR – Transaction Model
 Tracks MoMo payments, job impact, status
+
+Ledger layout:
+- `transactions`          → hot table, recent + pending rows only
+- `transactions_archive`  → settled rows past ARCHIVE_AFTER_DAYS
+                            (RANGE-partitioned by month on Postgres,
+                             plain emulated table on SQLite)
+- cold storage            → gzip JSONL / Parquet files per month, plus
+                            `transactions_cold_summary` (completed
+                            backings per day / project / backer) for the
+                            rollup rebuilders
 """
 
 from sqlalchemy import (
@@ -11,6 +21,7 @@ from sqlalchemy import (
     ForeignKey,
     Enum,
     DECIMAL,
+    Index,
 )
 from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
@@ -36,8 +47,11 @@ class Transaction(Base):
 
     status = Column(Enum(TransactionStatus), default=TransactionStatus.pending)
 
-    momo_ref = Column(String, unique=True, nullable=True)
-    external_id = Column(String, unique=True, index=True)
+    momo_ref = Column(String, unique=True, nullable=True)      # settled reference (MoMo financialTransactionId, Stripe payment intent)
+    external_id = Column(String, unique=True, index=True)      # ours, echoed back by the provider
+
+    provider = Column(String(20), default="momo", server_default="momo", nullable=False)
+    provider_ref = Column(String, nullable=True)               # provider's id for the request (status checks)
 
     created_at = Column(
         DateTime(timezone=True),
@@ -51,10 +65,13 @@ class Transaction(Base):
 
     backer_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"))
+    # Set when this backing is one line of a basket payment (app/models/payment.py)
+    payment_id = Column(Integer, ForeignKey("payments.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # Relationships
     backer = relationship("User", back_populates="transactions")
     project = relationship("Project", back_populates="transactions")
+    payment = relationship("Payment", back_populates="transactions")
 
     @validates("amount")
     def validate_amount(self, key, value):
@@ -62,5 +79,92 @@ class Transaction(Base):
             raise ValueError("Minimum backing is RWF 10,000")
         return value
 
+    # Keyset pagination paths (WHERE backer_id = ? AND id < ? ORDER BY id DESC)
+    # + archive scan by age + reconciliation scan of old pending rows
+    __table_args__ = (
+        Index("ix_transactions_backer_id_id", "backer_id", "id"),
+        Index("ix_transactions_project_id_id", "project_id", "id"),
+        Index("ix_transactions_created_at", "created_at"),
+        Index("ix_transactions_status_created_at", "status", "created_at"),
+    )
+
     def __repr__(self):
         return f"<Transaction {self.id} {self.status.value}>"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Archive (append-only, settled rows only)
+# ─────────────────────────────────────────────────────────────────────────────
+class TransactionArchive(Base):
+    """
+    Settled transactions moved out of the hot table.
+    Rows are written once by the archive job and never updated.
+    On Postgres the table is partitioned by month on created_at, so the
+    partition key must be part of the primary key.
+    """
+    __tablename__ = "transactions_archive"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    created_at = Column(DateTime(timezone=True), primary_key=True)
+
+    amount = Column(DECIMAL(10, 0), nullable=False)
+    jobs_created = Column(Integer, default=0)
+    status = Column(String(20), nullable=False)
+
+    momo_ref = Column(String, nullable=True)
+    external_id = Column(String, nullable=True)
+    provider = Column(String(20), nullable=True)
+    provider_ref = Column(String, nullable=True)
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+    archived_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # No FKs — archived rows outlive project / user deletes
+    backer_id = Column(Integer, nullable=True)
+    project_id = Column(Integer, nullable=True)
+    payment_id = Column(Integer, nullable=True)             # basket payment this was a line of
+
+    __table_args__ = (
+        Index("ix_transactions_archive_created_at", "created_at"),
+        Index("ix_transactions_archive_backer_id_id", "backer_id", "id"),
+        Index("ix_transactions_archive_project_id_id", "project_id", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    def __repr__(self):
+        return f"<TransactionArchive {self.id} {self.status}>"
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cold months — what stays in the DB once the rows are in files
+# ─────────────────────────────────────────────────────────────────────────────
+class TransactionColdSummary(Base):
+    """
+    Completed backings of a cold month, per (completion day, project,
+    backer). Written by the archive job in the DB transaction that drops
+    the month's rows, so the ledger rebuilders (backer stats, funding
+    buckets, project jobs) still count them. A late-settled row archived
+    into an already-cold month adds rows; readers always SUM.
+    """
+    __tablename__ = "transactions_cold_summary"
+
+    id = Column(Integer, primary_key=True)
+    month = Column(DateTime, nullable=False)                 # cold month the rows came from
+    day = Column(DateTime, nullable=False)                   # completion day (updated_at, else created_at)
+
+    # No FKs — like the archive, outlives project / user deletes
+    backer_id = Column(Integer, nullable=True)
+    project_id = Column(Integer, nullable=True)
+
+    amount = Column(DECIMAL(14, 0), nullable=False)
+    contributions = Column(Integer, nullable=False)
+    jobs_created = Column(Integer, default=0, nullable=False)
+    first_backed_at = Column(DateTime(timezone=True), nullable=True)   # min / max created_at
+    last_backed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_transactions_cold_summary_project_id", "project_id"),
+        Index("ix_transactions_cold_summary_backer_id", "backer_id"),
+    )
+
+    def __repr__(self):
+        return f"<TransactionColdSummary {self.month:%Y-%m} project={self.project_id} backer={self.backer_id}>"
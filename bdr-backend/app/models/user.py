@@ -29,7 +29,7 @@ class User(Base):
     role = Column(String, nullable=False, default=UserRole.BACKER)
 
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # --- RELATIONSHIPS (unchanged) ---------------------------------------- #
     projects = relationship(
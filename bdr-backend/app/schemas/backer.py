@@ -0,0 +1,27 @@
+"""
+BDR – Backer Dashboard Schemas
+Impact rollup + keyset-paginated contribution history
+"""
+
+from pydantic import BaseModel
+from typing import Optional, List
+from decimal import Decimal
+from datetime import datetime
+
+from .transaction import TransactionListOut
+
+
+class BackerImpactOut(BaseModel):
+    total_rwf: Decimal = Decimal(0)
+    jobs_created: int = 0
+    projects_backed: int = 0
+    contributions_count: int = 0
+    last_backed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ContributionPage(BaseModel):
+    items: List[TransactionListOut]
+    next_cursor: Optional[int] = None  # pass back as ?before_id=
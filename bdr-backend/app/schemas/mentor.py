@@ -0,0 +1,91 @@
+# app/schemas/mentor.py
+"""
+BDR – Mentor directory + booking schemas
+Field names match src/lib/mentors.ts on the frontend.
+"""
+
+import json
+import re
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List
+from datetime import datetime
+
+HHMM = re.compile(r"^([01]\d|2[0-3]):[0-5]\d$|^24:00$")
+
+
+class MentorOut(BaseModel):
+    id: int
+    slug: str
+    name: str
+    title: Optional[str] = None
+    company: Optional[str] = None
+    bio: Optional[str] = None
+    quote: Optional[str] = None
+    image: Optional[str] = None
+    expertise: List[str] = []
+    rating: float = 5.0
+    sessions_completed: int = 0
+    hourly_rate: int = 0
+    available: bool = False
+    timezone: str = "Africa/Kigali"
+    slot_minutes: int = 60
+
+    @field_validator("expertise", mode="before")
+    @classmethod
+    def parse_expertise(cls, value):
+        if isinstance(value, str):
+            return json.loads(value) if value else []
+        return value or []
+
+    class Config:
+        from_attributes = True
+
+
+class AvailabilityWindow(BaseModel):
+    weekday: int = Field(..., ge=0, le=6)      # 0 = Monday
+    start: str                                 # "HH:MM", mentor-local
+    end: str
+
+    @model_validator(mode="after")
+    def check_window(self):
+        if not HHMM.match(self.start) or not HHMM.match(self.end):
+            raise ValueError("start/end must be HH:MM")
+        if self.start >= self.end:
+            raise ValueError("start must be before end")
+        return self
+
+
+class SlotOut(BaseModel):
+    starts_at: datetime                        # UTC
+    ends_at: datetime
+
+
+class WeekSlotsOut(BaseModel):
+    mentor: str
+    week_start: datetime
+    timezone: str
+    slots: List[SlotOut]
+
+
+class BookingCreate(BaseModel):
+    starts_at: datetime                        # one of the slots from /slots
+    topic: Optional[str] = Field(None, max_length=255)
+
+
+class BookingOut(BaseModel):
+    id: int
+    mentor_id: int
+    user_id: int
+    starts_at: datetime
+    ends_at: datetime
+    topic: Optional[str] = None
+    status: str
+    created_at: Optional[datetime] = None
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def status_value(cls, value):
+        return getattr(value, "value", value)
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,52 @@
+"""
+BDR – Direct Message Schemas
+ConversationOut keeps the dashboard's fields (from / content / time / unread)
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, List
+from datetime import datetime
+
+
+class MessageCreate(BaseModel):
+    body: str = Field(..., min_length=1, max_length=4000)
+
+
+class ConversationCreate(MessageCreate):
+    recipient_id: int
+
+
+class MessageOut(BaseModel):
+    id: int
+    conversation_id: int
+    sender_id: Optional[int] = None
+    seq: int
+    body: str
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class MessagePage(BaseModel):
+    items: List[MessageOut]
+    next_cursor: Optional[int] = None   # pass back as ?before_id=
+
+
+class ConversationOut(BaseModel):
+    id: int
+    with_user_id: int
+    from_: str = Field(..., alias="from")
+    content: str
+    time: Optional[datetime] = None
+    last_message_id: int
+    last_sender_id: Optional[int] = None
+    unread_count: int = 0
+    unread: bool = False
+
+    class Config:
+        populate_by_name = True
+
+
+class ReadCursor(BaseModel):
+    seq: Optional[int] = None           # omit to mark everything read
@@ -0,0 +1,104 @@
+# app/schemas/payment.py
+"""
+BDR – Basket checkout + monthly pledge schemas
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, validator
+
+from .transaction import check_amount, check_payment_method, check_momo_phone
+
+MAX_BASKET_ITEMS = 20
+
+
+class BasketItem(BaseModel):
+    project_id: int = Field(..., gt=0)
+    amount: Decimal = Field(..., gt=0, description="Must be multiple of 10,000 RWF")
+
+    @validator("amount")
+    def amount_multiple_of_10000(cls, v):
+        return check_amount(v)
+
+
+def check_items(items: List[BasketItem]) -> List[BasketItem]:
+    if len({item.project_id for item in items}) != len(items):
+        raise ValueError("Each project can only appear once")
+    return items
+
+
+class BasketCheckout(BaseModel):
+    items: List[BasketItem] = Field(..., min_length=1, max_length=MAX_BASKET_ITEMS)
+    payment_method: str = Field("momo", example="momo", description="momo | card | bank")
+    momo_phone: Optional[str] = Field(None, example="+250788123456", description="Required for momo")
+
+    @validator("items")
+    def distinct_projects(cls, v):
+        return check_items(v)
+
+    @validator("payment_method")
+    def known_method(cls, v):
+        return check_payment_method(v)
+
+    @validator("momo_phone", always=True)
+    def validate_phone(cls, v, values):
+        return check_momo_phone(v, values.get("payment_method"))
+
+
+class BasketCheckoutResponse(BaseModel):
+    payment_id: int
+    external_id: str
+    payment_method: str
+    amount: int
+    jobs_to_create: int
+    transaction_ids: List[int]
+    momo_request_id: Optional[str] = None
+    checkout_url: Optional[str] = None
+    instructions: Optional[str] = None
+    message: str
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Monthly pledges (MoMo: the backer approves a prompt each month)
+# ─────────────────────────────────────────────────────────────────────────────
+class PledgeCreate(BaseModel):
+    items: List[BasketItem] = Field(..., min_length=1, max_length=MAX_BASKET_ITEMS)
+    momo_phone: str = Field(..., example="+250788123456")
+    day_of_month: Optional[int] = Field(None, ge=1, le=28, description="Default: first charge right away, then monthly")
+
+    @validator("items")
+    def distinct_projects(cls, v):
+        return check_items(v)
+
+    @validator("momo_phone")
+    def validate_phone(cls, v):
+        return check_momo_phone(v, "momo")
+
+
+class PledgeItemOut(BaseModel):
+    project_id: int
+    amount: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class PledgeOut(BaseModel):
+    id: int
+    status: str
+    payment_method: str
+    day_of_month: int
+    amount: int
+    next_run_at: datetime
+    last_run_at: Optional[datetime] = None
+    last_payment_id: Optional[int] = None
+    items: List[PledgeItemOut]
+
+    @validator("status", pre=True)
+    def enum_value(cls, v):
+        return getattr(v, "value", v)
+
+    class Config:
+        from_attributes = True
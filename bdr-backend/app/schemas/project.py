@@ -61,6 +61,7 @@ class ProjectListOut(BaseModel):
     funding_goal: int
     current_funding: int
     jobs_to_create: int
+    jobs_created: int = 0          # from the ledger: each backing at its own rate
     backers_count: int = 0
     status: str
     image_url: Optional[str] = None
@@ -73,11 +74,6 @@ class ProjectListOut(BaseModel):
             return 0.0
         return round((self.current_funding / self.funding_goal) * 100, 2)
 
-    @computed_field(return_type=int)
-    @property
-    def jobs_created(self) -> int:
-        return self.current_funding // 200000
-
     @computed_field(return_type=Optional[int])
     @property
     def days_remaining(self) -> Optional[int]:
@@ -104,7 +100,10 @@ class ProjectOut(BaseModel):
     funding_goal: int
     current_funding: int
     jobs_to_create: int
+    jobs_created: int = 0
     backers_count: int = 0
+    views_count: int = 0           # approximate: flushed every ENGAGEMENT_FLUSH_SECONDS
+    shares_count: int = 0
     status: str
     created_at: datetime
     launched_at: Optional[datetime] = None
@@ -125,11 +124,6 @@ class ProjectOut(BaseModel):
             return 0.0
         return round((self.current_funding / self.funding_goal) * 100, 2)
 
-    @computed_field(return_type=int)
-    @property
-    def jobs_created(self) -> int:
-        return self.current_funding // 200000
-
     @computed_field(return_type=Optional[int])
     @property
     def days_remaining(self) -> Optional[int]:
@@ -155,3 +149,29 @@ class ProjectStats(BaseModel):
 
 class ProjectLaunch(BaseModel):
     launch_now: bool = Field(..., description="Set to true to launch the project immediately")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Entrepreneur analytics (pre-aggregated funding buckets)
+# ─────────────────────────────────────────────────────────────────────────────
+class FundingBucketOut(BaseModel):
+    bucket_start: datetime
+    amount_rwf: int
+    contributions: int
+    jobs_created: int
+
+    class Config:
+        from_attributes = True
+
+
+class ProjectAnalyticsOut(BaseModel):
+    project_id: int
+    funding_goal: int
+    current_funding: int
+    remaining_rwf: int
+    velocity_7d_rwf_per_day: float
+    velocity_30d_rwf_per_day: float
+    projected_completion_at: Optional[datetime] = None
+    on_track: Optional[bool] = None
+    daily: List[FundingBucketOut] = []
+    hourly: List[FundingBucketOut] = []
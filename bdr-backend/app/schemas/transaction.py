@@ -2,9 +2,10 @@
 BDR – Beyond Degrees Rwanda
 Transaction Pydantic Schemas
 Pydantic models for:
-- Initiating MoMo payment
+- Initiating a payment (MoMo, card, bank)
 - Webhook from MoMo
 - API responses (detail, list)
+- Settling a bank transfer (admin)
 - Job impact calculation
 """
 from pydantic import BaseModel, Field, validator
@@ -17,23 +18,49 @@ import re
 # ─────────────────────────────────────────────────────────────────────────────
 # Transaction Create (Backer Input)
 # ─────────────────────────────────────────────────────────────────────────────
+PAYMENT_METHODS = ("momo", "card", "bank")
+PHONE_PATTERN = r"^\+250[0-9]{9}$|^0[0-9]{9}$"
+
+
+def check_amount(v: Decimal) -> Decimal:
+    if v % Decimal("10000") != 0:
+        raise ValueError("Amount must be a multiple of RWF 10,000 (1 job)")
+    return v
+
+
+def check_payment_method(v: str) -> str:
+    if v not in PAYMENT_METHODS:
+        raise ValueError(f"Payment method must be one of: {', '.join(PAYMENT_METHODS)}")
+    return v
+
+
+def check_momo_phone(v: Optional[str], payment_method: Optional[str]) -> Optional[str]:
+    if v is None:
+        if payment_method == "momo":
+            raise ValueError("A MoMo phone number is required")
+        return v
+    if not re.match(PHONE_PATTERN, v):
+        raise ValueError("Invalid Rwandan phone number. Use +250... or 07...")
+    return v
+
+
 class TransactionCreate(BaseModel):
     project_id: int = Field(..., gt=0, example=1)
     amount: Decimal = Field(..., gt=0, description="Must be multiple of 10,000 RWF")
-    momo_phone: str = Field(..., example="+250788123456")
+    payment_method: str = Field("momo", example="momo", description="momo | card | bank")
+    momo_phone: Optional[str] = Field(None, example="+250788123456", description="Required for momo")
 
     @validator("amount")
     def amount_multiple_of_10000(cls, v):
-        if v % Decimal("10000") != 0:
-            raise ValueError("Amount must be a multiple of RWF 10,000 (1 job)")
-        return v
+        return check_amount(v)
 
-    @validator("momo_phone")
-    def validate_phone(cls, v):
-        pattern = r"^\+250[0-9]{9}$|^0[0-9]{9}$"
-        if not re.match(pattern, v):
-            raise ValueError("Invalid Rwandan phone number. Use +250... or 07...")
-        return v
+    @validator("payment_method")
+    def known_method(cls, v):
+        return check_payment_method(v)
+
+    @validator("momo_phone", always=True)
+    def validate_phone(cls, v, values):
+        return check_momo_phone(v, values.get("payment_method"))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -41,10 +68,10 @@ class TransactionCreate(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────────
 class TransactionWebhook(BaseModel):
     financialTransactionId: str = Field(..., alias="financialTransactionId")
-    externalId: str = Field(..., alias="externalId")  # Our transaction ID
+    externalId: str = Field(..., alias="externalId")  # Our transaction external_id
     amount: str
     currency: str = "RWF"
-    payer: dict
+    payer: Optional[dict] = None
     status: str  # "SUCCESSFUL" or "FAILED"
     reason: Optional[str] = None
 
@@ -93,7 +120,11 @@ class TransactionListOut(BaseModel):
 # ─────────────────────────────────────────────────────────────────────────────
 class PaymentInitiateResponse(BaseModel):
     transaction_id: int
-    momo_request_id: str
+    external_id: str
+    payment_method: str = "momo"
+    momo_request_id: Optional[str] = None        # MoMo X-Reference-Id
+    checkout_url: Optional[str] = None           # card: redirect the backer here
+    instructions: Optional[str] = None           # bank: transfer details
     message: str = "Payment request sent to MoMo. Check your phone."
     jobs_to_create: int
 
@@ -104,4 +135,17 @@ class PaymentInitiateResponse(BaseModel):
 class PaymentStatusResponse(BaseModel):
     status: str
     jobs_created: int
-    message: str
\ No newline at end of file
+    message: str
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Bank Transfer Settlement (Admin)
+# ─────────────────────────────────────────────────────────────────────────────
+class BankTransferSettle(BaseModel):
+    received: bool = Field(..., description="true: the money landed (completed); false: it never will (failed)")
+    bank_ref: Optional[str] = Field(None, max_length=100, description="Reference on the bank statement")
+
+
+class BankTransferSettleOut(BaseModel):
+    reference: str
+    status: str
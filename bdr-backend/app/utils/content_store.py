@@ -0,0 +1,114 @@
+# app/utils/content_store.py
+"""
+BDR – Page content snapshot
+Every page is loaded once into an immutable snapshot: key → (version,
+pre-serialised JSON bytes, strong ETag). Requests hand out the bytes;
+nothing is rebuilt or re-serialised per request.
+
+Edits (admin) insert a new page version and bump the PAGES_VERSION
+counter. The editing worker reloads at once; other workers notice the
+counter change within PAGES_REFRESH_SECONDS (one primary-key read) and
+rebuild. The new snapshot replaces the old one with a single reference
+swap, so readers never lock and never see half a reload.
+"""
+
+import logging
+import threading
+import time
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import page as crud_page
+from app.models.counter import Counter, PAGES_VERSION
+from app.utils.etag import version_etag, check_not_modified
+from app.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class PageEntry(NamedTuple):
+    key: str
+    version: int
+    body: bytes
+    etag: str
+
+
+class Snapshot(NamedTuple):
+    stamp: int                          # PAGES_VERSION the snapshot was built at
+    pages: Mapping[str, PageEntry]
+
+
+class ContentStore:
+    def __init__(self, refresh_seconds: float = 5.0):
+        self.refresh_seconds = refresh_seconds
+        self._snapshot: Optional[Snapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()   # one rebuild at a time; reads never take it
+
+    @property
+    def snapshot(self) -> Optional[Snapshot]:
+        return self._snapshot
+
+    def warm(self, db: Session) -> Snapshot:
+        """Startup: seed pages missing from the DB, then build the snapshot."""
+        seeded = crud_page.seed_missing_pages(db)
+        if seeded:
+            logger.info(f"Seeded page content: {', '.join(seeded)}")
+        return self.reload(db)
+
+    def reload(self, db: Session) -> Snapshot:
+        with self._lock:
+            stamp = self._read_stamp(db)
+            pages = {
+                doc.key: PageEntry(
+                    key=doc.key,
+                    version=doc.version,
+                    body=doc.content.encode("utf-8"),
+                    etag=version_etag(f"page-{doc.key}", f"v{doc.version}", weak=False),
+                )
+                for doc in crud_page.get_latest_pages(db)
+            }
+            self._snapshot = Snapshot(stamp=stamp, pages=MappingProxyType(pages))
+            self._checked_at = time.monotonic()
+            return self._snapshot
+
+    def current(self, db: Session) -> Snapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            record_cache("pages", False)
+            return self.warm(db)
+        now = time.monotonic()
+        if now - self._checked_at >= self.refresh_seconds:
+            self._checked_at = now
+            if self._read_stamp(db) != snapshot.stamp:
+                record_cache("pages", False)
+                return self.reload(db)
+        record_cache("pages", True)
+        return snapshot
+
+    def get(self, db: Session, key: str) -> Optional[PageEntry]:
+        return self.current(db).pages.get(key)
+
+    def response(self, request: Request, db: Session, key: str) -> Response:
+        entry = self.get(db, key)
+        if entry is None:
+            raise HTTPException(status_code=404, detail="Page not found")
+        check_not_modified(request, entry.etag)
+        return Response(
+            entry.body,
+            media_type="application/json",
+            headers={"ETag": entry.etag, "Cache-Control": "no-cache"},
+        )
+
+    @staticmethod
+    def _read_stamp(db: Session) -> int:
+        value = db.execute(select(Counter.value).where(Counter.name == PAGES_VERSION)).scalar()
+        return int(value or 0)
+
+
+content_store = ContentStore(refresh_seconds=settings.PAGES_REFRESH_SECONDS)
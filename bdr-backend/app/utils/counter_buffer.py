@@ -0,0 +1,140 @@
+# app/utils/counter_buffer.py
+"""
+BDR – Write-behind counter buffer
+
+Hot read paths (project page views, share clicks) call add() instead of
+writing to the DB. Increments collect in memory, split over N shards —
+each a dict behind its own lock, so threadpool requests rarely contend —
+and a background task (started in main.py lifespan) drains them every
+`interval` seconds into ONE batched statement through the `apply`
+callback (e.g. UPDATE … SET views_count = views_count + :n per key).
+
+Loss is bounded: a worker that dies loses at most one interval of
+increments, and a clean shutdown flushes what is left. A failed flush
+puts its deltas back for the next attempt. Each shard holds at most
+max_keys / shards distinct keys; increments for new keys beyond that
+are dropped and counted, so a DB outage can't grow memory without bound.
+Counts are approximate by design — never use this for money.
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+Deltas = List[Tuple[object, Tuple[int, ...]]]
+
+
+class CounterBuffer:
+    def __init__(
+        self,
+        name: str,
+        fields: Sequence[str],
+        apply: Callable[[Session, Deltas], None],
+        shards: int = 16,
+        max_keys: int = 50000,
+        interval: float = 5.0,
+        session_factory: Optional[Callable[[], Session]] = None,
+    ):
+        self.name = name
+        self.fields = tuple(fields)
+        self.apply = apply
+        self.interval = interval
+        self.session_factory = session_factory
+        self._shard_limit = max(1, max_keys // shards)
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._maps: List[Dict] = [{} for _ in range(shards)]
+        self._task: Optional[asyncio.Task] = None
+        self.flushed = 0           # keys written
+        self.dropped = 0           # increments refused (shard full)
+        self.failures = 0
+
+    # ── producer side (any thread) ──────────────────────────────────────────
+    def add(self, key, **deltas: int) -> bool:
+        values = [deltas.get(field, 0) for field in self.fields]
+        shard = hash(key) % len(self._locks)
+        with self._locks[shard]:
+            pending = self._maps[shard]
+            row = pending.get(key)
+            if row is None:
+                if len(pending) >= self._shard_limit:
+                    self.dropped += 1
+                    return False
+                pending[key] = values
+            else:
+                for i, value in enumerate(values):
+                    row[i] += value
+        return True
+
+    def pending(self) -> int:
+        return sum(len(pending) for pending in self._maps)
+
+    # ── flush ───────────────────────────────────────────────────────────────
+    def _drain(self) -> Dict:
+        merged: Dict = {}
+        for shard, lock in enumerate(self._locks):
+            with lock:
+                taken, self._maps[shard] = self._maps[shard], {}
+            merged.update(taken)       # shards never share a key
+        return merged
+
+    def _restore(self, drained: Dict) -> None:
+        for key, values in drained.items():
+            self.add(key, **dict(zip(self.fields, values)))
+
+    def flush(self, db: Session) -> int:
+        """Write everything pending in one statement and commit. Returns keys written."""
+        drained = self._drain()
+        if not drained:
+            return 0
+        # Sorted keys: concurrent flushes from other workers lock rows in the same order
+        rows = [(key, tuple(values)) for key, values in sorted(drained.items())]
+        try:
+            self.apply(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            self.failures += 1
+            self._restore(drained)
+            raise
+        self.flushed += len(rows)
+        return len(rows)
+
+    def _flush_new_session(self) -> int:
+        db = self.session_factory()
+        try:
+            return self.flush(db)
+        finally:
+            db.close()
+
+    # ── lifecycle ───────────────────────────────────────────────────────────
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"bdr-{self.name}-flush")
+
+    async def stop(self) -> None:
+        """Cancel the flush loop, then write what is left."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await run_in_threadpool(self._flush_new_session)
+        except Exception as e:
+            logger.warning(f"Final {self.name} flush failed, {self.pending()} key(s) lost: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await run_in_threadpool(self._flush_new_session)
+            except Exception as e:
+                logger.warning(f"{self.name} flush failed, retrying next interval: {e}")
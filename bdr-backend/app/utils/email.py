@@ -1,12 +1,15 @@
 # app/utils/email.py
 import logging
 from email.message import EmailMessage
+from typing import List
 import aiosmtplib
 from app.core.config import settings
+from app.utils.email_queue import email_queue
 
 logger = logging.getLogger(__name__)
 
-async def send_contact_email(to_user: str, user_name: str, subject: str, user_message: str):
+
+def build_contact_emails(to_user: str, user_name: str, subject: str, user_message: str) -> List[EmailMessage]:
     # Auto-reply to user
     user_msg = EmailMessage()
     user_msg["From"] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>"
@@ -44,7 +47,12 @@ Message:
 
 Reply directly to: {to_user}
 """)
+    return [user_msg, francis_msg]
+
 
+async def send_contact_email(to_user: str, user_name: str, subject: str, user_message: str):
+    """Inline send (two SMTP sessions). The contact endpoint uses the queue instead."""
+    user_msg, francis_msg = build_contact_emails(to_user, user_name, subject, user_message)
     try:
         await aiosmtplib.send(
             user_msg,
@@ -64,5 +72,36 @@ Reply directly to: {to_user}
     except Exception as e:
         logger.error(f"Failed to send email: {e}")
 
+
+def queue_contact_email(to_user: str, user_name: str, subject: str, user_message: str) -> bool:
+    """Hand both contact emails to the background worker. Never blocks."""
+    return email_queue.enqueue(build_contact_emails(to_user, user_name, subject, user_message))
+
+
+def build_payment_confirmed_email(to_user: str, user_name: str, amount, projects: List[str], jobs: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>"
+    msg["To"] = to_user
+    msg["Subject"] = "Your BDR Payment is Confirmed!"
+    backed = "\n".join(f"  - {title}" for title in projects)
+    msg.set_content(f"""
+Hi {user_name},
+
+Your payment of RWF {int(amount):,} is confirmed. It backed:
+{backed}
+
+Together that creates {jobs} job(s) for young Rwandans. Thank you!
+
+Best regards,  
+Francis Mutabazi  
+Founder, Beyond Degrees Rwanda
+""")
+    return msg
+
+
+def queue_payment_confirmed_email(to_user: str, user_name: str, amount, projects: List[str], jobs: int) -> bool:
+    """Backer's receipt for a settled payment, via the background worker. Safe from sync code."""
+    return email_queue.enqueue([build_payment_confirmed_email(to_user, user_name, amount, projects, jobs)])
+
 # ← THIS LINE FIXES EVERYTHING
-send_email = send_contact_email
\ No newline at end of file
+send_email = send_contact_email
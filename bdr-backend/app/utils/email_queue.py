@@ -0,0 +1,172 @@
+# app/utils/email_queue.py
+"""
+BDR – Background email worker
+Requests enqueue EmailMessage objects and return immediately. One worker
+task (started in main.py lifespan) drains the queue, reusing a single
+SMTP session for everything that is waiting instead of one per email.
+The queue is bounded: under a flood extra emails are dropped and logged
+(the contact message itself is already saved in the DB). enqueue() may be
+called from sync code in the threadpool (payment settlement); it hands
+the emails to the worker's loop. Failed sends are retried with backoff;
+on stop() retries still waiting get one last immediate try, and whatever
+is left unsent after the timeout is counted in `dropped`.
+"""
+
+import asyncio
+import itertools
+import logging
+from email.message import EmailMessage
+from typing import Dict, List, Optional, Tuple
+
+import aiosmtplib
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _running_on(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+class EmailQueue:
+    def __init__(self, maxsize: int = 1000, batch_size: int = 20, max_attempts: int = 3):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Retries waiting out their backoff: id → (timer, message, attempt)
+        self._retries: Dict[int, Tuple[asyncio.TimerHandle, EmailMessage, int]] = {}
+        self._retry_ids = itertools.count()
+        self.sent = 0
+        self.dropped = 0
+        self.failed = 0
+
+    # ── producer side ───────────────────────────────────────────────────────
+    def enqueue(self, messages: List[EmailMessage]) -> bool:
+        loop = self._loop
+        if loop is not None and not _running_on(loop):
+            # asyncio.Queue isn't thread-safe: put from the worker's own loop
+            loop.call_soon_threadsafe(self._put_all, messages)
+            return True
+        return self._put_all(messages)
+
+    def _put_all(self, messages: List[EmailMessage]) -> bool:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        for msg in messages:
+            try:
+                self._queue.put_nowait((msg, 1))
+            except asyncio.QueueFull:
+                self.dropped += 1
+                logger.warning(f"Email queue full — dropped email to {msg['To']}")
+                return False
+        return True
+
+    def qsize(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    # ── lifecycle ───────────────────────────────────────────────────────────
+    async def start(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+        if self._worker is None or self._worker.done():
+            self._loop = asyncio.get_running_loop()
+            self._worker = asyncio.create_task(self._run(), name="bdr-email-worker")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Give queued emails (and pending retries) a chance to go out, then cancel the worker."""
+        if self._worker is None:
+            return
+        for retry_id in list(self._retries):
+            timer, msg, attempt = self._retries.pop(retry_id)
+            timer.cancel()
+            self._put_retry(msg, attempt)
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        # Still queued, or failed again and waiting for a retry that will never run
+        unsent = self.qsize() + len(self._retries)
+        for timer, _, _ in self._retries.values():
+            timer.cancel()
+        self._retries.clear()
+        if unsent:
+            self.dropped += unsent
+            logger.warning(f"Shutting down with {unsent} email(s) unsent")
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._loop = None
+        # An asyncio.Queue is tied to the loop that used it; the next start()
+        # may run on a new loop (reload, test clients), so begin fresh.
+        self._queue = None
+
+    # ── consumer side ───────────────────────────────────────────────────────
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send_batch(self, batch) -> None:
+        smtp = aiosmtplib.SMTP(hostname=settings.SMTP_HOST, port=settings.SMTP_PORT, start_tls=True)
+        try:
+            await smtp.connect()
+            await smtp.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except Exception as e:
+            logger.error(f"SMTP connect failed: {e}")
+            await self._retry_all(batch)
+            return
+
+        try:
+            for msg, attempt in batch:
+                try:
+                    await smtp.send_message(msg)
+                    self.sent += 1
+                except Exception as e:
+                    logger.error(f"Failed to send email to {msg['To']}: {e}")
+                    await self._retry_all([(msg, attempt)])
+        finally:
+            try:
+                await smtp.quit()
+            except Exception:
+                pass
+
+    async def _retry_all(self, batch) -> None:
+        for msg, attempt in batch:
+            if attempt >= self.max_attempts:
+                self.failed += 1
+                logger.error(f"Giving up on email to {msg['To']} after {attempt} attempts")
+                continue
+            retry_id = next(self._retry_ids)
+            timer = asyncio.get_running_loop().call_later(2 ** attempt, self._requeue, retry_id)
+            self._retries[retry_id] = (timer, msg, attempt + 1)
+
+    def _requeue(self, retry_id: int) -> None:
+        entry = self._retries.pop(retry_id, None)
+        if entry is not None:
+            self._put_retry(entry[1], entry[2])
+
+    def _put_retry(self, msg: EmailMessage, attempt: int) -> None:
+        try:
+            self._queue.put_nowait((msg, attempt))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Email queue full — dropped retry to {msg['To']}")
+
+
+email_queue = EmailQueue(maxsize=settings.EMAIL_QUEUE_MAXSIZE)
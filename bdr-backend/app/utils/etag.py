@@ -0,0 +1,36 @@
+# app/utils/etag.py
+"""
+BDR – ETag helpers
+- body_etag()          → weak ETag from response bytes (used by the middleware)
+- version_etag()       → ETag from a version stamp (no body needed), weak by default
+- check_not_modified() → raise 304 before any query/serialisation runs
+"""
+
+import hashlib
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+
+def body_etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def version_etag(namespace: str, version, weak: bool = True) -> str:
+    tag = f'"{namespace}-{version}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison (RFC 9110 §13.1.2): W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in if_none_match.split(","))
+
+
+def check_not_modified(request: Request, etag: str) -> None:
+    if request.method in ("GET", "HEAD") and etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag})
@@ -0,0 +1,101 @@
+# app/utils/export.py
+"""
+BDR – Incremental CSV / Parquet encoders for admin exports.
+Both take an iterator of row tuples (from a yield_per query) and yield
+bytes chunks, so memory stays flat whatever the row count.
+"""
+
+import csv
+import io
+import logging
+from typing import Iterable, Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Parquet is optional — CSV always works
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    parquet_available = True
+except Exception:
+    parquet_available = False
+
+# (column name, kind) — kind is "int", "str" or "datetime"
+ColumnSpec = List[Tuple[str, str]]
+
+
+def stream_csv(columns: ColumnSpec, rows: Iterable[tuple], chunk_rows: int = 1000) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in columns])
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the generator."""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def drain(self) -> bytes:
+        out = b"".join(self.chunks)
+        self.chunks = []
+        return out
+
+
+def _arrow_schema(columns: ColumnSpec):
+    kinds = {"int": pa.int64(), "str": pa.string(), "datetime": pa.timestamp("us")}
+    return pa.schema([(name, kinds[kind]) for name, kind in columns])
+
+
+def stream_parquet(columns: ColumnSpec, rows: Iterable[tuple], chunk_rows: int = 1000) -> Iterator[bytes]:
+    """One row group per chunk; the footer is emitted when the iterator ends."""
+    if not parquet_available:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    schema = _arrow_schema(columns)
+    names = [name for name, _ in columns]
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+
+    def flush(batch):
+        table = pa.Table.from_pydict(
+            {name: [row[i] for row in batch] for i, name in enumerate(names)},
+            schema=schema,
+        )
+        writer.write_table(table)
+
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= chunk_rows:
+            flush(batch)
+            batch = []
+            yield sink.drain()
+    if batch:
+        flush(batch)
+    writer.close()
+    yield sink.drain()
@@ -0,0 +1,106 @@
+# app/utils/idempotency.py
+"""
+BDR – Idempotency-Key handling for async routes
+
+    return await run_idempotent(db, user.id, "payments.initiate", key, body, lambda: do_it())
+
+- first request with a key      → runs `call`, stores the response
+- retry after it finished        → stored response, replayed byte-for-byte
+- duplicate while it still runs  → waits (up to IDEMPOTENCY_WAIT_SECONDS)
+                                   for the stored response, else 409
+- same key, different body       → 422
+- first request died mid-way     → a duplicate takes the key over once its
+                                   lease (IDEMPOTENCY_LEASE_SECONDS) runs out
+- `call` raises a 4xx            → key released, so the client may fix and retry;
+                                   `call` must only raise 4xx before it has
+                                   contacted a provider
+- `call` fails any other way     → the error response is stored and replayed:
+                                   the provider may already have acted
+
+Replays carry `Idempotent-Replayed: true`.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud import idempotency as crud_idempotency
+from app.models.idempotency import COMPLETED
+
+MAX_KEY_LENGTH = 255
+FAILED_DETAIL = "Payment initiation failed. Try again."
+
+
+def fingerprint(body: Any) -> str:
+    canonical = json.dumps(jsonable_encoder(body), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _replay(record) -> JSONResponse:
+    return JSONResponse(
+        content=json.loads(record.response_body),
+        status_code=record.response_status,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+async def run_idempotent(
+    db: Session,
+    user_id: int,
+    scope: str,
+    key: Optional[str],
+    body: Any,
+    call: Callable[[], Awaitable[Any]],
+    status_code: int = 200,
+    wait_seconds: Optional[float] = None,
+):
+    if key is None:
+        return await call()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+
+    request_hash = fingerprint(body)
+    ttl = timedelta(hours=settings.IDEMPOTENCY_TTL_HOURS)
+    lease = timedelta(seconds=settings.IDEMPOTENCY_LEASE_SECONDS)
+    deadline = time.monotonic() + (settings.IDEMPOTENCY_WAIT_SECONDS if wait_seconds is None else wait_seconds)
+    delay = 0.05
+    while True:
+        record, owner = await run_in_threadpool(crud_idempotency.claim, db, user_id, scope, key, request_hash, ttl, lease)
+        if owner:
+            break
+        if record.request_hash != request_hash:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used for a different request")
+        if record.state == COMPLETED:
+            return _replay(record)
+        # The first request is still running — wait for its answer rather than run again
+        if time.monotonic() >= deadline:
+            raise HTTPException(
+                status_code=409, detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "2"},
+            )
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+
+    try:
+        result = await call()
+    except HTTPException as e:
+        if e.status_code < 500:
+            await run_in_threadpool(crud_idempotency.release, db, record)
+        else:
+            await run_in_threadpool(crud_idempotency.fail, db, record, e.status_code, {"detail": e.detail})
+        raise
+    except Exception:
+        await run_in_threadpool(crud_idempotency.fail, db, record, 502, {"detail": FAILED_DETAIL})
+        raise
+    await run_in_threadpool(crud_idempotency.complete, db, record, status_code, jsonable_encoder(result))
+    return result
@@ -0,0 +1,155 @@
+# app/utils/impact.py
+"""
+BDR – Job-impact engine: how many jobs an amount of RWF creates
+
+The single home of the "RWF per job" rate, which may differ by sector and
+change over time. JOB_CREATION_RATE is the base rate; dated overrides
+come from app/content/impact_rates.json (or IMPACT_RATES_FILE):
+
+    {"default": [{"from": "2027-01-01", "rwf_per_job": 12000}],
+     "sectors": {"Agriculture": [{"from": "2026-06-01", "rwf_per_job": 8000}]}}
+
+The file is read once per process into an immutable RateTable, where
+each sector's timeline is already merged with the default one:
+- jobs_for()   → one amount (a backing, a goal, progress so far)
+- jobs_bulk()  → NumPy arrays of amounts / sectors / dates at once
+                 (backfill, dashboards), one searchsorted per sector
+- rate_table() / reload_rate_table()
+
+A backing's jobs are fixed at the rate in force when it was made. After
+changing the rates, run `python -m app.jobs.backfill_jobs_created`.
+"""
+
+import json
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.core.config import settings
+from app.utils.metrics import record_cache
+
+RATES_FILE = Path(__file__).resolve().parent.parent / "content" / "impact_rates.json"
+BEGINNING = datetime(2000, 1, 1)       # the base rate applies from here on
+
+
+def _naive_utc(dt: datetime) -> datetime:
+    if dt.tzinfo is None:
+        return dt
+    return dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _sector_key(sector: Optional[str]) -> str:
+    return (sector or "").strip().lower()
+
+
+@dataclass(frozen=True)
+class Timeline:
+    starts: Tuple[datetime, ...]       # ascending; starts[0] == BEGINNING
+    rates: Tuple[int, ...]
+
+    def rate(self, at: datetime) -> int:
+        return self.rates[max(bisect_right(self.starts, at) - 1, 0)]
+
+
+@dataclass(frozen=True)
+class RateTable:
+    default: Timeline
+    sectors: Mapping[str, Timeline]    # keyed by lower-cased sector name
+
+    def timeline(self, sector: Optional[str]) -> Timeline:
+        return self.sectors.get(_sector_key(sector), self.default)
+
+    def rate(self, sector: Optional[str] = None, at: Optional[datetime] = None) -> int:
+        return self.timeline(sector).rate(_naive_utc(at) if at else datetime.utcnow())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Loading
+# ─────────────────────────────────────────────────────────────────────────────
+def _entries(raw, where: str) -> Tuple[Tuple[datetime, int], ...]:
+    entries = []
+    for entry in raw:
+        rate = int(entry["rwf_per_job"])
+        if rate <= 0:
+            raise ValueError(f"{where}: rwf_per_job must be positive")
+        entries.append((datetime.fromisoformat(entry["from"]), rate))
+    return tuple(sorted(entries))
+
+
+def build_rate_table(data: dict, base_rate: int) -> RateTable:
+    default = ((BEGINNING, base_rate),) + _entries(data.get("default", []), "default")
+    sectors = {}
+    for sector, raw in (data.get("sectors") or {}).items():
+        own = _entries(raw, sector)
+        if not own:
+            continue
+        # Before the sector's first entry it follows the default timeline
+        merged = tuple(e for e in default if e[0] < own[0][0]) + own
+        sectors[_sector_key(sector)] = Timeline(tuple(s for s, _ in merged), tuple(r for _, r in merged))
+    return RateTable(
+        default=Timeline(tuple(s for s, _ in default), tuple(r for _, r in default)),
+        sectors=MappingProxyType(sectors),
+    )
+
+
+def load_rate_table(path: Optional[Union[str, Path]] = None, base_rate: Optional[int] = None) -> RateTable:
+    path = Path(path or settings.IMPACT_RATES_FILE or RATES_FILE)
+    data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    return build_rate_table(data, base_rate or settings.JOB_CREATION_RATE)
+
+
+_rate_table: Optional[RateTable] = None
+
+
+def rate_table() -> RateTable:
+    global _rate_table
+    table = _rate_table
+    record_cache("impact_rates", table is not None)
+    if table is None:
+        # Immutable, so two threads loading at once is harmless
+        table = _rate_table = load_rate_table()
+    return table
+
+
+def reload_rate_table() -> RateTable:
+    global _rate_table
+    _rate_table = None
+    return rate_table()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Computation
+# ─────────────────────────────────────────────────────────────────────────────
+def jobs_for(amount_rwf, sector: Optional[str] = None, at: Optional[datetime] = None) -> int:
+    """Jobs `amount_rwf` creates in `sector` at the rate in force at `at` (default: now)."""
+    return int(amount_rwf or 0) // rate_table().rate(sector, at)
+
+
+def jobs_bulk(
+    amounts: Sequence,
+    sectors: Sequence[Optional[str]],
+    at: Union[datetime, Sequence[datetime], None] = None,
+    table: Optional[RateTable] = None,
+) -> np.ndarray:
+    """Vectorised jobs_for(): aligned amounts / sectors, and one date or one per amount."""
+    table = table or rate_table()
+    amounts = np.array([int(a or 0) for a in amounts], dtype=np.int64)
+    if at is None or isinstance(at, datetime):
+        when = np.full(len(amounts), np.datetime64(_naive_utc(at or datetime.utcnow()), "us"))
+    else:
+        when = np.array([_naive_utc(a) for a in at], dtype="datetime64[us]")
+    keys = np.array([_sector_key(s) for s in sectors], dtype=object)
+
+    rates = np.empty(len(amounts), dtype=np.int64)
+    for key in set(keys.tolist()):
+        mask = keys == key
+        timeline = table.timeline(key)
+        starts = np.array(timeline.starts, dtype="datetime64[us]")
+        index = np.searchsorted(starts, when[mask], side="right") - 1
+        rates[mask] = np.array(timeline.rates, dtype=np.int64)[np.maximum(index, 0)]
+    return amounts // rates
@@ -0,0 +1,78 @@
+# app/utils/intervals.py
+"""
+BDR – Sorted interval index (mentor bookings)
+
+Half-open, non-overlapping intervals [start, end) kept as two parallel
+sorted lists. Because intervals never overlap, the ends are sorted too,
+so every lookup is a bisect:
+- overlaps()   → O(log n): only the last interval starting before `end` can clash
+- between()    → O(log n + k) for the k intervals touching a window
+- free()       → candidates minus booked intervals, one merge pass
+
+Works with anything orderable (datetimes, epoch minutes, ...).
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, Iterable, Iterator, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class IntervalIndex(Generic[T]):
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, intervals: Iterable[Tuple[T, T]] = ()):
+        pairs = sorted(intervals)
+        self._starts: List[T] = [start for start, _ in pairs]
+        self._ends: List[T] = [end for _, end in pairs]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Tuple[T, T]]:
+        return iter(zip(self._starts, self._ends))
+
+    def overlaps(self, start: T, end: T) -> bool:
+        i = bisect_left(self._starts, end)      # intervals starting before `end`
+        return i > 0 and self._ends[i - 1] > start
+
+    def add(self, start: T, end: T) -> bool:
+        """Insert unless it clashes. False means the slot is taken."""
+        if self.overlaps(start, end):
+            return False
+        i = bisect_left(self._starts, start)
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        return True
+
+    def remove(self, start: T, end: T) -> bool:
+        i = bisect_left(self._starts, start)
+        if i < len(self._starts) and self._starts[i] == start and self._ends[i] == end:
+            del self._starts[i]
+            del self._ends[i]
+            return True
+        return False
+
+    def between(self, start: T, end: T) -> Iterator[Tuple[T, T]]:
+        """Intervals overlapping [start, end), in order."""
+        i = bisect_right(self._ends, start)     # first interval ending after `start`
+        while i < len(self._starts) and self._starts[i] < end:
+            yield self._starts[i], self._ends[i]
+            i += 1
+
+    def free(self, candidates: List[Tuple[T, T]]) -> List[Tuple[T, T]]:
+        """
+        Candidates (sorted, non-overlapping) that clash with nothing. One
+        bisect to find the window, then a merge walk over the bookings in it.
+        """
+        if not candidates:
+            return []
+        booked = list(self.between(candidates[0][0], candidates[-1][1]))
+        free, j = [], 0
+        for start, end in candidates:
+            while j < len(booked) and booked[j][1] <= start:
+                j += 1
+            if j < len(booked) and booked[j][0] < end:
+                continue
+            free.append((start, end))
+        return free
@@ -0,0 +1,129 @@
+# app/utils/mentor_schedule.py
+"""
+BDR – Mentor slot grid + per-mentor booking index
+
+- week_slots()   → the week's bookable slots from recurring availability
+                   (mentor's timezone in, naive UTC out)
+- slot_on_grid() → is this start time one of the mentor's slots?
+- schedule_cache → mentor_id → IntervalIndex of live future bookings
+
+The index only answers "which slots look free". The booking itself is
+decided by the unique index on mentor_bookings, so a stale cache in
+another worker can at worst offer a slot that then fails with 409.
+Entries reload after MENTOR_SCHEDULE_TTL_SECONDS; this worker's own
+bookings/cancellations update its index immediately.
+"""
+
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.utils.intervals import IntervalIndex
+from app.utils.metrics import record_cache
+
+Slot = Tuple[datetime, datetime]
+
+
+def parse_hhmm(value: str) -> int:
+    hours, minutes = value.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def format_hhmm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def to_utc_naive(value: datetime) -> datetime:
+    """Aware → UTC naive; naive values are taken to be UTC already."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def _local_to_utc(day: date, minute: int, tz: ZoneInfo) -> datetime:
+    local = datetime.combine(day, dt_time()) + timedelta(minutes=minute)
+    return local.replace(tzinfo=tz).astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def week_slots(mentor, monday: date) -> List[Slot]:
+    """Sorted candidate slots for the week starting `monday` (mentor-local)."""
+    tz = ZoneInfo(mentor.timezone)
+    length = mentor.slot_minutes
+    slots = []
+    for window in mentor.availability:
+        day = monday + timedelta(days=window.weekday)
+        minute = window.start_minute
+        while minute + length <= window.end_minute:
+            start = _local_to_utc(day, minute, tz)
+            slots.append((start, start + timedelta(minutes=length)))
+            minute += length
+    slots.sort()
+    return slots
+
+
+def slot_on_grid(mentor, starts_at: datetime) -> bool:
+    """`starts_at` is naive UTC."""
+    local = starts_at.replace(tzinfo=timezone.utc).astimezone(ZoneInfo(mentor.timezone))
+    minute = local.hour * 60 + local.minute
+    if local.second or local.microsecond:
+        return False
+    for window in mentor.availability:
+        if window.weekday != local.weekday():
+            continue
+        offset = minute - window.start_minute
+        if offset >= 0 and offset % mentor.slot_minutes == 0 and minute + mentor.slot_minutes <= window.end_minute:
+            return True
+    return False
+
+
+class ScheduleCache:
+    def __init__(self, ttl_seconds: float = 30.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[int, Tuple[float, IntervalIndex]] = {}
+        self._lock = threading.Lock()
+
+    def index(self, mentor_id: int, load: Callable[[], List[Slot]]) -> IntervalIndex:
+        now = time.monotonic()
+        entry = self._entries.get(mentor_id)
+        if entry is None or now - entry[0] >= self.ttl_seconds:
+            record_cache("mentor_schedule", False)
+            fresh = IntervalIndex(load())
+            with self._lock:
+                self._entries[mentor_id] = (now, fresh)
+            return fresh
+        record_cache("mentor_schedule", True)
+        return entry[1]
+
+    def free_slots(self, mentor_id: int, load: Callable[[], List[Slot]], candidates: List[Slot]) -> List[Slot]:
+        index = self.index(mentor_id, load)
+        with self._lock:
+            return index.free(candidates)
+
+    def booked(self, mentor_id: int, slot: Slot) -> None:
+        self._update(mentor_id, lambda index: index.add(*slot))
+
+    def cancelled(self, mentor_id: int, slot: Slot) -> None:
+        self._update(mentor_id, lambda index: index.remove(*slot))
+
+    def invalidate(self, mentor_id: Optional[int] = None) -> None:
+        with self._lock:
+            if mentor_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(mentor_id, None)
+
+    def _update(self, mentor_id: int, change) -> None:
+        with self._lock:
+            entry = self._entries.get(mentor_id)
+            if entry is not None:
+                change(entry[1])
+
+
+schedule_cache = ScheduleCache(ttl_seconds=settings.MENTOR_SCHEDULE_TTL_SECONDS)
@@ -0,0 +1,227 @@
+# app/utils/metrics.py
+"""
+BDR – In-process metrics + Prometheus text exposition (no extra dependency)
+
+- REQUEST_LATENCY / REQUESTS      → filled by app/middleware/metrics.py
+- DB_QUERIES_PER_REQUEST / DB_TIME_PER_REQUEST / DB_QUERIES
+                                  → SQLAlchemy cursor hooks (instrument_engine)
+- record_cache(name, hit)         → caches report hits/misses here: "pages"
+                                    (content_store), "mentor_schedule",
+                                    "impact_rates"
+- render_prometheus(engine)       → text for GET /metrics (adds pool gauges)
+
+Per-request DB stats travel in a ContextVar, so sync endpoints running in
+the threadpool still report into the request that started them.
+Each uvicorn worker has its own registry (scrape every worker, or run one).
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger("bdr.slow_query")
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**kwargs) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in kwargs.items()))
+
+
+def _fmt_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{k}="{v}"' for k, v in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Metric types
+# ─────────────────────────────────────────────────────────────────────────────
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name, self.help = name, help
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = _labels(**labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_labels(**labels), 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = list(self._values.items())
+        lines += [f"{self.name}{_fmt_labels(k)} {v}" for k, v in items]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets=LATENCY_BUCKETS):
+        self.name, self.help = name, help
+        self.buckets = tuple(buckets)
+        # labels → [bucket counts..., +Inf count, sum]
+        self._values: Dict[Labels, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _labels(**labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[index] += 1
+            row[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = [(k, list(v)) for k, v in self._values.items()]
+        for key, row in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), row):
+                cumulative += count
+                le = 'le="%s"' % bound
+                lines.append(f"{self.name}_bucket{_fmt_labels(key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_fmt_labels(key)} {row[-1]}")
+            lines.append(f"{self.name}_count{_fmt_labels(key)} {cumulative}")
+        return lines
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Registry
+# ─────────────────────────────────────────────────────────────────────────────
+REQUESTS = Counter("bdr_http_requests_total", "HTTP requests by route and status")
+REQUEST_LATENCY = Histogram("bdr_http_request_duration_seconds", "HTTP request latency by route")
+DB_QUERIES = Counter("bdr_db_queries_total", "SQL statements executed, by originating route")
+DB_QUERIES_PER_REQUEST = Histogram(
+    "bdr_db_queries_per_request", "SQL statements per HTTP request", buckets=QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = Histogram("bdr_db_time_per_request_seconds", "Time spent in SQL per HTTP request")
+CACHE_REQUESTS = Counter("bdr_cache_requests_total", "Cache lookups by cache and result")
+
+_REGISTRY = [REQUESTS, REQUEST_LATENCY, DB_QUERIES, DB_QUERIES_PER_REQUEST, DB_TIME_PER_REQUEST, CACHE_REQUESTS]
+
+
+def record_cache(name: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=name, result="hit" if hit else "miss")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Per-request DB accounting
+# ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class RequestStats:
+    resolve_route: Callable[[], str]
+    queries: int = 0
+    db_seconds: float = 0.0
+    _route: Optional[str] = None
+
+    @property
+    def route(self) -> str:
+        # Routing happens after the middleware starts; resolve once it has
+        if self._route is None:
+            route = self.resolve_route()
+            if route == "unmatched":
+                return route
+            self._route = route
+        return self._route
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("bdr_request_stats", default=None)
+
+
+def start_request(resolve_route: Callable[[], str]):
+    stats = RequestStats(resolve_route=resolve_route)
+    return stats, _current.set(stats)
+
+
+def end_request(token) -> None:
+    _current.reset(token)
+
+
+def current_request() -> Optional[RequestStats]:
+    return _current.get()
+
+
+_slow_query_seconds: Optional[float] = None
+
+
+def instrument_engine(engine: Engine, slow_query_ms: int = 0) -> None:
+    """Attach cursor hooks once. slow_query_ms > 0 turns on the slow-query log."""
+    global _slow_query_seconds
+    _slow_query_seconds = slow_query_ms / 1000.0 if slow_query_ms > 0 else None
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("bdr_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("bdr_query_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    stats = _current.get()
+    route = stats.route if stats else "background"
+    if stats:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+    DB_QUERIES.inc(route=route)
+
+    if _slow_query_seconds is not None and elapsed >= _slow_query_seconds:
+        sql = " ".join(statement.split())
+        slow_query_logger.warning(f"{elapsed * 1000:.0f}ms route={route} sql={sql[:500]}")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Exposition
+# ─────────────────────────────────────────────────────────────────────────────
+def _pool_lines(engine: Optional[Engine]) -> List[str]:
+    if engine is None:
+        return []
+    pool = engine.pool
+    gauges = []
+    for name, attr in (("size", "size"), ("checked_out", "checkedout"),
+                       ("checked_in", "checkedin"), ("overflow", "overflow")):
+        fn = getattr(pool, attr, None)
+        if fn is None:
+            continue
+        try:
+            gauges.append((name, fn()))
+        except Exception:
+            continue
+    lines = []
+    for name, value in gauges:
+        metric = f"bdr_db_pool_{name}"
+        lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+    return lines
+
+
+def render_prometheus(engine: Optional[Engine] = None) -> str:
+    lines: List[str] = []
+    for metric in _REGISTRY:
+        lines += metric.render()
+    lines += _pool_lines(engine)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,86 @@
+# app/utils/pagination.py
+"""
+BDR – Keyset pagination + cheap total estimates for list endpoints.
+
+Cursor = id of the last row on the previous page. The sort value is
+looked up in the DB (scalar subquery on the PK), so cursors stay
+opaque ints and compare exactly the way the column is stored — no
+datetime/decimal round-tripping through the URL.
+
+Totals: exact bounded count up to COUNT_EXACT_LIMIT rows, then the
+planner estimate on Postgres (EXPLAIN) or a lower bound on SQLite.
+COUNT(*) over a large table never runs.
+"""
+
+import json
+import logging
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+COUNT_EXACT_LIMIT = 10000
+
+
+def keyset_filter(sort_column, id_column, cursor: int, descending: bool = True):
+    if sort_column is id_column:
+        return id_column < cursor if descending else id_column > cursor
+    cursor_value = select(sort_column).where(id_column == cursor).scalar_subquery()
+    if descending:
+        return or_(sort_column < cursor_value, and_(sort_column == cursor_value, id_column < cursor))
+    return or_(sort_column > cursor_value, and_(sort_column == cursor_value, id_column > cursor))
+
+
+def estimate_count(db: Session, query) -> Tuple[int, bool]:
+    """Returns (count, is_exact)."""
+    query = query.order_by(None).limit(None)
+    bounded = select(func.count()).select_from(query.limit(COUNT_EXACT_LIMIT + 1).subquery())
+    count = db.execute(bounded).scalar() or 0
+    if count <= COUNT_EXACT_LIMIT:
+        return count, True
+
+    bind = db.get_bind()
+    if bind.dialect.name == "postgresql":
+        try:
+            sql = str(query.compile(dialect=bind.dialect, compile_kwargs={"literal_binds": True}))
+            plan = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}").scalar()
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            return max(int(plan[0]["Plan"]["Plan Rows"]), count), False
+        except Exception as e:
+            logger.warning(f"Count estimate failed, using lower bound: {e}")
+    return count, False
+
+
+def paginate(
+    db: Session,
+    query,
+    sort_column,
+    id_column,
+    cursor: Optional[int] = None,
+    limit: int = 50,
+    descending: bool = True,
+    with_total: bool = True
+) -> Dict:
+    """
+    `query` is a Core select of the projected columns (must include id_column).
+    Sort is (sort_column, id) so ties are stable.
+    """
+    total, exact = estimate_count(db, query) if with_total else (None, None)
+
+    if cursor:
+        query = query.where(keyset_filter(sort_column, id_column, cursor, descending))
+    order = [sort_column] if sort_column is id_column else [sort_column, id_column]
+    query = query.order_by(*[c.desc() if descending else c.asc() for c in order])
+
+    rows = db.execute(query.limit(limit)).mappings().all()
+    items = [dict(row) for row in rows]
+    next_cursor = items[-1][id_column.key] if len(items) == limit else None
+
+    return {
+        "items": items,
+        "next_cursor": next_cursor,
+        "total_estimate": total,
+        "total_is_exact": exact,
+    }
@@ -0,0 +1,62 @@
+# app/utils/payments/__init__.py
+"""
+BDR – Payments
+- get_provider("momo" | "card" | "bank") → configured PaymentProvider
+- payment_http                           → the shared pooled HTTP client
+"""
+
+from typing import Dict
+
+from app.core.config import settings
+
+from .base import (
+    PaymentProvider, PaymentRequest, PaymentResult, ProviderStatus, WebhookEvent,
+    PaymentError, SUCCESSFUL, FAILED, PENDING,
+)
+from .client import PaymentHttpClient, payment_http
+from .momo import MoMoProvider, TokenCache
+from .stripe import StripeProvider
+from .bank import BankProvider
+
+MOMO_BASE_URLS = {
+    "sandbox": "https://sandbox.momodeveloper.mtn.com",
+}
+MOMO_LIVE_BASE_URL = "https://proxy.momoapi.mtn.com"
+
+
+def _build_providers() -> Dict[str, PaymentProvider]:
+    return {
+        "momo": MoMoProvider(
+            base_url=settings.MOMO_BASE_URL or MOMO_BASE_URLS.get(settings.MOMO_ENV, MOMO_LIVE_BASE_URL),
+            api_user=settings.MOMO_API_USER,
+            api_key=settings.MOMO_API_KEY,
+            subscription_key=settings.MOMO_SUBSCRIPTION_KEY,
+            target_environment=settings.MOMO_ENV,
+            currency=settings.MOMO_CURRENCY,
+            callback_url=settings.MOMO_CALLBACK_URL,
+            webhook_secret=settings.MOMO_WEBHOOK_SECRET,
+        ),
+        "card": StripeProvider(
+            base_url=settings.STRIPE_API_BASE,
+            secret_key=settings.STRIPE_SECRET_KEY,
+            webhook_secret=settings.STRIPE_WEBHOOK_SECRET,
+            frontend_url=settings.FRONTEND_URL,
+        ),
+        "bank": BankProvider(settings.BANK_TRANSFER_DETAILS),
+    }
+
+
+providers: Dict[str, PaymentProvider] = _build_providers()
+
+
+def get_provider(name: str) -> PaymentProvider:
+    """KeyError for an unknown payment method."""
+    return providers[name]
+
+
+__all__ = [
+    "PaymentProvider", "PaymentRequest", "PaymentResult", "ProviderStatus", "WebhookEvent",
+    "PaymentError", "SUCCESSFUL", "FAILED", "PENDING",
+    "PaymentHttpClient", "payment_http", "MoMoProvider", "TokenCache", "StripeProvider", "BankProvider",
+    "providers", "get_provider",
+]
@@ -0,0 +1,23 @@
+# app/utils/payments/bank.py
+"""
+BDR – Bank transfer provider
+No API to call: the backer gets transfer instructions quoting our
+reference, and an admin settles it once the money lands:
+POST /api/v1/admin/transfers/{reference}/settle.
+"""
+
+from .base import PaymentProvider, PaymentRequest, PaymentResult
+
+
+class BankProvider(PaymentProvider):
+    name = "bank"
+
+    def __init__(self, details: str):
+        self.details = details
+
+    async def initiate(self, payment: PaymentRequest) -> PaymentResult:
+        return PaymentResult(
+            reference=payment.external_id,
+            message="Transfer the amount to the account below, quoting the reference",
+            instructions=f"{self.details} Amount: RWF {payment.amount:,}. Reference: {payment.external_id}",
+        )
@@ -0,0 +1,80 @@
+# app/utils/payments/base.py
+"""
+BDR – Payment provider interface
+
+Every way of paying (MoMo, card, bank transfer) implements PaymentProvider:
+- initiate()       → ask the provider to collect; returns its reference
+- fetch_status()   → ask the provider where a payment stands (reconciliation)
+- parse_webhook()  → verify + normalise a provider callback
+- confirm()        → settle a callback against the provider's own record
+                     before we credit anything (MoMo callbacks are only hints)
+
+Statuses are normalised to SUCCESSFUL / FAILED / PENDING, the words
+update_transaction_status() already understands.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Mapping, NamedTuple, Optional
+
+SUCCESSFUL = "SUCCESSFUL"
+FAILED = "FAILED"
+PENDING = "PENDING"
+
+
+class PaymentError(Exception):
+    """Provider unreachable, refused the request, or sent a bad webhook."""
+
+
+class PaymentRequest(NamedTuple):
+    external_id: str             # our id for the payment, echoed back by the provider
+    amount: int                  # RWF
+    project_id: Optional[int]    # None for a basket covering several projects
+    project_title: str
+    phone: Optional[str] = None
+    email: Optional[str] = None
+
+
+class PaymentResult(NamedTuple):
+    reference: str               # provider-side id (MoMo X-Reference-Id, Stripe session id...)
+    message: str
+    checkout_url: Optional[str] = None
+    instructions: Optional[str] = None
+
+
+class ProviderStatus(NamedTuple):
+    status: str                  # SUCCESSFUL / FAILED / PENDING
+    provider_ref: Optional[str] = None   # e.g. MoMo financialTransactionId
+
+
+class WebhookEvent(NamedTuple):
+    external_id: str
+    status: str
+    provider_ref: Optional[str] = None
+
+
+class PaymentProvider(ABC):
+    name: str = ""
+
+    @property
+    def configured(self) -> bool:
+        """False → development mode: no network calls, payments stay pending."""
+        return True
+
+    @abstractmethod
+    async def initiate(self, payment: PaymentRequest) -> PaymentResult:
+        ...
+
+    async def fetch_status(self, reference: str) -> Optional[ProviderStatus]:
+        """None when the provider can't be asked (bank transfers, dev mode)."""
+        return None
+
+    def parse_webhook(self, body: bytes, headers: Mapping[str, str]) -> Optional[WebhookEvent]:
+        """Raises PaymentError on a bad signature. None → event we don't act on."""
+        raise PaymentError(f"{self.name} does not send webhooks")
+
+    async def confirm(self, event: WebhookEvent, reference: Optional[str]) -> Optional[WebhookEvent]:
+        """
+        The event to apply for a pending payment whose provider-side id is
+        `reference`; None → not settled yet. Signed webhooks are taken as-is.
+        """
+        return event
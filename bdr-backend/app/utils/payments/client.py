@@ -0,0 +1,96 @@
+# app/utils/payments/client.py
+"""
+BDR – Shared HTTP client for payment providers
+
+One long-lived httpx.AsyncClient per worker, opened in main.py lifespan
+and shared by every provider: connections (and their TLS sessions) are
+pooled and kept alive, so initiating a payment reuses a warm connection
+instead of paying a fresh TCP + TLS handshake on a slow mobile-money API.
+HTTP/2 is used when the `h2` package is installed.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Safe import — HTTP/2 is optional
+try:
+    import h2  # noqa: F401
+    http2_available = True
+except Exception:
+    http2_available = False
+
+
+class PaymentHttpClient:
+    def __init__(
+        self,
+        timeout: float = 15.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 50,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and http2_available
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client; created on first use if start() wasn't called (CLI jobs)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            # A pool is tied to the loop that opened its connections
+            self._client = self._build()
+            self._loop = loop
+        return self._client
+
+    def _build(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=self.limits,
+            http2=self.http2,
+            transport=self.transport,
+            headers={"User-Agent": "BDR-Payments/1.0"},
+        )
+
+    async def start(self) -> None:
+        self.client
+        logger.info(f"Payment HTTP client ready (http2={self.http2}, pool={self.limits.max_connections})")
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+    async def __aenter__(self) -> "PaymentHttpClient":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+
+payment_http = PaymentHttpClient(
+    timeout=settings.PAYMENT_HTTP_TIMEOUT_SECONDS,
+    connect_timeout=settings.PAYMENT_HTTP_CONNECT_TIMEOUT_SECONDS,
+    max_connections=settings.PAYMENT_HTTP_MAX_CONNECTIONS,
+    max_keepalive=settings.PAYMENT_HTTP_MAX_KEEPALIVE,
+    keepalive_expiry=settings.PAYMENT_HTTP_KEEPALIVE_SECONDS,
+    http2=settings.PAYMENT_HTTP2,
+)
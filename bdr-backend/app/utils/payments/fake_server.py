@@ -0,0 +1,100 @@
+# app/utils/payments/fake_server.py
+"""
+BDR – Local fake MoMo + Stripe server
+
+Speaks just enough of both APIs for the providers: MoMo token,
+requesttopay + status, Stripe checkout sessions. Tests mount it in-process
+(httpx.ASGITransport); for manual runs start it and point the providers at it:
+
+    python -m app.utils.payments.fake_server --port 8900
+    MOMO_BASE_URL=http://127.0.0.1:8900  STRIPE_API_BASE=http://127.0.0.1:8900
+
+Payments settle as `outcome` says ("SUCCESSFUL" by default).
+"""
+
+import argparse
+import uuid
+
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+
+
+def create_fake_provider_app(outcome: str = "SUCCESSFUL", token_ttl: int = 3600) -> FastAPI:
+    app = FastAPI(title="BDR fake payment provider")
+    app.state.outcome = outcome
+    app.state.tokens_issued = 0
+    app.state.requests = {}
+    app.state.sessions = {}
+    tokens = set()
+
+    def check_token(authorization: str):
+        if authorization.removeprefix("Bearer ") not in tokens:
+            raise HTTPException(status_code=401, detail="Access token invalid or expired")
+
+    # ── MoMo Collections ────────────────────────────────────────────────────
+    @app.post("/collection/token/")
+    def momo_token(authorization: str = Header("")):
+        if not authorization.startswith("Basic "):
+            raise HTTPException(status_code=401)
+        token = uuid.uuid4().hex
+        tokens.add(token)
+        app.state.tokens_issued += 1
+        return {"access_token": token, "token_type": "access_token", "expires_in": token_ttl}
+
+    @app.post("/collection/v1_0/requesttopay", status_code=202)
+    async def request_to_pay(request: Request, authorization: str = Header(""), x_reference_id: str = Header(...)):
+        check_token(authorization)
+        if x_reference_id in app.state.requests:
+            raise HTTPException(status_code=409, detail="Duplicated reference id")
+        body = await request.json()
+        app.state.requests[x_reference_id] = {**body, "status": "PENDING"}
+        return Response(status_code=202)
+
+    @app.get("/collection/v1_0/requesttopay/{reference}")
+    def request_to_pay_status(reference: str, authorization: str = Header("")):
+        check_token(authorization)
+        payment = app.state.requests.get(reference)
+        if not payment:
+            raise HTTPException(status_code=404)
+        payment["status"] = app.state.outcome
+        return {**payment, "financialTransactionId": f"fake-fin-{reference[:8]}"}
+
+    # ── Stripe Checkout ─────────────────────────────────────────────────────
+    @app.post("/v1/checkout/sessions")
+    async def create_session(request: Request, authorization: str = Header("")):
+        if not authorization.startswith("Bearer sk_"):
+            raise HTTPException(status_code=401)
+        form = dict(await request.form())
+        session_id = f"cs_test_{uuid.uuid4().hex[:16]}"
+        session = {
+            "id": session_id,
+            "url": f"https://checkout.stripe.test/pay/{session_id}",
+            "client_reference_id": form.get("client_reference_id"),
+            "amount_total": int(form.get("line_items[0][price_data][unit_amount]", 0)),
+            "status": "open",
+            "payment_status": "unpaid",
+        }
+        app.state.sessions[session_id] = session
+        return session
+
+    @app.get("/v1/checkout/sessions/{session_id}")
+    def get_session(session_id: str):
+        session = app.state.sessions.get(session_id)
+        if not session:
+            raise HTTPException(status_code=404)
+        if app.state.outcome == "SUCCESSFUL":
+            session.update(status="complete", payment_status="paid", payment_intent=f"pi_{session_id[8:]}")
+        else:
+            session.update(status="expired")
+        return session
+
+    return app
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Run the fake MoMo/Stripe provider locally")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--outcome", default="SUCCESSFUL", choices=["SUCCESSFUL", "FAILED"])
+    args = parser.parse_args()
+    uvicorn.run(create_fake_provider_app(outcome=args.outcome), host="127.0.0.1", port=args.port)
@@ -0,0 +1,215 @@
+# app/utils/payments/momo.py
+"""
+BDR – MTN MoMo Collections provider
+
+- TokenCache   → OAuth access token, reused until shortly before it expires;
+                 concurrent payments wait on one refresh instead of each
+                 fetching their own
+- MoMoProvider → requesttopay + status + callback parsing
+
+Without MOMO_API_USER / MOMO_API_KEY the provider runs in development
+mode: nothing is sent and the payment stays pending.
+
+MoMo doesn't sign its callbacks, so a configured provider refuses them
+unless MOMO_WEBHOOK_SECRET is set (the gateway in front of us signs), and
+even a signed callback is only a hint: confirm() asks MoMo for the
+payment's real status before anything is credited.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import time
+import uuid
+from typing import Callable, Mapping, Optional
+
+import httpx
+
+from .base import (
+    PaymentProvider, PaymentRequest, PaymentResult, ProviderStatus, WebhookEvent,
+    PaymentError, SUCCESSFUL, FAILED, PENDING,
+)
+from .client import PaymentHttpClient, payment_http
+
+logger = logging.getLogger(__name__)
+
+MOMO_STATUSES = {"SUCCESSFUL": SUCCESSFUL, "FAILED": FAILED, "REJECTED": FAILED, "TIMEOUT": FAILED}
+
+
+def msisdn(phone: str) -> str:
+    """+250788123456 / 0788123456 → 250788123456"""
+    digits = phone.lstrip("+").replace(" ", "")
+    return "250" + digits[1:] if digits.startswith("0") else digits
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Access token cache
+# ─────────────────────────────────────────────────────────────────────────────
+class TokenCache:
+    def __init__(self, fetch, skew_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._fetch = fetch                  # async () → (token, expires_in seconds)
+        self.skew = skew_seconds
+        self.clock = clock
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self.fetches = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        return self._lock
+
+    def _fresh(self) -> bool:
+        return self._token is not None and self.clock() < self._expires_at
+
+    async def get(self) -> str:
+        if self._fresh():
+            return self._token
+        async with self._get_lock():
+            if not self._fresh():            # someone else may have refreshed while we waited
+                token, expires_in = await self._fetch()
+                self.fetches += 1
+                self._token = token
+                self._expires_at = self.clock() + max(float(expires_in) - self.skew, 0.0)
+        return self._token
+
+    def invalidate(self) -> None:
+        self._token = None
+        self._expires_at = 0.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Provider
+# ─────────────────────────────────────────────────────────────────────────────
+class MoMoProvider(PaymentProvider):
+    name = "momo"
+
+    def __init__(
+        self,
+        base_url: str,
+        api_user: Optional[str],
+        api_key: Optional[str],
+        subscription_key: Optional[str],
+        target_environment: str = "sandbox",
+        currency: str = "RWF",
+        callback_url: Optional[str] = None,
+        webhook_secret: Optional[str] = None,
+        http: PaymentHttpClient = payment_http,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.api_user = api_user
+        self.api_key = api_key
+        self.subscription_key = subscription_key
+        self.target_environment = target_environment
+        self.currency = currency
+        self.callback_url = callback_url
+        self.webhook_secret = webhook_secret
+        self.http = http
+        self.tokens = TokenCache(self._fetch_token)
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.api_user and self.api_key)
+
+    def _headers(self, **extra) -> dict:
+        headers = {"X-Target-Environment": self.target_environment}
+        if self.subscription_key:
+            headers["Ocp-Apim-Subscription-Key"] = self.subscription_key
+        headers.update(extra)
+        return headers
+
+    async def _fetch_token(self):
+        try:
+            response = await self.http.client.post(
+                f"{self.base_url}/collection/token/",
+                auth=(self.api_user, self.api_key),
+                headers=self._headers(),
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise PaymentError(f"MoMo token request failed: {e}") from e
+        data = response.json()
+        return data["access_token"], data.get("expires_in", 3600)
+
+    async def _request(self, method: str, path: str, headers: Optional[dict] = None, **kwargs) -> httpx.Response:
+        """Authorised call; one retry with a new token if MoMo says the cached one is stale."""
+        for attempt in (1, 2):
+            token = await self.tokens.get()
+            try:
+                response = await self.http.client.request(
+                    method, f"{self.base_url}{path}",
+                    headers=self._headers(Authorization=f"Bearer {token}", **(headers or {})),
+                    **kwargs,
+                )
+            except httpx.HTTPError as e:
+                raise PaymentError(f"MoMo unreachable: {e}") from e
+            if response.status_code != 401 or attempt == 2:
+                return response
+            self.tokens.invalidate()
+
+    async def initiate(self, payment: PaymentRequest) -> PaymentResult:
+        if not payment.phone:
+            raise PaymentError("A MoMo phone number is required")
+        reference = str(uuid.uuid4())
+        if not self.configured:
+            logger.info(f"[DEV MODE] MoMo payment: {payment.amount} RWF from {payment.phone} → Project {payment.project_id}")
+            return PaymentResult(reference=reference, message="Payment request recorded (development mode)")
+
+        headers = {"X-Reference-Id": reference}
+        if self.callback_url:
+            headers["X-Callback-Url"] = self.callback_url
+        response = await self._request("POST", "/collection/v1_0/requesttopay", headers=headers, json={
+            "amount": str(payment.amount),
+            "currency": self.currency,
+            "externalId": payment.external_id,
+            "payer": {"partyIdType": "MSISDN", "partyId": msisdn(payment.phone)},
+            "payerMessage": "BDR: Create jobs for Rwandan youth",
+            "payeeNote": f"Project {payment.project_id}" if payment.project_id else payment.project_title,
+        })
+        if response.status_code != 202:
+            raise PaymentError(f"MoMo refused requesttopay ({response.status_code}): {response.text[:200]}")
+        return PaymentResult(reference=reference, message="Payment request sent to MoMo. Check your phone.")
+
+    async def fetch_status(self, reference: str) -> Optional[ProviderStatus]:
+        if not self.configured:
+            return None
+        response = await self._request("GET", f"/collection/v1_0/requesttopay/{reference}")
+        if response.status_code == 404:
+            return ProviderStatus(FAILED)
+        if response.status_code != 200:
+            raise PaymentError(f"MoMo status check failed ({response.status_code})")
+        data = response.json()
+        return ProviderStatus(MOMO_STATUSES.get(data.get("status"), PENDING), data.get("financialTransactionId"))
+
+    def parse_webhook(self, body: bytes, headers: Mapping[str, str]) -> Optional[WebhookEvent]:
+        # The gateway in front of us adds an HMAC of the body
+        if self.webhook_secret:
+            expected = hmac.new(self.webhook_secret.encode(), body, hashlib.sha256).hexdigest()
+            if not hmac.compare_digest(expected, headers.get("x-signature", "")):
+                raise PaymentError("Bad MoMo webhook signature")
+        elif self.configured:
+            raise PaymentError("MOMO_WEBHOOK_SECRET is not set; refusing unsigned callback")
+        try:
+            data = json.loads(body)
+            external_id = str(data["externalId"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise PaymentError(f"Malformed MoMo webhook: {e}") from e
+        status = MOMO_STATUSES.get(str(data.get("status", "")).upper())
+        if status is None:
+            return None
+        return WebhookEvent(external_id=external_id, status=status, provider_ref=data.get("financialTransactionId"))
+
+    async def confirm(self, event: WebhookEvent, reference: Optional[str]) -> Optional[WebhookEvent]:
+        if not self.configured:
+            return event                     # development mode: nothing to ask
+        if not reference:
+            return None                      # never reached MoMo; reconciliation fails it
+        status = await self.fetch_status(reference)
+        if status.status == PENDING:
+            return None
+        return WebhookEvent(event.external_id, status.status, status.provider_ref or event.provider_ref)
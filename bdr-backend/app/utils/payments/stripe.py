@@ -0,0 +1,150 @@
+# app/utils/payments/stripe.py
+"""
+BDR – Stripe Checkout provider (card payments)
+
+Talks to the Stripe REST API over the shared payment client rather than
+the stripe SDK, which opens its own connections. RWF is a zero-decimal
+currency, so amounts go to Stripe as-is.
+
+Without STRIPE_SECRET_KEY the provider runs in development mode and
+redirects straight to the frontend success page.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import time
+from typing import Mapping, Optional
+
+import httpx
+
+from .base import (
+    PaymentProvider, PaymentRequest, PaymentResult, ProviderStatus, WebhookEvent,
+    PaymentError, SUCCESSFUL, FAILED, PENDING,
+)
+from .client import PaymentHttpClient, payment_http
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_TOLERANCE_SECONDS = 300
+WEBHOOK_EVENTS = {
+    "checkout.session.completed": SUCCESSFUL,
+    "checkout.session.async_payment_succeeded": SUCCESSFUL,
+    "checkout.session.async_payment_failed": FAILED,
+    "checkout.session.expired": FAILED,
+}
+
+
+def stripe_signature(secret: str, timestamp: int, body: bytes) -> str:
+    signed = f"{timestamp}.".encode() + body
+    return hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
+
+
+class StripeProvider(PaymentProvider):
+    name = "card"
+
+    def __init__(
+        self,
+        base_url: str,
+        secret_key: Optional[str],
+        webhook_secret: Optional[str],
+        frontend_url: str,
+        http: PaymentHttpClient = payment_http,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.secret_key = secret_key
+        self.webhook_secret = webhook_secret
+        self.frontend_url = frontend_url.rstrip("/")
+        self.http = http
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.secret_key)
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        try:
+            return await self.http.client.request(
+                method, f"{self.base_url}{path}",
+                headers={"Authorization": f"Bearer {self.secret_key}"},
+                **kwargs,
+            )
+        except httpx.HTTPError as e:
+            raise PaymentError(f"Stripe unreachable: {e}") from e
+
+    async def initiate(self, payment: PaymentRequest) -> PaymentResult:
+        target = f"project={payment.project_id}" if payment.project_id else f"payment={payment.external_id}"
+        success_url = f"{self.frontend_url}/payment-success?{target}&amount={payment.amount}"
+        if not self.configured:
+            logger.info(f"[DEV MODE] Stripe checkout: {payment.amount} RWF → {payment.project_title}")
+            return PaymentResult(
+                reference=f"stripe_dev_{payment.external_id}",
+                message="Redirecting to success (dev mode)",
+                checkout_url=success_url,
+            )
+
+        form = {
+            "mode": "payment",
+            "success_url": success_url,
+            "cancel_url": f"{self.frontend_url}/projects/{payment.project_id or ''}".rstrip("/"),
+            "client_reference_id": payment.external_id,
+            "metadata[external_id]": payment.external_id,
+            "line_items[0][quantity]": "1",
+            "line_items[0][price_data][currency]": "rwf",
+            "line_items[0][price_data][unit_amount]": str(payment.amount),
+            "line_items[0][price_data][product_data][name]": f"Back: {payment.project_title}"[:250],
+        }
+        if payment.email:
+            form["customer_email"] = payment.email
+        response = await self._request("POST", "/v1/checkout/sessions", data=form)
+        if response.status_code != 200:
+            raise PaymentError(f"Stripe refused the checkout session ({response.status_code}): {response.text[:200]}")
+        session = response.json()
+        return PaymentResult(reference=session["id"], message="Redirecting to secure payment...", checkout_url=session["url"])
+
+    async def fetch_status(self, reference: str) -> Optional[ProviderStatus]:
+        if not self.configured:
+            return None
+        response = await self._request("GET", f"/v1/checkout/sessions/{reference}")
+        if response.status_code == 404:
+            return ProviderStatus(FAILED)
+        if response.status_code != 200:
+            raise PaymentError(f"Stripe status check failed ({response.status_code})")
+        session = response.json()
+        if session.get("payment_status") == "paid":
+            return ProviderStatus(SUCCESSFUL, session.get("payment_intent") or session["id"])
+        if session.get("status") == "expired":
+            return ProviderStatus(FAILED)
+        return ProviderStatus(PENDING)
+
+    def verify_signature(self, body: bytes, header: str) -> None:
+        if not self.webhook_secret:
+            if self.configured:
+                raise PaymentError("STRIPE_WEBHOOK_SECRET is not set; refusing unsigned webhook")
+            logger.info("Stripe webhook received (dev mode — accepted)")
+            return
+        parts = dict(item.split("=", 1) for item in header.split(",") if "=" in item)
+        try:
+            timestamp = int(parts.get("t", ""))
+        except ValueError:
+            raise PaymentError("Bad Stripe signature header")
+        if abs(time.time() - timestamp) > WEBHOOK_TOLERANCE_SECONDS:
+            raise PaymentError("Stale Stripe webhook")
+        expected = stripe_signature(self.webhook_secret, timestamp, body)
+        if not hmac.compare_digest(expected, parts.get("v1", "")):
+            raise PaymentError("Bad Stripe webhook signature")
+
+    def parse_webhook(self, body: bytes, headers: Mapping[str, str]) -> Optional[WebhookEvent]:
+        self.verify_signature(body, headers.get("stripe-signature", ""))
+        try:
+            event = json.loads(body)
+            session = event["data"]["object"]
+        except (ValueError, KeyError, TypeError) as e:
+            raise PaymentError(f"Malformed Stripe webhook: {e}") from e
+        status = WEBHOOK_EVENTS.get(event.get("type"))
+        external_id = session.get("client_reference_id")
+        if status is None or not external_id:
+            return None
+        if event["type"] == "checkout.session.completed" and session.get("payment_status") != "paid":
+            return None              # delayed methods settle via async_payment_succeeded
+        return WebhookEvent(external_id=external_id, status=status, provider_ref=session.get("payment_intent") or session.get("id"))
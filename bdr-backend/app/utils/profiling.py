@@ -0,0 +1,246 @@
+# app/utils/profiling.py
+"""
+BDR – Low-overhead sampling profiler for live requests
+
+One daemon thread wakes every PROFILE_INTERVAL_MS and, for each active
+ProfileSession, reads the current frame of the one thread running that
+request's endpoint. track_endpoints() wraps every route's endpoint so the
+call itself records (thread, frame) into the session it finds in a
+ContextVar; the sample is the stack above that exact frame, so another
+request running the same endpoint on another thread — or on the same
+event loop — is never counted. Works for async endpoints (event loop
+thread) and sync ones (threadpool) alike — cProfile only sees its own thread.
+
+Output is "folded stacks" (`frame;frame;frame count` per line), which
+flamegraph.pl, speedscope and inferno all read directly.
+
+ProfileStore keeps:
+- the last PROFILE_ON_DEMAND_KEEP admin-requested profiles (ring buffer)
+- the slowest PROFILE_SLOWEST_PER_ROUTE sampled profiles per route (min-heaps)
+"""
+
+import functools
+import heapq
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from starlette.routing import request_response
+
+from app.core.config import settings
+
+_MAX_DEPTH = 128
+
+
+def _frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+@dataclass
+class ProfileSession:
+    scope: dict
+    samples: Counter = field(default_factory=Counter)
+    sample_count: int = 0
+    # (thread ident, endpoint wrapper frame) while the endpoint runs; one
+    # attribute so the sampler never sees a thread without its frame
+    anchor: Optional[Tuple[int, object]] = None
+
+    def offer(self, frame, root) -> bool:
+        """Count the stack from `frame` up to (not including) `root`; False if `root` isn't on it."""
+        stack = []
+        while frame is not None and len(stack) < _MAX_DEPTH:
+            if frame is root:
+                break
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        if frame is not root or not stack:
+            return False
+        self.samples[";".join(_frame_label(c) for c in reversed(stack))] += 1
+        self.sample_count += 1
+        return True
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.samples.most_common())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Sampler thread (shared by every active session)
+# ─────────────────────────────────────────────────────────────────────────────
+class Sampler:
+    def __init__(self, interval_ms: float = 5.0):
+        self.interval = interval_ms / 1000.0
+        self._sessions: Dict[int, ProfileSession] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def start_session(self, scope: dict) -> Tuple[int, ProfileSession]:
+        session = ProfileSession(scope=scope)
+        with self._lock:
+            key = next(self._ids)
+            self._sessions[key] = session
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="bdr-profiler", daemon=True)
+                self._thread.start()
+        return key, session
+
+    def stop_session(self, key: int) -> None:
+        with self._lock:
+            self._sessions.pop(key, None)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                sessions = [(s, s.anchor) for s in self._sessions.values()]
+                sessions = [(s, anchor) for s, anchor in sessions if anchor is not None]
+                idle = not self._sessions
+            if idle:
+                with self._lock:
+                    if not self._sessions:
+                        self._thread = None
+                        return
+                continue
+            if not sessions:
+                continue
+            frames = sys._current_frames()
+            for session, (thread_id, root) in sessions:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    session.offer(frame, root)
+            del frames
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Endpoint hook — tells a session which thread and frame are its request's
+# ─────────────────────────────────────────────────────────────────────────────
+current_session: ContextVar[Optional[ProfileSession]] = ContextVar("bdr_profile_session", default=None)
+
+
+def _tracked(call):
+    # The context is copied into the threadpool, so a sync endpoint sees
+    # the session too; the wrapper's own frame is this request's anchor
+    if inspect.iscoroutinefunction(call):
+        @functools.wraps(call)
+        async def endpoint(*args, **kwargs):
+            session = current_session.get()
+            if session is None:
+                return await call(*args, **kwargs)
+            session.anchor = (threading.get_ident(), sys._getframe())
+            try:
+                return await call(*args, **kwargs)
+            finally:
+                session.anchor = None
+    else:
+        @functools.wraps(call)
+        def endpoint(*args, **kwargs):
+            session = current_session.get()
+            if session is None:
+                return call(*args, **kwargs)
+            session.anchor = (threading.get_ident(), sys._getframe())
+            try:
+                return call(*args, **kwargs)
+            finally:
+                session.anchor = None
+    endpoint.__bdr_tracked__ = True
+    return endpoint
+
+
+def track_endpoints(app: FastAPI) -> None:
+    """Wrap every API route's endpoint with the hook above. Call once all routes are added."""
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or getattr(route.dependant.call, "__bdr_tracked__", False):
+            continue
+        route.dependant.call = _tracked(route.dependant.call)
+        route.app = request_response(route.get_route_handler())
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Storage
+# ─────────────────────────────────────────────────────────────────────────────
+@dataclass
+class StoredProfile:
+    id: str
+    route: str
+    method: str
+    path: str
+    status: int
+    duration_ms: float
+    samples: int
+    trigger: str                 # "admin" or "sampled"
+    captured_at: datetime
+    folded: str
+
+    def summary(self) -> Dict:
+        return {k: v for k, v in self.__dict__.items() if k != "folded"}
+
+
+class ProfileStore:
+    def __init__(self, on_demand_keep: int = 50, slowest_per_route: int = 5, max_routes: int = 200):
+        self.slowest_per_route = slowest_per_route
+        self.max_routes = max_routes
+        self._by_id: Dict[str, StoredProfile] = {}
+        self._on_demand: Deque[str] = deque(maxlen=on_demand_keep)
+        self._slowest: Dict[str, List[Tuple[float, str]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex[:12]
+
+    def wants(self, route: str, duration_ms: float) -> bool:
+        """Would a sampled profile of this duration make the slowest-N cut?"""
+        heap = self._slowest.get(route)
+        if heap is None:
+            return len(self._slowest) < self.max_routes
+        return len(heap) < self.slowest_per_route or duration_ms > heap[0][0]
+
+    def add(self, profile: StoredProfile) -> None:
+        with self._lock:
+            if profile.trigger == "admin":
+                if len(self._on_demand) == self._on_demand.maxlen:
+                    self._forget(self._on_demand[0])
+                self._on_demand.append(profile.id)
+                self._by_id[profile.id] = profile
+                return
+
+            if not self.wants(profile.route, profile.duration_ms):
+                return
+            heap = self._slowest.setdefault(profile.route, [])
+            self._by_id[profile.id] = profile
+            if len(heap) < self.slowest_per_route:
+                heapq.heappush(heap, (profile.duration_ms, profile.id))
+            else:
+                _, evicted = heapq.heapreplace(heap, (profile.duration_ms, profile.id))
+                self._forget(evicted)
+
+    def _forget(self, profile_id: str) -> None:
+        self._by_id.pop(profile_id, None)
+
+    def get(self, profile_id: str) -> Optional[StoredProfile]:
+        return self._by_id.get(profile_id)
+
+    def list(self, route: Optional[str] = None) -> List[StoredProfile]:
+        with self._lock:
+            profiles = list(self._by_id.values())
+        if route:
+            profiles = [p for p in profiles if p.route == route]
+        return sorted(profiles, key=lambda p: p.duration_ms, reverse=True)
+
+
+sampler = Sampler(interval_ms=settings.PROFILE_INTERVAL_MS)
+profile_store = ProfileStore(
+    on_demand_keep=settings.PROFILE_ON_DEMAND_KEEP,
+    slowest_per_route=settings.PROFILE_SLOWEST_PER_ROUTE,
+)
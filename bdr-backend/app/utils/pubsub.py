@@ -0,0 +1,227 @@
+# app/utils/pubsub.py
+"""
+BDR – Channel pub/sub for live updates (project funding streams)
+
+- Broker         → in-process fan-out to async subscribers
+- MemoryBackend  → default, one worker only
+- RedisBackend   → PUBSUB_BACKEND=redis: publishes go through Redis and
+                   every worker's listener re-delivers them locally
+
+Messages are small absolute snapshots (funding total, backers, jobs), so
+a slow subscriber may safely lose old ones: each subscriber queue is
+bounded and drops the oldest message when full.
+
+subscribe() and publish() are safe from sync code in the threadpool
+(webhooks, CRUD, sync endpoints); delivery always happens on the loop.
+Outside a running server (CLI jobs) there is no loop to deliver on;
+with the Redis backend those messages still reach other workers.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Set
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Safe import — Redis is optional
+try:
+    import redis
+    import redis.asyncio as aioredis
+    redis_available = True
+except Exception:
+    redis = aioredis = None
+    redis_available = False
+
+
+def project_channel(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n".encode("utf-8")
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Subscriber
+# ─────────────────────────────────────────────────────────────────────────────
+class Subscription:
+    def __init__(self, broker: "Broker", channel: str, maxsize: int):
+        self.broker = broker
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def deliver(self, message: Dict[str, Any]) -> None:
+        if self.queue.full():
+            self.queue.get_nowait()         # drop the oldest, keep the newest
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next message, or None after `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self.broker._unsubscribe(self)
+
+    async def __aenter__(self) -> "Subscription":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Cross-worker backends
+# ─────────────────────────────────────────────────────────────────────────────
+class PubSubBackend(ABC):
+    async def start(self, deliver) -> None:
+        """Begin feeding messages from other workers into `deliver(channel, message)`."""
+
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    def publish(self, channel: str, message: Dict[str, Any]) -> bool:
+        """Send to other workers. True if this backend already delivers locally too."""
+
+
+class MemoryBackend(PubSubBackend):
+    def publish(self, channel, message):
+        return False
+
+
+class RedisBackend(PubSubBackend):
+    def __init__(self, url: str, prefix: str = "bdr:ps:"):
+        if not redis_available:
+            raise RuntimeError("PUBSUB_BACKEND=redis requires `pip install redis`")
+        self.url = url
+        self.prefix = prefix
+        self._publisher = redis.Redis.from_url(url)   # sync: publish() runs in the threadpool
+        self._listener: Optional[asyncio.Task] = None
+
+    async def start(self, deliver):
+        self._listener = asyncio.create_task(self._listen(deliver))
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+            self._listener = None
+
+    def publish(self, channel, message):
+        try:
+            self._publisher.publish(self.prefix + channel, json.dumps(message))
+        except Exception as e:
+            logger.warning(f"Redis publish failed, delivering locally only: {e}")
+            return False
+        return True   # our own listener delivers it back to this worker
+
+    async def _listen(self, deliver):
+        while True:
+            try:
+                client = aioredis.from_url(self.url)
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(self.prefix + "*")
+                    async for item in pubsub.listen():
+                        if item.get("type") != "pmessage":
+                            continue
+                        channel = item["channel"].decode()[len(self.prefix):]
+                        deliver(channel, json.loads(item["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Redis pub/sub listener failed, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Broker
+# ─────────────────────────────────────────────────────────────────────────────
+class Broker:
+    def __init__(self, backend: Optional[PubSubBackend] = None, queue_size: int = 16, max_subscribers: int = 1000):
+        self.backend = backend or MemoryBackend()
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._channels: Dict[str, Set[Subscription]] = {}
+        self._count = 0
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return self._count
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        await self.backend.start(self._deliver_local)
+
+    async def stop(self) -> None:
+        await self.backend.stop()
+        self._loop = None
+
+    def subscribe(self, channel: str) -> Subscription:
+        """Raises OverflowError past max_subscribers. Always close() the result."""
+        if self._loop is None:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        with self._lock:
+            if self._count >= self.max_subscribers:
+                raise OverflowError("Too many live subscribers")
+            subscription = Subscription(self, channel, self.queue_size)
+            self._channels.setdefault(channel, set()).add(subscription)
+            self._count += 1
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._channels.get(subscription.channel)
+            if subscribers and subscription in subscribers:
+                subscribers.discard(subscription)
+                self._count -= 1
+                if not subscribers:
+                    del self._channels[subscription.channel]
+
+    def publish(self, channel: str, message: Dict[str, Any]) -> None:
+        """Fire-and-forget, from any thread."""
+        if self.backend.publish(channel, message):
+            return
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._deliver_local(channel, message)
+        else:
+            loop.call_soon_threadsafe(self._deliver_local, channel, message)
+
+    def _deliver_local(self, channel: str, message: Dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = tuple(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+
+def _make_backend() -> PubSubBackend:
+    if settings.PUBSUB_BACKEND == "redis" and settings.REDIS_URL:
+        return RedisBackend(settings.REDIS_URL)
+    return MemoryBackend()
+
+
+broker = Broker(
+    backend=_make_backend(),
+    queue_size=settings.STREAM_QUEUE_SIZE,
+    max_subscribers=settings.STREAM_MAX_SUBSCRIBERS,
+)
@@ -0,0 +1,122 @@
+# app/utils/ranking.py
+"""
+BDR – Project ranking math (NumPy, no DB)
+
+- trending_scores()  → one score per project from funding velocity,
+                       recent backings, time remaining and page engagement
+- tfidf_matrix()     → L2-normalised TF-IDF rows over title + description
+- top_similar()      → top-k cosine neighbours (+ same-sector bonus),
+                       computed in row blocks so memory stays O(block × n)
+
+Everything works on whole arrays at once; app/crud/ranking.py feeds it
+the rows and stores the results, so request paths only ever read.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+# Each signal is scaled to [0, 1] across the projects being ranked first,
+# so the weights say how much each one matters, whatever its units.
+TRENDING_WEIGHTS: Dict[str, float] = {
+    "velocity": 0.4,       # share of the goal raised in the window
+    "backers": 0.3,        # backings in the window (log-damped)
+    "urgency": 0.15,       # ending soon and still short of the goal
+    "engagement": 0.15,    # decayed page views + shares
+}
+URGENCY_DAYS = 14.0        # urgency halves every this many days before the end
+SECTOR_BONUS = 0.15        # added to the cosine of two projects in the same sector
+
+_TOKEN = re.compile(r"[a-z]{3,}")
+STOPWORDS = frozenset("""
+    the and for with that this from are was were will our your their have has
+    not but can all its into who how what when which about more also they them
+    you his her she him out been one two new per
+""".split())
+
+
+def _unit(values: np.ndarray) -> np.ndarray:
+    top = values.max() if values.size else 0.0
+    return values / top if top > 0 else np.zeros_like(values)
+
+
+def trending_scores(
+    recent_amount: np.ndarray,
+    recent_backings: np.ndarray,
+    funding_goal: np.ndarray,
+    current_funding: np.ndarray,
+    days_left: np.ndarray,
+    engagement: np.ndarray,
+    weights: Dict[str, float] = TRENDING_WEIGHTS,
+) -> np.ndarray:
+    """All inputs are aligned 1-D arrays; days_left is NaN for open-ended campaigns."""
+    goal = np.maximum(funding_goal, 1.0)
+    velocity = recent_amount / goal
+    backers = np.log1p(recent_backings)
+    shortfall = np.clip(1.0 - current_funding / goal, 0.0, 1.0)
+    urgency = np.where(np.isnan(days_left), 0.0, 0.5 ** (np.nan_to_num(days_left) / URGENCY_DAYS)) * shortfall
+    engagement = np.log1p(engagement)
+    return (
+        weights["velocity"] * _unit(velocity)
+        + weights["backers"] * _unit(backers)
+        + weights["urgency"] * _unit(urgency)
+        + weights["engagement"] * _unit(engagement)
+    )
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def tfidf_matrix(documents: Sequence[str], max_terms: int = 2000) -> np.ndarray:
+    """(n_docs × n_terms) float32, rows L2-normalised, so X @ X.T is cosine similarity."""
+    counts = [Counter(tokenize(doc)) for doc in documents]
+    df = Counter(term for doc in counts for term in doc)
+    # Terms in a single document can't make two projects similar
+    vocabulary = [term for term, n in df.most_common(max_terms) if n > 1]
+    index = {term: i for i, term in enumerate(vocabulary)}
+
+    tf = np.zeros((len(documents), len(vocabulary)), dtype=np.float32)
+    for row, doc in enumerate(counts):
+        for term, n in doc.items():
+            col = index.get(term)
+            if col is not None:
+                tf[row, col] = n
+    if not vocabulary:
+        return tf
+
+    n_docs = len(documents)
+    idf = np.log((1 + n_docs) / (1 + np.array([df[t] for t in vocabulary], dtype=np.float32))) + 1
+    weights = np.log1p(tf) * idf                      # sublinear tf
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return np.divide(weights, norms, out=np.zeros_like(weights), where=norms > 0)
+
+
+def top_similar(
+    vectors: np.ndarray,
+    sectors: Sequence[str],
+    candidates: np.ndarray,
+    k: int = 6,
+    block: int = 512,
+) -> List[List[Tuple[int, float]]]:
+    """
+    For every row, the k best (row index, score) among `candidates` (bool
+    mask), best first; never itself, never a score <= 0.
+    """
+    n = vectors.shape[0]
+    _, sector_codes = np.unique(np.asarray(sectors, dtype=str), return_inverse=True)
+    results: List[List[Tuple[int, float]]] = []
+    for start in range(0, n, block):
+        stop = min(start + block, n)
+        scores = vectors[start:stop] @ vectors.T
+        scores += SECTOR_BONUS * (sector_codes[start:stop, None] == sector_codes[None, :])
+        scores[:, ~candidates] = -np.inf
+        scores[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        top = min(k, n)
+        best = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+        for row, cols in enumerate(best):
+            ranked = sorted(((int(c), float(scores[row, c])) for c in cols), key=lambda pair: -pair[1])
+            results.append([(c, s) for c, s in ranked if s > 0])
+    return results
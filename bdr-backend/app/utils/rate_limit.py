@@ -0,0 +1,203 @@
+# app/utils/rate_limit.py
+"""
+BDR – Token-bucket rate limiting + short-lived "seen" keys
+
+Two backends behind one async interface:
+- MemoryRateLimitStore → default, per-process (fine for one Render instance)
+- RedisRateLimitStore  → shared across workers / instances
+                         (RATE_LIMIT_BACKEND=redis, needs `pip install redis`)
+
+Buckets are described by `capacity` (burst) and `refill_per_sec`.
+"""
+
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple
+
+from starlette.requests import HTTPConnection
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Safe import — Redis is optional
+try:
+    import redis.asyncio as aioredis
+    redis_available = True
+except Exception:
+    aioredis = None
+    redis_available = False
+
+
+def per_hour(count: float) -> float:
+    return count / 3600.0
+
+
+def per_minute(count: float) -> float:
+    return count / 60.0
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Store interface
+# ─────────────────────────────────────────────────────────────────────────────
+class RateLimitStore(ABC):
+    @abstractmethod
+    async def take(self, key: str, capacity: float, refill_per_sec: float, cost: float = 1.0) -> Tuple[bool, float]:
+        """Take `cost` tokens. Returns (allowed, retry_after_seconds)."""
+
+    @abstractmethod
+    async def add_if_absent(self, key: str, ttl_seconds: float) -> bool:
+        """Remember `key` for `ttl_seconds`. False if it was already there."""
+
+    @abstractmethod
+    async def forget(self, key: str) -> None:
+        """Undo add_if_absent() — the thing it guarded didn't happen after all."""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# In-memory backend
+# ─────────────────────────────────────────────────────────────────────────────
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    Dict of key → (tokens, last_refill). A lock keeps it correct when
+    called from threadpool endpoints too. Idle keys are pruned once the
+    table passes `max_keys`, so a flood of unique IPs can't grow it forever.
+    """
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    async def take(self, key, capacity, refill_per_sec, cost=1.0):
+        now = time.monotonic()
+        with self._lock:
+            tokens, last = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - last) * refill_per_sec)
+            if tokens >= cost:
+                self._buckets[key] = (tokens - cost, now)
+                allowed, retry_after = True, 0.0
+            else:
+                self._buckets[key] = (tokens, now)
+                allowed = False
+                retry_after = (cost - tokens) / refill_per_sec if refill_per_sec > 0 else 3600.0
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+        return allowed, retry_after
+
+    async def add_if_absent(self, key, ttl_seconds):
+        now = time.monotonic()
+        with self._lock:
+            expires = self._seen.get(key)
+            if expires and expires > now:
+                return False
+            self._seen[key] = now + ttl_seconds
+            if len(self._seen) > self.max_keys:
+                self._seen = {k: v for k, v in self._seen.items() if v > now}
+        return True
+
+    async def forget(self, key):
+        with self._lock:
+            self._seen.pop(key, None)
+
+    def _prune(self, now: float) -> None:
+        # Drop buckets idle long enough to be full again (≈ never limited)
+        cutoff = now - 3600
+        self._buckets = {k: v for k, v in self._buckets.items() if v[1] > cutoff}
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Redis backend (shared)
+# ─────────────────────────────────────────────────────────────────────────────
+_TOKEN_BUCKET_LUA = """
+local key = KEYS[1]
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+local state = redis.call('HMGET', key, 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+  tokens = tokens - cost
+  allowed = 1
+end
+redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+local ttl = 3600
+if rate > 0 then ttl = math.ceil(capacity / rate) + 1 end
+redis.call('EXPIRE', key, ttl)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisRateLimitStore(RateLimitStore):
+    def __init__(self, url: str, prefix: str = "bdr:rl:"):
+        if not redis_available:
+            raise RuntimeError("RATE_LIMIT_BACKEND=redis requires `pip install redis`")
+        self.client = aioredis.from_url(url)
+        self.prefix = prefix
+        self._script = self.client.register_script(_TOKEN_BUCKET_LUA)
+
+    async def take(self, key, capacity, refill_per_sec, cost=1.0):
+        allowed, tokens = await self._script(
+            keys=[self.prefix + key],
+            args=[capacity, refill_per_sec, cost, time.time()],
+        )
+        if int(allowed):
+            return True, 0.0
+        missing = cost - float(tokens)
+        return False, (missing / refill_per_sec if refill_per_sec > 0 else 3600.0)
+
+    async def add_if_absent(self, key, ttl_seconds):
+        return bool(await self.client.set(self.prefix + "seen:" + key, 1, nx=True, ex=max(1, int(ttl_seconds))))
+
+    async def forget(self, key):
+        await self.client.delete(self.prefix + "seen:" + key)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared instance + helpers
+# ─────────────────────────────────────────────────────────────────────────────
+_store: Optional[RateLimitStore] = None
+
+
+def get_rate_limit_store() -> RateLimitStore:
+    global _store
+    if _store is None:
+        if settings.RATE_LIMIT_BACKEND == "redis" and settings.REDIS_URL:
+            _store = RedisRateLimitStore(settings.REDIS_URL)
+        else:
+            _store = MemoryRateLimitStore()
+    return _store
+
+
+def set_rate_limit_store(store: RateLimitStore) -> None:
+    """Swap the backend (tests, or a custom shared store)."""
+    global _store
+    _store = store
+
+
+def client_ip(conn: HTTPConnection) -> str:
+    """
+    The socket peer, unless TRUSTED_PROXY_HOPS proxies sit in front of us.
+    Each of those appends the address it saw to X-Forwarded-For, so the
+    client is that many hops from the right; anything further left came
+    from the client itself and is never trusted.
+    """
+    peer = conn.client.host if conn.client else "unknown"
+    hops = settings.TRUSTED_PROXY_HOPS
+    if hops > 0:
+        forwarded = [
+            hop.strip()
+            for header in conn.headers.getlist("x-forwarded-for")
+            for hop in header.split(",")
+            if hop.strip()
+        ]
+        if len(forwarded) >= hops:
+            return forwarded[-hops]
+    return peer
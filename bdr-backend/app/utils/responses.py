@@ -0,0 +1,51 @@
+# app/utils/responses.py
+"""
+BDR – Fast JSON responses
+- DefaultJSONResponse → orjson-backed app default (falls back to JSONResponse)
+- model_response()    → validate ORM rows once and dump straight to JSON
+                        bytes. Returning a Response makes FastAPI skip its
+                        own response_model validation + serialisation, so
+                        each row is validated exactly once.
+
+Keep `response_model=` on routes that use model_response(): it still
+drives the OpenAPI schema.
+"""
+
+from functools import lru_cache
+from typing import Any, Iterable
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
+
+# Safe import — orjson is optional, stdlib json works without it
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse
+    orjson_available = True
+except Exception:
+    ORJSONResponse = None
+    orjson_available = False
+
+DefaultJSONResponse = ORJSONResponse if orjson_available else JSONResponse
+
+
+@lru_cache(maxsize=None)
+def adapter_for(schema: Any) -> TypeAdapter:
+    """TypeAdapters are costly to build — one per schema/type, reused."""
+    return TypeAdapter(schema)
+
+
+def model_response(schema: Any, data: Any, status_code: int = 200) -> Response:
+    """`schema` is a model or a type such as List[ProjectListOut]."""
+    adapter = adapter_for(schema)
+    validated = adapter.validate_python(data, from_attributes=True)
+    if orjson_available:
+        # dump_python + orjson measures faster than dump_json (benchmarks/serialization.py)
+        body = orjson.dumps(adapter.dump_python(validated, mode="json"))
+    else:
+        body = adapter.dump_json(validated)
+    return Response(body, status_code=status_code, media_type="application/json")
+
+
+def model_list_response(model: Any, rows: Iterable[Any], status_code: int = 200) -> Response:
+    return model_response(list[model], list(rows), status_code)
@@ -35,7 +35,3 @@ def verify_token(token: str) -> Optional[Dict]:
 
 def blacklist_token(token: str):
     pass  # stateless JWT — no real logout needed
-
-def calculate_jobs_created(amount_rwf: int) -> int:
-    rate = getattr(settings, "JOB_CREATION_RATE", 10000)
-    return amount_rwf // rate
\ No newline at end of file
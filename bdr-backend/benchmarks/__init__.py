@@ -0,0 +1,10 @@
+# benchmarks/__init__.py
+"""
+BDR – API benchmark suite (not collected by pytest)
+
+    python -m benchmarks.run                      # seed + run, compare to baseline if present
+    python -m benchmarks.run --save-baseline      # record the current numbers
+    python -m benchmarks.run --database-url postgresql://... --users 20000
+
+Always point --database-url at a throwaway database: it is dropped and reseeded.
+"""
@@ -0,0 +1,300 @@
+# benchmarks/generate.py
+"""
+Synthetic data generator — millions of rows with realistic shape.
+
+    python -m benchmarks.generate --database-url sqlite:////tmp/bdr_big.db \\
+        --users 1000000 --projects 50000 --transactions 5000000 --notifications 2000000
+
+Distributions:
+- project popularity is Zipfian (a few projects take most of the backing)
+- launches come in bursts around campaign days, not uniformly
+- backing arrives front-loaded after launch (decays over the 90-day window)
+- amounts are RWF multiples of 10,000, heavy-tailed (most 10k–50k, rare 1M+)
+
+Rows are streamed in batches through Core `insert()` + executemany
+(insertmanyvalues on SQLAlchemy 2), never ORM objects, so memory stays
+flat. --reset drops and recreates every table first.
+"""
+
+import argparse
+import bisect
+import itertools
+import math
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+ADJECTIVES = ["Green", "Smart", "Rising", "Kigali", "Hillside", "Bright", "Urban", "Rural", "Youth", "Lake"]
+NOUNS = ["Coffee", "Clinic", "Solar", "Poultry", "Tailoring", "Academy", "Water", "Honey", "Transport", "Code"]
+SECTORS = ["Agriculture", "Health", "Education", "Renewable Energy", "Technology & Innovation"]
+FIRST_NAMES = ["Aline", "Eric", "Grace", "Jean", "Diane", "Patrick", "Claudine", "Emmanuel", "Ange", "Olivier"]
+LAST_NAMES = ["Uwase", "Mugisha", "Ishimwe", "Niyonzima", "Mukamana", "Habimana", "Iradukunda", "Nshuti"]
+# RWF 10,000 units → weights (heavy tail)
+AMOUNT_UNITS = [1, 2, 3, 5, 10, 20, 50, 100]
+AMOUNT_WEIGHTS = [40, 22, 10, 12, 8, 5, 2, 1]
+
+
+@dataclass
+class Volumes:
+    users: int = 100_000
+    projects: int = 5_000
+    transactions: int = 500_000
+    notifications: int = 200_000
+    entrepreneur_share: float = 0.15
+    zipf_s: float = 1.1               # popularity skew (1.0 ≈ classic Zipf)
+    campaigns: int = 24               # launch bursts over the period
+    days: int = 730                   # history length
+
+
+class ZipfSampler:
+    """Draws indexes 0..n-1 with P(k) ∝ 1/(k+1)^s via bisect on the CDF."""
+
+    def __init__(self, n: int, s: float, rng: random.Random):
+        self.rng = rng
+        self.cdf = list(itertools.accumulate(1.0 / (k + 1) ** s for k in range(n)))
+        self.total = self.cdf[-1]
+
+    def sample(self) -> int:
+        return bisect.bisect_left(self.cdf, self.rng.random() * self.total)
+
+
+def batched(rows: Iterator[Dict], size: int) -> Iterator[List[Dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Row streams
+# ─────────────────────────────────────────────────────────────────────────────
+def user_rows(volumes: Volumes, rng: random.Random, now: datetime, password_hash: str, prefix: str):
+    entrepreneurs = max(1, int(volumes.users * volumes.entrepreneur_share))
+    for i in range(volumes.users):
+        role, n = ("entrepreneur", i) if i < entrepreneurs else ("backer", i - entrepreneurs)
+        yield {
+            "email": f"{prefix}{role}-{n}@bdr.rw",
+            "full_name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "hashed_password": password_hash,
+            "role": role,
+            "is_active": True,
+            # signups accelerate over time (sqrt → more recent users)
+            "created_at": now - timedelta(days=volumes.days * (1 - math.sqrt(rng.random()))),
+        }
+
+
+def project_rows(volumes: Volumes, rng: random.Random, now: datetime, entrepreneur_ids: List[int], prefix: str):
+    from app.models.project import ProjectStatus
+
+    campaign_days = sorted(rng.uniform(0, volumes.days) for _ in range(volumes.campaigns))
+    for i in range(volumes.projects):
+        # 80% launch within a few days of a campaign, the rest uniformly
+        if rng.random() < 0.8:
+            days_ago = max(0.0, rng.choice(campaign_days) - rng.expovariate(1 / 3))
+        else:
+            days_ago = rng.uniform(0, volumes.days)
+        launched = now - timedelta(days=days_ago)
+        goal = rng.choice([500_000, 1_000_000, 2_000_000, 5_000_000, 10_000_000])
+        title = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {i}"
+        ends_at = launched + timedelta(days=90)
+        yield {
+            "title": title,
+            "slug": f"{prefix}{title.lower().replace(' ', '-')}",
+            "description": f"{title} creates jobs for youth in {rng.choice(SECTORS).lower()}. " * rng.randint(2, 12),
+            "sector": rng.choice(SECTORS),
+            "funding_goal": goal,
+            "current_funding": 0,
+            "job_goal": goal // 10000,
+            "jobs_to_create": goal // 10000,
+            "backers_count": 0,
+            "status": ProjectStatus.active if ends_at > now else rng.choice([ProjectStatus.funded, ProjectStatus.failed]),
+            "launched_at": launched,
+            "ends_at": ends_at,
+            "created_at": launched - timedelta(days=rng.uniform(0, 14)),
+            "entrepreneur_id": rng.choice(entrepreneur_ids),
+        }
+
+
+def transaction_rows(volumes: Volumes, rng: random.Random, now: datetime,
+                     projects: List, backer_ids: List[int], prefix: str):
+    from app.models.transaction import TransactionStatus
+
+    popularity = ZipfSampler(len(projects), volumes.zipf_s, rng)
+    # shuffle so popularity isn't correlated with insertion order / id
+    order = list(range(len(projects)))
+    rng.shuffle(order)
+    backer_pick = ZipfSampler(len(backer_ids), 0.6, rng)   # some backers give repeatedly
+
+    for i in range(volumes.transactions):
+        project_id, launched_at = projects[order[popularity.sample()]]
+        # front-loaded: most backing in the first weeks after launch
+        offset = min(90.0, rng.expovariate(1 / 12))
+        created = launched_at + timedelta(days=offset, seconds=rng.uniform(0, 86400))
+        if created > now:
+            created = now - timedelta(seconds=rng.uniform(0, 3600))
+        units = rng.choices(AMOUNT_UNITS, AMOUNT_WEIGHTS)[0]
+        roll = rng.random()
+        status = (TransactionStatus.completed if roll < 0.88 else
+                  TransactionStatus.failed if roll < 0.97 else
+                  TransactionStatus.pending)
+        yield {
+            "amount": units * 10000,
+            "jobs_created": units if status == TransactionStatus.completed else 0,
+            "status": status,
+            "external_id": f"{prefix}tx-{i}",
+            "created_at": created,
+            "updated_at": created,
+            "backer_id": backer_ids[backer_pick.sample()],
+            "project_id": project_id,
+        }
+
+
+def notification_rows(volumes: Volumes, rng: random.Random, now: datetime, user_ids: List[int]):
+    from app.models.notification import NotificationType
+
+    types = list(NotificationType)
+    active = ZipfSampler(len(user_ids), 0.8, rng)
+    for _ in range(volumes.notifications):
+        created = now - timedelta(days=rng.expovariate(1 / 30))
+        yield {
+            "title": "Update on your project",
+            "message": "Something happened on a project you follow.",
+            "type": rng.choice(types),
+            "is_read": created < now - timedelta(days=7) or rng.random() < 0.4,
+            "is_email_sent": True,
+            "created_at": created,
+            "user_id": user_ids[active.sample()],
+        }
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Driver
+# ─────────────────────────────────────────────────────────────────────────────
+def _fast_sqlite(conn) -> None:
+    if conn.dialect.name == "sqlite":
+        conn.exec_driver_sql("PRAGMA synchronous=OFF")
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+
+def _load(engine, table, rows: Iterator[Dict], batch_size: int, label: str, total: int) -> None:
+    from sqlalchemy import insert
+
+    started = time.perf_counter()
+    done = 0
+    for batch in batched(rows, batch_size):
+        with engine.begin() as conn:
+            _fast_sqlite(conn)
+            conn.execute(insert(table), batch)
+        done += len(batch)
+        if done % (batch_size * 50) < batch_size or done == total:
+            rate = done / max(time.perf_counter() - started, 1e-9)
+            print(f"  {label:<14}{done:>12,} / {total:,}  ({rate:,.0f} rows/s)", flush=True)
+
+
+def generate(engine, volumes: Volumes, rng_seed: int = 42, reset: bool = False,
+             batch_size: int = 5000, prefix: str = "gen-") -> Dict[str, int]:
+    """Stream every table into `engine`. Returns row counts."""
+    from sqlalchemy import select, update, func
+
+    from app.database import Base
+    from app.models.user import User
+    from app.models.project import Project
+    from app.models.transaction import Transaction, TransactionStatus
+    from app.models.notification import Notification
+    from app.utils.security import get_password_hash
+
+    rng = random.Random(rng_seed)
+    now = datetime.utcnow()
+    if reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    # pbkdf2 is deliberately slow — every generated user shares one hash
+    password_hash = get_password_hash("password")
+
+    _load(engine, User.__table__, user_rows(volumes, rng, now, password_hash, prefix),
+          batch_size, "users", volumes.users)
+    with engine.connect() as conn:
+        users = conn.execute(
+            select(User.id, User.role).where(User.email.like(f"{prefix}%")).order_by(User.id)
+        ).all()
+    user_ids = [u.id for u in users]
+    entrepreneur_ids = [u.id for u in users if u.role == "entrepreneur"]
+    backer_ids = [u.id for u in users if u.role == "backer"] or user_ids
+
+    _load(engine, Project.__table__, project_rows(volumes, rng, now, entrepreneur_ids, prefix),
+          batch_size, "projects", volumes.projects)
+    with engine.connect() as conn:
+        projects = conn.execute(
+            select(Project.id, Project.launched_at).where(Project.slug.like(f"{prefix}%")).order_by(Project.id)
+        ).all()
+    projects = [(p.id, p.launched_at.replace(tzinfo=None)) for p in projects]
+
+    _load(engine, Transaction.__table__,
+          transaction_rows(volumes, rng, now, projects, backer_ids, prefix),
+          batch_size, "transactions", volumes.transactions)
+    _load(engine, Notification.__table__, notification_rows(volumes, rng, now, user_ids),
+          batch_size, "notifications", volumes.notifications)
+
+    # Denormalised project totals, one set-based statement
+    completed = Transaction.status == TransactionStatus.completed
+    with engine.begin() as conn:
+        conn.execute(update(Project).where(Project.slug.like(f"{prefix}%")).values(
+            current_funding=select(func.coalesce(func.sum(Transaction.amount), 0))
+            .where(Transaction.project_id == Project.id, completed).scalar_subquery(),
+            backers_count=select(func.count(func.distinct(Transaction.backer_id)))
+            .where(Transaction.project_id == Project.id, completed).scalar_subquery(),
+        ))
+
+    return {
+        "users": volumes.users,
+        "projects": volumes.projects,
+        "transactions": volumes.transactions,
+        "notifications": volumes.notifications,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate synthetic BDR data")
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL / the app's default DB")
+    parser.add_argument("--users", type=int, default=Volumes.users)
+    parser.add_argument("--projects", type=int, default=Volumes.projects)
+    parser.add_argument("--transactions", type=int, default=Volumes.transactions)
+    parser.add_argument("--notifications", type=int, default=Volumes.notifications)
+    parser.add_argument("--zipf", type=float, default=Volumes.zipf_s, help="project popularity skew")
+    parser.add_argument("--campaigns", type=int, default=Volumes.campaigns)
+    parser.add_argument("--days", type=int, default=Volumes.days)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--prefix", default="gen-", help="email/slug prefix, so runs can be appended")
+    parser.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    args = parser.parse_args(argv)
+
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    for key, value in (("SECRET_KEY", "generator"), ("SMTP_USER", "gen@bdr.rw"), ("SMTP_PASSWORD", "gen")):
+        os.environ.setdefault(key, value)
+
+    from app.database import engine
+
+    volumes = Volumes(
+        users=args.users, projects=args.projects, transactions=args.transactions,
+        notifications=args.notifications, zipf_s=args.zipf, campaigns=args.campaigns, days=args.days,
+    )
+    print(f"Generating into {engine.url.render_as_string(hide_password=True)}")
+    started = time.perf_counter()
+    generate(engine, volumes, rng_seed=args.seed, reset=args.reset, batch_size=args.batch_size, prefix=args.prefix)
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# benchmarks/loadgen.py
+"""
+Load generator against a running server (local uvicorn, staging, ...).
+
+    # closed loop: 50 virtual users, each waits for its response (+ think time)
+    python -m benchmarks.loadgen http://localhost:8000 --mix benchmarks/mixes/browse.json --users 50
+
+    # open loop: Poisson arrivals at 200 req/s regardless of response time
+    python -m benchmarks.loadgen http://localhost:8000 --mix benchmarks/mixes/browse.json --rate 200
+
+    # replay a recorded mix: uvicorn access log or JSONL of {"method", "path", "json"?}
+    python -m benchmarks.loadgen http://localhost:8000 --replay access.log --rate 100
+
+Open-loop latency is measured from each request's *scheduled* start, so a
+stalled server shows up as latency instead of silently lowering the rate
+(no coordinated omission). Placeholders {slug}, {project_id} and
+{backer_email} are filled from data the server already has (generated with
+benchmarks.generate --prefix gen-).
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from .run import percentile
+
+_ACCESS_LOG = re.compile(r'"(GET|POST|PUT|PATCH|DELETE) (\S+) HTTP/[\d.]+"')
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+
+
+@dataclass
+class MixEntry:
+    name: str
+    method: str
+    path: str
+    weight: float = 1.0
+    json: Optional[dict] = None
+    auth: Optional[str] = None          # "admin" / "backer" / None
+
+
+@dataclass
+class Stats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    errors: int = 0
+
+
+def load_mix(path: Path) -> List[MixEntry]:
+    spec = json.loads(path.read_text())
+    return [MixEntry(**entry) for entry in spec["requests"]]
+
+
+def load_replay(path: Path) -> List[MixEntry]:
+    """Recorded traffic → weighted mix (frequency of each method + path)."""
+    counts: Counter = Counter()
+    bodies: Dict = {}
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            record = json.loads(line)
+            key = (record["method"].upper(), record["path"])
+            if record.get("json") is not None:
+                bodies[key] = record["json"]
+        else:
+            match = _ACCESS_LOG.search(line)
+            if not match:
+                continue
+            key = (match.group(1), match.group(2))
+            if key[0] != "GET" and key not in bodies:
+                continue   # access logs have no request bodies — only GETs replay faithfully
+        counts[key] += 1
+    return [
+        MixEntry(name=f"{method} {path}", method=method, path=path, weight=count, json=bodies.get((method, path)))
+        for (method, path), count in counts.items()
+    ]
+
+
+def _fill(value, variables: Dict[str, list], rng: random.Random):
+    if isinstance(value, str):
+        return _PLACEHOLDER.sub(lambda m: str(rng.choice(variables[m.group(1)])) if m.group(1) in variables
+                                else m.group(0), value)
+    if isinstance(value, dict):
+        return {k: _fill(v, variables, rng) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, variables, rng) for v in value]
+    return value
+
+
+async def discover_variables(client: httpx.AsyncClient, prefix: str) -> Dict[str, list]:
+    variables: Dict[str, list] = {"backer_email": [f"{prefix}backer-{i}@bdr.rw" for i in range(1000)]}
+    try:
+        projects = (await client.get("/api/v1/projects/")).json()
+        variables["slug"] = [p["slug"] for p in projects] or ["missing"]
+        variables["project_id"] = [p["id"] for p in projects] or [0]
+    except Exception as e:
+        print(f"Could not list projects for placeholders: {e}")
+    return variables
+
+
+async def login(client: httpx.AsyncClient, credentials: str) -> str:
+    email, _, password = credentials.partition(":")
+    response = await client.post("/api/v1/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+class LoadGenerator:
+    def __init__(self, client, mix: List[MixEntry], variables, tokens: Dict[str, str], seed: int = 1):
+        self.client = client
+        self.mix = mix
+        self.weights = [e.weight for e in mix]
+        self.variables = variables
+        self.tokens = tokens
+        self.rng = random.Random(seed)
+        self.stats: Dict[str, Stats] = defaultdict(Stats)
+        self.sent = 0
+
+    def pick(self) -> MixEntry:
+        return self.rng.choices(self.mix, self.weights)[0]
+
+    async def fire(self, entry: MixEntry, scheduled: float) -> None:
+        headers = {}
+        if entry.auth and self.tokens.get(entry.auth):
+            headers["Authorization"] = f"Bearer {self.tokens[entry.auth]}"
+        stats = self.stats[entry.name]
+        try:
+            response = await self.client.request(
+                entry.method,
+                _fill(entry.path, self.variables, self.rng),
+                json=_fill(entry.json, self.variables, self.rng) if entry.json is not None else None,
+                headers=headers,
+            )
+            stats.statuses[response.status_code] += 1
+            if response.status_code >= 500:
+                stats.errors += 1
+        except httpx.HTTPError as e:
+            stats.statuses[type(e).__name__] += 1
+            stats.errors += 1
+        stats.latencies.append(time.perf_counter() - scheduled)
+        self.sent += 1
+
+    async def closed_loop(self, users: int, duration: float, think: float) -> None:
+        deadline = time.perf_counter() + duration
+
+        async def virtual_user():
+            while time.perf_counter() < deadline:
+                await self.fire(self.pick(), time.perf_counter())
+                if think:
+                    await asyncio.sleep(self.rng.expovariate(1 / think))
+
+        await asyncio.gather(*(virtual_user() for _ in range(users)))
+
+    async def open_loop(self, rate: float, duration: float, max_in_flight: int) -> None:
+        start = time.perf_counter()
+        next_at = start
+        in_flight = set()
+        dropped = 0
+        while next_at < start + duration:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= max_in_flight:
+                dropped += 1    # client-side cap so a dead server can't exhaust sockets
+            else:
+                task = asyncio.create_task(self.fire(self.pick(), next_at))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_at += self.rng.expovariate(rate)
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        if dropped:
+            print(f"Warning: {dropped} arrivals not sent (client in-flight cap {max_in_flight} reached)")
+
+    def report(self, elapsed: float) -> Dict:
+        rows = {}
+        for name, stats in sorted(self.stats.items()):
+            latencies = sorted(stats.latencies)
+            rows[name] = {
+                "requests": len(latencies),
+                "errors": stats.errors,
+                "statuses": {str(k): v for k, v in stats.statuses.items()},
+                "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            }
+        every = sorted(l for s in self.stats.values() for l in s.latencies)
+        total = {
+            "requests": len(every),
+            "errors": sum(s.errors for s in self.stats.values()),
+            "rps": round(len(every) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(every, 50) * 1000, 2),
+            "p95_ms": round(percentile(every, 95) * 1000, 2),
+            "p99_ms": round(percentile(every, 99) * 1000, 2),
+        }
+        return {"total": total, "endpoints": rows}
+
+
+def print_report(report: Dict) -> None:
+    header = f"{'endpoint':<32}{'req':>8}{'5xx':>6}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}  statuses"
+    print(header)
+    print("-" * len(header))
+    for name, r in report["endpoints"].items():
+        statuses = " ".join(f"{k}×{v}" for k, v in sorted(r["statuses"].items()))
+        print(f"{name[:31]:<32}{r['requests']:>8}{r['errors']:>6}{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}  {statuses}")
+    t = report["total"]
+    print("-" * len(header))
+    print(f"{'TOTAL':<32}{t['requests']:>8}{t['errors']:>6}{t['p50_ms']:>10}{t['p95_ms']:>10}{t['p99_ms']:>10}"
+          f"  {t['rps']} req/s")
+
+
+async def main_async(args) -> int:
+    mix = load_replay(args.replay) if args.replay else load_mix(args.mix)
+    if not mix:
+        print("Empty traffic mix")
+        return 1
+
+    limits = httpx.Limits(max_connections=args.connections, max_keepalive_connections=args.connections)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=timeout) as client:
+        variables = await discover_variables(client, args.prefix)
+        tokens = {}
+        if args.admin:
+            tokens["admin"] = await login(client, args.admin)
+        if args.backer:
+            tokens["backer"] = await login(client, args.backer)
+
+        generator = LoadGenerator(client, mix, variables, tokens, seed=args.seed)
+        mode = f"open loop @ {args.rate} req/s" if args.rate else f"closed loop × {args.users} users"
+        print(f"{mode} for {args.duration}s against {args.base_url} ({len(mix)} request types)\n")
+
+        started = time.perf_counter()
+        if args.rate:
+            await generator.open_loop(args.rate, args.duration, args.connections * 4)
+        else:
+            await generator.closed_loop(args.users, args.duration, args.think_ms / 1000)
+        report = generator.report(time.perf_counter() - started)
+
+    print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="BDR load generator")
+    parser.add_argument("base_url", help="e.g. http://localhost:8000")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--mix", type=Path, default=Path(__file__).parent / "mixes" / "browse.json")
+    source.add_argument("--replay", type=Path, help="uvicorn access log or JSONL of recorded requests")
+    parser.add_argument("--rate", type=float, help="open loop: arrivals per second (Poisson)")
+    parser.add_argument("--users", type=int, default=20, help="closed loop: concurrent virtual users")
+    parser.add_argument("--think-ms", type=float, default=0.0, help="closed loop: mean think time")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--admin", help="email:password used for requests with auth=admin")
+    parser.add_argument("--backer", help="email:password used for requests with auth=backer")
+    parser.add_argument("--prefix", default="gen-", help="prefix the data was generated with")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="write the report as JSON")
+    return asyncio.run(main_async(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
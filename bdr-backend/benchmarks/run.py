@@ -0,0 +1,252 @@
+# benchmarks/run.py
+"""
+Seed, drive the hot endpoints in-process, report throughput + p50/p95/p99,
+and compare against a stored baseline (exit code 1 on regression).
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def _configure_env(database_url: str) -> None:
+    # Must happen before anything imports app.core.config / app.database
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+    os.environ.setdefault("SMTP_USER", "bench@bdr.rw")
+    os.environ.setdefault("SMTP_PASSWORD", "bench")
+    os.environ["RATE_LIMIT_ENABLED"] = "False"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: Callable[[int], str]
+    json: Optional[Callable[[int], dict]] = None
+    headers: Optional[Callable[[int], dict]] = None
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def build_scenarios(data, tokens: Dict[str, str]) -> List[Scenario]:
+    from .seed import BENCH_PASSWORD
+
+    slugs, backers, pending = data.project_slugs, data.backer_emails, data.pending_external_ids
+    admin = {"Authorization": f"Bearer {tokens['admin']}"}
+    backer = {"Authorization": f"Bearer {tokens['backer']}"}
+    return [
+        Scenario("projects.list", "GET", lambda i: "/api/v1/projects/"),
+        Scenario("projects.by_slug", "GET", lambda i: f"/api/v1/projects/slug/{slugs[i % len(slugs)]}"),
+        Scenario("auth.login", "POST", lambda i: "/api/v1/auth/login",
+                 json=lambda i: {"email": backers[i % len(backers)], "password": BENCH_PASSWORD}),
+        Scenario("payments.initiate", "POST", lambda i: "/api/v1/transactions/",
+                 json=lambda i: {"project_id": data.active_project_ids[i % len(data.active_project_ids)],
+                                 "amount": 20000, "momo_phone": "+250788123456"},
+                 headers=lambda i: backer),
+        Scenario("payments.webhook", "POST", lambda i: "/api/v1/transactions/webhook/momo",
+                 json=lambda i: {"financialTransactionId": f"bench-fin-{i}",
+                                 "externalId": pending[i % len(pending)], "amount": "20000",
+                                 "payer": {"partyIdType": "MSISDN", "partyId": "250788123456"},
+                                 "status": "SUCCESSFUL"},
+                 headers=lambda i: {"X-Signature": "bench"}),
+        Scenario("admin.stats", "GET", lambda i: "/api/v1/admin/stats", headers=lambda i: admin),
+    ]
+
+
+async def run_scenario(client, scenario: Scenario, requests: int, concurrency: int, warmup: int) -> Dict:
+    async def call(i: int):
+        return await client.request(
+            scenario.method,
+            scenario.path(i),
+            json=scenario.json(i) if scenario.json else None,
+            headers=scenario.headers(i) if scenario.headers else None,
+        )
+
+    probe = await call(0)
+    if probe.status_code in (404, 405) and probe.headers.get("content-type", "").startswith("application/json") \
+            and probe.json().get("detail") in ("Not Found", "Method Not Allowed"):
+        return {"skipped": f"route missing ({probe.status_code})"}
+    for i in range(1, warmup):
+        await call(i)
+
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i: int):
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await call(warmup + i)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regression = p95 slower or throughput lower by more than `tolerance`."""
+    problems = []
+    for name, current in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before or "skipped" in current or "skipped" in before:
+            continue
+        if current["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            problems.append(f"{name}: p95 {before['p95_ms']}ms → {current['p95_ms']}ms")
+        if current["rps"] < before["rps"] * (1 - tolerance):
+            problems.append(f"{name}: throughput {before['rps']} → {current['rps']} req/s")
+        if current["errors"] > before.get("errors", 0):
+            problems.append(f"{name}: errors {before.get('errors', 0)} → {current['errors']}")
+    return problems
+
+
+def print_table(results: Dict, baseline: Optional[Dict]) -> None:
+    header = f"{'scenario':<20}{'req':>6}{'err':>6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Δp95':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, r in results["scenarios"].items():
+        if "skipped" in r:
+            print(f"{name:<20}  skipped: {r['skipped']}")
+            continue
+        delta = ""
+        before = (baseline or {}).get("scenarios", {}).get(name)
+        if before and "p95_ms" in before and before["p95_ms"]:
+            delta = f"{(r['p95_ms'] / before['p95_ms'] - 1) * 100:+.0f}%"
+        print(f"{name:<20}{r['requests']:>6}{r['errors']:>6}{r['rps']:>10}"
+              f"{r['p50_ms']:>10}{r['p95_ms']:>10}{r['p99_ms']:>10}{delta:>9}")
+
+
+async def main_async(args) -> int:
+    import logging
+    import httpx
+    from sqlalchemy import select
+
+    from app.database import engine, SessionLocal
+    from app.models.user import User
+    from app.utils.security import create_access_token
+    from main import app
+    from .seed import seed, SeedVolumes, ADMIN_EMAIL
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)   # one INFO line per request otherwise
+
+    volumes = SeedVolumes(
+        users=args.users, projects=args.projects, transactions=args.transactions,
+        notifications=args.notifications, pending_transactions=max(args.requests + args.warmup, 100),
+    )
+    print(f"Seeding {engine.url.render_as_string(hide_password=True)} with {volumes} ...")
+    started = time.perf_counter()
+    data = seed(engine, volumes, rng_seed=args.seed)
+    print(f"Seeded in {time.perf_counter() - started:.1f}s\n")
+
+    with SessionLocal() as db:
+        admin_id = db.execute(select(User.id).where(User.email == ADMIN_EMAIL)).scalar_one()
+    tokens = {
+        "admin": create_access_token({"sub": str(admin_id), "role": "admin"}),
+        "backer": create_access_token({"sub": str(data.backer_ids[0]), "role": "backer"}),
+    }
+
+    scenarios = build_scenarios(data, tokens)
+    if args.scenario:
+        scenarios = [s for s in scenarios if s.name in args.scenario]
+
+    results = {
+        "meta": {
+            "dialect": engine.dialect.name,
+            "volumes": volumes.__dict__,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": sys.version.split()[0],
+        },
+        "scenarios": {},
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for scenario in scenarios:
+            results["scenarios"][scenario.name] = await run_scenario(
+                client, scenario, args.requests, args.concurrency, args.warmup
+            )
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else None
+    print_table(results, baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+    if baseline is None:
+        print(f"\nNo baseline at {args.baseline} (run with --save-baseline to create one)")
+        return 0
+
+    if baseline.get("meta", {}).get("volumes") != results["meta"]["volumes"]:
+        print("\nWarning: baseline was recorded with different seed volumes")
+    problems = compare(results, baseline, args.tolerance)
+    if problems:
+        print("\nREGRESSIONS:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print(f"\nNo regressions beyond {args.tolerance:.0%}")
+    return 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="BDR API benchmarks")
+    parser.add_argument("--database-url", default=f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bdr_bench.db')}",
+                        help="throwaway DB — it is dropped and reseeded")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--transactions", type=int, default=20000)
+    parser.add_argument("--notifications", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=200, help="timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--scenario", action="append", help="only run these (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown before failing")
+    parser.add_argument("--output", type=Path, help="also write this run's results as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    _configure_env(args.database_url)
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# benchmarks/seed.py
+"""
+Seed the benchmark database: synthetic data from benchmarks.generate
+(Zipfian popularity, launch bursts) plus the fixtures the scenarios need —
+an admin account and a pool of pending transactions for the webhook.
+Deterministic for a given seed; works on SQLite and Postgres.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Engine
+
+from app.models.user import User, UserRole
+from app.models.project import Project, ProjectStatus
+from app.models.transaction import Transaction, TransactionStatus
+from app.utils.security import get_password_hash
+from .generate import Volumes, generate
+
+BENCH_PASSWORD = "password"          # what benchmarks.generate gives every user
+ADMIN_EMAIL = "bench-admin@bdr.rw"
+PREFIX = "bench-"
+
+
+@dataclass
+class SeedVolumes:
+    users: int = 2000
+    projects: int = 500
+    transactions: int = 20000
+    notifications: int = 10000
+    pending_transactions: int = 2000     # consumed by the webhook scenario
+
+
+@dataclass
+class SeedResult:
+    backer_emails: List[str] = field(default_factory=list)
+    backer_ids: List[int] = field(default_factory=list)
+    project_ids: List[int] = field(default_factory=list)
+    active_project_ids: List[int] = field(default_factory=list)   # payments are only accepted on these
+    project_slugs: List[str] = field(default_factory=list)
+    pending_external_ids: List[str] = field(default_factory=list)
+
+
+def seed(engine: Engine, volumes: SeedVolumes, rng_seed: int = 42) -> SeedResult:
+    generate(
+        engine,
+        Volumes(users=volumes.users, projects=volumes.projects,
+                transactions=volumes.transactions, notifications=volumes.notifications),
+        rng_seed=rng_seed, reset=True, prefix=PREFIX,
+    )
+    result = SeedResult()
+    now = datetime.utcnow()
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{
+            "email": ADMIN_EMAIL, "full_name": "Bench Admin",
+            "hashed_password": get_password_hash(BENCH_PASSWORD),
+            "role": UserRole.ADMIN.value, "is_active": True, "created_at": now,
+        }])
+
+        backers = conn.execute(
+            select(User.id, User.email).where(User.role == UserRole.BACKER.value).order_by(User.id)
+        ).all()
+        result.backer_ids = [b.id for b in backers]
+        result.backer_emails = [b.email for b in backers]
+
+        projects = conn.execute(select(Project.id, Project.slug, Project.status).order_by(Project.id)).all()
+        result.project_ids = [p.id for p in projects]
+        result.active_project_ids = [p.id for p in projects if p.status == ProjectStatus.active] or result.project_ids
+        result.project_slugs = [p.slug for p in projects]
+
+        pending = []
+        for i in range(volumes.pending_transactions):
+            external_id = f"{PREFIX}pending-{i}"
+            result.pending_external_ids.append(external_id)
+            pending.append({
+                "amount": 20000, "jobs_created": 0, "status": TransactionStatus.pending,
+                "external_id": external_id, "created_at": now, "updated_at": now,
+                "backer_id": result.backer_ids[i % len(result.backer_ids)],
+                "project_id": result.project_ids[i % len(result.project_ids)],
+            })
+        if pending:
+            conn.execute(insert(Transaction), pending)
+
+    return result
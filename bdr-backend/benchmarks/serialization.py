@@ -0,0 +1,103 @@
+# benchmarks/serialization.py
+"""
+Serialisation cost per ProjectListOut row, no DB or HTTP involved.
+
+    python -m benchmarks.serialization --rows 1000 --repeat 20
+
+Paths compared (all produce the same JSON):
+- fastapi_default : what a route returning ORM objects with response_model
+                    does — validate, dump to python (mode=json), json.dumps
+- jsonable_orjson : same plus jsonable_encoder pass, rendered by orjson
+                    (routes returning dicts/models without response_model)
+- orjson_default  : validate + dump (mode=json) + orjson (new app default)
+- model_response  : the hot list fast path in app/utils/responses.py — one
+                    cached TypeAdapter validates, dump_python (mode=json)
+                    and orjson render; TypeAdapter.dump_json only when
+                    orjson is not installed
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+
+
+def _rows(n: int) -> List[SimpleNamespace]:
+    from app.models.project import ProjectStatus
+
+    now = datetime.utcnow()
+    return [SimpleNamespace(
+        id=i, title=f"Project {i}", slug=f"project-{i}", sector="Agriculture",
+        funding_goal=1_000_000, current_funding=(i * 37_000) % 1_000_000,
+        jobs_to_create=100, backers_count=i % 50, status=ProjectStatus.active,
+        image_url=f"/static/uploads/projects/{i}.jpg", ends_at=now + timedelta(days=i % 90),
+    ) for i in range(n)]
+
+
+def paths() -> Dict[str, Callable]:
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from app.schemas.project import ProjectListOut
+    from app.utils.responses import adapter_for, model_list_response
+
+    adapter = adapter_for(List[ProjectListOut])
+
+    def fastapi_default(rows):
+        validated = adapter.validate_python(rows, from_attributes=True)
+        return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False,
+                          allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def jsonable_orjson(rows):
+        validated = adapter.validate_python(rows, from_attributes=True)
+        return orjson.dumps(jsonable_encoder(validated))
+
+    def orjson_default(rows):
+        validated = adapter.validate_python(rows, from_attributes=True)
+        return orjson.dumps(adapter.dump_python(validated, mode="json"))
+
+    def model_response(rows):
+        return model_list_response(ProjectListOut, rows).body
+
+    return {
+        "fastapi_default": fastapi_default,
+        "jsonable_orjson": jsonable_orjson,
+        "orjson_default": orjson_default,
+        "model_response": model_response,
+    }
+
+
+def measure(fn: Callable, rows, repeat: int) -> float:
+    fn(rows)  # warm caches
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="ProjectListOut serialisation benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    for key, value in (("SECRET_KEY", "bench"), ("SMTP_USER", "bench@bdr.rw"), ("SMTP_PASSWORD", "bench")):
+        os.environ.setdefault(key, value)
+
+    rows = _rows(args.rows)
+    results = {name: measure(fn, rows, args.repeat) for name, fn in paths().items()}
+    baseline = results["fastapi_default"]
+
+    print(f"{args.rows} ProjectListOut rows, best of {args.repeat}\n")
+    print(f"{'path':<18}{'total ms':>10}{'µs/row':>10}{'speedup':>10}")
+    for name, seconds in results.items():
+        print(f"{name:<18}{seconds * 1000:>10.2f}{seconds / args.rows * 1e6:>10.2f}{baseline / seconds:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
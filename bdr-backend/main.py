@@ -1,15 +1,30 @@
 # main.py — FINAL PRODUCTION VERSION
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
+import hmac
 import logging
 import os
 
 # ✅ NEW: Auto-create tables (important for SQLite on Render)
-from app.database import init_db
+from app.database import init_db, engine, SessionLocal
 
 from app.core.config import settings
+from app.utils.email_queue import email_queue
+from app.middleware import (
+    RateLimitMiddleware, LoadSheddingMiddleware, MetricsMiddleware, ProfilingMiddleware,
+    CompressionMiddleware,
+)
+from app.utils.metrics import instrument_engine, render_prometheus
+from app.utils.responses import DefaultJSONResponse
+from app.utils.content_store import content_store
+from app.utils.pubsub import broker
+from app.utils.payments import payment_http
+from app.crud.project_engagement import engagement_buffer
+from app.utils.impact import rate_table
+from app.utils.profiling import track_endpoints
 
 # === ROUTERS ===
 from app.api.v1.auth import router as auth_router
@@ -22,6 +37,7 @@ from app.api.v1.mentors import router as mentors_router
 from app.api.v1.contact import router as contact_router
 from app.api.v1.success import router as success_router
 from app.api.v1.admin import router as admin_router
+from app.api.v1.me import router as me_router
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("bdr")
@@ -29,27 +45,75 @@ logger = logging.getLogger("bdr")
 # ✅ NEW: Initialize DB tables for first-time setup
 init_db()
 
+# Query counts / timings per request (+ slow-query log when SLOW_QUERY_MS > 0)
+instrument_engine(engine, slow_query_ms=settings.SLOW_QUERY_MS)
+
+# Job-impact rates are read once per worker; a broken rates file fails the boot, not a payment
+rate_table()
+
 # ✅ NEW: Ensure upload directories exist at startup
 os.makedirs("static/uploads/projects", exist_ok=True)
 os.makedirs("static/uploads/business_plans", exist_ok=True)
 os.makedirs("static/uploads/users", exist_ok=True)  # in case user profile images exist
 
+def warm_page_content():
+    # Seed + load page content before the first request; a failure here
+    # (e.g. migration not applied yet) just defers loading to first use.
+    db = SessionLocal()
+    try:
+        content_store.warm(db)
+    except Exception as e:
+        logger.warning(f"Page content not loaded at startup: {e}")
+    finally:
+        db.close()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("BDR API Starting...")
+    await email_queue.start()
+    await broker.start()
+    await payment_http.start()
+    await engagement_buffer.start()
+    warm_page_content()
     yield
     logger.info("BDR API Shutting down...")
+    await engagement_buffer.stop()         # last views / shares go out before exit
+    await payment_http.stop()
+    await broker.stop()
+    await email_queue.stop()
 
 app = FastAPI(
     title="BDR - Beyond Degrees Rwanda",
     description="Every RWF 10,000 = 1 Job for Rwandan Youth",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,  # orjson when installed
 )
 
 # Static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# PROFILING — innermost, so profiles measure the route, not the middleware stack
+app.add_middleware(ProfilingMiddleware, sample_rate=settings.PROFILE_SAMPLE_RATE)
+
+# OVERLOAD PROTECTION — added before CORS so 429/503 still carry CORS headers
+app.add_middleware(RateLimitMiddleware, enabled=settings.RATE_LIMIT_ENABLED)
+app.add_middleware(
+    LoadSheddingMiddleware,
+    max_in_flight=settings.MAX_IN_FLIGHT,
+    max_loop_lag_ms=settings.MAX_LOOP_LAG_MS,
+    retry_after=settings.SHED_RETRY_AFTER_SECONDS,
+)
+app.add_middleware(MetricsMiddleware)  # outside shedding, so 503s are counted too
+
+# COMPRESSION + ETAG/304 — slow mobile networks pay per byte
+app.add_middleware(
+    CompressionMiddleware,
+    min_size=settings.COMPRESSION_MIN_BYTES,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+)
+
 # PRODUCTION CORS
 app.add_middleware(
     CORSMiddleware,
@@ -74,6 +138,7 @@ app.include_router(pages_router, prefix="/api/v1")
 app.include_router(mentors_router, prefix="/api/v1")
 app.include_router(contact_router, prefix="/api/v1")
 app.include_router(success_router, prefix="/api/v1")
+app.include_router(me_router, prefix="/api/v1")
 app.include_router(admin_router)
 
 @app.get("/")
@@ -84,6 +149,21 @@ def root():
 def health():
     return {"status": "healthy", "nation": "Rwanda Rising"}
 
+@app.get("/metrics", include_in_schema=False)
+def metrics(request: Request):
+    # Fails closed: per-route traffic and DB stats are only open in DEBUG
+    if settings.METRICS_TOKEN:
+        if not hmac.compare_digest(
+            request.headers.get("authorization", "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+        ):
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    elif not settings.DEBUG:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return PlainTextResponse(render_prometheus(engine), media_type="text/plain; version=0.0.4")
+
+# Profiled requests find their own thread through this hook — keep it after the last route
+track_endpoints(app)
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.environ.get("PORT", 8000))
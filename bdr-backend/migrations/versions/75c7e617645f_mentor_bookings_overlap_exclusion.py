@@ -0,0 +1,37 @@
+"""mentor bookings overlap exclusion
+
+Revision ID: 75c7e617645f
+Revises: 6a22c26de923
+Create Date: 2026-10-19 12:59:46.939013
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '75c7e617645f'
+down_revision: Union[str, None] = '6a22c26de923'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres only: SQLite keeps just the live-slot unique index
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute("""
+        ALTER TABLE mentor_bookings
+        ADD CONSTRAINT ex_mentor_bookings_live_overlap
+        EXCLUDE USING gist (mentor_id WITH =, tsrange(starts_at, ends_at) WITH &&)
+        WHERE (status <> 'cancelled')
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_constraint('ex_mentor_bookings_live_overlap', 'mentor_bookings')
@@ -1,20 +1,47 @@
 """
 BDR – Test Configuration
 """
+import os
+import tempfile
+
+# Settings are read at import time — give the app a throwaway DB and dummy
+# secrets before anything from `app` / `main` is imported.
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("SMTP_USER", "test@bdr.rw")
+os.environ.setdefault("SMTP_PASSWORD", "test")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'bdr_test.db')}")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "False")
+# Re-check the page version on every request, so page edits rolled back
+# at the end of a test don't linger in the content snapshot
+os.environ.setdefault("PAGES_REFRESH_SECONDS", "0")
+os.environ.setdefault("MENTOR_SCHEDULE_TTL_SECONDS", "0")
+
 import pytest
 import uuid
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
 from sqlalchemy.orm import sessionmaker
-from app.main import get_app
-from app.database import Base, get_db
-from app.utils.security import create_access_token
+from main import app
+from app.database import Base, engine
+from app.dependencies import get_db
+from app.crud.project_engagement import engagement_buffer
+from app.utils.security import create_access_token, get_password_hash
 from app.models.user import User, UserRole
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# pysqlite defers BEGIN, which breaks SAVEPOINT-per-test rollback; take over
+# transaction control so each test's writes really roll back.
+@event.listens_for(engine, "connect")
+def _sqlite_no_autobegin(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _sqlite_begin(connection):
+    connection.exec_driver_sql("BEGIN")
+
+engine.dispose()
+
 @pytest.fixture(autouse=True, scope="session")
 def setup_db():
     Base.metadata.create_all(bind=engine)
@@ -25,28 +52,28 @@ def setup_db():
 def db():
     connection = engine.connect()
     transaction = connection.begin()
-    session = TestingSessionLocal(bind=connection)
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     yield session
     session.close()
     transaction.rollback()
     connection.close()
 
 @pytest.fixture
-def client(db):
-    app = get_app()  # Fresh app with lifespan
+def client(db, monkeypatch):
     app.dependency_overrides[get_db] = lambda: db
+    # Buffered view / share counts flush into the test's transaction too
+    monkeypatch.setattr(engagement_buffer, "session_factory", lambda: db)
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
 
 @pytest.fixture
 def test_user(db):
-    email = f"test-{uuid.uuid4().hex[:8]}@bdr.rw"
     user = User(
-        email=email,
+        email="test@bdr.rw",
         full_name="Test User",
-        hashed_password="$2b$12$KIXs7v8Q3Z6Z6Z6Z6Z6Z6u",
-        role=UserRole.entrepreneur
+        hashed_password=get_password_hash("password"),
+        role=UserRole.ENTREPRENEUR
     )
     db.add(user)
     db.commit()
@@ -63,10 +90,23 @@ def backer_token(db):
     backer = User(
         email=email,
         full_name="Backer",
-        hashed_password="$2b$12$KIXs7v8Q3Z6Z6Z6Z6Z6Z6u",
-        role=UserRole.backer
+        hashed_password=get_password_hash("password"),
+        role=UserRole.BACKER
     )
     db.add(backer)
     db.commit()
     db.refresh(backer)
-    return create_access_token({"sub": str(backer.id), "role": "backer"})
\ No newline at end of file
+    return create_access_token({"sub": str(backer.id), "role": "backer"})
+
+@pytest.fixture
+def admin_token(db):
+    admin = User(
+        email=f"admin-{uuid.uuid4().hex[:8]}@bdr.rw",
+        full_name="Admin",
+        hashed_password=get_password_hash("password"),
+        role=UserRole.ADMIN
+    )
+    db.add(admin)
+    db.commit()
+    db.refresh(admin)
+    return create_access_token({"sub": str(admin.id), "role": "admin"})
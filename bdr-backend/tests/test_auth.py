@@ -7,7 +7,7 @@ def test_register(client, db):
         "email": "new@bdr.rw",
         "full_name": "New User",
         "phone": "+250788123456",
-        "role": "backer",
+        "role": "entrepreneur",
         "password": "Secure123!",
         "confirm_password": "Secure123!"
     })
@@ -17,8 +17,8 @@ def test_register(client, db):
     assert "id" in data
 
 def test_login(client, test_user):
-    response = client.post("/api/v1/auth/login", data={
-        "username": "test@bdr.rw",
+    response = client.post("/api/v1/auth/login", json={
+        "email": "test@bdr.rw",
         "password": "password"
     })
     assert response.status_code == 200
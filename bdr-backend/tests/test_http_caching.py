@@ -0,0 +1,76 @@
+"""
+Test compression + conditional GET
+"""
+import gzip
+from decimal import Decimal
+
+from app.core.config import settings
+from app.crud.counter import get_counter
+from app.crud.transaction import update_transaction_status
+from app.models.counter import PROJECTS_VERSION
+from app.models.project import Project
+from app.models.transaction import Transaction
+
+
+def test_large_json_is_gzipped(client):
+    response = client.get("/api/v1/pages/about", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["mission"]["pillars"]
+
+
+def test_small_json_is_not_compressed(client):
+    response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+
+
+def test_body_etag_round_trip(client):
+    first = client.get("/health")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    second = client.get("/health", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+
+
+def test_project_list_version_etag(client, db, entrepreneur_token, tmp_path, monkeypatch):
+    first = client.get("/api/v1/projects/")
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/projects/", headers={"If-None-Match": etag}).status_code == 304
+
+    # Any project write bumps the version → the old ETag no longer matches
+    monkeypatch.chdir(tmp_path)
+    client.post(
+        "/api/v1/projects/upload",
+        data={"title": "Solar Kiosk", "description": "Charging", "funding_goal": "200000"},
+        files={"business_plan": ("plan.pdf", b"%PDF-1.4", "application/pdf")},
+        headers={"Authorization": f"Bearer {entrepreneur_token}"},
+    )
+    refreshed = client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert [p["title"] for p in refreshed.json()] == ["Solar Kiosk"]
+
+    # A funding credit changes the list without bumping the shared counter
+    etag, version = refreshed.headers["etag"], get_counter(db, PROJECTS_VERSION)
+    project = db.query(Project).one()
+    db.add(Transaction(amount=Decimal(20000), backer_id=project.entrepreneur_id, project_id=project.id,
+                       external_id="etag-credit"))
+    db.commit()
+    update_transaction_status(db, "etag-credit", "fin-etag", "SUCCESSFUL")
+    assert get_counter(db, PROJECTS_VERSION) == version
+    credited = client.get("/api/v1/projects/", headers={"If-None-Match": etag})
+    assert credited.status_code == 200
+    assert credited.json()[0]["current_funding"] == 20000
+
+
+def test_metrics_fail_closed(client, monkeypatch):
+    monkeypatch.setattr(settings, "METRICS_TOKEN", None)
+    monkeypatch.setattr(settings, "DEBUG", False)
+    assert client.get("/metrics").status_code == 404
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "s3cret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer s3cret"}).status_code == 200
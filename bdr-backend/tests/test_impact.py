@@ -0,0 +1,57 @@
+"""
+Test the job-impact engine: dated / per-sector rates + the backfill
+"""
+from datetime import datetime
+from decimal import Decimal
+
+from app.crud.impact import backfill_jobs_created, rebuild_project_jobs
+from app.models.project import Project, ProjectStatus
+from app.models.transaction import Transaction, TransactionStatus
+from app.utils.impact import build_rate_table, jobs_bulk
+
+RATES = {
+    "default": [{"from": "2026-01-01", "rwf_per_job": 20000}],
+    "sectors": {"Agriculture": [{"from": "2025-06-01", "rwf_per_job": 5000}]},
+}
+
+
+def test_rates_by_sector_and_date():
+    table = build_rate_table(RATES, base_rate=10000)
+    assert table.rate("Health", datetime(2025, 1, 1)) == 10000
+    assert table.rate("Health", datetime(2026, 3, 1)) == 20000
+    # A sector follows the default timeline until its own first entry
+    assert table.rate("agriculture ", datetime(2025, 1, 1)) == 10000
+    assert table.rate("Agriculture", datetime(2026, 3, 1)) == 5000
+
+    dates = [datetime(2025, 1, 1), datetime(2026, 3, 1), datetime(2026, 3, 1), datetime(2030, 1, 1)]
+    jobs = jobs_bulk([40000, 40000, 40000, 45000], ["Health", "Health", "Agriculture", None], dates, table=table)
+    assert jobs.tolist() == [4, 2, 8, 2]
+    assert [table.rate(s, d) for s, d in zip(["Health", "Health", "Agriculture", None], dates)] == [
+        10000, 20000, 5000, 20000]
+
+
+def test_backfill_recomputes_only_changed_rows(db, test_user):
+    farm = Project(
+        title="Farm", slug="farm-impact", description="Maize", sector="Agriculture",
+        funding_goal=Decimal(1000000), current_funding=Decimal(0), job_goal=100, jobs_to_create=100,
+        entrepreneur_id=test_user.id, status=ProjectStatus.active,
+    )
+    db.add(farm)
+    db.commit()
+    for n, created_at in enumerate((datetime(2025, 1, 1), datetime(2026, 3, 1), datetime(2026, 4, 1))):
+        db.add(Transaction(amount=Decimal(40000), jobs_created=4, status=TransactionStatus.completed,
+                           backer_id=test_user.id, project_id=farm.id, external_id=f"impact-{n}",
+                           created_at=created_at))
+    db.commit()
+
+    table = build_rate_table(RATES, base_rate=10000)
+    assert backfill_jobs_created(db, batch_size=2, table=table) == 2
+    rows = db.query(Transaction).filter_by(project_id=farm.id).order_by(Transaction.id).all()
+    assert [t.jobs_created for t in rows] == [4, 8, 8]
+    assert backfill_jobs_created(db, batch_size=2, table=table) == 0
+
+    # The project's total follows its own ledger, not today's rate × funding
+    assert rebuild_project_jobs(db) == 1
+    db.refresh(farm)
+    assert farm.jobs_created == 20
+    assert rebuild_project_jobs(db) == 0
@@ -0,0 +1,113 @@
+"""
+Test Mentor directory + bookings
+"""
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.models.mentor import MentorProfile, MentorAvailability, MentorBooking, BookingStatus
+from app.utils.intervals import IntervalIndex
+
+NEXT_WEEK = (datetime.utcnow() + timedelta(days=7)).date().isoformat()
+
+
+@pytest.fixture
+def mentor(db):
+    mentor = MentorProfile(
+        slug="grace-test",
+        name="Dr. Grace",
+        expertise=json.dumps(["Fundraising"]),
+        hourly_rate=5000,
+        availability=[MentorAvailability(weekday=d, start_minute=8 * 60, end_minute=12 * 60) for d in range(7)],
+    )
+    db.add(mentor)
+    db.commit()
+    db.refresh(mentor)
+    return mentor
+
+
+def test_interval_index():
+    index = IntervalIndex([(10, 20), (30, 40)])
+    assert index.overlaps(15, 16) and index.overlaps(35, 50)
+    assert not index.overlaps(20, 30)
+    assert not index.add(19, 31)
+    assert index.add(20, 30)
+    assert index.free([(0, 10), (10, 20), (40, 50)]) == [(0, 10), (40, 50)]
+
+
+def test_directory(client, mentor):
+    data = client.get("/api/v1/mentors/").json()
+    assert [m["slug"] for m in data] == ["grace-test"]
+    assert data[0]["available"] is True
+    assert data[0]["expertise"] == ["Fundraising"]
+    assert client.get("/api/v1/mentors/?expertise=Fintech").json() == []
+
+
+def test_book_and_cancel(client, mentor, entrepreneur_token, backer_token):
+    slots = client.get(f"/api/v1/mentors/grace-test/slots?week={NEXT_WEEK}").json()["slots"]
+    assert len(slots) == 7 * 4
+    slot = slots[0]["starts_at"]
+
+    first = client.post("/api/v1/mentors/grace-test/bookings", json={"starts_at": slot, "topic": "Pitch deck"},
+                        headers={"Authorization": f"Bearer {entrepreneur_token}"})
+    assert first.status_code == 201
+    second = client.post("/api/v1/mentors/grace-test/bookings", json={"starts_at": slot},
+                         headers={"Authorization": f"Bearer {backer_token}"})
+    assert second.status_code == 409
+
+    slots = client.get(f"/api/v1/mentors/grace-test/slots?week={NEXT_WEEK}").json()["slots"]
+    assert slot not in [s["starts_at"] for s in slots]
+
+    cancel = client.post(f"/api/v1/mentors/bookings/{first.json()['id']}/cancel",
+                         headers={"Authorization": f"Bearer {entrepreneur_token}"})
+    assert cancel.json()["status"] == "cancelled"
+    again = client.post("/api/v1/mentors/grace-test/bookings", json={"starts_at": slot},
+                        headers={"Authorization": f"Bearer {backer_token}"})
+    assert again.status_code == 201
+
+
+def test_off_grid_slot_rejected(client, mentor, backer_token):
+    slot = client.get(f"/api/v1/mentors/grace-test/slots?week={NEXT_WEEK}").json()["slots"][0]["starts_at"]
+    off_grid = (datetime.fromisoformat(slot) + timedelta(minutes=30)).isoformat()
+    response = client.post("/api/v1/mentors/grace-test/bookings", json={"starts_at": off_grid},
+                           headers={"Authorization": f"Bearer {backer_token}"})
+    assert response.status_code == 422
+
+
+def test_live_slot_is_unique_in_db(db, mentor, test_user):
+    start = datetime(2030, 1, 7, 6, 0)
+
+    def booking(status=BookingStatus.pending):
+        return MentorBooking(mentor_id=mentor.id, user_id=test_user.id, starts_at=start,
+                             ends_at=start + timedelta(hours=1), status=status)
+
+    db.add(booking(BookingStatus.cancelled))
+    db.add(booking())
+    db.flush()          # a cancelled booking doesn't hold the slot
+    db.add(booking())
+    with pytest.raises(IntegrityError):
+        db.flush()
+    db.rollback()
+
+
+def test_availability_cannot_strand_bookings(client, db, mentor, test_user, entrepreneur_token, backer_token):
+    mentor.user_id = test_user.id
+    db.commit()
+    mentor_auth = {"Authorization": f"Bearer {entrepreneur_token}"}
+    slot = client.get(f"/api/v1/mentors/grace-test/slots?week={NEXT_WEEK}").json()["slots"][0]["starts_at"]
+    booked = client.post("/api/v1/mentors/grace-test/bookings", json={"starts_at": slot},
+                         headers={"Authorization": f"Bearer {backer_token}"})
+    assert booked.status_code == 201
+
+    # Half an hour later: 08:30 slots would overlap the 08:00 booking
+    shifted = [{"weekday": d, "start": "08:30", "end": "12:30"} for d in range(7)]
+    response = client.put("/api/v1/mentors/me/availability", json=shifted, headers=mentor_auth)
+    assert response.status_code == 409
+
+    # Shorter days on the same grid keep the booking's slot
+    shorter = [{"weekday": d, "start": "08:00", "end": "10:00"} for d in range(7)]
+    response = client.put("/api/v1/mentors/me/availability", json=shorter, headers=mentor_auth)
+    assert response.status_code == 200
+    assert len(client.get(f"/api/v1/mentors/grace-test/slots?week={NEXT_WEEK}").json()["slots"]) == 7 * 2 - 1
@@ -0,0 +1,78 @@
+"""
+Test direct messages
+"""
+import threading
+import time
+
+from app.models.user import User
+from app.utils.security import create_access_token, get_password_hash
+
+
+def _auth(user):
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id), 'role': user.role})}"}
+
+
+def _user(db, email):
+    user = User(email=email, full_name=email.split("@")[0].title(), hashed_password=get_password_hash("password"), role="backer")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_conversation_flow(client, db, test_user):
+    backer = _user(db, "amina@bdr.rw")
+    first = client.post("/api/v1/messages/conversations", json={"recipient_id": test_user.id, "body": "Hello!"},
+                        headers=_auth(backer))
+    assert first.status_code == 201
+    conversation_id = first.json()["conversation_id"]
+
+    # Same pair → same conversation
+    again = client.post("/api/v1/messages/conversations", json={"recipient_id": backer.id, "body": "Hi Amina"},
+                        headers=_auth(test_user))
+    assert again.json()["conversation_id"] == conversation_id
+    client.post(f"/api/v1/messages/conversations/{conversation_id}/messages", json={"body": "How is the kiosk?"},
+                headers=_auth(backer))
+
+    inbox = client.get("/api/v1/messages/", headers=_auth(test_user)).json()
+    assert inbox[0]["from"] == "Amina"
+    assert inbox[0]["content"] == "How is the kiosk?"
+    assert inbox[0]["unread_count"] == 1          # replying marked "Hello!" read
+    assert client.get("/api/v1/messages/unread-count", headers=_auth(test_user)).json() == {"unread": 1}
+
+    client.post(f"/api/v1/messages/conversations/{conversation_id}/read", headers=_auth(test_user))
+    assert client.get("/api/v1/messages/unread-count", headers=_auth(test_user)).json() == {"unread": 0}
+
+    page = client.get(f"/api/v1/messages/conversations/{conversation_id}/messages?limit=2", headers=_auth(backer)).json()
+    assert [m["seq"] for m in page["items"]] == [3, 2]
+    older = client.get(f"/api/v1/messages/conversations/{conversation_id}/messages?before_id={page['next_cursor']}",
+                       headers=_auth(backer)).json()
+    assert [m["body"] for m in older["items"]] == ["Hello!"]
+
+
+def test_outsiders_cannot_read(client, db, test_user):
+    backer, outsider = _user(db, "b1@bdr.rw"), _user(db, "b2@bdr.rw")
+    sent = client.post("/api/v1/messages/conversations", json={"recipient_id": test_user.id, "body": "Private"},
+                       headers=_auth(backer)).json()
+    response = client.get(f"/api/v1/messages/conversations/{sent['conversation_id']}/messages", headers=_auth(outsider))
+    assert response.status_code == 404
+
+
+def test_long_poll_wakes_on_new_message(client, db, test_user):
+    backer = _user(db, "poller@bdr.rw")
+    sent = client.post("/api/v1/messages/conversations", json={"recipient_id": test_user.id, "body": "Ping"},
+                       headers=_auth(backer)).json()
+    url = f"/api/v1/messages/conversations/{sent['conversation_id']}/poll?after_id={sent['id']}&timeout=5"
+
+    def reply():
+        time.sleep(0.3)
+        client.post(f"/api/v1/messages/conversations/{sent['conversation_id']}/messages", json={"body": "Pong"},
+                    headers=_auth(test_user))
+
+    replier = threading.Thread(target=reply)
+    replier.start()
+    started = time.monotonic()
+    polled = client.get(url, headers=_auth(backer)).json()
+    replier.join()
+    assert [m["body"] for m in polled] == ["Pong"]
+    assert time.monotonic() - started < 4
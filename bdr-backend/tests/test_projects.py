@@ -1,48 +1,125 @@
 """
 Test Projects CRUD
 """
-def test_create_project(client, db, entrepreneur_token):
-    response = client.post(
-        "/api/v1/projects/",
-        json={
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.crud.project_analytics import floor_day
+from app.crud.project_engagement import decay_trending, engagement_buffer
+from app.crud.ranking import rebuild_rankings
+from app.models.project import Project, ProjectStatus
+from app.models.project_funding_bucket import ProjectFundingBucket, DAY
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    # /upload writes under ./static/uploads — keep test files out of the repo
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _upload(client, token, launch_now=False):
+    return client.post(
+        "/api/v1/projects/upload",
+        data={
             "title": "Eco Coffee",
             "description": "Sustainable coffee",
-            "detailed_description": "Full plan",
-            "sector": "Agribusiness",
-            "funding_goal": 100000,
-            "image_url": "https://img.com/coffee.jpg"
+            "funding_goal": "100000",
+            "launch_now": str(launch_now).lower(),
         },
-        headers={"Authorization": f"Bearer {entrepreneur_token}"}
+        files={"business_plan": ("plan.pdf", b"%PDF-1.4 test", "application/pdf")},
+        headers={"Authorization": f"Bearer {token}"}
     )
+
+
+def test_create_project(client, db, entrepreneur_token, upload_dir):
+    response = _upload(client, entrepreneur_token)
     assert response.status_code == 201
     data = response.json()
     assert data["title"] == "Eco Coffee"
     assert data["status"] == "draft"
+    assert (upload_dir / "static" / "uploads" / "business_plans").exists()
 
 
-def test_launch_project(client, db, entrepreneur_token):
-    # Create project
-    create_resp = client.post(
-        "/api/v1/projects/",
-        json={
-            "title": "Eco Coffee",
-            "description": "Sustainable coffee",
-            "detailed_description": "Full plan",
-            "sector": "Agribusiness",
-            "funding_goal": 100000,
-            "image_url": "https://img.com/coffee.jpg"
-        },
-        headers={"Authorization": f"Bearer {entrepreneur_token}"}
-    )
-    assert create_resp.status_code == 201
-    project_id = create_resp.json()["id"]
-
-    # Launch project
-    launch_resp = client.post(
-        f"/api/v1/projects/{project_id}/launch",
-        json={"launch_now": True},
-        headers={"Authorization": f"Bearer {entrepreneur_token}"}
-    )
-    assert launch_resp.status_code == 200
-    data = launch_resp.json()
-    assert data["status"] == "live"
\ No newline at end of file
+def test_launch_project(client, db, entrepreneur_token, upload_dir):
+    response = _upload(client, entrepreneur_token, launch_now=True)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["status"] == "active"
+
+    slug_resp = client.get(f"/api/v1/projects/slug/{data['slug']}")
+    assert slug_resp.status_code == 200
+    assert slug_resp.json()["id"] == data["id"]
+
+
+def test_views_and_shares_are_written_behind(client, db, entrepreneur_token, upload_dir):
+    data = _upload(client, entrepreneur_token, launch_now=True).json()
+    engagement_buffer.flush(db)
+    for _ in range(3):
+        client.get(f"/api/v1/projects/slug/{data['slug']}")
+    assert client.post(f"/api/v1/projects/{data['id']}/share").status_code == 204
+    assert client.post("/api/v1/projects/999999/share").status_code == 404
+
+    # Nothing written yet; one flush writes both counts in one statement
+    project = db.get(Project, data["id"])
+    assert project.views_count == 0
+    assert engagement_buffer.flush(db) == 1
+    db.refresh(project)
+    assert (project.views_count, project.shares_count) == (3, 1)
+    assert project.trending_score == 8.0            # 3 views + 1 share × 5
+
+    # Decays by elapsed time, however the runs are spaced
+    decay_trending(db, now=1_000_000)
+    decay_trending(db, now=1_000_000 + 12 * 3600)
+    decay_trending(db, now=1_000_000 + 24 * 3600)
+    db.refresh(project)
+    assert project.trending_score == pytest.approx(4.0)
+
+
+def test_counter_buffer_keeps_deltas_when_flush_fails(db, monkeypatch):
+    def broken(db, rows):
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr(engagement_buffer, "apply", broken)
+    engagement_buffer.add(42, views=2)
+    with pytest.raises(RuntimeError):
+        engagement_buffer.flush(db)
+    engagement_buffer.add(42, views=1, shares=1)
+    assert engagement_buffer._drain() == {42: [3, 1]}
+
+
+def test_trending_and_similar_are_precomputed(client, db, test_user):
+    def project(title, description, sector, status=ProjectStatus.active):
+        p = Project(
+            title=title, slug=f"p-{uuid.uuid4().hex[:8]}", description=description, sector=sector,
+            funding_goal=Decimal(1000000), current_funding=Decimal(0), job_goal=5, jobs_to_create=5,
+            entrepreneur_id=test_user.id, status=status,
+        )
+        db.add(p)
+        return p
+
+    coffee = project("Coffee Roastery", "Roasting coffee beans from Huye farmers for export", "Agriculture")
+    beans = project("Bean Cooperative", "Coffee beans washing station with farmers cooperative", "Agriculture")
+    solar = project("Solar Kiosk", "Charging phones with solar panels in rural markets", "Renewable Energy")
+    closed = project("Coffee Exporters", "Export coffee beans grown by farmers", "Agriculture", ProjectStatus.funded)
+    db.commit()
+    now = datetime.utcnow()
+    db.add(ProjectFundingBucket(project_id=solar.id, granularity=DAY, bucket_start=floor_day(now),
+                                amount_rwf=Decimal(300000), contributions=12, jobs_created=30))
+    db.commit()
+
+    stats = rebuild_rankings(db, now=now)
+    assert stats["ranked"] == 3                    # the funded project is not ranked
+
+    response = client.get("/api/v1/projects/trending?limit=2")
+    assert [p["id"] for p in response.json()] == [solar.id, coffee.id]
+
+    similar = client.get(f"/api/v1/projects/{coffee.slug}/similar").json()
+    assert similar[0]["id"] == beans.id
+    assert closed.id not in [p["id"] for p in similar]
+    # A closed project's page still suggests open ones
+    assert client.get(f"/api/v1/projects/{closed.slug}/similar").json()[0]["id"] in (coffee.id, beans.id)
+    assert client.get("/api/v1/projects/nope/similar").status_code == 404
@@ -0,0 +1,65 @@
+"""
+Test live funding progress (pub/sub + SSE endpoint)
+"""
+import asyncio
+import threading
+from decimal import Decimal
+
+from app.crud import project as crud_project
+from app.crud.transaction import update_transaction_status
+from app.models.project import Project, ProjectStatus
+from app.models.transaction import Transaction
+from app.utils.pubsub import Broker
+
+
+def test_broker_fans_out_from_threads():
+    async def scenario():
+        broker = Broker(queue_size=2)
+        await broker.start()
+        first, second = broker.subscribe("project:1"), broker.subscribe("project:1")
+        other = broker.subscribe("project:2")
+
+        publisher = threading.Thread(target=broker.publish, args=("project:1", {"funding": 1}))
+        publisher.start()
+        publisher.join()
+        assert await first.get(timeout=1) == {"funding": 1}
+        assert await second.get(timeout=1) == {"funding": 1}
+        assert await other.get(timeout=0.05) is None
+
+        # Slow subscriber: oldest message is dropped, newest kept
+        for funding in (2, 3, 4):
+            broker.publish("project:1", {"funding": funding})
+        assert [await first.get(timeout=1) for _ in range(2)] == [{"funding": 3}, {"funding": 4}]
+        assert first.dropped == 1
+
+        for subscription in (first, second, other):
+            subscription.close()
+        assert broker.subscriber_count == 0
+
+    asyncio.run(scenario())
+
+
+def test_completed_payment_publishes_progress(db, test_user, monkeypatch):
+    project = Project(
+        title="Solar Kiosk", slug="solar-kiosk-stream", description="Charging", sector="Energy",
+        funding_goal=Decimal(200000), current_funding=Decimal(0), job_goal=20, jobs_to_create=20,
+        entrepreneur_id=test_user.id, status=ProjectStatus.active,
+    )
+    db.add(project)
+    db.commit()
+    transaction = Transaction(amount=Decimal(50000), jobs_created=5, backer_id=test_user.id, project_id=project.id,
+                              external_id="stream-1")
+    db.add(transaction)
+    db.commit()
+
+    published = []
+    monkeypatch.setattr(crud_project.broker, "publish", lambda channel, message: published.append((channel, message)))
+    update_transaction_status(db, transaction.external_id, "MOMO-1", "SUCCESSFUL")
+
+    channel, message = published[0]
+    assert channel == f"project:{project.id}"
+    assert message["funding"] == 50000 and message["backers"] == 1 and message["jobs"] == 5
+
+
+def test_stream_unknown_project(client):
+    assert client.get("/api/v1/projects/999999/stream").status_code == 404
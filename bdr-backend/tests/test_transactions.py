@@ -1,35 +1,419 @@
 """
-Test MoMo Flow (Mocked)
+Test payments against the local fake MoMo / Stripe server
 """
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
 
-from unittest.mock import patch
+import httpx
+import pytest
+from sqlalchemy import update
 
-@patch("app.utils.momo.initiate_momo_payment")
-def test_initiate_payment(mock_momo, client, db, backer_token):
-    mock_momo.return_value = {
-        "reference_id": "123",
-        "financialTransactionId": "momo-123"
-    }
+from fastapi import HTTPException
 
-    response = client.post("/api/v1/transactions/", json={
-        "project_id": 1,
-        "amount": 20000,
-        "momo_phone": "+250788123456"
-    }, headers={"Authorization": f"Bearer {backer_token}"})
-    assert response.status_code == 200
-    assert response.json()["jobs_to_create"] == 2
+from app.core.config import settings
+from app.crud import idempotency as crud_idempotency
+from app.crud.backer_stats import rebuild_backer_stats
+from app.crud.impact import rebuild_project_jobs
+from app.crud.project_analytics import rebuild_funding_buckets
+from app.crud.idempotency import purge_expired
+from app.crud.transaction import update_transaction_status
+from app.jobs import archive_transactions
+from app.jobs.reconcile_payments import reconcile
+from app.jobs.run_pledges import run_due_pledges
+from app.models.backer_stats import BackerStats
+from app.models.idempotency import IdempotencyKey
+from app.models.payment import Payment, Pledge
+from app.models.project import Project, ProjectStatus
+from app.models.project_funding_bucket import ProjectFundingBucket, DAY
+from app.models.transaction import Transaction, TransactionArchive, TransactionColdSummary, TransactionStatus
+from app.utils import payments
+from app.utils.email_queue import email_queue
+from app.utils.idempotency import fingerprint, run_idempotent
+from app.utils.payments import MoMoProvider, PaymentHttpClient, StripeProvider
+from app.utils.payments.fake_server import create_fake_provider_app
+from app.utils.payments.stripe import stripe_signature
+
+
+MOMO_SECRET = "momo_whsec_1"
+
+
+def momo_callback(client, payload, secret=MOMO_SECRET):
+    body = json.dumps(payload).encode()
+    headers = {"Content-Type": "application/json"}
+    if secret:
+        headers["X-Signature"] = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return client.put("/api/v1/transactions/webhook/momo", content=body, headers=headers)
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    fake = create_fake_provider_app()
+    http = PaymentHttpClient(transport=httpx.ASGITransport(app=fake))
+    monkeypatch.setitem(payments.providers, "momo", MoMoProvider(
+        base_url="http://fake-momo", api_user="user", api_key="key", subscription_key="sub",
+        webhook_secret=MOMO_SECRET, http=http,
+    ))
+    monkeypatch.setitem(payments.providers, "card", StripeProvider(
+        base_url="http://fake-stripe", secret_key="sk_test_1", webhook_secret="whsec_1",
+        frontend_url="http://localhost:3000", http=http,
+    ))
+    return fake
+
+
+def make_project(db, owner, title="Tailoring Hub"):
+    project = Project(
+        title=title, slug=f"tailoring-{uuid.uuid4().hex[:6]}", description="Uniforms", sector="Manufacturing",
+        funding_goal=Decimal(500000), current_funding=Decimal(0), job_goal=50, jobs_to_create=50,
+        entrepreneur_id=owner.id, status=ProjectStatus.active,
+    )
+    db.add(project)
+    db.commit()
+    return project
+
+
+@pytest.fixture
+def project(db, test_user):
+    return make_project(db, test_user)
+
+
+def test_initiate_payment_reuses_token(client, db, backer_token, project, fake_provider):
+    headers = {"Authorization": f"Bearer {backer_token}"}
+    for _ in range(2):
+        response = client.post("/api/v1/transactions/", json={
+            "project_id": project.id,
+            "amount": 20000,
+            "momo_phone": "0788123456"
+        }, headers=headers)
+        assert response.status_code == 200
+        assert response.json()["jobs_to_create"] == 2
+
+    data = response.json()
+    request = fake_provider.state.requests[data["momo_request_id"]]
+    assert request["payer"]["partyId"] == "250788123456"
+    assert request["externalId"] == data["external_id"]
+    assert fake_provider.state.tokens_issued == 1
+
+    transaction = db.get(Transaction, data["transaction_id"])
+    assert transaction.status == TransactionStatus.pending
+    assert transaction.provider_ref == data["momo_request_id"]
+
+
+def test_idempotency_key_replays_first_response(client, db, backer_token, project, fake_provider):
+    headers = {"Authorization": f"Bearer {backer_token}", "Idempotency-Key": "tap-1"}
+    body = {"project_id": project.id, "amount": 20000, "momo_phone": "+250788123456"}
+    first = client.post("/api/v1/transactions/", json=body, headers=headers)
+    retry = client.post("/api/v1/transactions/", json=body, headers=headers)
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert len(fake_provider.state.requests) == 1
+    assert db.query(Transaction).filter_by(project_id=project.id).count() == 1
 
-def test_momo_webhook(client, db):
+    response = client.post("/api/v1/transactions/", json={**body, "amount": 30000}, headers=headers)
+    assert response.status_code == 422
+
+
+def test_idempotency_serialises_duplicates(db, test_user):
+    calls = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def pay():
+            calls.append(1)
+            await release.wait()
+            return {"transaction_id": 7}
+
+        def attempt(wait_seconds=0):
+            return run_idempotent(db, test_user.id, "test", "double-tap", {"a": 1}, pay, wait_seconds=wait_seconds)
+
+        first = asyncio.create_task(attempt())
+        await asyncio.sleep(0.05)
+        # Duplicate while the first is still talking to the provider: no second call
+        with pytest.raises(HTTPException) as busy:
+            await attempt()
+        assert busy.value.status_code == 409
+        release.set()
+        assert await first == {"transaction_id": 7}
+        replay = await attempt()
+        assert replay.headers["Idempotent-Replayed"] == "true" and json.loads(replay.body) == {"transaction_id": 7}
+
+        # Rejected before any provider call (4xx): the key is freed for the retry
+        async def rejected():
+            raise HTTPException(status_code=404)
+        with pytest.raises(HTTPException):
+            await run_idempotent(db, test_user.id, "test", "flaky", {}, rejected)
+        assert await run_idempotent(db, test_user.id, "test", "flaky", {}, pay) == {"transaction_id": 7}
+
+        # Provider failure (5xx): it may have charged anyway, so the failure is replayed
+        async def boom():
+            raise HTTPException(status_code=502, detail="Payment initiation failed. Try again.")
+        with pytest.raises(HTTPException):
+            await run_idempotent(db, test_user.id, "test", "timeout", {}, boom)
+        replay = await run_idempotent(db, test_user.id, "test", "timeout", {}, pay)
+        assert replay.status_code == 502 and replay.headers["Idempotent-Replayed"] == "true"
+
+        # The first request died holding the key: once its lease is up a duplicate runs instead
+        crud_idempotency.claim(db, test_user.id, "test", "crashed", fingerprint({}), timedelta(hours=1), timedelta(0))
+        assert await run_idempotent(db, test_user.id, "test", "crashed", {}, pay) == {"transaction_id": 7}
+
+    asyncio.run(scenario())
+    assert len(calls) == 3
+    assert purge_expired(db, now=datetime.utcnow() + timedelta(days=2)) == 4
+    assert db.query(IdempotencyKey).count() == 0
+
+
+def test_momo_requires_phone(client, backer_token, project):
+    response = client.post("/api/v1/transactions/", json={"project_id": project.id, "amount": 20000},
+                           headers={"Authorization": f"Bearer {backer_token}"})
+    assert response.status_code == 422
+
+
+def test_momo_webhook(client, db, test_user, project, fake_provider):
+    fake_provider.state.requests["ref-1"] = {"externalId": "momo-ext-1", "status": "PENDING"}
+    transaction = Transaction(amount=Decimal(20000), backer_id=test_user.id, project_id=project.id,
+                              external_id="momo-ext-1", provider_ref="ref-1")
+    db.add(transaction)
+    db.commit()
     payload = {
         "financialTransactionId": "momo-123",
-        "externalId": "1",
+        "externalId": "momo-ext-1",
         "amount": "20000",
         "status": "SUCCESSFUL"
     }
-    signature = "valid-hmac"  # Mocked in momo.py
 
-    with patch("app.utils.momo.verify_webhook_signature", return_value=True):
-        response = client.post("/api/v1/transactions/webhook/momo", json=payload, headers={
-            "X-Signature": signature
-        })
-        assert response.status_code == 200
\ No newline at end of file
+    # Unsigned, badly signed, or no secret configured at all: refused
+    assert momo_callback(client, payload, secret=None).status_code == 400
+    assert momo_callback(client, payload, secret="guess").status_code == 400
+    momo = payments.providers["momo"]          # this test's own instance (fake_provider)
+    momo.webhook_secret = None
+    assert momo_callback(client, payload, secret=None).status_code == 400
+    momo.webhook_secret = MOMO_SECRET
+
+    # Signed, but MoMo itself doesn't say SUCCESSFUL yet: nothing credited
+    fake_provider.state.outcome = "PENDING"
+    assert momo_callback(client, payload).json() == {"status": "pending"}
+    db.refresh(transaction)
+    assert transaction.status == TransactionStatus.pending
+
+    fake_provider.state.outcome = "SUCCESSFUL"
+    response = momo_callback(client, payload)
+    assert response.status_code == 200
+    assert response.json() == {"status": "completed"}
+    db.refresh(transaction)
+    assert transaction.momo_ref == "fake-fin-ref-1"      # MoMo's own record, not the callback's
+
+    # Unknown references are acknowledged so MoMo stops retrying
+    assert momo_callback(client, {**payload, "externalId": "nope"}).json() == {"status": "unknown"}
+
+
+def test_same_event_twice_credits_once(db, test_user, project):
+    def backing(external_id):
+        transaction = Transaction(amount=Decimal(20000), backer_id=test_user.id, project_id=project.id,
+                                  external_id=external_id)
+        db.add(transaction)
+        db.commit()
+        return transaction
+
+    backing("dup-1")
+    for _ in range(2):                 # provider retries the callback
+        update_transaction_status(db, "dup-1", "fin-1", "SUCCESSFUL")
+    db.refresh(project)
+    assert (project.current_funding, project.backers_count) == (20000, 1)
+
+    # A second worker settled the row after this session read it as pending
+    late = backing("dup-2")
+    assert late.status == TransactionStatus.pending
+    db.execute(update(Transaction.__table__).where(Transaction.__table__.c.id == late.id)
+               .values(status=TransactionStatus.completed))
+    assert late.status == TransactionStatus.pending          # stale in this session
+    update_transaction_status(db, "dup-2", "fin-2", "SUCCESSFUL")
+    db.refresh(project)
+    assert (project.current_funding, project.backers_count) == (20000, 1)
+
+
+def test_cold_months_still_count(client, db, test_user, admin_token, project, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "ARCHIVE_DIR", str(tmp_path))
+    long_ago = datetime(2020, 3, 10, 9, 30)
+
+    def old_backing(external_id):
+        db.add(Transaction(amount=Decimal(150000), jobs_created=15, backer_id=test_user.id, project_id=project.id,
+                           external_id=external_id))
+        db.commit()
+        update_transaction_status(db, external_id, f"fin-{external_id}", "SUCCESSFUL")
+        db.execute(update(Transaction.__table__).where(Transaction.__table__.c.external_id == external_id)
+                   .values(created_at=long_ago, updated_at=long_ago))
+        db.commit()
+
+    old_backing("cold-1")
+    old_backing("cold-2")
+    assert archive_transactions.run(db) == {"archived": 2, "cold_files": 1}
+    assert db.query(TransactionArchive).count() == 0
+    assert [p.name for p in tmp_path.iterdir()] == ["2020-03.jsonl.gz"]
+    stats = client.get("/api/v1/admin/stats", headers={"Authorization": f"Bearer {admin_token}"}).json()
+    assert (stats["total_donated_rwf"], stats["total_jobs_created"]) == (300000, 30)
+
+    rebuild_backer_stats(db)
+    stats = db.get(BackerStats, test_user.id)
+    assert (stats.total_rwf, stats.jobs_created, stats.contributions_count) == (300000, 30, 2)
+    rebuild_project_jobs(db)
+    rebuild_funding_buckets(db, project_id=project.id)
+    db.refresh(project)
+    assert (project.current_funding, project.jobs_created) == (300000, 30)
+    day = db.query(ProjectFundingBucket).filter_by(project_id=project.id, granularity=DAY).one()
+    assert (day.bucket_start.replace(tzinfo=None), day.amount_rwf, day.contributions) == (
+        datetime(2020, 3, 10), 300000, 2)
+
+    # A late-settled row of the same month: a second part, the first file untouched
+    old_backing("cold-3")
+    archive_transactions.run(db)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2020-03.jsonl.gz", "2020-03.part2.jsonl.gz"]
+    assert db.query(TransactionColdSummary).count() == 2
+    rebuild_backer_stats(db)
+    db.refresh(stats)
+    assert (stats.total_rwf, stats.contributions_count) == (450000, 3)
+
+
+def test_card_checkout_and_signed_webhook(client, db, backer_token, project, fake_provider):
+    response = client.post("/api/v1/transactions/", json={
+        "project_id": project.id, "amount": 30000, "payment_method": "card"
+    }, headers={"Authorization": f"Bearer {backer_token}"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["checkout_url"].startswith("https://checkout.stripe.test/")
+
+    body = json.dumps({"type": "checkout.session.completed", "data": {"object": {
+        "id": "cs_test_1", "client_reference_id": data["external_id"],
+        "payment_status": "paid", "payment_intent": "pi_1",
+    }}}).encode()
+    timestamp = int(time.time())
+    response = client.post("/api/v1/transactions/webhook/stripe", content=body,
+                           headers={"Stripe-Signature": f"t={timestamp},v1=bad"})
+    assert response.status_code == 400
+
+    response = client.post("/api/v1/transactions/webhook/stripe", content=body,
+                           headers={"Stripe-Signature": f"t={timestamp},v1={stripe_signature('whsec_1', timestamp, body)}"})
+    assert response.json() == {"status": "completed"}
+    assert db.get(Transaction, data["transaction_id"]).momo_ref == "pi_1"
+
+
+def test_admin_settles_bank_transfer(client, db, backer_token, admin_token, project, fake_provider):
+    response = client.post("/api/v1/transactions/", json={
+        "project_id": project.id, "amount": 30000, "payment_method": "bank",
+    }, headers={"Authorization": f"Bearer {backer_token}"})
+    reference = response.json()["external_id"]
+    assert reference in response.json()["instructions"]
+
+    admin = {"Authorization": f"Bearer {admin_token}"}
+    settle = f"/api/v1/admin/transfers/{reference}/settle"
+    assert client.post(settle, json={"received": True}, headers={"Authorization": f"Bearer {backer_token}"}
+                       ).status_code == 403
+    response = client.post(settle, json={"received": True, "bank_ref": "BK-0042"}, headers=admin)
+    assert response.json() == {"reference": reference, "status": "completed"}
+    db.refresh(project)
+    assert (project.current_funding, project.backers_count) == (30000, 1)
+    assert client.post(settle, json={"received": True}, headers=admin).status_code == 409
+
+    assert client.post("/api/v1/admin/transfers/nope/settle", json={"received": False},
+                       headers=admin).status_code == 404
+
+
+def test_reconcile_resolves_stuck_payments(db, test_user, project, fake_provider):
+    now = datetime.utcnow()
+
+    def pending(ref, age, provider="momo", known=True):
+        if known:
+            fake_provider.state.requests[ref] = {"externalId": f"ext-{ref}", "status": "PENDING"}
+        db.add(Transaction(amount=Decimal(20000), backer_id=test_user.id, project_id=project.id, provider=provider,
+                           external_id=f"ext-{ref}", provider_ref=ref, created_at=now - age))
+
+    pending("lost-callback", timedelta(hours=1))
+    pending("never-reached-momo", timedelta(hours=2), known=False)
+    pending("too-recent", timedelta(minutes=2))
+    pending("bank-transfer", timedelta(days=3), provider="bank", known=False)
+    db.commit()
+
+    stats = asyncio.run(reconcile(db, now=now, after_minutes=15, give_up_hours=24, batch_size=1, concurrency=2))
+    assert (stats.scanned, stats.completed, stats.failed, stats.still_pending) == (2, 1, 1, 0)
+    status = lambda ref: db.query(Transaction).filter_by(provider_ref=ref).one().status
+    assert status("lost-callback") == TransactionStatus.completed
+    assert status("too-recent") == status("bank-transfer") == TransactionStatus.pending
+
+    # Provider still says PENDING: wait until the give-up window, then fail it
+    fake_provider.state.outcome = "PENDING"
+    pending("slow-approval", timedelta(hours=3))
+    db.commit()
+    assert asyncio.run(reconcile(db, now=now, give_up_hours=24)).still_pending == 1
+    stats = asyncio.run(reconcile(db, now=now + timedelta(hours=22), give_up_hours=24))
+    assert stats.expired == 1 and status("slow-approval") == TransactionStatus.failed
+
+
+def test_basket_checkout_is_one_charge(client, db, backer_token, test_user, project, fake_provider, monkeypatch):
+    other = make_project(db, test_user, title="Solar Kiosk")
+    emails = []
+    monkeypatch.setattr(email_queue, "enqueue", lambda messages: emails.extend(messages) or True)
+    response = client.post("/api/v1/transactions/basket", json={
+        "items": [{"project_id": project.id, "amount": 20000}, {"project_id": other.id, "amount": 10000}],
+        "momo_phone": "0788123456",
+    }, headers={"Authorization": f"Bearer {backer_token}"})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["amount"] == 30000 and len(data["transaction_ids"]) == 2
+    # One MoMo prompt for the whole basket
+    assert len(fake_provider.state.requests) == 1
+    assert fake_provider.state.requests[data["momo_request_id"]]["amount"] == "30000"
+
+    response = momo_callback(client, {
+        "financialTransactionId": "momo-basket-1", "externalId": data["external_id"], "status": "SUCCESSFUL",
+    })
+    assert response.json() == {"status": "completed"}
+    db.expire_all()
+    assert [db.get(Transaction, i).status for i in data["transaction_ids"]] == [TransactionStatus.completed] * 2
+    assert (project.current_funding, other.current_funding) == (20000, 10000)
+    assert (project.jobs_created, other.jobs_created) == (2, 1)
+    [receipt] = emails
+    assert receipt["Subject"] == "Your BDR Payment is Confirmed!"
+    assert "RWF 30,000" in receipt.get_content() and "Solar Kiosk" in receipt.get_content()
+
+    response = client.post("/api/v1/transactions/basket", json={
+        "items": [{"project_id": project.id, "amount": 20000}, {"project_id": project.id, "amount": 10000}],
+        "momo_phone": "0788123456",
+    }, headers={"Authorization": f"Bearer {backer_token}"})
+    assert response.status_code == 422
+
+
+def test_pledge_runs_once_a_month(client, db, backer_token, project, fake_provider):
+    headers = {"Authorization": f"Bearer {backer_token}"}
+    response = client.post("/api/v1/transactions/pledges", json={
+        "items": [{"project_id": project.id, "amount": 10000}], "momo_phone": "0788123456",
+    }, headers=headers)
+    assert response.status_code == 201
+    pledge_id = response.json()["id"]
+
+    now = datetime.utcnow() + timedelta(minutes=1)
+    stats = asyncio.run(run_due_pledges(db, now=now))
+    assert (stats.due, stats.charged) == (1, 1)
+    assert len(fake_provider.state.requests) == 1
+    # Already moved on to next month: a second pass charges nothing
+    assert asyncio.run(run_due_pledges(db, now=now)).due == 0
+
+    pledge = db.get(Pledge, pledge_id)
+    assert pledge.next_run_at > now + timedelta(days=27)
+    payment = db.get(Payment, pledge.last_payment_id)
+    assert payment.provider_ref in fake_provider.state.requests
+
+    # Lost callback: reconciliation settles the basket payment and its lines
+    stats = asyncio.run(reconcile(db, now=now + timedelta(hours=1), after_minutes=15))
+    assert stats.completed == 1
+    db.refresh(payment)
+    assert payment.status == TransactionStatus.completed
+    assert [t.status for t in payment.transactions] == [TransactionStatus.completed]
+
+    response = client.post(f"/api/v1/transactions/pledges/{pledge_id}/cancel", headers=headers)
+    assert response.json()["status"] == "cancelled"
@@ -44,7 +44,7 @@ const { user, isLoading: authLoading } = useAuth();
         ]);
         setStats(statsRes.data);
         setProjects(projectsRes.data);
-        setMessages(messagesRes.data);
+        setMessages(messagesRes.data.items);
       } catch (err: any) {
         console.error("Admin load failed:", err);
         alert("Check backend is running");